@@ -3,9 +3,7 @@ import inspect
 import json
 import time
 from datetime import date, datetime
-from typing import Any, Optional
-
-import anthropic
+from typing import TYPE_CHECKING, Any, Optional
 
 import config as app_config
 from config import MAX_TOOL_ROUNDS
@@ -53,11 +51,17 @@ class AgentResult(str):
 MAX_TOOL_RESULT_LENGTH = 10000
 from agents.registry import AgentConfig
 from capabilities.registry import get_tools_for_capabilities
-from documents.store import DocumentStore
 from memory.store import MemoryStore
 from tools.executor import execute_query_memory, execute_store_memory, execute_search_documents
+from utils.lazy_import import lazy_import
 from utils.retry import retry_api_call
 
+if TYPE_CHECKING:
+    from documents.store import DocumentStore
+
+anthropic = lazy_import("anthropic")
+
+
 class BaseExpertAgent(
     LifecycleMixin,
     CalendarMixin,
@@ -81,8 +85,8 @@ class BaseExpertAgent(
         self,
         config: AgentConfig,
         memory_store: MemoryStore,
-        document_store: DocumentStore,
-        client: Optional[anthropic.AsyncAnthropic] = None,
+        document_store: "DocumentStore",
+        client: Optional["anthropic.AsyncAnthropic"] = None,
         calendar_store=None,
         reminder_store=None,
         notifier=None,
@@ -350,6 +354,9 @@ class BaseExpertAgent(
             "mark_mail_read": self._handle_mail_mark_read,
             "mark_mail_flagged": self._handle_mail_mark_flagged,
             "move_mail_message": self._handle_mail_move_message,
+            "mark_mail_read_bulk": self._handle_mail_mark_read_bulk,
+            "mark_mail_flagged_bulk": self._handle_mail_mark_flagged_bulk,
+            "move_mail_messages_bulk": self._handle_mail_move_messages_bulk,
             # Web browser (from WebBrowserMixin) — async handlers
             "web_open": self._handle_web_open,
             "web_snapshot": self._handle_web_snapshot,
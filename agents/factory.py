@@ -2,11 +2,12 @@
 import json
 from datetime import datetime
 
-import anthropic
-
 import config as app_config
 from agents.registry import AgentConfig, AgentRegistry
 from capabilities.registry import capability_prompt_lines, validate_capabilities
+from utils.lazy_import import lazy_import
+
+anthropic = lazy_import("anthropic")
 
 MAX_AUTO_CAPABILITIES = 8
 RESTRICTED_CAPABILITIES = {"mail_write", "notifications", "alerts_write"}
@@ -10,6 +10,7 @@ from typing import Any
 
 from tools import lifecycle as lifecycle_tools
 from utils.text import split_addresses as _split_addresses
+from utils.text import split_ids as _split_ids
 
 
 # ---------------------------------------------------------------------------
@@ -314,6 +315,31 @@ class MailMixin:
         )
 
 
+    def _handle_mail_mark_read_bulk(self, tool_input: dict) -> Any:
+        if self.mail_store is None:
+            return {"error": "Mail not available (macOS only)"}
+        return self.mail_store.mark_read_bulk(
+            message_ids=_split_ids(tool_input["message_ids"]),
+            read=tool_input.get("read", True),
+        )
+
+    def _handle_mail_mark_flagged_bulk(self, tool_input: dict) -> Any:
+        if self.mail_store is None:
+            return {"error": "Mail not available (macOS only)"}
+        return self.mail_store.mark_flagged_bulk(
+            message_ids=_split_ids(tool_input["message_ids"]),
+            flagged=tool_input.get("flagged", True),
+        )
+
+    def _handle_mail_move_messages_bulk(self, tool_input: dict) -> Any:
+        if self.mail_store is None:
+            return {"error": "Mail not available (macOS only)"}
+        return self.mail_store.move_messages_bulk(
+            message_ids=_split_ids(tool_input["message_ids"]),
+            target_mailbox=tool_input["target_mailbox"],
+            target_account=tool_input.get("target_account", ""),
+        )
+
 # ---------------------------------------------------------------------------
 # Web Browser (agent-browser CLI)
 # ---------------------------------------------------------------------------
@@ -10,11 +10,11 @@ import logging
 from dataclasses import replace
 from typing import Optional
 
-import anthropic
-
 import config as app_config
 from agents.registry import AgentConfig
+from utils.lazy_import import lazy_import
 
+anthropic = lazy_import("anthropic")
 logger = logging.getLogger("jarvis-triage")
 
 _VALID_CLASSIFICATIONS = {"simple", "standard", "complex"}
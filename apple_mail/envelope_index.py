@@ -0,0 +1,230 @@
+"""Read-only access to Apple Mail's ``Envelope Index`` SQLite database.
+
+Mail keeps every message header it has downloaded in
+``~/Library/Mail/V<n>/MailData/Envelope Index``. Reading headers, flags and
+mailbox counts from there takes milliseconds, where the AppleScript path in
+``MailStore`` fetches each message over Apple Events. Bodies and mutations
+still go through AppleScript, which keeps Mail the only writer.
+
+Mailboxes are identified by URL (``imap://<account-id>/INBOX``). Account
+display names are looked up in ``Accounts4.sqlite`` when it is readable;
+otherwise only the account id from the URL is known. A mailbox or account
+that cannot be resolved raises ``LookupError`` so the caller can fall back.
+"""
+
+import logging
+import re
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+from urllib.parse import unquote, urlsplit
+
+logger = logging.getLogger(__name__)
+
+MAX_LIMIT = 500
+
+_MAIL_DIR = Path.home() / "Library" / "Mail"
+_ACCOUNTS_DB = Path.home() / "Library" / "Accounts" / "Accounts4.sqlite"
+_VERSION_DIR = re.compile(r"^V(\d+)$")
+
+_MESSAGE_COLUMNS = """
+    m.ROWID AS rowid,
+    COALESCE(g.message_id_header, '') AS message_id_header,
+    COALESCE(m.subject_prefix, '') AS subject_prefix,
+    COALESCE(s.subject, '') AS subject,
+    COALESCE(a.address, '') AS address,
+    COALESCE(a.comment, '') AS comment,
+    m.date_sent AS date_sent,
+    m.date_received AS date_received,
+    m.read AS read,
+    m.flagged AS flagged,
+    m.mailbox AS mailbox
+"""
+
+_MESSAGE_JOINS = """
+    FROM messages m
+    LEFT JOIN message_global_data g ON g.ROWID = m.global_message_id
+    LEFT JOIN subjects s ON s.ROWID = m.subject
+    LEFT JOIN addresses a ON a.ROWID = m.sender
+"""
+
+
+def default_index_path(mail_dir: Path = _MAIL_DIR) -> Optional[Path]:
+    """The Envelope Index of the newest ``V<n>`` Mail data directory, if any."""
+    try:
+        versions = [
+            (int(match.group(1)), entry)
+            for entry in mail_dir.iterdir()
+            if (match := _VERSION_DIR.match(entry.name))
+        ]
+    except OSError:
+        return None
+    for _, entry in sorted(versions, reverse=True):
+        candidate = entry / "MailData" / "Envelope Index"
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _split_mailbox_url(url: str) -> tuple[str, str]:
+    """(account id, mailbox path) for a Mail mailbox URL."""
+    parts = urlsplit(url or "")
+    account_id = unquote(parts.netloc.rsplit("@", 1)[-1])
+    return account_id, unquote(parts.path.lstrip("/"))
+
+
+def _format_sender(address: str, comment: str) -> str:
+    # Matches AppleScript's ``sender of msg``: "Name <addr>" or bare address.
+    if comment and address:
+        return f"{comment} <{address}>"
+    return address or comment
+
+
+def _format_date(timestamp: Optional[int]) -> str:
+    if not timestamp:
+        return ""
+    return datetime.fromtimestamp(timestamp).isoformat(timespec="seconds")
+
+
+class EnvelopeIndex:
+    """Headers, flags and counts from Mail's Envelope Index, opened read-only."""
+
+    def __init__(self, db_path: Optional[Path] = None, accounts_db_path: Optional[Path] = None):
+        self._db_path = Path(db_path) if db_path else None
+        self.accounts_db_path = Path(accounts_db_path) if accounts_db_path else _ACCOUNTS_DB
+        self._account_names: Optional[dict[str, str]] = None
+
+    @property
+    def db_path(self) -> Optional[Path]:
+        if self._db_path is None:
+            self._db_path = default_index_path()
+        return self._db_path
+
+    def available(self) -> bool:
+        """True when the index file exists (read access is checked on open)."""
+        path = self.db_path
+        return path is not None and path.exists()
+
+    def _open(self) -> sqlite3.Connection:
+        if not self.available():
+            raise LookupError("Mail Envelope Index not found")
+        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _query(self, sql: str, params: tuple = (), max_retries: int = 3) -> list[sqlite3.Row]:
+        """Run a read query, retrying while Mail holds the write lock."""
+        for attempt in range(max_retries):
+            try:
+                conn = self._open()
+                try:
+                    return conn.execute(sql, params).fetchall()
+                finally:
+                    conn.close()
+            except sqlite3.OperationalError as e:
+                if "locked" in str(e) and attempt < max_retries - 1:
+                    time.sleep(0.1 * (2 ** attempt))
+                    continue
+                raise
+        return []
+
+    def account_names(self) -> dict[str, str]:
+        """Account id -> display name from Accounts4.sqlite (empty if unreadable)."""
+        if self._account_names is None:
+            names: dict[str, str] = {}
+            try:
+                conn = sqlite3.connect(f"file:{self.accounts_db_path}?mode=ro", uri=True)
+                try:
+                    rows = conn.execute(
+                        "SELECT ZIDENTIFIER, ZACCOUNTDESCRIPTION FROM ZACCOUNT "
+                        "WHERE ZIDENTIFIER IS NOT NULL AND ZACCOUNTDESCRIPTION IS NOT NULL"
+                    ).fetchall()
+                finally:
+                    conn.close()
+                names = {identifier: description for identifier, description in rows}
+            except sqlite3.Error as e:
+                logger.debug("Mail account names unavailable: %s", e)
+            self._account_names = names
+        return self._account_names
+
+    def _mailboxes(self) -> dict[int, dict]:
+        names = self.account_names()
+        mailboxes = {}
+        for row in self._query("SELECT ROWID, url, total_count, unread_count FROM mailboxes"):
+            account_id, name = _split_mailbox_url(row["url"])
+            if not name:
+                continue
+            mailboxes[row["ROWID"]] = {
+                "name": name,
+                "account": names.get(account_id, account_id),
+                "account_id": account_id,
+                "unread_count": int(row["unread_count"] or 0),
+                "total_count": int(row["total_count"] or 0),
+            }
+        return mailboxes
+
+    def _resolve(self, mailbox: str, account: str = "") -> dict[int, dict]:
+        """Mailboxes named *mailbox* (case-insensitive), optionally in *account*.
+
+        *account* matches an account id or display name. With no account,
+        the mailbox is matched in every account.
+        """
+        mailbox_key = mailbox.strip().casefold()
+        account_key = account.strip().casefold()
+        matches = {}
+        for rowid, info in self._mailboxes().items():
+            if info["name"].casefold() != mailbox_key:
+                continue
+            if account_key and account_key not in (info["account"].casefold(), info["account_id"].casefold()):
+                continue
+            matches[rowid] = info
+        if not matches:
+            where = f" in account {account!r}" if account else ""
+            raise LookupError(f"Mailbox {mailbox!r}{where} not in the Mail index")
+        return matches
+
+    def list_mailboxes(self) -> list[dict]:
+        """All mailboxes with unread and total counts."""
+        return sorted(self._mailboxes().values(), key=lambda mb: (mb["account"], mb["name"]))
+
+    def _messages(self, where: str, params: tuple, mailboxes: dict[int, dict], limit: int) -> list[dict]:
+        placeholders = ",".join("?" for _ in mailboxes)
+        rows = self._query(
+            f"SELECT {_MESSAGE_COLUMNS} {_MESSAGE_JOINS} "
+            f"WHERE m.mailbox IN ({placeholders}) AND COALESCE(m.deleted, 0) = 0 {where} "
+            "ORDER BY m.date_received DESC, m.ROWID DESC LIMIT ?",
+            (*mailboxes, *params, min(max(1, int(limit)), MAX_LIMIT)),
+        )
+        messages = []
+        for row in rows:
+            box = mailboxes[row["mailbox"]]
+            messages.append({
+                "message_id": row["message_id_header"].strip().strip("<>"),
+                "subject": row["subject_prefix"] + row["subject"],
+                "sender": _format_sender(row["address"], row["comment"]),
+                "date": _format_date(row["date_sent"] or row["date_received"]),
+                "read": bool(row["read"]),
+                "flagged": bool(row["flagged"]),
+                "mailbox": box["name"],
+                "account": box["account"],
+            })
+        return messages
+
+    def get_messages(self, mailbox: str = "INBOX", account: str = "", limit: int = 25) -> list[dict]:
+        """Most recently received messages in a mailbox, newest first."""
+        return self._messages("", (), self._resolve(mailbox, account), limit)
+
+    def search_messages(self, query: str, mailbox: str = "INBOX", account: str = "", limit: int = 25) -> list[dict]:
+        """Messages whose subject, sender address or sender name contains *query*."""
+        pattern = f"%{_escape_like(query)}%"
+        where = (
+            "AND (s.subject LIKE ? ESCAPE '\\' OR a.address LIKE ? ESCAPE '\\' "
+            "OR a.comment LIKE ? ESCAPE '\\')"
+        )
+        return self._messages(where, (pattern, pattern, pattern), self._resolve(mailbox, account), limit)
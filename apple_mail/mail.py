@@ -1,9 +1,11 @@
 import base64
 import logging
 import platform
+import sqlite3
 import subprocess
 from typing import Optional
 
+from apple_mail.envelope_index import EnvelopeIndex
 from apple_notifications.notifier import Notifier
 from utils.osascript import escape_osascript as _escape_osascript
 from utils.subprocess import run_with_cleanup
@@ -16,6 +18,9 @@ _DEFAULT_TIMEOUT = 15
 _SEND_TIMEOUT = 30
 _FIELD_SEP = "|||"
 _RECORD_SEP = "~~~RECORD~~~"
+# Bulk updates run one osascript per batch; the timeout grows with its size.
+_BULK_BATCH_SIZE = 100
+_BULK_SECONDS_PER_MESSAGE = 1
 
 
 def _run_applescript(script: str, timeout: int = _DEFAULT_TIMEOUT) -> dict:
@@ -51,11 +56,41 @@ def _parse_fields(record: str) -> list[str]:
     return [f.strip() for f in record.split(_FIELD_SEP)]
 
 
+def _mailbox_ref(mailbox: str, account: str = "") -> str:
+    """AppleScript reference to a mailbox; the first account when none is given."""
+    mailbox_esc = _escape_osascript(mailbox)
+    if account:
+        return f'mailbox "{mailbox_esc}" of account "{_escape_osascript(account)}"'
+    return f'mailbox "{mailbox_esc}" of account 1'
+
+
 class MailStore:
-    """Read, search, and manage Apple Mail via AppleScript."""
+    """Read, search, and manage Apple Mail via AppleScript.
+
+    With an ``EnvelopeIndex``, mailbox listings, header listings and searches
+    are read from Mail's SQLite index instead, falling back to AppleScript
+    when the index is missing, unreadable, or does not know the mailbox.
+    """
+
+    def __init__(self, envelope_index: Optional[EnvelopeIndex] = None):
+        self.envelope_index = envelope_index
+
+    def _from_index(self, method: str, *args, **kwargs) -> Optional[list[dict]]:
+        """Result of an EnvelopeIndex read, or None to fall back to AppleScript."""
+        index = self.envelope_index
+        if index is None or not index.available():
+            return None
+        try:
+            return getattr(index, method)(*args, **kwargs)
+        except (LookupError, sqlite3.Error) as e:
+            logger.info("Mail index %s unavailable, using AppleScript: %s", method, e)
+            return None
 
     def list_mailboxes(self) -> list[dict]:
         """List all mailboxes across all accounts with unread counts."""
+        indexed = self._from_index("list_mailboxes")
+        if indexed is not None:
+            return indexed
         script = '''
 tell application "Mail"
     set output to ""
@@ -86,14 +121,15 @@ end tell
         return mailboxes
 
     def get_messages(self, mailbox: str = "INBOX", account: str = "", limit: int = 25) -> list[dict]:
-        """Get recent messages (headers only) from a mailbox. Limit capped at 100."""
+        """Get recent messages (headers only) from a mailbox.
+
+        Limit is capped at 100 over AppleScript and 500 from the index.
+        """
+        indexed = self._from_index("get_messages", mailbox=mailbox, account=account, limit=limit)
+        if indexed is not None:
+            return indexed
         limit = min(max(1, limit), 100)
-        mailbox_esc = _escape_osascript(mailbox)
-        if account:
-            account_esc = _escape_osascript(account)
-            mailbox_ref = f'mailbox "{mailbox_esc}" of account "{account_esc}"'
-        else:
-            mailbox_ref = f'mailbox "{mailbox_esc}" of account 1'
+        mailbox_ref = _mailbox_ref(mailbox, account)
         script = f'''
 tell application "Mail"
     set mb to {mailbox_ref}
@@ -201,14 +237,12 @@ end tell
 
     def search_messages(self, query: str, mailbox: str = "INBOX", account: str = "", limit: int = 25) -> list[dict]:
         """Search messages by subject or sender text in a mailbox."""
+        indexed = self._from_index("search_messages", query=query, mailbox=mailbox, account=account, limit=limit)
+        if indexed is not None:
+            return indexed
         limit = min(max(1, limit), 100)
         query_esc = _escape_osascript(query)
-        mailbox_esc = _escape_osascript(mailbox)
-        if account:
-            account_esc = _escape_osascript(account)
-            mailbox_ref = f'mailbox "{mailbox_esc}" of account "{account_esc}"'
-        else:
-            mailbox_ref = f'mailbox "{mailbox_esc}" of account 1'
+        mailbox_ref = _mailbox_ref(mailbox, account)
         script = f'''
 tell application "Mail"
     set mb to {mailbox_ref}
@@ -308,12 +342,7 @@ end tell
     def move_message(self, message_id: str, target_mailbox: str, target_account: str = "") -> dict:
         """Move a message to a different mailbox."""
         mid_esc = _escape_osascript(message_id)
-        target_mb_esc = _escape_osascript(target_mailbox)
-        if target_account:
-            target_acct_esc = _escape_osascript(target_account)
-            target_ref = f'mailbox "{target_mb_esc}" of account "{target_acct_esc}"'
-        else:
-            target_ref = f'mailbox "{target_mb_esc}" of account 1'
+        target_ref = _mailbox_ref(target_mailbox, target_account)
         script = f'''
 tell application "Mail"
     set targetMb to {target_ref}
@@ -338,6 +367,113 @@ end tell
             return {"error": result["output"]}
         return {"status": "ok", "message_id": message_id, "moved_to": target_mailbox}
 
+    def _bulk_update(self, message_ids: list[str], action: str, setup: str = "") -> dict:
+        """Apply one AppleScript *action* on ``foundMsg`` to each message id.
+
+        Each batch of up to _BULK_BATCH_SIZE ids is a single osascript run
+        that walks the mailboxes once, reading all message ids of a mailbox in
+        one Apple Event and matching the pending ids against them, and reports
+        a status per id. One missing or failing message does not stop the
+        rest, and a failed run marks only its own batch as failed. Returns
+        {'error': ...} only if every batch fails.
+        """
+        ids = list(dict.fromkeys(mid.strip() for mid in message_ids if mid and mid.strip()))
+        if not ids:
+            return {"error": "message_ids must contain at least one message ID"}
+        statuses: dict[str, str] = {}
+        batch_errors: list[dict] = []
+        batches = [ids[start:start + _BULK_BATCH_SIZE] for start in range(0, len(ids), _BULK_BATCH_SIZE)]
+        for batch in batches:
+            id_list = ", ".join(f'"{_escape_osascript(mid)}"' for mid in batch)
+            script = f'''
+tell application "Mail"
+    {setup}
+    set output to ""
+    set pending to {{{id_list}}}
+    repeat with acct in accounts
+        repeat with mb in mailboxes of acct
+            if (count of pending) is 0 then exit repeat
+            try
+                set mbIds to message id of messages of mb
+                set stillPending to {{}}
+                repeat with idRef in pending
+                    set targetId to idRef as text
+                    if mbIds contains targetId then
+                        try
+                            set foundMsg to first message of mb whose message id is targetId
+                            {action}
+                            set itemStatus to "OK"
+                        on error errMsg
+                            set itemStatus to "ERROR: " & errMsg
+                        end try
+                        set output to output & targetId & "|||" & itemStatus & return & "~~~RECORD~~~" & return
+                    else
+                        set end of stillPending to targetId
+                    end if
+                end repeat
+                set pending to stillPending
+            end try
+        end repeat
+        if (count of pending) is 0 then exit repeat
+    end repeat
+    repeat with idRef in pending
+        set output to output & (idRef as text) & "|||ERROR: Message not found" & return & "~~~RECORD~~~" & return
+    end repeat
+    return output
+end tell
+'''
+            timeout = _DEFAULT_TIMEOUT + _BULK_SECONDS_PER_MESSAGE * len(batch)
+            result = _run_applescript(script, timeout=timeout)
+            if "error" in result:
+                batch_errors.append(result)
+                statuses.update({mid: f"ERROR: {result['error']}" for mid in batch})
+                continue
+            for rec in _parse_records(result["output"]):
+                fields = _parse_fields(rec)
+                if len(fields) >= 2:
+                    statuses[fields[0]] = fields[1]
+        if len(batch_errors) == len(batches):
+            return batch_errors[0]
+
+        results = []
+        for mid in ids:
+            status = statuses.get(mid, "ERROR: No status returned")
+            if status == "OK":
+                results.append({"message_id": mid, "status": "ok"})
+            else:
+                results.append({"message_id": mid, "error": status})
+        failed = sum(1 for r in results if "error" in r)
+        return {
+            "status": "ok" if not failed else ("partial" if failed < len(results) else "failed"),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "results": results,
+        }
+
+    def mark_read_bulk(self, message_ids: list[str], read: bool = True) -> dict:
+        """Mark several messages read or unread in one AppleScript run."""
+        read_val = "true" if read else "false"
+        result = self._bulk_update(message_ids, f"set read status of foundMsg to {read_val}")
+        if "error" not in result:
+            result["read"] = read
+        return result
+
+    def mark_flagged_bulk(self, message_ids: list[str], flagged: bool = True) -> dict:
+        """Flag or unflag several messages in one AppleScript run."""
+        flag_val = "true" if flagged else "false"
+        result = self._bulk_update(message_ids, f"set flagged status of foundMsg to {flag_val}")
+        if "error" not in result:
+            result["flagged"] = flagged
+        return result
+
+    def move_messages_bulk(self, message_ids: list[str], target_mailbox: str, target_account: str = "") -> dict:
+        """Move several messages to one mailbox in one AppleScript run."""
+        setup = f"set targetMb to {_mailbox_ref(target_mailbox, target_account)}"
+        result = self._bulk_update(message_ids, "move foundMsg to targetMb", setup=setup)
+        if "error" not in result:
+            result["moved_to"] = target_mailbox
+        return result
+
     def reply_message(
         self,
         message_id: str,
@@ -3,6 +3,7 @@ import logging
 import platform
 import sqlite3
 import subprocess
+import threading
 import time
 from pathlib import Path
 from datetime import UTC, datetime
@@ -71,6 +72,11 @@ class MessageStore:
             else (_project_root() / "data" / "imessage-thread-profiles.db")
         )
         self.profile_db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._profile_lock = threading.Lock()
+        self._profile_connection: sqlite3.Connection | None = None
+        # chat_identifier -> profile (None if absent), valid for _profile_cache_version.
+        self._profile_cache: dict[str, dict | None] = {}
+        self._profile_cache_version: int | None = None
         self._init_profile_db()
 
     def _open_chat_db(self) -> sqlite3.Connection:
@@ -134,40 +140,102 @@ class MessageStore:
             )
             conn.commit()
 
-    def _upsert_thread_observation(self, chat_identifier: str, sender: str, date_local: str) -> None:
-        chat_identifier = (chat_identifier or "").strip()
-        sender = (sender or "").strip()
-        date_local = (date_local or "").strip()
-        if not chat_identifier:
+    def _profile_conn(self) -> sqlite3.Connection:
+        """Long-lived profile DB connection; use under ``self._profile_lock``."""
+        if self._profile_connection is None:
+            conn = sqlite3.connect(self.profile_db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            self._profile_connection = conn
+        return self._profile_connection
+
+    def close(self) -> None:
+        with self._profile_lock:
+            if self._profile_connection is not None:
+                self._profile_connection.close()
+                self._profile_connection = None
+            self._profile_cache.clear()
+
+    @staticmethod
+    def _aggregate_observations(
+        rows: list[dict],
+    ) -> tuple[list[tuple[str, str, str]], dict[tuple[str, str], str]]:
+        """Collapse message rows into the latest observation per thread and member.
+
+        Returns (threads, members): one (chat_identifier, last_sender,
+        last_seen_at) per thread, where last_sender is the sender of its
+        newest row (later rows win ties), and (chat_identifier, handle) ->
+        newest date for every named sender.
+        """
+        latest: dict[str, tuple[str, str]] = {}
+        members: dict[tuple[str, str], str] = {}
+        for row in rows:
+            chat_identifier = str(row.get("chat_identifier", "")).strip()
+            if not chat_identifier:
+                continue
+            sender = str(row.get("sender", "")).strip()
+            date_local = str(row.get("date_local", "")).strip()
+            current = latest.get(chat_identifier)
+            if current is None or current[1] <= date_local:
+                latest[chat_identifier] = (sender, date_local)
+            if sender and members.get((chat_identifier, sender), "") <= date_local:
+                members[(chat_identifier, sender)] = date_local
+        threads = [(chat, sender, date_local) for chat, (sender, date_local) in latest.items()]
+        return threads, members
+
+    def _record_observations(self, rows: list[dict]) -> None:
+        """Persist thread and member observations from *rows* in one transaction."""
+        threads, members = self._aggregate_observations(rows)
+        if not threads:
             return
+        # A thread with no prior preferred handle takes its newest named sender.
+        preferred: dict[str, tuple[str, str]] = {}
+        for (chat_identifier, handle), date_local in members.items():
+            best = preferred.get(chat_identifier)
+            if best is None or best[1] < date_local:
+                preferred[chat_identifier] = (handle, date_local)
         now = self._utc_now_iso()
-        with self._open_profile_db() as conn:
-            conn.execute(
-                """
-                INSERT INTO thread_profiles(
-                    chat_identifier, display_name, preferred_handle, notes, auto_reply_mode,
-                    last_seen_at, last_sender, updated_at_utc
-                )
-                VALUES(?, NULL, ?, NULL, 'manual', ?, ?, ?)
-                ON CONFLICT(chat_identifier) DO UPDATE SET
-                    preferred_handle = CASE
-                        WHEN COALESCE(thread_profiles.preferred_handle, '') = '' THEN excluded.preferred_handle
-                        ELSE thread_profiles.preferred_handle
-                    END,
-                    last_seen_at = CASE
-                        WHEN COALESCE(thread_profiles.last_seen_at, '') <= COALESCE(excluded.last_seen_at, '')
-                        THEN excluded.last_seen_at ELSE thread_profiles.last_seen_at
-                    END,
-                    last_sender = CASE
-                        WHEN COALESCE(thread_profiles.last_seen_at, '') <= COALESCE(excluded.last_seen_at, '')
-                        THEN excluded.last_sender ELSE thread_profiles.last_sender
-                    END,
-                    updated_at_utc = excluded.updated_at_utc
-                """,
-                (chat_identifier, sender or None, date_local or None, sender or None, now),
+        profile_params = [
+            (
+                chat_identifier,
+                preferred.get(chat_identifier, ("", ""))[0] or None,
+                date_local or None,
+                sender or None,
+                now,
             )
-            if sender:
-                conn.execute(
+            for chat_identifier, sender, date_local in threads
+        ]
+        member_params = [
+            (chat_identifier, handle, date_local or None)
+            for (chat_identifier, handle), date_local in members.items()
+        ]
+        with self._profile_lock:
+            conn = self._profile_conn()
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO thread_profiles(
+                        chat_identifier, display_name, preferred_handle, notes, auto_reply_mode,
+                        last_seen_at, last_sender, updated_at_utc
+                    )
+                    VALUES(?, NULL, ?, NULL, 'manual', ?, ?, ?)
+                    ON CONFLICT(chat_identifier) DO UPDATE SET
+                        preferred_handle = CASE
+                            WHEN COALESCE(thread_profiles.preferred_handle, '') = '' THEN excluded.preferred_handle
+                            ELSE thread_profiles.preferred_handle
+                        END,
+                        last_seen_at = CASE
+                            WHEN COALESCE(thread_profiles.last_seen_at, '') <= COALESCE(excluded.last_seen_at, '')
+                            THEN excluded.last_seen_at ELSE thread_profiles.last_seen_at
+                        END,
+                        last_sender = CASE
+                            WHEN COALESCE(thread_profiles.last_seen_at, '') <= COALESCE(excluded.last_seen_at, '')
+                            THEN excluded.last_sender ELSE thread_profiles.last_sender
+                        END,
+                        updated_at_utc = excluded.updated_at_utc
+                    """,
+                    profile_params,
+                )
+                conn.executemany(
                     """
                     INSERT INTO thread_members(chat_identifier, handle, last_seen_at)
                     VALUES(?, ?, ?)
@@ -177,64 +245,71 @@ class MessageStore:
                             THEN excluded.last_seen_at ELSE thread_members.last_seen_at
                         END
                     """,
-                    (chat_identifier, sender, date_local or None),
+                    member_params,
                 )
-            conn.commit()
-
-    def _record_observations(self, rows: list[dict]) -> None:
-        seen: set[tuple[str, str, str]] = set()
-        for row in rows:
-            chat_identifier = str(row.get("chat_identifier", "")).strip()
-            sender = str(row.get("sender", "")).strip()
-            date_local = str(row.get("date_local", "")).strip()
-            key = (chat_identifier, sender, date_local)
-            if key in seen:
-                continue
-            seen.add(key)
-            self._upsert_thread_observation(chat_identifier, sender, date_local)
+            for chat_identifier, _, _ in threads:
+                self._profile_cache.pop(chat_identifier, None)
 
     def _load_profiles(self, chat_ids: list[str]) -> dict[str, dict]:
-        chat_ids = [c for c in chat_ids if c]
+        """Profiles for *chat_ids*, served from a cache where possible.
+
+        Our own writes invalidate the threads they touch. Writes through any
+        other connection bump SQLite's ``data_version``, which clears the cache.
+        """
+        chat_ids = list(dict.fromkeys(c for c in chat_ids if c))
         if not chat_ids:
             return {}
-        placeholders = ",".join("?" for _ in chat_ids)
-        with self._open_profile_db() as conn:
-            rows = conn.execute(
-                f"""
-                SELECT
-                    p.chat_identifier,
-                    COALESCE(p.display_name, '') AS display_name,
-                    COALESCE(p.preferred_handle, '') AS preferred_handle,
-                    COALESCE(p.notes, '') AS notes,
-                    COALESCE(p.auto_reply_mode, 'manual') AS auto_reply_mode,
-                    COALESCE(p.last_seen_at, '') AS last_seen_at,
-                    COALESCE(p.last_sender, '') AS last_sender,
-                    COALESCE(
-                        (
-                            SELECT group_concat(m.handle, '|||')
-                            FROM thread_members m
-                            WHERE m.chat_identifier = p.chat_identifier
-                        ),
-                        ''
-                    ) AS members
-                FROM thread_profiles p
-                WHERE p.chat_identifier IN ({placeholders})
-                """,
-                tuple(chat_ids),
-            ).fetchall()
-        profiles: dict[str, dict] = {}
-        for row in rows:
-            members = [m for m in row["members"].split("|||") if m] if row["members"] else []
-            profiles[row["chat_identifier"]] = {
-                "display_name": row["display_name"] or "",
-                "preferred_handle": row["preferred_handle"] or "",
-                "notes": row["notes"] or "",
-                "auto_reply_mode": row["auto_reply_mode"] or "manual",
-                "last_seen_at": row["last_seen_at"] or "",
-                "last_sender": row["last_sender"] or "",
-                "members": members,
-            }
-        return profiles
+        with self._profile_lock:
+            conn = self._profile_conn()
+            version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if version != self._profile_cache_version:
+                self._profile_cache.clear()
+                self._profile_cache_version = version
+            missing = [c for c in chat_ids if c not in self._profile_cache]
+            if missing:
+                placeholders = ",".join("?" for _ in missing)
+                rows = conn.execute(
+                    f"""
+                    SELECT
+                        p.chat_identifier,
+                        COALESCE(p.display_name, '') AS display_name,
+                        COALESCE(p.preferred_handle, '') AS preferred_handle,
+                        COALESCE(p.notes, '') AS notes,
+                        COALESCE(p.auto_reply_mode, 'manual') AS auto_reply_mode,
+                        COALESCE(p.last_seen_at, '') AS last_seen_at,
+                        COALESCE(p.last_sender, '') AS last_sender,
+                        COALESCE(
+                            (
+                                SELECT group_concat(m.handle, '|||')
+                                FROM thread_members m
+                                WHERE m.chat_identifier = p.chat_identifier
+                            ),
+                            ''
+                        ) AS members
+                    FROM thread_profiles p
+                    WHERE p.chat_identifier IN ({placeholders})
+                    """,
+                    tuple(missing),
+                ).fetchall()
+                for chat_identifier in missing:
+                    self._profile_cache[chat_identifier] = None
+                for row in rows:
+                    members = [m for m in row["members"].split("|||") if m] if row["members"] else []
+                    self._profile_cache[row["chat_identifier"]] = {
+                        "display_name": row["display_name"] or "",
+                        "preferred_handle": row["preferred_handle"] or "",
+                        "notes": row["notes"] or "",
+                        "auto_reply_mode": row["auto_reply_mode"] or "manual",
+                        "last_seen_at": row["last_seen_at"] or "",
+                        "last_sender": row["last_sender"] or "",
+                        "members": members,
+                    }
+            cached = {c: self._profile_cache[c] for c in chat_ids}
+        return {
+            chat_identifier: {**profile, "members": list(profile["members"])}
+            for chat_identifier, profile in cached.items()
+            if profile is not None
+        }
 
     def get_messages(
         self,
@@ -588,7 +663,8 @@ class MessageStore:
         if not handle:
             return {"handle": handle, "found_in_threads": False, "chat_identifiers": [], "display_names": []}
 
-        with self._open_profile_db() as conn:
+        with self._profile_lock:
+            conn = self._profile_conn()
             # Find all threads where this handle is a member
             member_rows = conn.execute(
                 "SELECT chat_identifier FROM thread_members WHERE handle = ?",
@@ -1,15 +1,23 @@
-"""EventKit wrapper for macOS Reminders access via PyObjC."""
+"""EventKit wrapper for macOS Reminders access via PyObjC.
 
+Reads are served from a ``ReminderIndex`` built from one fetch of every
+reminder; it is invalidated by ``EKEventStoreChangedNotification`` and
+otherwise rebuilt after a short TTL.
+"""
+
+import asyncio
 import logging
 import threading
 from datetime import datetime
 from typing import Optional
 
+from apple_reminders.index import ReminderIndex
+
 logger = logging.getLogger(__name__)
 
 try:
     import EventKit  # noqa: N811
-    from Foundation import NSDate, NSDateComponents, NSCalendar
+    from Foundation import NSDate, NSDateComponents, NSCalendar, NSNotificationCenter
 
     _EVENTKIT_AVAILABLE = True
 except ImportError:
@@ -29,6 +37,9 @@ _PERMISSION_ERROR = {
 # EKEntityType constants
 _EK_ENTITY_TYPE_REMINDER = 1
 
+# Seconds to wait for a fetchRemindersMatchingPredicate completion handler
+_FETCH_TIMEOUT_SECONDS = 10
+
 # Priority map for human-readable output
 _PRIORITY_MAP = {0: "none", 1: "high", 4: "medium", 9: "low"}
 
@@ -79,9 +90,12 @@ class ReminderStore:
     return plain dicts so callers never need to touch PyObjC objects.
     """
 
-    def __init__(self):
+    def __init__(self, index_ttl_seconds: float = 30.0):
         self._store = None
         self._access_granted: Optional[bool] = None
+        self._index = ReminderIndex(ttl_seconds=index_ttl_seconds)
+        self._index_lock = threading.Lock()
+        self._change_observer = None
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -98,6 +112,7 @@ class ReminderStore:
 
         if self._store is None:
             self._store = EventKit.EKEventStore.alloc().init()
+            self._observe_changes()
 
         if self._access_granted is None:
             self._access_granted = self._request_access()
@@ -107,6 +122,22 @@ class ReminderStore:
 
         return None
 
+    def _observe_changes(self) -> None:
+        """Invalidate the index when another process changes reminders.
+
+        The notification is only delivered while something services the
+        main run loop; the index TTL covers processes that never do.
+        """
+        try:
+            self._change_observer = NSNotificationCenter.defaultCenter().addObserverForName_object_queue_usingBlock_(
+                EventKit.EKEventStoreChangedNotification,
+                self._store,
+                None,
+                lambda _notification: self._index.invalidate(),
+            )
+        except (AttributeError, TypeError, RuntimeError) as e:
+            logger.debug("Could not observe EKEventStoreChangedNotification: %s", e)
+
     def _request_access(self) -> bool:
         """Request Reminders access synchronously."""
         granted_flag = threading.Event()
@@ -154,20 +185,53 @@ class ReminderStore:
             done.set()
 
         self._store.fetchRemindersMatchingPredicate_completion_(predicate, handler)
-        done.wait(timeout=10)
+        if not done.wait(timeout=_FETCH_TIMEOUT_SECONDS):
+            raise RuntimeError(f"Reminders fetch timed out after {_FETCH_TIMEOUT_SECONDS}s")
         return results
 
+    async def _fetch_reminders_async(self, predicate) -> list:
+        """Execute a reminder fetch with predicate, awaiting the completion handler."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve(reminders):
+            if not future.done():
+                future.set_result(reminders)
+
+        def handler(reminders):
+            # EventKit calls back on its own queue; hand the result to the loop.
+            try:
+                loop.call_soon_threadsafe(resolve, list(reminders) if reminders else [])
+            except RuntimeError:
+                pass  # loop closed after the caller gave up
+
+        self._store.fetchRemindersMatchingPredicate_completion_(predicate, handler)
+        try:
+            return await asyncio.wait_for(future, _FETCH_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"Reminders fetch timed out after {_FETCH_TIMEOUT_SECONDS}s") from None
+
+    def _load_index(self) -> ReminderIndex:
+        """The reminder index, refetching every reminder if it is stale."""
+        with self._index_lock:
+            if not self._index.fresh():
+                generation = self._index.generation
+                raw_reminders = self._fetch_reminders(self._store.predicateForRemindersInCalendars_(None))
+                self._index.replace(((_reminder_to_dict(r), r) for r in raw_reminders), generation)
+        return self._index
+
     def _find_reminder_by_id(self, reminder_id: str):
         """Find a single EKReminder by its external identifier."""
+        if self._index.fresh():
+            item = self._index.item(reminder_id)
+            if item is not None:
+                return item
         item = self._store.calendarItemWithIdentifier_(reminder_id)
         if item is not None:
             return item
-        # Fallback: fetch all reminders and filter
-        predicate = self._store.predicateForRemindersInCalendars_(None)
-        for r in self._fetch_reminders(predicate):
-            if str(r.calendarItemExternalIdentifier()) == reminder_id:
-                return r
-        return None
+        # calendarItemWithIdentifier_ takes the local id; external ids
+        # are resolved through the index.
+        return self._load_index().item(reminder_id)
 
     # ------------------------------------------------------------------
     # Public API
@@ -218,36 +282,62 @@ class ReminderStore:
         err = self._ensure_store()
         if err is not None:
             return [err]
-        store = self._store
         err = self._check_access()
         if err:
             return [err]
 
         try:
-            calendars = None
             if list_name:
                 cal = self._get_reminder_list_by_name(list_name)
                 if not cal:
                     return [{"error": f"Reminder list '{list_name}' not found"}]
-                calendars = [cal]
-
-            if completed is True:
-                predicate = store.predicateForCompletedRemindersWithCompletionDateStarting_ending_calendars_(
-                    None, None, calendars
-                )
-            elif completed is False:
-                predicate = store.predicateForIncompleteRemindersWithDueDateStarting_ending_calendars_(
-                    None, None, calendars
-                )
-            else:
-                predicate = store.predicateForRemindersInCalendars_(calendars)
+                list_name = str(cal.title())
 
-            raw_reminders = self._fetch_reminders(predicate)
-            return [_reminder_to_dict(r) for r in raw_reminders]
+            return self._load_index().reminders(list_name=list_name or None, completed=completed)
         except (AttributeError, TypeError, RuntimeError) as e:
             logger.error("PyObjC error getting reminders: %s", e)
             return [{"error": f"Failed to get reminders: {e}"}]
 
+    def due_reminders(self, before: Optional[datetime] = None, include_completed: bool = False) -> list[dict]:
+        """Reminders due at or before *before* (default: the end of today), earliest first."""
+        err = self._ensure_store()
+        if err is not None:
+            return [err]
+        err = self._check_access()
+        if err:
+            return [err]
+
+        if before is None:
+            before = datetime.now().replace(hour=23, minute=59, second=59, microsecond=999999)
+        try:
+            return self._load_index().due_before(
+                before.isoformat(), completed=None if include_completed else False
+            )
+        except (AttributeError, TypeError, RuntimeError) as e:
+            logger.error("PyObjC error getting due reminders: %s", e)
+            return [{"error": f"Failed to get due reminders: {e}"}]
+
+    async def refresh_index_async(self) -> dict:
+        """Rebuild the reminder index without blocking the event loop.
+
+        Returns the number of reminders indexed, or an error dict.
+        """
+        err = await asyncio.to_thread(self._ensure_store)
+        if err is not None:
+            return err
+        err = self._check_access()
+        if err:
+            return err
+
+        try:
+            generation = self._index.generation
+            raw_reminders = await self._fetch_reminders_async(self._store.predicateForRemindersInCalendars_(None))
+            self._index.replace(((_reminder_to_dict(r), r) for r in raw_reminders), generation)
+            return {"indexed": len(self._index)}
+        except (AttributeError, TypeError, RuntimeError) as e:
+            logger.error("PyObjC error indexing reminders: %s", e)
+            return {"error": f"Failed to index reminders: {e}"}
+
     def create_reminder(
         self,
         title: str,
@@ -305,7 +395,9 @@ class ReminderStore:
             if not success:
                 return {"error": f"Failed to save reminder: {error}"}
 
-            return _reminder_to_dict(reminder)
+            result = _reminder_to_dict(reminder)
+            self._index.upsert(result, reminder)
+            return result
         except (AttributeError, TypeError, RuntimeError, ValueError) as e:
             logger.error("Error creating reminder: %s", e)
             return {"error": f"Failed to create reminder: {e}"}
@@ -330,7 +422,9 @@ class ReminderStore:
             if not success:
                 return {"error": f"Failed to complete reminder: {error}"}
 
-            return _reminder_to_dict(reminder)
+            result = _reminder_to_dict(reminder)
+            self._index.upsert(result, reminder)
+            return result
         except (AttributeError, TypeError, RuntimeError) as e:
             logger.error("PyObjC error completing reminder: %s", e)
             return {"error": f"Failed to complete reminder: {e}"}
@@ -350,9 +444,11 @@ class ReminderStore:
             if reminder is None:
                 return {"error": f"Reminder not found: {reminder_id}"}
 
+            external_id = str(reminder.calendarItemExternalIdentifier())
             success, error = store.removeReminder_commit_error_(reminder, True, None)
             if not success:
                 return {"error": f"Failed to delete reminder: {error}"}
+            self._index.remove(external_id)
             return {"status": "deleted", "reminder_id": reminder_id}
         except (AttributeError, TypeError, RuntimeError) as e:
             logger.error("PyObjC error deleting reminder: %s", e)
@@ -372,27 +468,14 @@ class ReminderStore:
         err = self._ensure_store()
         if err is not None:
             return [err]
-        store = self._store
         err = self._check_access()
         if err:
             return [err]
 
         try:
-            if include_completed:
-                predicate = store.predicateForRemindersInCalendars_(None)
-            else:
-                predicate = store.predicateForIncompleteRemindersWithDueDateStarting_ending_calendars_(
-                    None, None, None
-                )
-
-            raw_reminders = self._fetch_reminders(predicate)
+            reminders = self._load_index().reminders(completed=None if include_completed else False)
             query_lower = query.lower()
-            results = []
-            for r in raw_reminders:
-                title = str(r.title()) if r.title() else ""
-                if query_lower in title.lower():
-                    results.append(_reminder_to_dict(r))
-            return results
+            return [r for r in reminders if query_lower in r["title"].lower()]
         except (AttributeError, TypeError, RuntimeError) as e:
             logger.error("PyObjC error searching reminders: %s", e)
             return [{"error": f"Failed to search reminders: {e}"}]
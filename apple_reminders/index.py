@@ -0,0 +1,123 @@
+"""In-process index of reminders keyed by id, list and due date.
+
+EventKit only hands reminders out through an asynchronous predicate fetch
+that walks every list, so ``ReminderStore`` keeps the last full fetch here
+and answers id lookups, list filters and due-date queries from memory.
+
+The index is rebuilt when it is older than its TTL or has been invalidated
+(``EKEventStoreChangedNotification``, or a write through the store). A
+rebuild that started before an invalidation does not mark the index fresh,
+so a change that lands mid-fetch is picked up on the next read.
+"""
+
+import bisect
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional
+
+
+class ReminderIndex:
+    """Reminder dicts plus the EKReminder each came from.
+
+    Lookups by id are O(1); due-date queries bisect a list sorted by
+    ISO due date. All reads return copies of the stored dicts.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._by_id: dict[str, dict] = {}
+        self._items: dict[str, Any] = {}
+        self._by_list: dict[str, dict[str, None]] = {}
+        self._due: list[tuple[str, str]] = []
+        self._loaded_at: Optional[float] = None
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Bumped on every invalidation; pass it back to ``replace``."""
+        return self._generation
+
+    def fresh(self) -> bool:
+        loaded_at = self._loaded_at
+        return loaded_at is not None and self._clock() - loaded_at < self.ttl_seconds
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded_at = None
+            self._generation += 1
+
+    def replace(self, entries: Iterable[tuple[dict, Any]], generation: Optional[int] = None) -> None:
+        """Swap in a full fetch of (reminder dict, EKReminder) pairs.
+
+        If *generation* is given and the index was invalidated since it was
+        read, the entries are stored but the index stays stale.
+        """
+        by_id: dict[str, dict] = {}
+        items: dict[str, Any] = {}
+        for reminder, item in entries:
+            by_id[reminder["id"]] = reminder
+            items[reminder["id"]] = item
+        by_list: dict[str, dict[str, None]] = {}
+        for reminder_id, reminder in by_id.items():
+            by_list.setdefault(reminder.get("list_name") or "", {})[reminder_id] = None
+        due = sorted((r["due_date"], rid) for rid, r in by_id.items() if r.get("due_date"))
+        with self._lock:
+            self._by_id, self._items, self._by_list, self._due = by_id, items, by_list, due
+            if generation is None or generation == self._generation:
+                self._loaded_at = self._clock()
+
+    def upsert(self, reminder: dict, item: Any = None) -> None:
+        """Add or update one reminder after a local write."""
+        with self._lock:
+            reminder_id = reminder["id"]
+            self._discard(reminder_id)
+            self._by_id[reminder_id] = dict(reminder)
+            self._items[reminder_id] = item
+            self._by_list.setdefault(reminder.get("list_name") or "", {})[reminder_id] = None
+            if reminder.get("due_date"):
+                bisect.insort(self._due, (reminder["due_date"], reminder_id))
+
+    def remove(self, reminder_id: str) -> None:
+        with self._lock:
+            self._discard(reminder_id)
+
+    def _discard(self, reminder_id: str) -> None:
+        old = self._by_id.pop(reminder_id, None)
+        self._items.pop(reminder_id, None)
+        if old is None:
+            return
+        self._by_list.get(old.get("list_name") or "", {}).pop(reminder_id, None)
+        if old.get("due_date"):
+            key = (old["due_date"], reminder_id)
+            i = bisect.bisect_left(self._due, key)
+            if i < len(self._due) and self._due[i] == key:
+                del self._due[i]
+
+    def get(self, reminder_id: str) -> Optional[dict]:
+        reminder = self._by_id.get(reminder_id)
+        return dict(reminder) if reminder is not None else None
+
+    def item(self, reminder_id: str) -> Any:
+        """The EKReminder behind *reminder_id*, or None."""
+        return self._items.get(reminder_id)
+
+    def reminders(self, list_name: Optional[str] = None, completed: Optional[bool] = None) -> list[dict]:
+        """Reminders in fetch order, optionally in one list and completion state."""
+        with self._lock:
+            if list_name is None:
+                selected = list(self._by_id.values())
+            else:
+                selected = [self._by_id[rid] for rid in self._by_list.get(list_name, {})]
+        return [dict(r) for r in selected if completed is None or r["completed"] == completed]
+
+    def due_before(self, end: str, completed: Optional[bool] = False) -> list[dict]:
+        """Reminders due at or before ISO timestamp *end*, earliest first."""
+        with self._lock:
+            stop = bisect.bisect_right(self._due, (end, "\uffff"))
+            selected = [self._by_id[rid] for _, rid in self._due[:stop]]
+        return [dict(r) for r in selected if completed is None or r["completed"] == completed]
+
+    def __len__(self) -> int:
+        return len(self._by_id)
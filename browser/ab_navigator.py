@@ -6,11 +6,22 @@ agent-browser daemon.
 
 Uses keyboard shortcuts for navigation (reliable) and snapshot parsing
 for element identification (resilient to DOM changes).
+
+Snapshots are parsed once into a ``SnapshotIndex`` and reused until the page
+may have changed. Any command the navigator (or anything else sharing the
+AgentBrowser) sends that can change the page bumps the browser's generation
+counter and invalidates the cached snapshot; an unchanged generation is
+trusted for ``SNAPSHOT_MAX_AGE_SECONDS``, since probing the DOM would cost
+an agent-browser process of its own. Repeated keyword lookups against one
+snapshot are dictionary hits. ``ABNavigator.snapshot_hits`` and
+``snapshot_misses`` count how often the cache was used.
 """
 
 import asyncio
 import logging
 import re
+import time
+from dataclasses import dataclass
 from typing import Optional
 
 from browser.agent_browser import AgentBrowser, AgentBrowserError
@@ -21,6 +32,13 @@ logger = logging.getLogger(__name__)
 SHORTCUT_NEW_MESSAGE = "Control+Shift+KeyN"
 SHORTCUT_SEARCH = "Meta+e"
 
+# How long a cached snapshot is trusted while the browser generation is unchanged.
+SNAPSHOT_MAX_AGE_SECONDS = 2.0
+
+_REF_INLINE = re.compile(r"\[ref=(e\d+)\]")
+_REF_PREFIX = re.compile(r"(@e\d+)\s+(.*)")
+_WORD = re.compile(r"\w+")
+
 # Patterns that look like date-separator headings in the chat area
 _DATE_WORDS = re.compile(
     r"(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday"
@@ -31,6 +49,83 @@ _DATE_WORDS = re.compile(
 )
 
 
+def _parse_snapshot_line(line: str) -> Optional[tuple[str, str]]:
+    """(ref, description) for one snapshot line, or None if it has no ref.
+
+    Handles two formats:
+    - Real agent-browser: ``- heading "Chat" [ref=e17] [level=1]``
+    - Legacy/test:        ``@e17 heading 'Chat'``
+    """
+    line = line.strip()
+    ref_match = _REF_INLINE.search(line)
+    if ref_match:
+        return "@" + ref_match.group(1), line
+    prefix_match = _REF_PREFIX.match(line)
+    if prefix_match:
+        return prefix_match.group(1), prefix_match.group(2)
+    return None
+
+
+class SnapshotIndex:
+    """One parsed snapshot with a word index and memoized keyword lookups.
+
+    *previous* is the snapshot this one replaces: lines present in both are
+    not re-parsed.
+    """
+
+    def __init__(self, text: str, previous: Optional["SnapshotIndex"] = None) -> None:
+        known = previous._parsed if previous is not None else {}
+        self._parsed: dict[str, Optional[tuple[str, str]]] = {}
+        self.pairs: list[tuple[str, str]] = []
+        for line in text.strip().split("\n"):
+            if line not in self._parsed:
+                self._parsed[line] = known[line] if line in known else _parse_snapshot_line(line)
+            parsed = self._parsed[line]
+            if parsed is not None:
+                self.pairs.append(parsed)
+        self._lowered = [desc.lower() for _, desc in self.pairs]
+        self._words: dict[str, list[int]] = {}
+        for position, desc in enumerate(self._lowered):
+            for word in set(_WORD.findall(desc)):
+                self._words.setdefault(word, []).append(position)
+        self._found: dict[tuple[str, ...], Optional[str]] = {}
+
+    def _candidates(self, keyword: str) -> Optional[set[int]]:
+        """Positions whose description can contain *keyword*; None = unknown."""
+        if not _WORD.fullmatch(keyword):
+            return None
+        positions: set[int] = set()
+        for word, where in self._words.items():
+            if keyword in word:
+                positions.update(where)
+        return positions
+
+    def find(self, *keywords: str) -> Optional[str]:
+        """Ref of the first element whose description contains all *keywords*."""
+        key = tuple(kw.lower() for kw in keywords)
+        if key in self._found:
+            return self._found[key]
+        candidates: Optional[set[int]] = None
+        for keyword in key:
+            positions = self._candidates(keyword)
+            if positions is not None:
+                candidates = positions if candidates is None else candidates & positions
+        order = sorted(candidates) if candidates is not None else range(len(self.pairs))
+        ref = next(
+            (self.pairs[i][0] for i in order if all(kw in self._lowered[i] for kw in key)),
+            None,
+        )
+        self._found[key] = ref
+        return ref
+
+
+@dataclass
+class _CachedSnapshot:
+    index: SnapshotIndex
+    generation: Optional[int]
+    taken_at: float
+
+
 class ABNavigator:
     """Navigate within Teams using agent-browser snapshots.
 
@@ -41,6 +136,15 @@ class ABNavigator:
 
     def __init__(self, ab: Optional[AgentBrowser] = None) -> None:
         self._ab = ab or AgentBrowser()
+        self._cached: Optional[_CachedSnapshot] = None
+        self.snapshot_hits = 0
+        self.snapshot_misses = 0
+
+    @property
+    def snapshot_hit_rate(self) -> float:
+        """Share of snapshot lookups answered from the cache."""
+        total = self.snapshot_hits + self.snapshot_misses
+        return self.snapshot_hits / total if total else 0.0
 
     @staticmethod
     def _extract_ref(result: dict) -> Optional[str]:
@@ -51,38 +155,56 @@ class ABNavigator:
 
     @staticmethod
     def _extract_refs_with_text(snapshot_text: str) -> list[tuple[str, str]]:
-        """Parse snapshot text into (ref, description) pairs.
+        """Parse snapshot text into (ref, description) pairs."""
+        return SnapshotIndex(snapshot_text).pairs
+
+    def invalidate_snapshot(self) -> None:
+        """Drop the cached snapshot; the next lookup takes a new one."""
+        self._cached = None
+
+    def _generation(self) -> Optional[int]:
+        generation = getattr(self._ab, "generation", None)
+        return generation if isinstance(generation, int) else None
+
+    async def _snapshot(self) -> SnapshotIndex:
+        """The current page's snapshot, reusing the cached one while it is valid."""
+        cached = self._cached
+        if (
+            cached is not None
+            and cached.generation == self._generation()
+            and time.monotonic() - cached.taken_at < SNAPSHOT_MAX_AGE_SECONDS
+        ):
+            self.snapshot_hits += 1
+            return cached.index
+
+        self.snapshot_misses += 1
+        snap = await self._ab.snapshot()
+        index = SnapshotIndex(snap.get("text", ""), cached.index if cached is not None else None)
+        logger.debug(
+            "snapshot cache miss (%d hits, %d misses)", self.snapshot_hits, self.snapshot_misses,
+        )
+        self._cached = _CachedSnapshot(index, self._generation(), time.monotonic())
+        return index
+
+    async def _act(self, command, *args):
+        """Run a page-changing AgentBrowser command and drop the cached snapshot."""
+        try:
+            return await command(*args)
+        finally:
+            self._cached = None
 
-        Handles two formats:
-        - Real agent-browser: ``- heading "Chat" [ref=e17] [level=1]``
-        - Legacy/test:        ``@e17 heading 'Chat'``
-        """
-        pairs = []
-        for line in snapshot_text.strip().split("\n"):
-            line = line.strip()
-            # Real agent-browser format: [ref=eN] inline
-            ref_match = re.search(r"\[ref=(e\d+)\]", line)
-            if ref_match:
-                pairs.append(("@" + ref_match.group(1), line))
-                continue
-            # Legacy @eN prefix format
-            prefix_match = re.match(r"(@e\d+)\s+(.*)", line)
-            if prefix_match:
-                pairs.append((prefix_match.group(1), prefix_match.group(2)))
-        return pairs
+    async def _act_and_snapshot(self, command, *args, settle_ms: int) -> SnapshotIndex:
+        """Run a page-changing command, wait *settle_ms*, then take a fresh snapshot."""
+        await self._act(command, *args)
+        await asyncio.sleep(settle_ms / 1000)
+        return await self._snapshot()
 
     async def _find_ref_in_snapshot(self, *keywords: str) -> Optional[str]:
-        """Take a snapshot and find the first element matching all keywords.
+        """Find the first element in the current snapshot matching all keywords.
 
         Returns the @ref ID or None.
         """
-        snap = await self._ab.snapshot()
-        snap_text = snap.get("text", "")
-        for ref, desc in self._extract_refs_with_text(snap_text):
-            desc_lower = desc.lower()
-            if all(kw.lower() in desc_lower for kw in keywords):
-                return ref
-        return None
+        return (await self._snapshot()).find(*keywords)
 
     @staticmethod
     def _is_date_heading(name: str) -> bool:
@@ -97,11 +219,9 @@ class ABNavigator:
         as a ``treeitem "Chat PersonName"`` in the sidebar.
         """
         try:
-            result = await self._ab.snapshot()
-            text = result.get("text", "")
             skip = {"Chat", "Teams", "Microsoft Teams", "Chat participants"}
 
-            pairs = self._extract_refs_with_text(text)
+            pairs = (await self._snapshot()).pairs
 
             # Pass 1: level-2 headings (channels and group chats)
             for ref, desc in pairs:
@@ -161,8 +281,7 @@ class ABNavigator:
         """
         try:
             # 1. Press Ctrl+Shift+N to open new message
-            await self._ab.press(SHORTCUT_NEW_MESSAGE)
-            await asyncio.sleep(2)
+            await self._act_and_snapshot(self._ab.press, SHORTCUT_NEW_MESSAGE, settle_ms=2000)
 
             # 2. Add each recipient via the To field
             failed = []
@@ -202,27 +321,22 @@ class ABNavigator:
                 logger.warning("Could not find To field for recipient '%s'", name)
                 return False
 
-            # Type the name
-            await self._ab.fill(ref, name)
-            await asyncio.sleep(2)
-
-            # Get snapshot and find matching suggestion
-            snap = await self._ab.snapshot()
-            snap_text = snap.get("text", "")
+            # Type the name and snapshot the suggestions
+            pairs = (await self._act_and_snapshot(self._ab.fill, ref, name, settle_ms=2000)).pairs
             name_lower = name.lower()
 
-            for sref, desc in self._extract_refs_with_text(snap_text):
+            for sref, desc in pairs:
                 if "option" in desc.lower():
                     if name_lower in desc.lower():
-                        await self._ab.click(sref)
+                        await self._act(self._ab.click, sref)
                         await asyncio.sleep(1)
                         return True
 
             # Fallback: click first option
-            for sref, desc in self._extract_refs_with_text(snap_text):
+            for sref, desc in pairs:
                 if "option" in desc.lower():
                     logger.info("No exact match for '%s', clicking first suggestion", name)
-                    await self._ab.click(sref)
+                    await self._act(self._ab.click, sref)
                     await asyncio.sleep(1)
                     return True
 
@@ -244,22 +358,17 @@ class ABNavigator:
         """
         try:
             # 1. Activate search via keyboard shortcut
-            await self._ab.press(SHORTCUT_SEARCH)
-            await asyncio.sleep(1)
+            index = await self._act_and_snapshot(self._ab.press, SHORTCUT_SEARCH, settle_ms=1000)
 
             # 2. Find the active search input via snapshot and type
-            ref = await self._find_ref_in_snapshot("combobox", "search")
+            ref = index.find("combobox", "search")
             if ref is None:
-                ref = await self._find_ref_in_snapshot("combobox")
+                ref = index.find("combobox")
             if ref is None:
                 return {"status": "error", "error": "Search bar not found"}
 
-            await self._ab.fill(ref, target)
-            await asyncio.sleep(2)
-
             # 3. Find matching search result
-            snap = await self._ab.snapshot()
-            snap_text = snap.get("text", "")
+            pairs = (await self._act_and_snapshot(self._ab.fill, ref, target, settle_ms=2000)).pairs
             target_lower = target.lower()
 
             # Teams search results have two kinds of "option" elements:
@@ -273,7 +382,7 @@ class ABNavigator:
             best_ref = None
 
             # Pass 1: prefer actual result entries (Person/Group chat/Channel)
-            for sref, desc in self._extract_refs_with_text(snap_text):
+            for sref, desc in pairs:
                 desc_lower = desc.lower()
                 if "option" not in desc_lower:
                     continue
@@ -285,7 +394,7 @@ class ABNavigator:
 
             # Pass 2: any matching option, but skip filter pills
             if best_ref is None:
-                for sref, desc in self._extract_refs_with_text(snap_text):
+                for sref, desc in pairs:
                     desc_lower = desc.lower()
                     if "option" not in desc_lower:
                         continue
@@ -301,7 +410,7 @@ class ABNavigator:
 
             # Pass 3: first non-filter option as last resort
             if best_ref is None:
-                for sref, desc in self._extract_refs_with_text(snap_text):
+                for sref, desc in pairs:
                     desc_lower = desc.lower()
                     if "option" not in desc_lower:
                         continue
@@ -314,13 +423,13 @@ class ABNavigator:
                     break
 
             if best_ref is None:
-                await self._ab.press("Escape")
+                await self._act(self._ab.press, "Escape")
                 return {
                     "status": "error",
                     "error": f"No search results found for '{target}'",
                 }
 
-            await self._ab.click(best_ref)
+            await self._act(self._ab.click, best_ref)
             await asyncio.sleep(2)
 
             detected = await self.detect_channel_name()
@@ -12,10 +12,13 @@ import asyncio
 import json
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
 logger = logging.getLogger(__name__)
 
+# Commands that do not change the page; anything else bumps AgentBrowser.generation.
+READ_ONLY_COMMANDS = frozenset({"snapshot", "get", "screenshot", "wait"})
+
 
 class AgentBrowserError(Exception):
     """Raised when the agent-browser CLI returns an error."""
@@ -35,14 +38,40 @@ class AgentBrowser:
         self.profile_dir = str(profile_dir) if profile_dir else None
         self.timeout = timeout
         self.headed = headed
+        # Bumped before every command that may change the page, so callers
+        # caching snapshots can tell when theirs is stale.
+        self.generation = 0
 
-    async def _run(self, *args: str) -> dict[str, Any]:
-        """Execute an agent-browser subcommand and return parsed JSON output."""
+    def _base_cmd(self) -> list[str]:
         cmd = [self.bin_path]
         if self.profile_dir:
             cmd.extend(["--profile", self.profile_dir])
         if self.headed:
             cmd.append("--headed")
+        return cmd
+
+    def _note_commands(self, commands: Sequence[Sequence[str]]) -> None:
+        if any(not args or args[0] not in READ_ONLY_COMMANDS for args in commands):
+            self.generation += 1
+
+    async def _run(self, *args: str) -> dict[str, Any]:
+        """Execute an agent-browser subcommand and return parsed JSON output."""
+        self._note_commands([args])
+        return await self._run_cli(*args)
+
+    async def batch(self, commands: Sequence[Sequence[str]]) -> list[dict[str, Any]]:
+        """Run several subcommands in order and return their results.
+
+        Each command is its own agent-browser process; the first failure
+        raises AgentBrowserError and the rest are not run.
+        """
+        commands = [tuple(args) for args in commands]
+        self._note_commands(commands)
+        return [await self._run_cli(*args) for args in commands]
+
+    async def _run_cli(self, *args: str) -> dict[str, Any]:
+        """Run one subcommand as its own agent-browser process."""
+        cmd = self._base_cmd()
         cmd.extend(args)
 
         logger.debug("agent-browser exec: %s", " ".join(cmd))
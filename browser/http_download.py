@@ -0,0 +1,298 @@
+"""Ranged, resumable HTTP downloads through the browser's request context.
+
+``BrowserContext.request`` sends requests with the browser's (already
+Okta-authenticated) cookies, so SharePoint files can be fetched over plain
+HTTP instead of a browser download:
+
+- A HEAD request (conditional on the cached ETag / Last-Modified) decides
+  whether the local copy is current. An unchanged file costs that one
+  request.
+- When the server accepts byte ranges, the file is fetched as fixed-size
+  segments, several in parallel, into ``<destination>.part``. Finished
+  segments are recorded in ``<destination>.part.json``, so a failed
+  download resumes where it stopped on the next call.
+- Servers without range support get one full GET.
+
+The cache manifest is a JSON file mapping download URL to the validators,
+size and SHA-256 of the file last written for it. A local copy whose size or
+checksum no longer matches is downloaded again.
+
+Failures raise ``RuntimeError``; callers fall back to a browser download.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEGMENT_BYTES = 4 * 1024 * 1024
+DEFAULT_PARALLEL_SEGMENTS = 4
+_SEGMENT_ATTEMPTS = 3
+
+_CONTENT_RANGE_TOTAL = re.compile(r"bytes\s+\d+-\d+/(\d+)")
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Write *data* to *path* atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data, indent=2, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def _read_json(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+class DownloadManifest:
+    """Validators and checksums of downloaded files, keyed by URL."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def get(self, url: str) -> Optional[dict]:
+        entry = _read_json(self.path).get(url)
+        return entry if isinstance(entry, dict) else None
+
+    def put(self, url: str, entry: dict) -> None:
+        entries = _read_json(self.path)
+        entries[url] = entry
+        _write_json(self.path, entries)
+
+    def valid_entry(self, url: str, destination: Path) -> Optional[dict]:
+        """The entry for *url* if *destination* still holds that exact file."""
+        entry = self.get(url)
+        if entry is None or entry.get("path") != str(destination):
+            return None
+        try:
+            if destination.stat().st_size != entry.get("size_bytes"):
+                return None
+            if file_sha256(destination) != entry.get("sha256"):
+                return None
+        except OSError:
+            return None
+        return entry
+
+
+def _header(response, name: str) -> str:
+    return (response.headers.get(name) or "").strip()
+
+
+def _conditional_headers(entry: Optional[dict]) -> dict:
+    if entry is None:
+        return {}
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def _unchanged(entry: Optional[dict], etag: str, last_modified: str) -> bool:
+    # For servers that answer a conditional HEAD with 200 anyway.
+    if entry is None:
+        return False
+    if etag and entry.get("etag"):
+        return etag == entry["etag"]
+    return bool(last_modified) and last_modified == entry.get("last_modified")
+
+
+async def _probe(request, url: str, headers: dict, timeout_ms: int) -> dict:
+    """HEAD *url*; fall back to a one-byte ranged GET if HEAD is refused."""
+    response = await request.head(url, headers=headers, timeout=timeout_ms, fail_on_status_code=False)
+    await response.dispose()
+    probe = {"status": response.status}
+    size = _header(response, "content-length")
+    accepts_ranges = _header(response, "accept-ranges").lower() == "bytes"
+    if response.status in (405, 501):
+        response = await request.get(
+            url, headers={**headers, "Range": "bytes=0-0"}, timeout=timeout_ms, fail_on_status_code=False,
+        )
+        probe["status"] = response.status
+        total = _CONTENT_RANGE_TOTAL.match(_header(response, "content-range"))
+        size = total.group(1) if total else _header(response, "content-length")
+        accepts_ranges = response.status == 206
+        await response.dispose()
+    if probe["status"] in (401, 403):
+        raise RuntimeError(f"HTTP {probe['status']}: not authorized")
+    if probe["status"] not in (200, 206, 304):
+        raise RuntimeError(f"HTTP {probe['status']} from {url}")
+    if probe["status"] != 304 and _header(response, "content-type").lower().startswith("text/html"):
+        # SharePoint serves its sign-in page with 200.
+        raise RuntimeError("Server returned an HTML page instead of the file")
+    probe.update({
+        "size": int(size) if size.isdigit() else None,
+        "accepts_ranges": accepts_ranges,
+        "etag": _header(response, "etag"),
+        "last_modified": _header(response, "last-modified"),
+    })
+    return probe
+
+
+async def _fetch_segment(request, url: str, part, start: int, end: int, validator: str, timeout_ms: int) -> None:
+    headers = {"Range": f"bytes={start}-{end}"}
+    if validator:
+        headers["If-Range"] = validator
+    error = ""
+    for attempt in range(_SEGMENT_ATTEMPTS):
+        try:
+            response = await request.get(url, headers=headers, timeout=timeout_ms, fail_on_status_code=False)
+            try:
+                status = response.status
+                body = await response.body() if status == 206 else b""
+            finally:
+                await response.dispose()
+        except Exception as exc:
+            error = str(exc)
+        else:
+            if status == 206 and len(body) == end - start + 1:
+                part.seek(start)
+                part.write(body)
+                return
+            if status != 206 and status != 429 and status < 500:
+                # 200 means If-Range failed: the file changed mid-download.
+                raise RuntimeError(f"HTTP {status} for range {start}-{end}")
+            error = f"HTTP {status}" if status != 206 else f"short read ({len(body)} bytes)"
+        if attempt < _SEGMENT_ATTEMPTS - 1:
+            await asyncio.sleep(0.5 * (2 ** attempt))
+    raise RuntimeError(f"Range {start}-{end} failed after {_SEGMENT_ATTEMPTS} attempts: {error}")
+
+
+async def _fetch_ranges(
+    request, url: str, part_path: Path, state_path: Path, probe: dict,
+    parallel: int, segment_bytes: int, timeout_ms: int,
+) -> int:
+    """Fill *part_path* segment by segment; returns how many were resumed."""
+    size = probe["size"]
+    identity = {
+        "url": url, "etag": probe["etag"], "last_modified": probe["last_modified"],
+        "size_bytes": size, "segment_bytes": segment_bytes,
+    }
+    state = _read_json(state_path)
+    done: set[int] = set()
+    if part_path.exists() and part_path.stat().st_size == size and {
+        k: state.get(k) for k in identity
+    } == identity:
+        done = {int(i) for i in state.get("done", [])}
+        logger.info("Resuming %s: %d segment(s) already downloaded", part_path.name, len(done))
+    else:
+        part_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(part_path, "wb") as f:
+            f.truncate(size)
+    resumed = len(done)
+
+    segment_count = -(-size // segment_bytes)
+    pending = [i for i in range(segment_count) if i not in done]
+    validator = probe["etag"] or probe["last_modified"]
+    semaphore = asyncio.Semaphore(max(1, parallel))
+
+    with open(part_path, "r+b") as part:
+        async def fetch(index: int) -> None:
+            start = index * segment_bytes
+            end = min(size, start + segment_bytes) - 1
+            async with semaphore:
+                await _fetch_segment(request, url, part, start, end, validator, timeout_ms)
+            done.add(index)
+            _write_json(state_path, {**identity, "done": sorted(done)})
+
+        results = await asyncio.gather(*(fetch(i) for i in pending), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        raise RuntimeError(
+            f"{len(errors)} of {segment_count} segments failed ({len(done)} kept for resume): {errors[0]}"
+        ) from errors[0]
+    return resumed
+
+
+async def _fetch_whole(request, url: str, part_path: Path, timeout_ms: int) -> None:
+    response = await request.get(url, timeout=timeout_ms, fail_on_status_code=False)
+    try:
+        if response.status != 200:
+            raise RuntimeError(f"HTTP {response.status} from {url}")
+        body = await response.body()
+    finally:
+        await response.dispose()
+    part_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path.write_bytes(body)
+
+
+async def http_download(
+    request,
+    url: str,
+    destination: Path,
+    manifest: Optional[DownloadManifest] = None,
+    parallel: int = DEFAULT_PARALLEL_SEGMENTS,
+    segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+    timeout_ms: int = 60_000,
+) -> dict:
+    """Download *url* to *destination* with a Playwright ``APIRequestContext``.
+
+    Returns a result dict like the browser strategies'. ``method`` is
+    ``"not_modified"`` when the cached copy was current, ``"http_ranged"``
+    for a segmented download and ``"http"`` for a single GET.
+    """
+    cached = manifest.valid_entry(url, destination) if manifest is not None else None
+    probe = await _probe(request, url, _conditional_headers(cached), timeout_ms)
+
+    if cached is not None and (
+        probe["status"] == 304 or _unchanged(cached, probe["etag"], probe["last_modified"])
+    ):
+        return {
+            "status": "downloaded",
+            "path": str(destination),
+            "size_bytes": cached["size_bytes"],
+            "method": "not_modified",
+            "sha256": cached["sha256"],
+        }
+    if probe["status"] == 304:
+        raise RuntimeError("HTTP 304 without a cached copy")
+
+    part_path = destination.with_name(destination.name + ".part")
+    state_path = destination.with_name(destination.name + ".part.json")
+    result: dict = {}
+    if probe["accepts_ranges"] and probe["size"]:
+        resumed = await _fetch_ranges(
+            request, url, part_path, state_path, probe, parallel, segment_bytes, timeout_ms,
+        )
+        result.update(method="http_ranged", segments=-(-probe["size"] // segment_bytes), resumed_segments=resumed)
+    else:
+        await _fetch_whole(request, url, part_path, timeout_ms)
+        result["method"] = "http"
+
+    size = part_path.stat().st_size
+    if size == 0:
+        raise RuntimeError("Downloaded file is empty (0 bytes)")
+    if probe["size"] is not None and size != probe["size"]:
+        raise RuntimeError(f"Downloaded {size} bytes, expected {probe['size']}")
+    sha256 = file_sha256(part_path)
+    os.replace(part_path, destination)
+    state_path.unlink(missing_ok=True)
+
+    if manifest is not None:
+        manifest.put(url, {
+            "path": str(destination),
+            "etag": probe["etag"],
+            "last_modified": probe["last_modified"],
+            "size_bytes": size,
+            "sha256": sha256,
+        })
+    return {"status": "downloaded", "path": str(destination), "size_bytes": size, "sha256": sha256, **result}
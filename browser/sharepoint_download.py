@@ -4,7 +4,11 @@ Uses the same CDP-connected browser that Teams tools use (already
 Okta-authenticated).
 
 Strategy order:
-1. ``download.aspx?UniqueId=`` — dedicated download endpoint (fastest)
+0. HTTP through the browser context's request API (``browser.http_download``)
+   — conditional on the cache manifest, ranged and resumable. An unchanged
+   file costs one HEAD request.
+1. ``download.aspx?UniqueId=`` — dedicated download endpoint (fastest
+   browser download)
 2. Excel Online UI clicks via raw CDP — connects directly to the Excel
    iframe target and clicks File → Create a Copy → Download a Copy.
    The file lands in ~/Downloads and is moved to the destination.
@@ -20,6 +24,8 @@ from typing import Optional
 from urllib.request import urlopen
 from urllib.error import URLError
 
+from browser.http_download import DEFAULT_PARALLEL_SEGMENTS, DownloadManifest, http_download
+
 try:
     from playwright._impl._errors import TimeoutError as PlaywrightTimeout
 except ImportError:
@@ -298,6 +304,8 @@ async def download_sharepoint_file(
     sharepoint_url: str,
     destination: Path,
     timeout_ms: int = 60_000,
+    cache_manifest: Optional[Path] = None,
+    parallel_segments: int = DEFAULT_PARALLEL_SEGMENTS,
 ) -> dict:
     """Download a file from SharePoint via the persistent browser.
 
@@ -306,6 +314,10 @@ async def download_sharepoint_file(
         sharepoint_url: Full SharePoint URL (view or download).
         destination: Local path to save the downloaded file.
         timeout_ms: Download timeout in milliseconds.
+        cache_manifest: JSON file of ETags and checksums from earlier
+            downloads. When given, an unchanged file is not downloaded again
+            (``method`` is ``"not_modified"``).
+        parallel_segments: Concurrent range requests for the HTTP strategy.
 
     Returns:
         A dict with ``status`` (``"downloaded"``, ``"error"``, or
@@ -325,6 +337,21 @@ async def download_sharepoint_file(
         pw, browser = await manager.connect()
         ctx = browser.contexts[0]
 
+        # --- Strategy 0: HTTP with the browser's cookies (ranged, cached) ---
+        try:
+            result = await http_download(
+                ctx.request, download_url, destination,
+                manifest=DownloadManifest(cache_manifest) if cache_manifest else None,
+                parallel=parallel_segments,
+                timeout_ms=timeout_ms,
+            )
+            logger.info("Fetched %s (%d bytes) to %s via %s", sharepoint_url,
+                        result["size_bytes"], destination, result["method"])
+            return result
+        except Exception as http_err:
+            logger.warning("HTTP download failed (%s). "
+                           "Trying browser download...", http_err)
+
         # --- Strategy 1: direct download.aspx URL (short timeout) ---
         try:
             result = await _try_direct_download(ctx, download_url,
@@ -254,6 +254,43 @@ TOOL_SCHEMAS: dict[str, dict] = {
             "required": ["message_id", "target_mailbox"],
         },
     },
+    "mark_mail_read_bulk": {
+        "name": "mark_mail_read_bulk",
+        "description": "Mark several emails as read or unread in one Mail round-trip. Returns a status per message.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "message_ids": {"type": "string", "description": "Comma-separated Message-IDs"},
+                "read": {"type": "boolean", "description": "True for read"},
+            },
+            "required": ["message_ids"],
+        },
+    },
+    "mark_mail_flagged_bulk": {
+        "name": "mark_mail_flagged_bulk",
+        "description": "Flag or unflag several emails in one Mail round-trip. Returns a status per message.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "message_ids": {"type": "string", "description": "Comma-separated Message-IDs"},
+                "flagged": {"type": "boolean", "description": "True to flag"},
+            },
+            "required": ["message_ids"],
+        },
+    },
+    "move_mail_messages_bulk": {
+        "name": "move_mail_messages_bulk",
+        "description": "Move several emails to one mailbox in one Mail round-trip. Returns a status per message.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "message_ids": {"type": "string", "description": "Comma-separated Message-IDs"},
+                "target_mailbox": {"type": "string", "description": "Target mailbox"},
+                "target_account": {"type": "string", "description": "Target account"},
+            },
+            "required": ["message_ids", "target_mailbox"],
+        },
+    },
     "open_teams_browser": {
         "name": "open_teams_browser",
         "description": "Launch persistent Chromium browser and navigate to Teams.",
@@ -873,7 +910,10 @@ CAPABILITY_DEFINITIONS: dict[str, CapabilityDefinition] = {
     "mail_write": CapabilityDefinition(
         name="mail_write",
         description="Send and update email state",
-        tool_names=("send_email", "mark_mail_read", "mark_mail_flagged", "move_mail_message"),
+        tool_names=(
+            "send_email", "mark_mail_read", "mark_mail_flagged", "move_mail_message",
+            "mark_mail_read_bulk", "mark_mail_flagged_bulk", "move_mail_messages_bulk",
+        ),
     ),
     "teams_write": CapabilityDefinition(
         name="teams_write",
@@ -5,6 +5,11 @@ This daemon:
 2) stores normalized events and queue jobs in SQLite,
 3) executes queued instructions via IMessageExecutor (Claude API),
 4) replies via iMessage.
+
+Jobs in different conversations run concurrently, up to
+``dispatch_concurrency`` at once. Jobs in one conversation run in arrival
+order. A reply is sent in a worker thread, so it does not delay the next
+job; replies within a conversation are still sent in order.
 """
 
 from __future__ import annotations
@@ -14,11 +19,14 @@ import json
 import logging
 import sqlite3
 import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Callable
 
+from utils.latency import latency_summary
+
 logger = logging.getLogger("imessage-daemon")
 
 
@@ -69,6 +77,7 @@ def compute_dispatch_lookback_minutes(
 
 
 DISPATCH_TIMEOUT_SECONDS = 120
+LATENCY_SAMPLES = 500
 
 
 @dataclass(frozen=True)
@@ -80,6 +89,7 @@ class DaemonConfig:
     bootstrap_lookback_minutes: int = 30
     max_lookback_minutes: int = 1440
     dispatch_batch_size: int = 25
+    dispatch_concurrency: int = 4  # jobs executing at once, across conversations
     chat_db_path: Path | None = None  # defaults to ~/Library/Messages/chat.db
     profile_db_path: Path | None = None  # defaults to data/imessage-thread-profiles.db
     monitored_conversation: str = ""  # filter to specific chat_identifier
@@ -242,6 +252,58 @@ class StateStore:
         )
         self.conn.commit()
 
+    def claim_queued_jobs(self, limit: int) -> list[dict[str, Any]]:
+        """Mark up to *limit* of the oldest queued jobs running, in one transaction.
+
+        Returns the claimed jobs oldest first, each with its conversation
+        (the chat_identifier recorded at ingest, or "" if unknown).
+        """
+        now = utc_now_iso()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = self.conn.execute(
+                """
+                SELECT
+                    j.id,
+                    j.message_guid,
+                    j.attempts,
+                    e.timestamp_epoch,
+                    e.date_local,
+                    e.text,
+                    e.raw_json
+                FROM processing_jobs j
+                JOIN message_events e ON e.guid = j.message_guid
+                WHERE j.status = 'queued'
+                ORDER BY e.timestamp_epoch ASC, j.id ASC
+                LIMIT ?
+                """,
+                (limit,),
+            ).fetchall()
+            self.conn.executemany(
+                """
+                UPDATE processing_jobs
+                SET status = 'running', attempts = attempts + 1, updated_at_utc = ?
+                WHERE id = ? AND status = 'queued'
+                """,
+                [(now, row["id"]) for row in rows],
+            )
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        jobs = []
+        for row in rows:
+            job = dict(row)
+            try:
+                raw = json.loads(job.pop("raw_json") or "{}")
+            except ValueError:
+                raw = {}
+            job["conversation"] = str(raw.get("chat_identifier", "") if isinstance(raw, dict) else "").strip()
+            job["status"] = "running"
+            job["attempts"] += 1
+            jobs.append(job)
+        return jobs
+
     def mark_job_result(self, message_guid: str, success: bool, error: str = "") -> None:
         status = "succeeded" if success else "failed"
         now = utc_now_iso()
@@ -300,6 +362,7 @@ class IMessageDaemon:
         self.config = config
         self.store = StateStore(config.state_db_path)
         self.config.data_dir.mkdir(parents=True, exist_ok=True)
+        self._owns_message_store = message_store is None
         if message_store is not None:
             self.message_store = message_store
         else:
@@ -312,15 +375,22 @@ class IMessageDaemon:
             )
         self.executor = executor
         self.reply_fn = reply_fn
+        self._dispatch_latency_ms: deque = deque(maxlen=LATENCY_SAMPLES)
 
     def close(self) -> None:
         self.store.close()
+        if self._owns_message_store:
+            self.message_store.close()
 
     async def run_once(self) -> dict[str, int]:
         self.store.recover_stale_running_jobs()
         ingested_count = self._ingest_cycle()
         dispatched_count = await self._dispatch_cycle()
-        return {"ingested": ingested_count, "dispatched": dispatched_count}
+        return {
+            "ingested": ingested_count,
+            "dispatched": dispatched_count,
+            "queue_depth": self.store.count_jobs_by_status("queued"),
+        }
 
     def _ingest_cycle(self) -> int:
         now_epoch = int(time.time())
@@ -379,45 +449,86 @@ class IMessageDaemon:
             self.store.set_watermark_epoch(max_epoch)
         return inserted
 
+    def metrics(self) -> dict[str, Any]:
+        """Queue depth, jobs in flight, and recent claim-to-finish dispatch latency."""
+        return {
+            "queue_depth": self.store.count_jobs_by_status("queued"),
+            "running": self.store.count_jobs_by_status("running"),
+            "dispatch_concurrency": self.config.dispatch_concurrency,
+            "dispatch_latency": latency_summary(self._dispatch_latency_ms),
+        }
+
     async def _dispatch_cycle(self) -> int:
         """Process queued messages: execute via Claude API and reply via iMessage."""
-        queued = self.store.list_queued_jobs(limit=self.config.dispatch_batch_size)
-        if not queued:
+        claimed = self.store.claim_queued_jobs(limit=self.config.dispatch_batch_size)
+        if not claimed:
             return 0
 
-        dispatched = 0
-        for job in queued:
-            guid = str(job["message_guid"])
-            text = str(job.get("text", "")).strip()
-            self.store.mark_jobs_running([int(job["id"])])
-
-            if not text:
-                self.store.mark_job_result(guid, success=False, error="empty_message_text")
-                continue
-
-            if self.executor is None:
-                self.store.mark_job_result(guid, success=False, error="no_executor_configured")
-                continue
-
-            try:
-                result_text = await asyncio.wait_for(
-                    self.executor.execute(text),
-                    timeout=DISPATCH_TIMEOUT_SECONDS,
-                )
-                # Mark execution as succeeded regardless of reply outcome
-                self.store.mark_job_result(guid, success=True)
+        conversations: dict[str, list[dict[str, Any]]] = {}
+        for job in claimed:
+            conversations.setdefault(job["conversation"], []).append(job)
+
+        claimed_at = time.perf_counter()
+        slots = asyncio.Semaphore(max(1, self.config.dispatch_concurrency))
+        replies: list[asyncio.Task] = []
+
+        async def run_conversation(jobs: list[dict[str, Any]]) -> int:
+            dispatched = 0
+            previous_reply: asyncio.Task | None = None
+            for job in jobs:
+                async with slots:
+                    result_text = await self._execute_job(job)
+                self._dispatch_latency_ms.append(round((time.perf_counter() - claimed_at) * 1000, 1))
+                if result_text is None:
+                    continue
                 dispatched += 1
-                # Reply via iMessage (separate from execution success)
                 if self.reply_fn and result_text:
-                    try:
-                        self.reply_fn(body=result_text)
-                    except Exception as reply_err:
-                        logger.error("Reply failed for guid=%s: %s", guid, reply_err)
-            except asyncio.TimeoutError:
-                self.store.mark_job_result(guid, success=False, error="execution_timeout")
-                logger.error("Dispatch timeout for guid=%s", guid)
-            except Exception as e:
-                self.store.mark_job_result(guid, success=False, error=str(e))
-                logger.error("Dispatch error for guid=%s: %s", guid, e)
-
-        return dispatched
+                    previous_reply = asyncio.create_task(
+                        self._send_reply(str(job["message_guid"]), result_text, after=previous_reply)
+                    )
+                    replies.append(previous_reply)
+            return dispatched
+
+        counts = await asyncio.gather(*(run_conversation(jobs) for jobs in conversations.values()))
+        if replies:
+            await asyncio.gather(*replies)
+        return sum(counts)
+
+    async def _execute_job(self, job: dict[str, Any]) -> str | None:
+        """Run one claimed job and record its result; the reply text on success."""
+        guid = str(job["message_guid"])
+        text = str(job.get("text", "")).strip()
+
+        if not text:
+            self.store.mark_job_result(guid, success=False, error="empty_message_text")
+            return None
+
+        if self.executor is None:
+            self.store.mark_job_result(guid, success=False, error="no_executor_configured")
+            return None
+
+        try:
+            result_text = await asyncio.wait_for(
+                self.executor.execute(text),
+                timeout=DISPATCH_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            self.store.mark_job_result(guid, success=False, error="execution_timeout")
+            logger.error("Dispatch timeout for guid=%s", guid)
+            return None
+        except Exception as e:
+            self.store.mark_job_result(guid, success=False, error=str(e))
+            logger.error("Dispatch error for guid=%s: %s", guid, e)
+            return None
+        # Mark execution as succeeded regardless of reply outcome
+        self.store.mark_job_result(guid, success=True)
+        return result_text or ""
+
+    async def _send_reply(self, guid: str, body: str, after: asyncio.Task | None = None) -> None:
+        """Send a reply in a worker thread once the conversation's previous reply is out."""
+        if after is not None:
+            await asyncio.gather(after, return_exceptions=True)
+        try:
+            await asyncio.to_thread(self.reply_fn, body=body)
+        except Exception as reply_err:
+            logger.error("Reply failed for guid=%s: %s", guid, reply_err)
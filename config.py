@@ -7,6 +7,22 @@ except ImportError:
     def get_secret(key):
         return os.environ.get(key)
 
+# Settings that need a secret (a Keychain subprocess on macOS) are computed on
+# first access by the module __getattr__ at the end of this file, so importing
+# config stays cheap for short-lived processes. Code inside this module must
+# read them with _setting(), since global lookups bypass __getattr__.
+_LAZY_SETTINGS = {}
+
+
+def _lazy_setting(name, factory):
+    _LAZY_SETTINGS[name] = factory
+    # A reload re-runs this file in the same namespace: drop the cached value.
+    globals().pop(name, None)
+
+
+def _setting(name):
+    return globals()[name] if name in globals() else __getattr__(name)
+
 BASE_DIR = Path(__file__).parent
 AGENT_CONFIGS_DIR = BASE_DIR / "agent_configs"
 PLAYBOOKS_DIR = BASE_DIR / "playbooks"
@@ -15,7 +31,7 @@ MEMORY_DB_PATH = DATA_DIR / "memory.db"
 SESSION_BRAIN_PATH = DATA_DIR / "session_brain.md"
 CHROMA_PERSIST_DIR = DATA_DIR / "chroma"
 
-ANTHROPIC_API_KEY = get_secret("anthropic_api_key") or os.environ.get("ANTHROPIC_API_KEY", "")
+_lazy_setting("ANTHROPIC_API_KEY", lambda: get_secret("anthropic_api_key") or os.environ.get("ANTHROPIC_API_KEY", ""))
 USER_EMAIL = os.environ.get("JARVIS_USER_EMAIL", "")
 DEFAULT_MODEL = "claude-sonnet-4-6"
 MODEL_TIERS = {
@@ -28,10 +44,21 @@ DEFAULT_MODEL_TIER = "sonnet"
 AGENT_TIMEOUT_SECONDS = 60
 USER_TIMEZONE = os.environ.get("JARVIS_TIMEZONE", "America/Denver")
 MAX_TOOL_ROUNDS = 25
+# Per-hook timeout for fire_hooks_async; a hook config's own `timeout` overrides it.
+HOOK_TIMEOUT_SECONDS = float(os.environ.get("HOOK_TIMEOUT_SECONDS", "5"))
+# Build heavy MCP server subsystems on first use and warm them in the background
+# after the server starts answering; false restores fully eager startup.
+MCP_LAZY_STARTUP = os.environ.get("MCP_LAZY_STARTUP", "true").strip().lower() not in {"0", "false", "no"}
 from memory.models import FactCategory
 VALID_FACT_CATEGORIES = frozenset(FactCategory)
 
 SHAREPOINT_DOWNLOAD_DIR = DATA_DIR / "sharepoint-downloads"
+# ETags and checksums of SharePoint downloads, for conditional re-fetches
+SHAREPOINT_CACHE_MANIFEST = DATA_DIR / "sharepoint-cache.json"
+try:
+    SHAREPOINT_DOWNLOAD_SEGMENTS = max(1, int(os.environ.get("SHAREPOINT_DOWNLOAD_SEGMENTS", "4")))
+except ValueError:
+    SHAREPOINT_DOWNLOAD_SEGMENTS = 4
 OKR_DATA_DIR = DATA_DIR / "okr"
 OKR_SPREADSHEET_DEFAULT = OKR_DATA_DIR / "2026_ISP_OKR_Master_Final.xlsx"
 OKR_SHAREPOINT_URL = (
@@ -69,10 +96,33 @@ SKILL_SUGGESTION_THRESHOLD = 0.7
 SKILL_MIN_OCCURRENCES = 5
 SKILL_AUTO_EXECUTE_ENABLED = os.environ.get("SKILL_AUTO_EXECUTE_ENABLED", "false").strip().lower() in {"1", "true", "yes"}
 
+# Usage log retention: raw tool_usage_log / agent_api_log rows are pruned after
+# they are rolled up and this old; hourly rollups likewise. Daily rollups are kept.
+try:
+    USAGE_RAW_RETENTION_DAYS = max(1, int(os.environ.get("USAGE_RAW_RETENTION_DAYS", "30")))
+except ValueError:
+    USAGE_RAW_RETENTION_DAYS = 30
+try:
+    USAGE_HOURLY_RETENTION_DAYS = max(1, int(os.environ.get("USAGE_HOURLY_RETENTION_DAYS", "90")))
+except ValueError:
+    USAGE_HOURLY_RETENTION_DAYS = 90
+
 # Proactive push notification settings
 PROACTIVE_PUSH_ENABLED = os.environ.get("PROACTIVE_PUSH_ENABLED", "false").strip().lower() in {"1", "true", "yes"}
 PROACTIVE_PUSH_THRESHOLD = os.environ.get("PROACTIVE_PUSH_THRESHOLD", "high").strip().lower()
 
+# Proactive suggestion checks run concurrently, each bounded by a timeout.
+# Results are cached per check: database checks until memory.db changes or
+# their TTL passes, the knowledge-lint and stale-document checks for longer.
+try:
+    PROACTIVE_CHECK_WORKERS = max(1, int(os.environ.get("PROACTIVE_CHECK_WORKERS", "4")))
+except ValueError:
+    PROACTIVE_CHECK_WORKERS = 4
+PROACTIVE_CHECK_TIMEOUT_SECONDS = float(os.environ.get("PROACTIVE_CHECK_TIMEOUT_SECONDS", "5"))
+PROACTIVE_DB_CHECK_TTL_SECONDS = float(os.environ.get("PROACTIVE_DB_CHECK_TTL_SECONDS", "30"))
+PROACTIVE_LINT_CHECK_TTL_SECONDS = float(os.environ.get("PROACTIVE_LINT_CHECK_TTL_SECONDS", "600"))
+PROACTIVE_DOCUMENT_CHECK_TTL_SECONDS = float(os.environ.get("PROACTIVE_DOCUMENT_CHECK_TTL_SECONDS", "1800"))
+
 # Proactive action execution (daemon acts on high-confidence suggestions)
 PROACTIVE_ACTION_ENABLED = os.environ.get(
     "PROACTIVE_ACTION_ENABLED", "false"
@@ -86,6 +136,19 @@ PROACTIVE_ACTION_CATEGORIES = frozenset(
 KNOWLEDGE_COMPILE_ON_INGEST = os.environ.get(
     "KNOWLEDGE_COMPILE_ON_INGEST", "false"
 ).strip().lower() in {"1", "true", "yes"}
+# Summary jobs are queued at ingest and drained by the daemon's knowledge_compile task
+try:
+    KNOWLEDGE_COMPILE_CONCURRENCY = max(1, int(os.environ.get("KNOWLEDGE_COMPILE_CONCURRENCY", "4")))
+except ValueError:
+    KNOWLEDGE_COMPILE_CONCURRENCY = 4
+try:
+    KNOWLEDGE_COMPILE_BATCH_THRESHOLD = max(1, int(os.environ.get("KNOWLEDGE_COMPILE_BATCH_THRESHOLD", "50")))
+except ValueError:
+    KNOWLEDGE_COMPILE_BATCH_THRESHOLD = 50
+try:
+    KNOWLEDGE_COMPILE_MAX_JOBS_PER_RUN = max(1, int(os.environ.get("KNOWLEDGE_COMPILE_MAX_JOBS_PER_RUN", "200")))
+except ValueError:
+    KNOWLEDGE_COMPILE_MAX_JOBS_PER_RUN = 200
 KNOWLEDGE_LINT_MAX_AGE_DAYS = int(os.environ.get("KNOWLEDGE_LINT_MAX_AGE_DAYS", "180"))
 KNOWLEDGE_LINT_MIN_CONFIDENCE = float(os.environ.get("KNOWLEDGE_LINT_MIN_CONFIDENCE", "0.6"))
 KNOWLEDGE_LINT_SIMILARITY_THRESHOLD = float(os.environ.get("KNOWLEDGE_LINT_SIMILARITY_THRESHOLD", "0.7"))
@@ -98,6 +161,32 @@ WEBHOOK_AUTO_DISPATCH_ENABLED = os.environ.get(
     "WEBHOOK_AUTO_DISPATCH_ENABLED", "false"
 ).strip().lower() in {"1", "true", "yes"}
 
+# Webhook dispatch queue: concurrent workers lease events from webhook_events
+try:
+    WEBHOOK_DISPATCH_CONCURRENCY = max(1, int(os.environ.get("WEBHOOK_DISPATCH_CONCURRENCY", "4")))
+except ValueError:
+    WEBHOOK_DISPATCH_CONCURRENCY = 4
+try:
+    WEBHOOK_DISPATCH_AGENT_CONCURRENCY = max(0, int(os.environ.get("WEBHOOK_DISPATCH_AGENT_CONCURRENCY", "2")))
+except ValueError:
+    WEBHOOK_DISPATCH_AGENT_CONCURRENCY = 2  # per agent; 0 = unlimited
+try:
+    WEBHOOK_DISPATCH_LEASE_SECONDS = max(30, int(os.environ.get("WEBHOOK_DISPATCH_LEASE_SECONDS", "600")))
+except ValueError:
+    WEBHOOK_DISPATCH_LEASE_SECONDS = 600
+try:
+    WEBHOOK_DISPATCH_MAX_ATTEMPTS = max(1, int(os.environ.get("WEBHOOK_DISPATCH_MAX_ATTEMPTS", "3")))
+except ValueError:
+    WEBHOOK_DISPATCH_MAX_ATTEMPTS = 3
+try:
+    WEBHOOK_DISPATCH_RETRY_BASE_SECONDS = max(1, int(os.environ.get("WEBHOOK_DISPATCH_RETRY_BASE_SECONDS", "60")))
+except ValueError:
+    WEBHOOK_DISPATCH_RETRY_BASE_SECONDS = 60
+
+# Inbox watcher (python -m webhook.receiver --watch)
+WEBHOOK_WATCH_DEBOUNCE_SECONDS = float(os.environ.get("WEBHOOK_WATCH_DEBOUNCE_SECONDS", "0.5"))
+WEBHOOK_WATCH_POLL_INTERVAL_SECONDS = float(os.environ.get("WEBHOOK_WATCH_POLL_INTERVAL_SECONDS", "1.0"))
+
 # dispatch_agents orchestrator settings
 DISPATCH_AGENTS_MAX_AGENTS = 10  # Hard cap on agents per dispatch
 DISPATCH_AGENTS_MAX_RESULT_LENGTH = 5000  # Truncate per-agent result text
@@ -171,13 +260,13 @@ AGENT_BROWSER_TIMEOUT = int(os.environ.get("AGENT_BROWSER_TIMEOUT", "30"))
 AGENT_BROWSER_HEADED = os.environ.get("AGENT_BROWSER_HEADED", "").lower() in ("1", "true", "yes")
 
 # Microsoft Graph API (direct)
-M365_CLIENT_ID = get_secret("m365_client_id") or ""
-M365_TENANT_ID = get_secret("m365_tenant_id") or ""
+_lazy_setting("M365_CLIENT_ID", lambda: get_secret("m365_client_id") or "")
+_lazy_setting("M365_TENANT_ID", lambda: get_secret("m365_tenant_id") or "")
 
 # MSAL token cache Keychain identifiers (shared between graph_client and bootstrap_secrets)
 MSAL_KEYCHAIN_SERVICE = "jarvis"
 MSAL_KEYCHAIN_ACCOUNT = "msal_token_cache"
-M365_GRAPH_ENABLED = bool(M365_CLIENT_ID)
+_lazy_setting("M365_GRAPH_ENABLED", lambda: bool(_setting("M365_CLIENT_ID")))
 M365_GRAPH_SCOPES = [
     "Calendars.ReadWrite",
     "Channel.ReadBasic.All",
@@ -193,12 +282,26 @@ M365_GRAPH_SCOPES = [
 ]
 
 # Backend routing (TEAMS_POSTER_BACKEND deprecated in favor of TEAMS_SEND_BACKEND)
-TEAMS_SEND_BACKEND = os.environ.get(
+_lazy_setting("TEAMS_SEND_BACKEND", lambda: os.environ.get(
     "TEAMS_SEND_BACKEND",
-    os.environ.get("TEAMS_POSTER_BACKEND", "graph" if M365_GRAPH_ENABLED else "agent-browser")
-)
-TEAMS_READ_BACKEND = os.environ.get("TEAMS_READ_BACKEND", "graph" if M365_GRAPH_ENABLED else "m365-bridge")
-EMAIL_SEND_BACKEND = os.environ.get("EMAIL_SEND_BACKEND", "graph" if M365_GRAPH_ENABLED else "apple")
+    os.environ.get("TEAMS_POSTER_BACKEND", "graph" if _setting("M365_GRAPH_ENABLED") else "agent-browser")
+))
+_lazy_setting("TEAMS_READ_BACKEND", lambda: os.environ.get(
+    "TEAMS_READ_BACKEND", "graph" if _setting("M365_GRAPH_ENABLED") else "m365-bridge"
+))
+_lazy_setting("EMAIL_SEND_BACKEND", lambda: os.environ.get(
+    "EMAIL_SEND_BACKEND", "graph" if _setting("M365_GRAPH_ENABLED") else "apple"
+))
+
+# Read Mail headers, flags and counts from Mail's Envelope Index (read-only)
+# instead of AppleScript. MAIL_ENVELOPE_INDEX_PATH overrides the newest
+# ~/Library/Mail/V<n>/MailData/Envelope Index.
+MAIL_ENVELOPE_INDEX_ENABLED = os.environ.get("MAIL_ENVELOPE_INDEX_ENABLED", "true").strip().lower() not in {"0", "false", "no"}
+MAIL_ENVELOPE_INDEX_PATH = os.environ.get("MAIL_ENVELOPE_INDEX_PATH", "")
+
+# Seconds a reminder index built from one EventKit fetch is reused before
+# refetching; EKEventStoreChangedNotification invalidates it sooner.
+REMINDERS_INDEX_TTL_SECONDS = float(os.environ.get("REMINDERS_INDEX_TTL_SECONDS", "30"))
 
 # Teams poster backend (DEPRECATED — use TEAMS_SEND_BACKEND instead)
 TEAMS_POSTER_BACKEND = os.environ.get("TEAMS_POSTER_BACKEND", "agent-browser")
@@ -214,3 +317,16 @@ IMESSAGE_DAEMON_ALLOWED_SENDERS = tuple(
 )
 IMESSAGE_DAEMON_COMMAND_PREFIX = os.environ.get("IMESSAGE_DAEMON_COMMAND_PREFIX", "jarvis")
 IMESSAGE_WORKER_DB_PATH = DATA_DIR / "imessage-worker.db"
+# Queued iMessage commands executed at once (one at a time per conversation)
+try:
+    IMESSAGE_DAEMON_DISPATCH_CONCURRENCY = max(1, int(os.environ.get("IMESSAGE_DAEMON_DISPATCH_CONCURRENCY", "4")))
+except ValueError:
+    IMESSAGE_DAEMON_DISPATCH_CONCURRENCY = 4
+
+
+def __getattr__(name):
+    factory = _LAZY_SETTINGS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = factory()
+    return value
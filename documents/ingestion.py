@@ -110,9 +110,12 @@ def content_hash(text: str) -> str:
     return hashlib.sha256(text.encode()).hexdigest()[:16]
 
 
-def ingest_path(path: Path, document_store: "DocumentStore") -> str:
+def ingest_path(path: Path, document_store: "DocumentStore", memory_store=None) -> str:
     """Ingest a file or directory into the document store.
 
+    When summary compilation is enabled and a *memory_store* is given,
+    summaries are queued for the daemon instead of generated inline.
+
     Returns a summary string of what was ingested.
     """
     files = []
@@ -138,6 +141,7 @@ def ingest_path(path: Path, document_store: "DocumentStore") -> str:
 
     total_chunks = 0
     skipped = 0
+    queued = 0
     for file in files:
         try:
             text = load_text_file(file)
@@ -180,7 +184,14 @@ def ingest_path(path: Path, document_store: "DocumentStore") -> str:
         total_chunks += len(chunks)
 
         # Optionally compile a summary for the document
-        if COMPILE_ON_INGEST:
+        if COMPILE_ON_INGEST and memory_store is not None:
+            try:
+                from knowledge.compile_queue import enqueue_document_summary
+                if enqueue_document_summary(memory_store, text, str(file.name), file_hash):
+                    queued += 1
+            except Exception:
+                logger.warning("Summary enqueue failed for %s", file.name, exc_info=True)
+        elif COMPILE_ON_INGEST:
             try:
                 from knowledge.compiler import compile_document_summary
                 compile_document_summary(text, str(file.name), file_hash, document_store)
@@ -190,4 +201,6 @@ def ingest_path(path: Path, document_store: "DocumentStore") -> str:
     summary = f"Ingested {len(files) - skipped} file(s), {total_chunks} chunks."
     if skipped:
         summary += f" Skipped {skipped} file(s) due to size or security restrictions."
+    if queued:
+        summary += f" Queued {queued} document summary job(s)."
     return summary
@@ -1,8 +1,9 @@
 from pathlib import Path
 from typing import Optional
 
-import chromadb
-from chromadb.config import Settings
+from utils.lazy_import import lazy_import
+
+chromadb = lazy_import("chromadb")
 
 
 COLLECTION_NAME = "jarvis_docs"
@@ -11,6 +12,8 @@ _OLD_COLLECTION_NAME = "chief_of_staff_docs"
 
 class DocumentStore:
     def __init__(self, persist_dir: Path):
+        from chromadb.config import Settings
+
         self.client = chromadb.Client(Settings(
             persist_directory=str(persist_dir),
             is_persistent=True,
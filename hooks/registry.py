@@ -8,17 +8,86 @@ Event types:
 
 Each hook callback receives a context dict and may return an arbitrary value.
 Hooks are error-isolated: one hook raising does not prevent subsequent hooks from running.
+
+``fire_hooks_async`` is the path for async callers. Priority groups run in
+order, and the hooks within one group run concurrently: sync callbacks in
+worker threads, coroutine callbacks on the loop. Each hook is bounded by its
+timeout. Hooks registered with ``observe_only=True`` only watch events, so
+both fire paths start them in the background and put ``None`` in their
+result slot. Every run's latency goes into a per-hook histogram
+(``hook_metrics``).
 """
 
+import asyncio
+import inspect
+import itertools
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 import yaml
 
 logger = logging.getLogger("jarvis-mcp.hooks")
 
+DEFAULT_HOOK_TIMEOUT_SECONDS = 5.0
+
+# Upper bounds (ms) of the latency histogram buckets; slower runs land in an overflow bucket.
+LATENCY_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+_observer_pool: Optional[ThreadPoolExecutor] = None
+_observer_pool_lock = threading.Lock()
+
+
+def _get_observer_pool() -> ThreadPoolExecutor:
+    """Threads that run observe-only hooks for the sync fire path."""
+    global _observer_pool
+    with _observer_pool_lock:
+        if _observer_pool is None:
+            _observer_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hook-observer")
+        return _observer_pool
+
+
+class _LatencyHistogram:
+    __slots__ = ("count", "errors", "timeouts", "total_ms", "max_ms", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, elapsed_ms: float, status: str) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if status == "error":
+            self.errors += 1
+        elif status == "timeout":
+            self.timeouts += 1
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
 EVENT_TYPES = frozenset({
     "before_tool_call",
     "after_tool_call",
@@ -30,8 +99,14 @@ EVENT_TYPES = frozenset({
 class HookRegistry:
     """Registry for Python-level lifecycle hooks."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, default_timeout: float = DEFAULT_HOOK_TIMEOUT_SECONDS) -> None:
         self._hooks: dict[str, list[dict[str, Any]]] = {et: [] for et in EVENT_TYPES}
+        self.default_timeout = default_timeout
+        self._metrics: dict[tuple[str, str], _LatencyHistogram] = {}
+        self._metrics_lock = threading.Lock()
+        # Strong references to in-flight observe-only runs (asyncio tasks and
+        # thread-pool futures) so they are not garbage-collected mid-run.
+        self._observers: set = set()
 
     # ------------------------------------------------------------------
     # Public API
@@ -45,6 +120,8 @@ class HookRegistry:
         name: str = "",
         priority: int = 100,
         enabled: bool = True,
+        timeout: Optional[float] = None,
+        observe_only: bool = False,
     ) -> None:
         """Register a hook callback for an event type.
 
@@ -54,6 +131,10 @@ class HookRegistry:
             name: Optional human-readable name (used in logs).
             priority: Lower numbers run first. Default 100.
             enabled: If False, the hook is registered but will not fire.
+            timeout: Seconds ``fire_hooks_async`` waits for the hook. None
+                uses the registry's default_timeout.
+            observe_only: The hook's result is never used, so it runs in
+                the background off the caller's path.
         """
         if event_type not in EVENT_TYPES:
             raise ValueError(
@@ -64,6 +145,8 @@ class HookRegistry:
             "callback": callback,
             "priority": priority,
             "enabled": enabled,
+            "timeout": timeout,
+            "observe_only": observe_only,
         }
         self._hooks[event_type].append(entry)
         # Keep hooks sorted by priority (stable sort preserves insertion order for ties)
@@ -74,23 +157,144 @@ class HookRegistry:
 
         Each hook receives a **copy** of *context* so mutations don't leak between hooks.
         If a hook raises, the exception is logged and ``None`` is appended to results.
+        A coroutine result is awaited (bounded by the hook's timeout) unless an
+        event loop is already running in this thread; then it is scheduled on
+        that loop and its result is ``None``. Async callers should use
+        ``fire_hooks_async``.
         """
-        if event_type not in EVENT_TYPES:
-            raise ValueError(
-                f"Unknown event type '{event_type}'. Must be one of: {sorted(EVENT_TYPES)}"
-            )
+        self._check_event_type(event_type)
         results: list[Any] = []
         for entry in self._hooks[event_type]:
             if not entry["enabled"]:
                 continue
-            try:
-                result = entry["callback"](dict(context))
-                results.append(result)
-            except Exception:
-                logger.exception("Hook '%s' failed for event '%s'", entry["name"], event_type)
+            if entry["observe_only"]:
+                future = _get_observer_pool().submit(self._run_sync, event_type, entry, dict(context))
+                self._observers.add(future)
+                future.add_done_callback(self._observers.discard)
                 results.append(None)
+                continue
+            results.append(self._run_sync(event_type, entry, dict(context)))
         return results
 
+    async def fire_hooks_async(self, event_type: str, context: dict) -> list[Any]:
+        """Async ``fire_hooks``: hooks of equal priority run concurrently.
+
+        Results are in the same order as ``fire_hooks``. A hook that raises
+        or exceeds its timeout contributes ``None``; a sync hook that times
+        out keeps running in its worker thread, but is no longer waited for.
+        """
+        self._check_event_type(event_type)
+        results: list[Any] = []
+        enabled = [entry for entry in self._hooks[event_type] if entry["enabled"]]
+        for _, group in itertools.groupby(enabled, key=lambda entry: entry["priority"]):
+            runs = []
+            for entry in group:
+                run = self._run_async(event_type, entry, dict(context))
+                if entry["observe_only"]:
+                    task = asyncio.create_task(run)
+                    self._observers.add(task)
+                    task.add_done_callback(self._observers.discard)
+                    run = None
+                runs.append(run)
+            pending = [run for run in runs if run is not None]
+            done = iter(await asyncio.gather(*pending) if len(pending) > 1 else [await run for run in pending])
+            results.extend(None if run is None else next(done) for run in runs)
+        return results
+
+    async def drain_observers(self) -> None:
+        """Wait for in-flight observe-only hooks (e.g. before shutdown, or in tests)."""
+        while self._observers:
+            await asyncio.gather(
+                *(
+                    observer if isinstance(observer, asyncio.Future) else asyncio.wrap_future(observer)
+                    for observer in list(self._observers)
+                ),
+                return_exceptions=True,
+            )
+
+    def hook_metrics(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Latency histograms per event type and hook name."""
+        with self._metrics_lock:
+            metrics: dict[str, dict[str, dict[str, Any]]] = {}
+            for (event_type, name), histogram in sorted(self._metrics.items()):
+                metrics.setdefault(event_type, {})[name] = histogram.to_dict()
+            return metrics
+
+    def _run_sync(self, event_type: str, entry: dict[str, Any], context: dict) -> Any:
+        started = time.perf_counter()
+        status = "ok"
+        try:
+            result = entry["callback"](context)
+            if inspect.isawaitable(result):
+                result = self._resolve_awaitable(entry, result)
+            return result
+        except TimeoutError:
+            status = "timeout"
+            logger.warning("Hook '%s' timed out for event '%s'", entry["name"], event_type)
+            return None
+        except Exception:
+            status = "error"
+            logger.exception("Hook '%s' failed for event '%s'", entry["name"], event_type)
+            return None
+        finally:
+            self._record(event_type, entry["name"], started, status)
+
+    def _resolve_awaitable(self, entry: dict[str, Any], awaitable) -> Any:
+        bounded = _bounded(awaitable, self._timeout(entry))
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(bounded)
+        # Blocking here would deadlock the running loop.
+        task = loop.create_task(bounded)
+        self._observers.add(task)
+        task.add_done_callback(self._observers.discard)
+        return None
+
+    async def _run_async(self, event_type: str, entry: dict[str, Any], context: dict) -> Any:
+        callback = entry["callback"]
+        timeout = self._timeout(entry)
+        started = time.perf_counter()
+        status = "ok"
+        try:
+            if inspect.iscoroutinefunction(callback):
+                result = await asyncio.wait_for(callback(context), timeout)
+            else:
+                # Sync hooks (file writes, etc.) must not block the event loop.
+                result = await asyncio.wait_for(asyncio.to_thread(callback, context), timeout)
+                if inspect.isawaitable(result):
+                    elapsed = time.perf_counter() - started
+                    result = await asyncio.wait_for(result, max(0.0, timeout - elapsed))
+            return result
+        except asyncio.TimeoutError:
+            status = "timeout"
+            logger.warning("Hook '%s' timed out after %.1fs for event '%s'", entry["name"], timeout, event_type)
+            return None
+        except Exception:
+            status = "error"
+            logger.exception("Hook '%s' failed for event '%s'", entry["name"], event_type)
+            return None
+        finally:
+            self._record(event_type, entry["name"], started, status)
+
+    def _timeout(self, entry: dict[str, Any]) -> float:
+        return entry["timeout"] if entry["timeout"] is not None else self.default_timeout
+
+    def _record(self, event_type: str, name: str, started: float, status: str) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._metrics_lock:
+            histogram = self._metrics.get((event_type, name))
+            if histogram is None:
+                histogram = self._metrics[(event_type, name)] = _LatencyHistogram()
+            histogram.record(elapsed_ms, status)
+
+    @staticmethod
+    def _check_event_type(event_type: str) -> None:
+        if event_type not in EVENT_TYPES:
+            raise ValueError(
+                f"Unknown event type '{event_type}'. Must be one of: {sorted(EVENT_TYPES)}"
+            )
+
     def get_hooks(self, event_type: str) -> list[dict[str, Any]]:
         """Return the list of hook entries for *event_type* (mainly for introspection/tests)."""
         if event_type not in EVENT_TYPES:
@@ -118,6 +322,8 @@ class HookRegistry:
               handler: hooks.builtin.audit_log_hook
               priority: 50
               enabled: true
+              timeout: 2.0          # optional, seconds
+              observe_only: false   # optional, true = run in the background
         """
         config_dir = Path(config_dir)
         if not config_dir.is_dir():
@@ -148,6 +354,8 @@ class HookRegistry:
                         name=entry.get("name", ""),
                         priority=entry.get("priority", 100),
                         enabled=entry.get("enabled", True),
+                        timeout=entry.get("timeout"),
+                        observe_only=entry.get("observe_only", False),
                     )
                     loaded += 1
             except Exception:
@@ -159,6 +367,10 @@ class HookRegistry:
 # Helpers
 # ------------------------------------------------------------------
 
+async def _bounded(awaitable, timeout: float) -> Any:
+    return await asyncio.wait_for(awaitable, timeout)
+
+
 def _import_handler(dotted_path: str) -> Callable | None:
     """Import a callable from a dotted module path like 'hooks.builtin.audit_log_hook'."""
     parts = dotted_path.rsplit(".", 1)
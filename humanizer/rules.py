@@ -2,20 +2,39 @@
 
 Based on Wikipedia's "Signs of AI writing" guide and the blader/humanizer
 Claude Code skill. Each rule is a regex pattern with a replacement.
+
+Rules apply in order, each to the output of the previous one. Most rules
+cannot match most text, so ``humanize`` does not run each rule's regex over
+the whole text. A rule list is compiled once into a dispatch table from the
+literal each rule declares (``HumanizerRule.literal``, text every match
+contains, e.g. "utilize" for ``\butilize\b``) to the rules declaring it.
+Only rules whose literal occurs in the text run, still in order; rules
+without a literal run on every text. When a rule changes
+the text, the later rules' literals are checked again, because a
+replacement or removal can create a match (removing a filler phrase can
+leave "could potentially"), but only around the replaced spans. Text that
+contains no rule's literal gets only the cleanup pass.
 """
 
 import re
 from dataclasses import dataclass
-from typing import Union, Callable
+from functools import lru_cache
+from typing import Optional, Union, Callable
 
 
 @dataclass
 class HumanizerRule:
-    """A single text transformation rule."""
+    """A single text transformation rule.
+
+    *literal* is text that every match of *pattern* contains (compared
+    case-insensitively if the pattern is). Without one the rule runs on
+    every text.
+    """
     name: str
     pattern: re.Pattern
     replacement: Union[str, Callable[[re.Match], str]]
     description: str
+    literal: Optional[str] = None
 
 
 def _build_rules() -> list[HumanizerRule]:
@@ -30,12 +49,14 @@ def _build_rules() -> list[HumanizerRule]:
         pattern=re.compile(r"(?<=\w)\s*\u2014\s*(?=[a-zA-Z])"),
         replacement=", ",
         description="Replace em dashes with commas (word-to-word only)",
+        literal="\u2014",
     ))
     rules.append(HumanizerRule(
         name="double_hyphen_em_dash",
         pattern=re.compile(r"(?<=\w)\s*--\s*(?=[a-zA-Z])"),
         replacement=", ",
         description="Replace double-hyphen em dashes with commas (word-to-word only)",
+        literal="--",
     ))
 
     # --- AI vocabulary swaps ---
@@ -93,6 +114,7 @@ def _build_rules() -> list[HumanizerRule]:
             pattern=re.compile(pattern_str),
             replacement=repl,
             description=f"Replace '{name}' with '{repl}'",
+            literal=pattern_str[2:-2],
         ))
 
     # --- Filler phrases ---
@@ -118,25 +140,27 @@ def _build_rules() -> list[HumanizerRule]:
             pattern=re.compile(pattern_str),
             replacement=repl,
             description=f"Remove filler phrase",
+            literal=pattern_str.removesuffix(r"\b"),
         ))
 
     # --- Sycophantic patterns ---
     syco_patterns = [
-        (r"Great question!\s*", ""),
-        (r"That's a great question!\s*", ""),
-        (r"Excellent question!\s*", ""),
-        (r"I hope this helps!?\s*", ""),
-        (r"Let me know if you have any (?:other )?questions!?\s*", ""),
-        (r"Absolutely!\s*", ""),
-        (r"You're absolutely right!\s*", ""),
+        (r"Great question!\s*", "", "Great question!"),
+        (r"That's a great question!\s*", "", "That's a great question!"),
+        (r"Excellent question!\s*", "", "Excellent question!"),
+        (r"I hope this helps!?\s*", "", "I hope this helps"),
+        (r"Let me know if you have any (?:other )?questions!?\s*", "", "Let me know if you have any "),
+        (r"Absolutely!\s*", "", "Absolutely!"),
+        (r"You're absolutely right!\s*", "", "You're absolutely right!"),
     ]
-    for pattern_str, repl in syco_patterns:
+    for pattern_str, repl, literal in syco_patterns:
         name = pattern_str[:25].strip().lower().replace(" ", "_").replace(r"\s*", "")
         rules.append(HumanizerRule(
             name=f"syco_{name}",
             pattern=re.compile(pattern_str, re.IGNORECASE),
             replacement=repl,
             description="Remove sycophantic pattern",
+            literal=literal,
         ))
 
     # --- Copula avoidance ---
@@ -157,6 +181,7 @@ def _build_rules() -> list[HumanizerRule]:
             pattern=re.compile(pattern_str),
             replacement=repl,
             description=f"Replace '{name}' with '{repl}'",
+            literal=pattern_str[2:-2],
         ))
 
     # --- Hedging ---
@@ -173,6 +198,7 @@ def _build_rules() -> list[HumanizerRule]:
             pattern=re.compile(pattern_str),
             replacement=repl,
             description=f"Reduce hedging: '{name}' to '{repl}'",
+            literal=pattern_str[2:-2],
         ))
 
     return rules
@@ -181,6 +207,96 @@ def _build_rules() -> list[HumanizerRule]:
 DEFAULT_RULES: list[HumanizerRule] = _build_rules()
 
 
+class _CompiledRules:
+    """A rule list with the dispatch table from rule literals to rules."""
+
+    def __init__(self, rules: tuple[tuple[re.Pattern, Union[str, Callable], Optional[str]], ...]):
+        self.rules = rules
+        self.literals: dict[str, list[int]] = {}
+        self.always: list[int] = []
+        ignorecase: list[str] = []
+        self.ignorecase_rules: list[int] = []
+        for index, (pattern, _, literal) in enumerate(rules):
+            if not literal:
+                self.always.append(index)
+            elif pattern.flags & re.IGNORECASE:
+                ignorecase.append(literal)
+                self.ignorecase_rules.append(index)
+            else:
+                self.literals.setdefault(literal, []).append(index)
+        # Case-insensitive rules are few; one search tells whether any of
+        # them can match, and then all of them run.
+        self._ignorecase_search = (
+            re.compile("|".join(map(re.escape, ignorecase)), re.IGNORECASE).search if ignorecase else None
+        )
+        self.longest_literal = max(map(len, [*self.literals, *ignorecase]), default=1)
+
+    def candidates(self, text: str, after: int = -1) -> set[int]:
+        """Indexes above *after* of the rules whose literal occurs in *text*."""
+        found = {i for i in self.always if i > after}
+        for literal, indexes in self.literals.items():
+            if indexes[-1] > after and literal in text:
+                found.update(i for i in indexes if i > after)
+        if self._ignorecase_search is not None and self.ignorecase_rules[-1] > after and self._ignorecase_search(text):
+            found.update(i for i in self.ignorecase_rules if i > after)
+        return found
+
+    def apply(self, text: str) -> str:
+        pending = self.candidates(text)
+        while pending:
+            index = min(pending)
+            pending.discard(index)
+            pattern, replacement, _ = self.rules[index]
+            spans: list[tuple[int, int]] = []
+            text = pattern.sub(_recording(replacement, spans), text)
+            if spans:
+                # A literal the replacements created overlaps one of them, or
+                # straddles the point where a removal joined the text.
+                reach = self.longest_literal - 1
+                changed = "\0".join(text[max(0, start - reach):end + reach] for start, end in spans)
+                pending |= self.candidates(changed, after=index)
+        return text
+
+
+def _recording(replacement: Union[str, Callable[[re.Match], str]], spans: list) -> Callable[[re.Match], str]:
+    """Wrap *replacement* to append each replacement's span in the output to *spans*."""
+    if callable(replacement):
+        expand = replacement
+    elif "\\" in replacement:
+        def expand(match: re.Match) -> str:
+            return match.expand(replacement)
+    else:
+        def expand(match: re.Match) -> str:
+            return replacement
+
+    shift = 0
+
+    def replace(match: re.Match) -> str:
+        nonlocal shift
+        out = expand(match)
+        start = match.start() + shift
+        spans.append((start, start + len(out)))
+        shift += len(out) - (match.end() - match.start())
+        return out
+
+    return replace
+
+
+@lru_cache(maxsize=32)
+def _compile(rules: tuple[tuple[re.Pattern, Union[str, Callable], Optional[str]], ...]) -> _CompiledRules:
+    return _CompiledRules(rules)
+
+
+# The two cleanup substitutions in one pass: a run of 2+ spaces after a
+# non-space becomes one space, or nothing when punctuation follows it, and
+# any other space directly before punctuation is dropped.
+_CLEANUP = re.compile(r" (?<=\S )(?: +(?=[.,;:!?])|( +))| (?=[.,;:!?])")
+
+
+def _cleanup_match(match: re.Match) -> str:
+    return " " if match.group(1) is not None else ""
+
+
 def humanize(text: str | None, rules: list[HumanizerRule] | None = None) -> str:
     """Apply humanizer rules to text, returning the cleaned version.
 
@@ -197,14 +313,8 @@ def humanize(text: str | None, rules: list[HumanizerRule] | None = None) -> str:
     if rules is None:
         rules = DEFAULT_RULES
 
-    result = text
-    for rule in rules:
-        result = rule.pattern.sub(rule.replacement, result)
-
-    # Clean up double spaces left by removals (only mid-line, preserve leading indent)
-    result = re.sub(r"(?<=\S)  +", " ", result)
-    # Clean up space before punctuation
-    result = re.sub(r" ([.,;:!?])", r"\1", result)
+    result = _compile(tuple((rule.pattern, rule.replacement, rule.literal) for rule in rules)).apply(text)
+    result = _CLEANUP.sub(_cleanup_match, result)
     # NOTE: Leading spaces are NOT stripped — they are meaningful in markdown
     # (nested lists, code blocks, indentation).
 
@@ -0,0 +1,176 @@
+"""Persistent, de-duplicated queue for document summary compilation.
+
+Ingestion enqueues one job per unique ``file_hash`` in the ``compile_jobs``
+table; the daemon's ``knowledge_compile`` task drains it. Small queues are
+processed with a bounded thread pool against the Messages API, large
+backfills are submitted through the Message Batches API and collected on a
+later run.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional
+
+import config as app_config
+from config import (
+    KNOWLEDGE_COMPILE_BATCH_THRESHOLD,
+    KNOWLEDGE_COMPILE_CONCURRENCY,
+    KNOWLEDGE_COMPILE_MAX_JOBS_PER_RUN,
+)
+from knowledge.compiler import build_summary_params, prepare_summary_input, store_summary
+from memory.models import CompileJobStatus
+from utils.lazy_import import lazy_import
+
+anthropic = lazy_import("anthropic")
+logger = logging.getLogger(__name__)
+
+_MAX_ATTEMPTS = 3
+_VALID_MODES = ("auto", "concurrent", "batch")
+
+
+def enqueue_document_summary(memory_store, text: str, source: str, file_hash: str) -> bool:
+    """Queue a summary job. Returns False if the text is too short or already known."""
+    prepared = prepare_summary_input(text)
+    if prepared is None:
+        return False
+    return memory_store.enqueue_compile_job(file_hash, source, prepared)
+
+
+def _retry_or_fail(memory_store, job: dict, error: str) -> str:
+    """Send a job back to pending unless it has exhausted its attempts."""
+    status = CompileJobStatus.failed if job["attempts"] >= _MAX_ATTEMPTS else CompileJobStatus.pending
+    memory_store.finish_compile_job(job["file_hash"], status, error=error)
+    return status
+
+
+def process_compile_jobs(
+    memory_store,
+    document_store,
+    limit: int = KNOWLEDGE_COMPILE_MAX_JOBS_PER_RUN,
+    concurrency: int = KNOWLEDGE_COMPILE_CONCURRENCY,
+    client=None,
+) -> dict:
+    """Summarize up to *limit* pending jobs with at most *concurrency* requests in flight.
+
+    API calls run in worker threads; SQLite and ChromaDB writes stay on the
+    calling thread as results complete.
+    """
+    jobs = memory_store.claim_compile_jobs(limit=limit)
+    result = {"claimed": len(jobs), "done": 0, "retried": 0, "failed": 0}
+    if not jobs:
+        return result
+
+    client = client or anthropic.Anthropic(api_key=app_config.ANTHROPIC_API_KEY)
+
+    def _summarize(job: dict) -> str:
+        response = client.messages.create(**build_summary_params(job["text"]))
+        return response.content[0].text
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = {pool.submit(_summarize, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                summary = future.result()
+                store_summary(summary, job["source"], job["file_hash"], document_store)
+                memory_store.finish_compile_job(job["file_hash"], CompileJobStatus.done)
+                result["done"] += 1
+            except Exception as e:
+                logger.warning("Summary job %s failed: %s", job["file_hash"], e)
+                status = _retry_or_fail(memory_store, job, str(e))
+                result["failed" if status == CompileJobStatus.failed else "retried"] += 1
+    return result
+
+
+def submit_compile_batch(
+    memory_store,
+    limit: int = KNOWLEDGE_COMPILE_MAX_JOBS_PER_RUN,
+    client=None,
+) -> dict:
+    """Submit up to *limit* pending jobs as a single Message Batch."""
+    jobs = memory_store.claim_compile_jobs(limit=limit)
+    if not jobs:
+        return {"submitted": 0, "batch_id": None}
+
+    client = client or anthropic.Anthropic(api_key=app_config.ANTHROPIC_API_KEY)
+    requests = [
+        {"custom_id": job["file_hash"], "params": build_summary_params(job["text"])}
+        for job in jobs
+    ]
+    try:
+        batch = client.messages.batches.create(requests=requests)
+    except Exception as e:
+        logger.warning("Message batch submission failed: %s", e)
+        for job in jobs:
+            _retry_or_fail(memory_store, job, str(e))
+        return {"submitted": 0, "batch_id": None, "error": str(e)}
+
+    memory_store.mark_compile_jobs_batched([job["file_hash"] for job in jobs], batch.id)
+    logger.info("Submitted %d summary jobs as batch %s", len(jobs), batch.id)
+    return {"submitted": len(jobs), "batch_id": batch.id}
+
+
+def collect_compile_batches(memory_store, document_store, client=None) -> dict:
+    """Store results for every outstanding batch that has finished processing."""
+    batch_ids = memory_store.list_compile_batches()
+    result = {"batches_checked": len(batch_ids), "batches_ended": 0, "done": 0, "retried": 0, "failed": 0}
+    if not batch_ids:
+        return result
+
+    client = client or anthropic.Anthropic(api_key=app_config.ANTHROPIC_API_KEY)
+    for batch_id in batch_ids:
+        try:
+            batch = client.messages.batches.retrieve(batch_id)
+            if batch.processing_status != "ended":
+                continue
+            result["batches_ended"] += 1
+            for entry in client.messages.batches.results(batch_id):
+                job = memory_store.get_compile_job(entry.custom_id)
+                if job is None or job["status"] != CompileJobStatus.batched:
+                    continue
+                if entry.result.type == "succeeded":
+                    summary = entry.result.message.content[0].text
+                    store_summary(summary, job["source"], job["file_hash"], document_store)
+                    memory_store.finish_compile_job(job["file_hash"], CompileJobStatus.done)
+                    result["done"] += 1
+                else:
+                    status = _retry_or_fail(memory_store, job, f"batch result {entry.result.type}")
+                    result["failed" if status == CompileJobStatus.failed else "retried"] += 1
+        except Exception as e:
+            logger.warning("Failed to collect message batch %s: %s", batch_id, e)
+    return result
+
+
+def run_compile_queue(
+    memory_store,
+    document_store,
+    mode: str = "auto",
+    limit: Optional[int] = None,
+    client=None,
+) -> dict:
+    """One daemon pass: collect finished batches, then drain pending jobs.
+
+    ``mode="auto"`` uses the Message Batches API once the pending backlog
+    reaches ``KNOWLEDGE_COMPILE_BATCH_THRESHOLD`` and bounded concurrent
+    requests below it.
+    """
+    if mode not in _VALID_MODES:
+        raise ValueError(f"Invalid compile mode '{mode}'. Must be one of: {', '.join(_VALID_MODES)}")
+    limit = limit or KNOWLEDGE_COMPILE_MAX_JOBS_PER_RUN
+
+    requeued = memory_store.requeue_stale_compile_jobs()
+    collected = collect_compile_batches(memory_store, document_store, client=client)
+
+    pending = memory_store.get_compile_job_stats()["counts"][CompileJobStatus.pending.value]
+    use_batch = mode == "batch" or (mode == "auto" and pending >= KNOWLEDGE_COMPILE_BATCH_THRESHOLD)
+    if use_batch:
+        processed = submit_compile_batch(memory_store, limit=limit, client=client)
+    else:
+        processed = process_compile_jobs(memory_store, document_store, limit=limit, client=client)
+
+    return {
+        "mode": "batch" if use_batch else "concurrent",
+        "requeued_stale": requeued,
+        "collected": collected,
+        "processed": processed,
+    }
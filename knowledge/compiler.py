@@ -8,13 +8,14 @@ import logging
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
 
-import anthropic
-
-from config import MODEL_TIERS, ANTHROPIC_API_KEY
+import config as app_config
+from config import MODEL_TIERS
+from utils.lazy_import import lazy_import
 
 if TYPE_CHECKING:
     from documents.store import DocumentStore
 
+anthropic = lazy_import("anthropic")
 logger = logging.getLogger(__name__)
 
 _SUMMARY_PROMPT = """Summarize this document in 2-4 sentences. Focus on:
@@ -31,36 +32,47 @@ _MIN_WORDS = 50
 _MAX_INPUT_WORDS = 3000
 
 
-def generate_summary(text: str) -> Optional[str]:
-    """Generate a summary of the given text using Haiku.
-    Returns the summary string, or None if text is too short, empty, or API fails.
-    """
+def prepare_summary_input(text: str) -> Optional[str]:
+    """Return the (truncated) text to summarize, or None if it is too short to bother."""
     if not text or not text.strip():
         return None
     words = text.split()
     if len(words) < _MIN_WORDS:
         return None
-    truncated = " ".join(words[:_MAX_INPUT_WORDS])
+    return " ".join(words[:_MAX_INPUT_WORDS])
+
+
+def build_summary_params(text: str) -> dict:
+    """Messages API parameters for summarizing already-prepared text.
+
+    Shared by the synchronous path and Message Batches submissions so both
+    produce identical requests.
+    """
+    return {
+        "model": MODEL_TIERS["haiku"],
+        "max_tokens": 512,
+        "messages": [{"role": "user", "content": _SUMMARY_PROMPT.format(text=text)}],
+    }
+
+
+def generate_summary(text: str) -> Optional[str]:
+    """Generate a summary of the given text using Haiku.
+    Returns the summary string, or None if text is too short, empty, or API fails.
+    """
+    truncated = prepare_summary_input(text)
+    if truncated is None:
+        return None
     try:
-        client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-        response = client.messages.create(
-            model=MODEL_TIERS["haiku"],
-            max_tokens=512,
-            messages=[{"role": "user", "content": _SUMMARY_PROMPT.format(text=truncated)}],
-        )
+        client = anthropic.Anthropic(api_key=app_config.ANTHROPIC_API_KEY)
+        response = client.messages.create(**build_summary_params(truncated))
         return response.content[0].text
     except Exception:
         logger.exception("Failed to generate document summary")
         return None
 
 
-def compile_document_summary(text, source, file_hash, document_store):
-    """Generate a summary and store it in the document store with doc_type="summary" metadata.
-    Returns the summary text, or None if skipped.
-    """
-    summary = generate_summary(text)
-    if summary is None:
-        return None
+def store_summary(summary: str, source: str, file_hash: str, document_store) -> None:
+    """Store a generated summary with doc_type="summary" metadata."""
     now = datetime.now(timezone.utc).isoformat()
     document_store.add_documents(
         texts=[summary],
@@ -68,4 +80,14 @@ def compile_document_summary(text, source, file_hash, document_store):
         ids=[f"{file_hash}_summary"],
     )
     logger.info("Stored summary for %s (%d chars)", source, len(summary))
+
+
+def compile_document_summary(text, source, file_hash, document_store):
+    """Generate a summary and store it in the document store with doc_type="summary" metadata.
+    Returns the summary text, or None if skipped.
+    """
+    summary = generate_summary(text)
+    if summary is None:
+        return None
+    store_summary(summary, source, file_hash, document_store)
     return summary
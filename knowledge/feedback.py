@@ -8,13 +8,14 @@ facts so they persist in the knowledge base for future queries.
 import logging
 from typing import TYPE_CHECKING
 
-import anthropic
-
-from config import MODEL_TIERS, ANTHROPIC_API_KEY
+import config as app_config
+from config import MODEL_TIERS
+from utils.lazy_import import lazy_import
 
 if TYPE_CHECKING:
     from memory.store import MemoryStore
 
+anthropic = lazy_import("anthropic")
 logger = logging.getLogger(__name__)
 
 _EXTRACT_PROMPT = """Extract the 3-5 most important findings, decisions, or status updates from this document.
@@ -51,7 +52,7 @@ def extract_and_store_findings(
     truncated = " ".join(document_text.split()[:_MAX_INPUT_WORDS])
 
     try:
-        client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
+        client = anthropic.Anthropic(api_key=app_config.ANTHROPIC_API_KEY)
         response = client.messages.create(
             model=MODEL_TIERS["haiku"],
             max_tokens=512,
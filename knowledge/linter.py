@@ -8,6 +8,8 @@ import logging
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
+from memory.fact_similarity import LSH_MIN_SIMILARITY, jaccard, words
+
 if TYPE_CHECKING:
     from memory.store import MemoryStore
 
@@ -16,11 +18,7 @@ logger = logging.getLogger(__name__)
 
 def _jaccard_similarity(a: str, b: str) -> float:
     """Word-level Jaccard similarity between two strings."""
-    words_a = set(a.lower().split())
-    words_b = set(b.lower().split())
-    if not words_a or not words_b:
-        return 0.0
-    return len(words_a & words_b) / len(words_a | words_b)
+    return jaccard(words(a), words(b))
 
 
 class KnowledgeLinter:
@@ -57,37 +55,53 @@ class KnowledgeLinter:
         return findings
 
     def check_near_duplicates(self, similarity_threshold: float = 0.7) -> list[dict]:
-        """Find fact pairs with high word overlap within the same category."""
+        """Find fact pairs with high word overlap within the same category.
+
+        At thresholds the MinHash/LSH index covers (``LSH_MIN_SIMILARITY``
+        and up), verified pairs are read from the index after indexing any
+        facts still missing a signature. Lower thresholds compare every
+        pair in each category exactly.
+        """
+        if similarity_threshold < LSH_MIN_SIMILARITY:
+            return self._check_near_duplicates_exact(similarity_threshold)
+
+        self.memory_store.backfill_fact_signatures()
+        return [
+            self._near_duplicate_finding(p["category"], p["fact_a"], p["fact_b"], p["similarity"])
+            for p in self.memory_store.list_near_duplicate_facts(similarity_threshold)
+        ]
+
+    def _check_near_duplicates_exact(self, similarity_threshold: float) -> list[dict]:
         rows = self.memory_store.conn.execute(
-            "SELECT * FROM facts ORDER BY category, key"
+            "SELECT category, key, value FROM facts ORDER BY category, key"
         ).fetchall()
 
         by_category: dict[str, list] = {}
         for row in rows:
-            by_category.setdefault(row["category"], []).append(row)
+            by_category.setdefault(row["category"], []).append((row, words(row["value"])))
 
         findings = []
-        seen_pairs: set[tuple] = set()
         for category, facts in by_category.items():
             for i in range(len(facts)):
+                a, words_a = facts[i]
                 for j in range(i + 1, len(facts)):
-                    a, b = facts[i], facts[j]
-                    pair_key = (a["id"], b["id"])
-                    if pair_key in seen_pairs:
-                        continue
-                    sim = _jaccard_similarity(a["value"], b["value"])
+                    b, words_b = facts[j]
+                    sim = jaccard(words_a, words_b)
                     if sim >= similarity_threshold:
-                        seen_pairs.add(pair_key)
-                        findings.append({
-                            "issue": "near_duplicate",
-                            "category": category,
-                            "fact_a": {"key": a["key"], "value": a["value"][:80]},
-                            "fact_b": {"key": b["key"], "value": b["value"][:80]},
-                            "similarity": round(sim, 2),
-                            "suggestion": f"Merge or deduplicate: '{a['key']}' and '{b['key']}' ({round(sim * 100)}% similar)",
-                        })
+                        findings.append(self._near_duplicate_finding(category, a, b, sim))
         return findings
 
+    @staticmethod
+    def _near_duplicate_finding(category: str, a, b, sim: float) -> dict:
+        return {
+            "issue": "near_duplicate",
+            "category": category,
+            "fact_a": {"key": a["key"], "value": a["value"][:80]},
+            "fact_b": {"key": b["key"], "value": b["value"][:80]},
+            "similarity": round(sim, 2),
+            "suggestion": f"Merge or deduplicate: '{a['key']}' and '{b['key']}' ({round(sim * 100)}% similar)",
+        }
+
     def run_all(self, max_age_days=180, min_confidence=0.6, similarity_threshold=0.7) -> list[dict]:
         """Run all lint checks and return combined findings."""
         findings = []
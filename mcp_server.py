@@ -5,6 +5,11 @@ Exposes granular tools for memory, document search, and agent management.
 No internal LLM calls — the host Claude handles all reasoning.
 """
 
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
+import asyncio
 import logging
 import sys
 from contextlib import asynccontextmanager
@@ -14,19 +19,18 @@ from mcp.server.fastmcp import FastMCP
 
 import config as app_config
 from agents.registry import AgentRegistry
-from apple_calendar.eventkit import CalendarStore
+from apple_mail.envelope_index import EnvelopeIndex
 from apple_mail.mail import MailStore
 from apple_messages.messages import MessageStore
-from apple_reminders.eventkit import ReminderStore
 from connectors.calendar_unified import UnifiedCalendarService
 from connectors.claude_m365_bridge import ClaudeM365Bridge
 from connectors.providers import AppleCalendarProvider, Microsoft365CalendarProvider
 from connectors.router import ProviderRouter
-from documents.store import DocumentStore
 from memory.models import ScheduledTask
 from memory.store import MemoryStore
 from okr.store import OKRStore
 from hooks.registry import HookRegistry
+from mcp_tools.startup import LazyHandle, StartupTimeline, start_warmers
 from mcp_tools.state import ServerState
 
 # All logging to stderr (stdout is the JSON-RPC channel for stdio transport)
@@ -40,10 +44,145 @@ logger = logging.getLogger("jarvis-mcp")
 # Module-level state populated by lifespan manager
 _state = ServerState()
 
+_DEFAULT_TASKS = (
+    ("alert_eval", '{"hours": 2}', "Evaluate alert rules every 2 hours"),
+    ("webhook_poll", '{"minutes": 5}', "Poll for new webhook events every 5 minutes"),
+    ("webhook_dispatch", '{"minutes": 5}', "Dispatch pending webhook events to matched agents every 5 minutes"),
+    ("skill_analysis", '{"hours": 24}', "Analyze skill usage patterns daily"),
+    ("knowledge_compile", '{"minutes": 5}', "Drain the queued document summary jobs every 5 minutes"),
+    ("usage_rollup", '{"hours": 1}', "Roll up tool and API usage logs hourly and prune old raw rows"),
+)
+
+
+# --- Subsystem factories (chromadb and PyObjC are imported on first use) ---
+
+def _open_document_store():
+    from documents.store import DocumentStore
+    return DocumentStore(persist_dir=app_config.CHROMA_PERSIST_DIR)
+
+
+def _open_calendar_store():
+    from apple_calendar.eventkit import CalendarStore
+    return CalendarStore()
+
+
+def _open_reminder_store():
+    from apple_reminders.eventkit import ReminderStore
+    return ReminderStore(index_ttl_seconds=app_config.REMINDERS_INDEX_TTL_SECONDS)
+
+
+def _seed_default_tasks(memory_store: MemoryStore) -> None:
+    """Store each default scheduled task that does not exist yet."""
+    from scheduler.engine import calculate_next_run
+
+    for name, schedule_config, description in _DEFAULT_TASKS:
+        if memory_store.get_scheduled_task_by_name(name) is not None:
+            continue
+        memory_store.store_scheduled_task(ScheduledTask(
+            name=name,
+            handler_type=name,
+            schedule_type="interval",
+            schedule_config=schedule_config,
+            description=description,
+            next_run_at=calculate_next_run("interval", schedule_config),
+        ))
+        logger.info("Seeded default scheduled task: %s", name)
+
+
+def _load_session_context() -> None:
+    """Load proactive session context into _state (non-fatal)."""
+    from session.context_loader import load_session_context
+    from session.context_config import ContextLoaderConfig
+
+    context_config = ContextLoaderConfig(
+        enabled=app_config.SESSION_CONTEXT_ENABLED,
+        per_source_timeout_seconds=app_config.SESSION_CONTEXT_TIMEOUT,
+        ttl_minutes=app_config.SESSION_CONTEXT_TTL,
+        sources={s: True for s in app_config.SESSION_CONTEXT_SOURCES},
+    )
+    if not context_config.enabled:
+        return
+    try:
+        _state.session_context = load_session_context(_state, context_config)
+        logger.info(
+            "Session context loaded: %d events, %d unread, %d overdue, %d pending, %d reminders, errors: %s",
+            len(_state.session_context.calendar_events),
+            _state.session_context.unread_mail_count,
+            len(_state.session_context.overdue_delegations),
+            len(_state.session_context.pending_decisions),
+            len(_state.session_context.due_reminders),
+            list(_state.session_context.errors.keys()) or "none",
+        )
+    except Exception:
+        logger.exception("Failed to load session context (non-fatal)")
+
+
+async def _init_graph_client() -> None:
+    """Initialize the Graph API client and validate its token, if enabled."""
+    if not app_config.M365_GRAPH_ENABLED:
+        return
+    try:
+        from connectors.graph_client import GraphClient
+        _state.graph_client = GraphClient(
+            client_id=app_config.M365_CLIENT_ID,
+            tenant_id=app_config.M365_TENANT_ID,
+            scopes=app_config.M365_GRAPH_SCOPES,
+            interactive=False,  # MCP server runs headless over stdio
+        )
+        logger.info("Graph API client initialized")
+    except ImportError:
+        logger.warning("msal/httpx not installed — Graph API disabled")
+        return
+    except Exception:
+        logger.warning("Graph API client initialization failed", exc_info=True)
+        return
+    # Proactively validate the delegated token on startup
+    try:
+        refresh_result = await _state.graph_client.proactive_token_refresh()
+        status = refresh_result["status"]
+        if status == "expired":
+            logger.warning("Graph delegated token EXPIRED: %s", refresh_result["message"])
+        elif status == "warning":
+            logger.warning("Graph token nearing expiry: %s", refresh_result["message"])
+        else:
+            logger.info("Graph token OK: %s", refresh_result["message"])
+        # Send macOS notification for warning/expired
+        if status in ("warning", "expired"):
+            try:
+                from apple_notifications.notifier import Notifier
+
+                if status == "warning":
+                    days = refresh_result.get("days_until_expiry", "?")
+                    Notifier.send(
+                        title="Jarvis: Graph Token Expiring",
+                        message=f"Token expires in ~{days} days. Run: python scripts/bootstrap_secrets.py --reauth",
+                    )
+                else:
+                    Notifier.send(
+                        title="Jarvis: Graph Token Expired",
+                        message="Run: python scripts/bootstrap_secrets.py --reauth",
+                        sound="Basso",
+                    )
+            except Exception:
+                logger.warning("Failed to send token notification", exc_info=True)
+    except Exception:
+        logger.warning("Graph token refresh check failed", exc_info=True)
+
 
 @asynccontextmanager
 async def app_lifespan(server: FastMCP):
-    """Initialize shared resources on startup, clean up on shutdown."""
+    """Initialize shared resources on startup, clean up on shutdown.
+
+    Only cheap setup runs before the server starts answering. ChromaDB,
+    EventKit, the M365 connector check, default task seeding, session
+    context and the Graph token check are warmed in background tasks; a
+    tool that needs one of them first builds or waits for it. With
+    MCP_LAZY_STARTUP off, the warm-up is awaited before serving.
+    """
+    timeline = StartupTimeline(started=_IMPORT_STARTED)
+    timeline.record("imports", _IMPORT_STARTED, "foreground", finished=_IMPORTS_FINISHED)
+    _state.startup_timeline = timeline
+
     app_config.DATA_DIR.mkdir(parents=True, exist_ok=True)
     app_config.AGENT_CONFIGS_DIR.mkdir(parents=True, exist_ok=True)
     routing_db_candidate = getattr(app_config, "CALENDAR_ROUTING_DB_PATH", None)
@@ -61,55 +200,64 @@ async def app_lifespan(server: FastMCP):
     detect_timeout_candidate = getattr(app_config, "M365_BRIDGE_DETECT_TIMEOUT_SECONDS", 5)
     m365_detect_timeout = detect_timeout_candidate if isinstance(detect_timeout_candidate, int) and detect_timeout_candidate > 0 else 5
 
-    document_store = DocumentStore(persist_dir=app_config.CHROMA_PERSIST_DIR)
-    memory_store = MemoryStore(
-        app_config.MEMORY_DB_PATH,
-        chroma_client=document_store.client,
-    )
-    agent_registry = AgentRegistry(app_config.AGENT_CONFIGS_DIR)
-    apple_calendar_store = CalendarStore()
-    m365_bridge = ClaudeM365Bridge(
-        claude_bin=claude_bin,
-        mcp_config=claude_mcp_config,
-        model=m365_model,
-        timeout_seconds=m365_timeout,
-        detect_timeout_seconds=m365_detect_timeout,
-    )
-    m365_initial_connected = m365_bridge.is_connector_connected()
-    if not m365_initial_connected:
-        logger.warning(
-            "M365 bridge not connected at startup — will re-check periodically. "
-            "Calendar reads may fall back to Apple until M365 reconnects."
+    with timeline.phase("memory_store"):
+        document_store = LazyHandle("document_store", _open_document_store, timeline)
+        facts_collection = LazyHandle(
+            "facts_collection",
+            lambda: document_store.client.get_or_create_collection(
+                "facts_vectors",
+                metadata={"hnsw:space": "cosine"},
+            ),
+            timeline,
         )
-    m365_provider = Microsoft365CalendarProvider(
-        connected=m365_initial_connected,
-        list_calendars_fn=m365_bridge.list_calendars,
-        get_events_fn=m365_bridge.get_events,
-        create_event_fn=m365_bridge.create_event,
-        update_event_fn=m365_bridge.update_event,
-        delete_event_fn=m365_bridge.delete_event,
-        search_events_fn=m365_bridge.search_events,
-        connectivity_checker=m365_bridge.is_connector_connected,
-    )
-    calendar_router = ProviderRouter({
-        "apple": AppleCalendarProvider(apple_calendar_store),
-        "microsoft_365": m365_provider,
-    })
-    calendar_store = UnifiedCalendarService(
-        router=calendar_router,
-        ownership_db_path=routing_db_path,
-        require_all_read_providers_success=require_dual_read,
-    )
-    reminder_store = ReminderStore()
-    mail_store = MailStore()
-    messages_store = MessageStore()
-    okr_store = OKRStore(app_config.OKR_DATA_DIR)
+        memory_store = MemoryStore(app_config.MEMORY_DB_PATH, facts_collection=facts_collection)
+
+    with timeline.phase("stores"):
+        agent_registry = AgentRegistry(app_config.AGENT_CONFIGS_DIR)
+        apple_calendar_store = LazyHandle("apple_calendar_store", _open_calendar_store, timeline)
+        m365_bridge = ClaudeM365Bridge(
+            claude_bin=claude_bin,
+            mcp_config=claude_mcp_config,
+            model=m365_model,
+            timeout_seconds=m365_timeout,
+            detect_timeout_seconds=m365_detect_timeout,
+        )
+        # Starts disconnected; the m365_connectivity warm-up sets the real state.
+        m365_provider = Microsoft365CalendarProvider(
+            connected=False,
+            list_calendars_fn=m365_bridge.list_calendars,
+            get_events_fn=m365_bridge.get_events,
+            create_event_fn=m365_bridge.create_event,
+            update_event_fn=m365_bridge.update_event,
+            delete_event_fn=m365_bridge.delete_event,
+            search_events_fn=m365_bridge.search_events,
+            connectivity_checker=m365_bridge.is_connector_connected,
+        )
+        calendar_router = ProviderRouter({
+            "apple": AppleCalendarProvider(apple_calendar_store),
+            "microsoft_365": m365_provider,
+        })
+        calendar_store = UnifiedCalendarService(
+            router=calendar_router,
+            ownership_db_path=routing_db_path,
+            require_all_read_providers_success=require_dual_read,
+        )
+        reminder_store = LazyHandle("reminder_store", _open_reminder_store, timeline)
+        mail_store = MailStore(
+            envelope_index=(
+                EnvelopeIndex(app_config.MAIL_ENVELOPE_INDEX_PATH or None)
+                if app_config.MAIL_ENVELOPE_INDEX_ENABLED else None
+            ),
+        )
+        messages_store = MessageStore()
+        okr_store = OKRStore(app_config.OKR_DATA_DIR)
 
-    # Initialize hook registry and load YAML configs
-    hook_registry = HookRegistry()
-    hook_configs_dir = app_config.BASE_DIR / "hooks" / "hook_configs"
-    loaded = hook_registry.load_configs(hook_configs_dir)
-    logger.info("Loaded %d hook(s) from %s", loaded, hook_configs_dir)
+    with timeline.phase("hooks"):
+        # Initialize hook registry and load YAML configs
+        hook_registry = HookRegistry(default_timeout=app_config.HOOK_TIMEOUT_SECONDS)
+        hook_configs_dir = app_config.BASE_DIR / "hooks" / "hook_configs"
+        loaded = hook_registry.load_configs(hook_configs_dir)
+        logger.info("Loaded %d hook(s) from %s", loaded, hook_configs_dir)
 
     _state.memory_store = memory_store
     _state.document_store = document_store
@@ -123,137 +271,70 @@ async def app_lifespan(server: FastMCP):
     _state.okr_store = okr_store
     _state.hook_registry = hook_registry
 
-    # Initialize session brain
-    from session.brain import SessionBrain
-    _state.session_brain = SessionBrain(app_config.SESSION_BRAIN_PATH)
-    _state.session_brain.load()
-
-    # Initialize session manager (with brain for cross-session persistence)
-    from session.manager import SessionManager
-    _state.session_manager = SessionManager(memory_store, session_brain=_state.session_brain)
-
-    # Seed default scheduled tasks if they don't already exist
-    _default_tasks = [
-        ScheduledTask(
-            name="alert_eval",
-            handler_type="alert_eval",
-            schedule_type="interval",
-            schedule_config='{"hours": 2}',
-            description="Evaluate alert rules every 2 hours",
-        ),
-        ScheduledTask(
-            name="webhook_poll",
-            handler_type="webhook_poll",
-            schedule_type="interval",
-            schedule_config='{"minutes": 5}',
-            description="Poll for new webhook events every 5 minutes",
-        ),
-        ScheduledTask(
-            name="webhook_dispatch",
-            handler_type="webhook_dispatch",
-            schedule_type="interval",
-            schedule_config='{"minutes": 5}',
-            description="Dispatch pending webhook events to matched agents every 5 minutes",
-        ),
-        ScheduledTask(
-            name="skill_analysis",
-            handler_type="skill_analysis",
-            schedule_type="interval",
-            schedule_config='{"hours": 24}',
-            description="Analyze skill usage patterns daily",
-        ),
-    ]
-    for default_task in _default_tasks:
-        if memory_store.get_scheduled_task_by_name(default_task.name) is None:
-            from scheduler.engine import calculate_next_run
-            default_task.next_run_at = calculate_next_run(
-                default_task.schedule_type, default_task.schedule_config
+    with timeline.phase("session"):
+        # Initialize session brain
+        from session.brain import SessionBrain
+        _state.session_brain = SessionBrain(app_config.SESSION_BRAIN_PATH)
+        _state.session_brain.load()
+
+        # Initialize session manager (with brain for cross-session persistence)
+        from session.manager import SessionManager
+        _state.session_manager = SessionManager(memory_store, session_brain=_state.session_brain)
+
+    async def check_m365() -> None:
+        connected = await asyncio.to_thread(m365_bridge.is_connector_connected)
+        m365_provider.set_connected(connected)
+        if not connected:
+            logger.warning(
+                "M365 bridge not connected at startup — will re-check periodically. "
+                "Calendar reads may fall back to Apple until M365 reconnects."
             )
-            memory_store.store_scheduled_task(default_task)
-            logger.info("Seeded default scheduled task: %s", default_task.name)
 
-    # Load proactive session context
-    from session.context_loader import load_session_context
-    from session.context_config import ContextLoaderConfig
+    async def warm_reminder_store() -> None:
+        store = await reminder_store.warm()
+        await store.refresh_index_async()
+
+    warmers = start_warmers({
+        "m365_connectivity": check_m365,
+        "document_store": document_store.warm,
+        "facts_collection": facts_collection.warm,
+        "apple_calendar_store": apple_calendar_store.warm,
+        "reminder_store": warm_reminder_store,
+        "default_tasks": lambda: asyncio.to_thread(_seed_default_tasks, memory_store),
+        "graph_client": _init_graph_client,
+    }, timeline)
+
+    async def warm_session_context() -> None:
+        # The calendar and reminder sources read through these.
+        await asyncio.gather(
+            warmers["m365_connectivity"], warmers["apple_calendar_store"], warmers["reminder_store"],
+        )
+        await asyncio.to_thread(_load_session_context)
 
-    context_config = ContextLoaderConfig(
-        enabled=app_config.SESSION_CONTEXT_ENABLED,
-        per_source_timeout_seconds=app_config.SESSION_CONTEXT_TIMEOUT,
-        ttl_minutes=app_config.SESSION_CONTEXT_TTL,
-        sources={s: True for s in app_config.SESSION_CONTEXT_SOURCES},
-    )
-    if context_config.enabled:
-        try:
-            _state.session_context = load_session_context(_state, context_config)
-            logger.info(
-                "Session context loaded: %d events, %d unread, %d overdue, %d pending, %d reminders, errors: %s",
-                len(_state.session_context.calendar_events),
-                _state.session_context.unread_mail_count,
-                len(_state.session_context.overdue_delegations),
-                len(_state.session_context.pending_decisions),
-                len(_state.session_context.due_reminders),
-                list(_state.session_context.errors.keys()) or "none",
-            )
-        except Exception:
-            logger.exception("Failed to load session context (non-fatal)")
-
-    # Initialize Graph API client if credentials are available
-    if app_config.M365_GRAPH_ENABLED:
-        try:
-            from connectors.graph_client import GraphClient
-            _state.graph_client = GraphClient(
-                client_id=app_config.M365_CLIENT_ID,
-                tenant_id=app_config.M365_TENANT_ID,
-                scopes=app_config.M365_GRAPH_SCOPES,
-                interactive=False,  # MCP server runs headless over stdio
-            )
-            logger.info("Graph API client initialized")
-            # Proactively validate the delegated token on startup
-            try:
-                refresh_result = await _state.graph_client.proactive_token_refresh()
-                status = refresh_result["status"]
-                if status == "expired":
-                    logger.warning("Graph delegated token EXPIRED: %s", refresh_result["message"])
-                elif status == "warning":
-                    logger.warning("Graph token nearing expiry: %s", refresh_result["message"])
-                else:
-                    logger.info("Graph token OK: %s", refresh_result["message"])
-                # Send macOS notification for warning/expired
-                if status in ("warning", "expired"):
-                    try:
-                        from apple_notifications.notifier import Notifier
-
-                        if status == "warning":
-                            days = refresh_result.get("days_until_expiry", "?")
-                            Notifier.send(
-                                title="Jarvis: Graph Token Expiring",
-                                message=f"Token expires in ~{days} days. Run: python scripts/bootstrap_secrets.py --reauth",
-                            )
-                        else:
-                            Notifier.send(
-                                title="Jarvis: Graph Token Expired",
-                                message="Run: python scripts/bootstrap_secrets.py --reauth",
-                                sound="Basso",
-                            )
-                    except Exception:
-                        logger.warning("Failed to send token notification", exc_info=True)
-            except Exception:
-                logger.warning("Graph token refresh check failed", exc_info=True)
-        except ImportError:
-            logger.warning("msal/httpx not installed — Graph API disabled")
-        except Exception:
-            logger.warning("Graph API client initialization failed", exc_info=True)
+    warmers.update(start_warmers({"session_context": warm_session_context}, timeline))
 
-    logger.info("Jarvis MCP server initialized")
+    if not app_config.MCP_LAZY_STARTUP:
+        await asyncio.gather(*warmers.values())
 
     # Fire session_start hooks
-    hook_registry.fire_hooks("session_start", {"event": "session_start"})
+    await hook_registry.fire_hooks_async("session_start", {"event": "session_start"})
+
+    logger.info(
+        "Jarvis MCP server initialized in %.0fms (%d subsystem(s) warming in background)",
+        timeline.elapsed_ms(), sum(not task.done() for task in warmers.values()),
+    )
 
     try:
         yield
     finally:
         # Fire session_end hooks
-        hook_registry.fire_hooks("session_end", {"event": "session_end"})
+        await hook_registry.fire_hooks_async("session_end", {"event": "session_end"})
+        await hook_registry.drain_observers()
+
+        pending = [task for task in warmers.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
 
         # Close Graph API client
         if _state.graph_client:
@@ -279,6 +360,7 @@ async def app_lifespan(server: FastMCP):
         _state.session_manager = None
         _state.session_brain = None
         _state.session_context = None
+        _state.startup_timeline = None
         memory_store.close()
         logger.info("Jarvis MCP server shut down")
 
@@ -355,6 +437,8 @@ api_usage_tools.register(mcp, _state)
 from mcp_tools.usage_tracker import install_usage_tracker
 install_usage_tracker(mcp, _state)
 
+_IMPORTS_FINISHED = time.perf_counter()
+
 
 # --- Entry point ---
 
@@ -73,10 +73,25 @@ def register(mcp, state):
         if not target.exists():
             return f"Path not found: {path}"
 
-        result = _ingest_path(target, document_store)
+        result = _ingest_path(target, document_store, memory_store=state.memory_store)
         logger.info(f"Ingested from {path}: {result}")
         return result
 
+    @mcp.tool()
+    @tool_errors("Knowledge compile status error", expected=_EXPECTED)
+    async def get_knowledge_compile_status() -> str:
+        """Show progress of queued document summary jobs.
+
+        Returns job counts by status (pending, running, batched, done, skipped, failed),
+        outstanding Message Batch ids, and the most recent failures.
+        """
+        memory_store = state.memory_store
+        stats = _retry_on_transient(memory_store.get_compile_job_stats)
+        counts = stats["counts"]
+        resolved = counts["done"] + counts["skipped"] + counts["failed"]
+        stats["progress_pct"] = round(100.0 * resolved / stats["total"], 1) if stats["total"] else 100.0
+        return json.dumps(stats)
+
     @mcp.tool()
     @tool_errors("Document list error", expected=_EXPECTED)
     async def list_documents() -> str:
@@ -204,5 +219,6 @@ def register(mcp, state):
     module.search_documents = search_documents
     module.ingest_documents = ingest_documents
     module.list_documents = list_documents
+    module.get_knowledge_compile_status = get_knowledge_compile_status
     module.delete_document = delete_document
     module.archive_document = archive_document
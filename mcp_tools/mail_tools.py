@@ -12,6 +12,7 @@ from .state import _retry_on_transient
 logger = logging.getLogger(__name__)
 
 from utils.text import split_addresses as _split_addresses
+from utils.text import split_ids as _split_ids
 
 try:
     from connectors.graph_client import GraphAPIError, GraphAuthError, GraphTransientError
@@ -72,8 +73,8 @@ def register(mcp, state):
 
         Args:
             mailbox: Mailbox name to fetch from (default: INBOX)
-            account: Mail account name (uses first account if empty)
-            limit: Maximum number of messages to return (default: 25, max: 100)
+            account: Mail account name (uses first account if empty; every account when read from the Mail index)
+            limit: Maximum number of messages to return (default: 25, max: 100, or 500 from the Mail index)
         """
         mail_store = state.mail_store
         messages = _retry_on_transient(mail_store.get_messages, mailbox=mailbox, account=account, limit=limit)
@@ -99,8 +100,8 @@ def register(mcp, state):
         Args:
             query: Text to search for in subject and sender fields (required)
             mailbox: Mailbox to search in (default: INBOX)
-            account: Mail account name (uses first account if empty)
-            limit: Maximum number of results (default: 25, max: 100)
+            account: Mail account name (uses first account if empty; every account when read from the Mail index)
+            limit: Maximum number of results (default: 25, max: 100, or 500 from the Mail index)
         """
         mail_store = state.mail_store
         messages = mail_store.search_messages(query=query, mailbox=mailbox, account=account, limit=limit)
@@ -148,6 +149,50 @@ def register(mcp, state):
         result = mail_store.move_message(message_id, target_mailbox=target_mailbox, target_account=target_account)
         return json.dumps(result)
 
+    @mcp.tool()
+    @tool_errors("Mail error", expected=_MAIL_EXPECTED)
+    async def mark_mail_read_bulk(message_ids: str, read: str = "true") -> str:
+        """Mark several messages as read or unread in one Mail round-trip. Reports a status per message.
+
+        Args:
+            message_ids: Comma-separated message IDs (required)
+            read: Set to 'true' to mark as read, 'false' for unread (default: 'true')
+        """
+        mail_store = state.mail_store
+        read_bool = read if isinstance(read, bool) else read.lower() == "true"
+        result = mail_store.mark_read_bulk(_split_ids(message_ids), read=read_bool)
+        return json.dumps(result)
+
+    @mcp.tool()
+    @tool_errors("Mail error", expected=_MAIL_EXPECTED)
+    async def mark_mail_flagged_bulk(message_ids: str, flagged: str = "true") -> str:
+        """Flag or unflag several messages in one Mail round-trip. Reports a status per message.
+
+        Args:
+            message_ids: Comma-separated message IDs (required)
+            flagged: Set to 'true' to flag, 'false' to unflag (default: 'true')
+        """
+        mail_store = state.mail_store
+        flagged_bool = flagged if isinstance(flagged, bool) else flagged.lower() == "true"
+        result = mail_store.mark_flagged_bulk(_split_ids(message_ids), flagged=flagged_bool)
+        return json.dumps(result)
+
+    @mcp.tool()
+    @tool_errors("Mail error", expected=_MAIL_EXPECTED)
+    async def move_mail_messages_bulk(message_ids: str, target_mailbox: str, target_account: str = "") -> str:
+        """Move several messages to one mailbox in one Mail round-trip. Reports a status per message.
+
+        Args:
+            message_ids: Comma-separated message IDs (required)
+            target_mailbox: Destination mailbox name (required)
+            target_account: Destination account name (uses first account if empty)
+        """
+        mail_store = state.mail_store
+        result = mail_store.move_messages_bulk(
+            _split_ids(message_ids), target_mailbox=target_mailbox, target_account=target_account,
+        )
+        return json.dumps(result)
+
     @mcp.tool()
     @tool_errors("Mail error", expected=_MAIL_EXPECTED)
     async def reply_to_email(
@@ -272,5 +317,8 @@ def register(mcp, state):
     module.mark_mail_read = mark_mail_read
     module.mark_mail_flagged = mark_mail_flagged
     module.move_mail_message = move_mail_message
+    module.mark_mail_read_bulk = mark_mail_read_bulk
+    module.mark_mail_flagged_bulk = mark_mail_flagged_bulk
+    module.move_mail_messages_bulk = move_mail_messages_bulk
     module.reply_to_email = reply_to_email
     module.send_email = send_email
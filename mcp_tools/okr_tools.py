@@ -153,7 +153,11 @@ def register(mcp, state):
                 })
 
         # Step 2: Download from SharePoint
-        dl_result = await download_sharepoint_file(manager, url, dest)
+        dl_result = await download_sharepoint_file(
+            manager, url, dest,
+            cache_manifest=app_config.SHAREPOINT_CACHE_MANIFEST,
+            parallel_segments=app_config.SHAREPOINT_DOWNLOAD_SEGMENTS,
+        )
         if dl_result["status"] != "downloaded":
             return json.dumps({
                 "status": dl_result["status"],
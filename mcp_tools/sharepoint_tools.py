@@ -61,9 +61,12 @@ def register(mcp, state):
 
         The browser must be running (call open_teams_browser first if needed).
 
-        Two download strategies are tried automatically:
-        1. Direct download via download.aspx URL (fastest, works for most files)
-        2. Excel Online UI fallback via CDP (for Excel files when direct fails)
+        Download strategies are tried automatically:
+        1. HTTP with the browser's cookies: parallel range requests, resumed
+           after a failure, and skipped (one HEAD request) when the file is
+           unchanged since the last download
+        2. Direct download via download.aspx URL
+        3. Excel Online UI fallback via CDP (for Excel files when direct fails)
 
         Args:
             sharepoint_url: Full SharePoint URL to the document. Accepts view
@@ -138,21 +141,27 @@ def register(mcp, state):
 
         # Download
         dl_result = await download_sharepoint_file(
-            manager, sharepoint_url, destination
+            manager, sharepoint_url, destination,
+            cache_manifest=app_config.SHAREPOINT_CACHE_MANIFEST,
+            parallel_segments=app_config.SHAREPOINT_DOWNLOAD_SEGMENTS,
         )
 
         if dl_result["status"] == "downloaded":
             dl_result["filename"] = resolved_filename
+            if dl_result.get("method") == "not_modified":
+                message = f"'{resolved_filename}' is unchanged since the last download ({dl_result['path']})"
+            else:
+                message = (
+                    f"Downloaded '{resolved_filename}' "
+                    f"({dl_result['size_bytes']:,} bytes) to {dl_result['path']}"
+                )
             return json.dumps({
                 "status": "downloaded",
                 "path": dl_result["path"],
                 "filename": resolved_filename,
                 "size_bytes": dl_result["size_bytes"],
                 "method": dl_result.get("method", "unknown"),
-                "message": (
-                    f"Downloaded '{resolved_filename}' "
-                    f"({dl_result['size_bytes']:,} bytes) to {dl_result['path']}"
-                ),
+                "message": message,
             })
 
         return json.dumps(dl_result)
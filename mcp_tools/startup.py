@@ -0,0 +1,147 @@
+"""Lazy subsystem handles and the startup timeline for the MCP server.
+
+The stdio handshake waits for ``app_lifespan`` to reach its ``yield``, so
+anything slow there (opening ChromaDB, spawning the M365 connector check,
+importing PyObjC) delays the first response. In lazy startup mode heavy
+subsystems are wrapped in a ``LazyHandle``: a proxy that builds its target
+on first attribute access, and that background warm-up tasks resolve as
+soon as the server is answering. A request that arrives before warm-up
+finishes builds (or waits for) the target itself, so callers never see an
+uninitialized store.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+logger = logging.getLogger("jarvis-mcp.startup")
+
+
+class StartupTimeline:
+    """Per-phase startup durations, measured from *started* (perf_counter)."""
+
+    def __init__(self, started: Optional[float] = None) -> None:
+        self.started = started if started is not None else time.perf_counter()
+        self.phases: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str, *, mode: str = "foreground") -> Iterator[None]:
+        """Time the enclosed block as one phase; failures are recorded and re-raised."""
+        began = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.record(name, began, mode, ok=False)
+            raise
+        self.record(name, began, mode)
+
+    def record(
+        self, name: str, began: float, mode: str, *, ok: bool = True, finished: Optional[float] = None,
+    ) -> None:
+        now = finished if finished is not None else time.perf_counter()
+        entry = {
+            "phase": name,
+            "mode": mode,
+            "ok": ok,
+            "duration_ms": round((now - began) * 1000, 1),
+            "finished_at_ms": round((now - self.started) * 1000, 1),
+        }
+        with self._lock:
+            self.phases.append(entry)
+        logger.info(
+            "startup %-10s %-22s %8.1fms (done at +%.0fms)%s",
+            mode, name, entry["duration_ms"], entry["finished_at_ms"], "" if ok else " FAILED",
+        )
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.started) * 1000, 1)
+
+    def to_list(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [dict(entry) for entry in self.phases]
+
+
+class LazyHandle:
+    """Proxy for an object built by *factory* on first use.
+
+    Attribute access is forwarded to the target, building it if needed;
+    concurrent first uses build it once. A failed build is not cached, so
+    the next use retries. The handle is always truthy and never None, so
+    ``state.x is not None`` checks behave as they did for eager objects.
+    """
+
+    __slots__ = ("_name", "_factory", "_timeline", "_lock", "_target", "_ready")
+
+    def __init__(self, name: str, factory: Callable[[], Any], timeline: Optional[StartupTimeline] = None) -> None:
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_timeline", timeline)
+        object.__setattr__(self, "_lock", threading.Lock())
+        object.__setattr__(self, "_target", None)
+        object.__setattr__(self, "_ready", False)
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def resolve(self, *, mode: str = "on-demand") -> Any:
+        """The target object, built now if no one has built it yet."""
+        if self._ready:
+            return self._target
+        with self._lock:
+            if not self._ready:
+                began = time.perf_counter()
+                try:
+                    target = self._factory()
+                except Exception:
+                    if self._timeline is not None:
+                        self._timeline.record(self._name, began, mode, ok=False)
+                    raise
+                object.__setattr__(self, "_target", target)
+                object.__setattr__(self, "_ready", True)
+                if self._timeline is not None:
+                    self._timeline.record(self._name, began, mode)
+        return self._target
+
+    async def warm(self) -> Any:
+        """Build the target in a worker thread without blocking the loop."""
+        return await asyncio.to_thread(self.resolve, mode="background")
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self.resolve(), attr, value)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __repr__(self) -> str:
+        state = repr(self._target) if self._ready else "not built"
+        return f"<LazyHandle {self._name}: {state}>"
+
+
+def start_warmers(
+    warmers: dict[str, Callable[[], Awaitable[Any]]],
+    timeline: StartupTimeline,
+) -> dict[str, asyncio.Task]:
+    """Start each warm-up coroutine as a task; failures are logged, not raised."""
+    async def run(name: str, warm: Callable[[], Awaitable[Any]]) -> None:
+        began = time.perf_counter()
+        try:
+            await warm()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Background warm-up '%s' failed", name, exc_info=True)
+            timeline.record(name, began, "background", ok=False)
+            return
+        timeline.record(name, began, "background")
+
+    return {name: asyncio.create_task(run(name, warm), name=f"warm-{name}") for name, warm in warmers.items()}
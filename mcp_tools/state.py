@@ -26,6 +26,7 @@ if TYPE_CHECKING:
     from session.brain import SessionBrain
     from session.context_loader import SessionContext
     from session.manager import SessionManager
+    from mcp_tools.startup import StartupTimeline
 
 
 @dataclass
@@ -80,6 +81,7 @@ class ServerState:
     agent_browser: Optional[Any] = None  # browser.agent_browser.AgentBrowser
     session_context: Optional[SessionContext] = None
     graph_client: Optional[GraphClient] = None  # initialized in lifespan if M365_GRAPH_ENABLED
+    startup_timeline: Optional[StartupTimeline] = None
 
     @staticmethod
     @cache
@@ -114,6 +116,7 @@ class ServerState:
         self.agent_browser = None
         self.session_context = None
         self.graph_client = None
+        self.startup_timeline = None
 
     def __setitem__(self, key: str, value: Any) -> None:
         """Dict-style assignment (for backward compatibility with tests)."""
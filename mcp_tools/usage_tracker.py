@@ -1,8 +1,9 @@
 """Automatic tool usage tracking middleware for the MCP server.
 
 Wraps FastMCP.call_tool to record every tool invocation in the
-skill_usage table. Tracking failures are swallowed so they never
-break actual tool execution.
+skill_usage table. Rows go through MemoryStore's write-behind telemetry
+buffer, so no commit happens on the tool-call path. Tracking failures
+are swallowed so they never break actual tool execution.
 """
 
 import functools
@@ -94,7 +95,7 @@ def install_usage_tracker(mcp, state):
             try:
                 memory_store = state.memory_store
                 if memory_store is not None:
-                    memory_store.record_skill_usage(name, pattern)
+                    memory_store.queue_skill_usage(name, pattern)
             except Exception:
                 logger.debug("Failed to record usage for %s", name, exc_info=True)
 
@@ -104,7 +105,7 @@ def install_usage_tracker(mcp, state):
                 try:
                     from hooks.registry import build_tool_context, extract_transformed_args
                     before_ctx = build_tool_context(name, arguments or {})
-                    hook_results = hook_registry.fire_hooks("before_tool_call", before_ctx)
+                    hook_results = await hook_registry.fire_hooks_async("before_tool_call", before_ctx)
                     transformed = extract_transformed_args(hook_results)
                     if transformed is not None:
                         arguments = transformed
@@ -151,7 +152,7 @@ def install_usage_tracker(mcp, state):
                         )
                         after_ctx["success"] = success
                         after_ctx["duration_ms"] = duration_ms
-                        hook_registry.fire_hooks("after_tool_call", after_ctx)
+                        await hook_registry.fire_hooks_async("after_tool_call", after_ctx)
                     except Exception:
                         logger.debug("after_tool_call hooks failed for %s", name, exc_info=True)
 
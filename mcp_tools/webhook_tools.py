@@ -8,7 +8,7 @@ from .state import _retry_on_transient
 
 logger = logging.getLogger("jarvis-mcp")
 
-_VALID_WEBHOOK_STATUSES = {"pending", "processed", "failed"}
+_VALID_WEBHOOK_STATUSES = {"pending", "dispatching", "processed", "failed", "dead_letter"}
 _MAX_WEBHOOK_LIMIT = 500
 
 
@@ -82,6 +82,8 @@ def register(mcp, state):
             "status": event.status,
             "received_at": event.received_at,
             "processed_at": event.processed_at,
+            "attempts": event.attempts,
+            "last_error": event.last_error,
         })
 
     @mcp.tool()
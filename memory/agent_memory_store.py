@@ -11,9 +11,10 @@ from memory.models import AgentMemory
 class AgentMemoryStore:
     """Manages per-agent memory and namespace-based shared memory."""
 
-    def __init__(self, conn: sqlite3.Connection, *, lock=None):
+    def __init__(self, conn: sqlite3.Connection, *, lock=None, reader=None):
         self.conn = conn
         self._lock = lock or threading.RLock()
+        self._reader = reader or (lambda: self.conn)
 
     # --- Agent Memory ---
 
@@ -31,7 +32,7 @@ class AgentMemoryStore:
                  memory.confidence, now, now),
             )
             self.conn.commit()
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT * FROM agent_memory WHERE agent_name=? AND memory_type=? AND key=?",
             (memory.agent_name, memory.memory_type, memory.key),
         ).fetchone()
@@ -39,19 +40,19 @@ class AgentMemoryStore:
 
     def get_agent_memories(self, agent_name: str, memory_type: str = "") -> list[AgentMemory]:
         if memory_type:
-            rows = self.conn.execute(
+            rows = self._reader().execute(
                 "SELECT * FROM agent_memory WHERE agent_name=? AND memory_type=? ORDER BY updated_at DESC",
                 (agent_name, memory_type),
             ).fetchall()
         else:
-            rows = self.conn.execute(
+            rows = self._reader().execute(
                 "SELECT * FROM agent_memory WHERE agent_name=? ORDER BY updated_at DESC",
                 (agent_name,),
             ).fetchall()
         return [self._row_to_agent_memory(r) for r in rows]
 
     def search_agent_memories(self, agent_name: str, query: str) -> list[AgentMemory]:
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             "SELECT * FROM agent_memory WHERE agent_name=? AND (key LIKE ? OR value LIKE ?) ORDER BY updated_at DESC",
             (agent_name, f"%{query}%", f"%{query}%"),
         ).fetchall()
@@ -121,7 +122,7 @@ class AgentMemoryStore:
                 (agent_name, memory_type, key, value, confidence, namespace, now, now),
             )
             self.conn.commit()
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT * FROM agent_memory WHERE agent_name=? AND memory_type=? AND key=?",
             (agent_name, memory_type, key),
         ).fetchone()
@@ -130,12 +131,12 @@ class AgentMemoryStore:
     def get_shared_memories(self, namespace: str, memory_type: str = "") -> list[AgentMemory]:
         agent_name = self._shared_agent_name(namespace)
         if memory_type:
-            rows = self.conn.execute(
+            rows = self._reader().execute(
                 "SELECT * FROM agent_memory WHERE agent_name=? AND namespace=? AND memory_type=? ORDER BY updated_at DESC",
                 (agent_name, namespace, memory_type),
             ).fetchall()
         else:
-            rows = self.conn.execute(
+            rows = self._reader().execute(
                 "SELECT * FROM agent_memory WHERE agent_name=? AND namespace=? ORDER BY updated_at DESC",
                 (agent_name, namespace),
             ).fetchall()
@@ -143,7 +144,7 @@ class AgentMemoryStore:
 
     def search_shared_memories(self, namespace: str, query: str) -> list[AgentMemory]:
         agent_name = self._shared_agent_name(namespace)
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             "SELECT * FROM agent_memory WHERE agent_name=? AND namespace=? AND (key LIKE ? OR value LIKE ?) ORDER BY updated_at DESC",
             (agent_name, namespace, f"%{query}%", f"%{query}%"),
         ).fetchall()
@@ -0,0 +1,271 @@
+# memory/alert_engine.py
+"""Single-pass evaluation of the built-in alerts and alert rules.
+
+Every built-in check and enabled alert rule is compiled to a date
+predicate on delegations or decisions (or a lookup of the backup fact).
+Identical predicates are shared, so two rules with the same threshold, or
+a rule that matches a built-in check, cost one SQL expression between
+them. All checks run as one parameterized ``UNION ALL`` statement, so
+they see a single consistent snapshot. Each returned row carries the list
+of checks it satisfied, and each rule's matches are built from that list.
+"""
+import json
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from memory.models import AlertRule, DecisionStatus, DelegationStatus
+
+# Built-in checks reported by check_alerts regardless of alert rules.
+BUILTIN_STALE_DECISION_DAYS = 7
+BUILTIN_UPCOMING_DAYS = 3
+
+_DELEGATION_PREDICATES = {
+    "due_before": "due_date < ?",
+    "due_between": "due_date BETWEEN ? AND ?",
+}
+_DECISION_PREDICATES = {
+    "created_before": "created_at < ?",
+}
+
+
+def parse_rule_condition(condition: str) -> dict:
+    """Parse an alert rule's JSON condition; anything but a JSON object is {}."""
+    condition = (condition or "").strip()
+    if not condition:
+        return {}
+    try:
+        value = json.loads(condition)
+    except json.JSONDecodeError:
+        return {}
+    return value if isinstance(value, dict) else {}
+
+
+class _Plan:
+    """Distinct checks, numbered per table, in the order first requested."""
+
+    def __init__(self):
+        self.delegation: dict[tuple, int] = {}
+        self.decision: dict[tuple, int] = {}
+        self.backup = False
+
+    def add(self, check: tuple) -> tuple:
+        table = self.decision if check[0] in _DECISION_PREDICATES else self.delegation
+        table.setdefault(check, len(table))
+        return check
+
+
+def _compile_rule(rule: AlertRule, today: date) -> Optional[tuple]:
+    """The check a rule needs, or None for alert types with nothing to query.
+
+    Raises ValueError/TypeError for conditions with non-numeric thresholds.
+    """
+    parsed = parse_rule_condition(rule.condition)
+    alert_type = (rule.alert_type or "").strip().lower()
+    if alert_type == "overdue_delegation":
+        # days_overdue >= n  <=>  due_date <= today - n  <=>  due_date < today - (n - 1),
+        # never later than the built-in "due before today".
+        min_days = int(parsed.get("days_overdue", 1))
+        return ("due_before", (today - timedelta(days=max(min_days - 1, 0))).isoformat())
+    if alert_type in ("pending_decision", "stale_decision"):
+        stale_days = int(parsed.get("days_stale", 7))
+        return ("created_before", (today - timedelta(days=stale_days)).isoformat())
+    if alert_type == "upcoming_deadline":
+        within_days = int(parsed.get("within_days", 3))
+        return ("due_between", today.isoformat(), (today + timedelta(days=within_days)).isoformat())
+    if alert_type == "stale_backup":
+        int(parsed.get("max_age_hours", 48))
+        return ("backup",)
+    return None
+
+
+class AlertEngine:
+    """Evaluates alert checks against decisions, delegations and facts."""
+
+    def __init__(self, conn: sqlite3.Connection, *, lock=None, reader=None):
+        self.conn = conn
+        self._lock = lock or threading.RLock()
+        self._reader = reader or (lambda: self.conn)
+
+    def evaluate_alerts(
+        self,
+        rules: list[AlertRule],
+        *,
+        include_builtin: bool = True,
+        now: Optional[datetime] = None,
+    ) -> dict:
+        """Evaluate the built-in checks and *rules* in one query.
+
+        Returns ``{"alerts": {...}, "rule_results": [...]}``. ``alerts``
+        holds the built-in overdue_delegations, stale_decisions and
+        upcoming_deadlines lists (empty when *include_builtin* is False).
+        ``rule_results`` has one entry per distinct rule, in order, with
+        rule_id, name, alert_type, count and matches; a rule whose
+        condition cannot be compiled gets an ``error`` instead.
+        """
+        now = now or datetime.now()
+        today = now.date()
+        plan = _Plan()
+
+        builtin = {}
+        if include_builtin:
+            builtin = {
+                "overdue_delegations": plan.add(("due_before", today.isoformat())),
+                "stale_decisions": plan.add((
+                    "created_before", (today - timedelta(days=BUILTIN_STALE_DECISION_DAYS)).isoformat(),
+                )),
+                "upcoming_deadlines": plan.add((
+                    "due_between", today.isoformat(),
+                    (today + timedelta(days=BUILTIN_UPCOMING_DAYS)).isoformat(),
+                )),
+            }
+
+        compiled: list[tuple[AlertRule, Optional[tuple], Optional[str]]] = []
+        seen_rules = set()
+        for rule in rules:
+            key = rule.id if rule.id is not None else rule.name
+            if key in seen_rules:
+                continue
+            seen_rules.add(key)
+            try:
+                check = _compile_rule(rule, today)
+            except (TypeError, ValueError) as exc:
+                compiled.append((rule, None, f"Invalid condition: {exc}"))
+                continue
+            if check == ("backup",):
+                plan.backup = True
+            elif check is not None:
+                plan.add(check)
+            compiled.append((rule, check, None))
+
+        hits, backup_value = self._run(plan)
+
+        alerts = {name: [] for name in ("overdue_delegations", "stale_decisions", "upcoming_deadlines")}
+        for name, check in builtin.items():
+            for row in hits.get(check, []):
+                if name == "stale_decisions":
+                    alerts[name].append({"id": row["id"], "title": row["title"], "created_at": row["created_at"]})
+                else:
+                    alerts[name].append(_delegation_match(row))
+
+        rule_results = []
+        for rule, check, error in compiled:
+            result = {"rule_id": rule.id, "name": rule.name, "alert_type": rule.alert_type}
+            if error:
+                result.update(count=0, matches=[], error=error)
+            else:
+                matches = self._rule_matches(rule, check, hits, backup_value, now)
+                result.update(count=len(matches), matches=matches)
+            rule_results.append(result)
+
+        return {"alerts": alerts, "rule_results": rule_results}
+
+    def _run(self, plan: _Plan) -> tuple[dict[tuple, list[sqlite3.Row]], Optional[str]]:
+        """Run every planned check in one statement. Returns rows per check and the backup fact."""
+        parts: list[str] = []
+        params: list = []
+        if plan.delegation:
+            flags, where, check_params = self._predicates(plan.delegation, _DELEGATION_PREDICATES)
+            parts.append(
+                f"""SELECT 'delegation' AS kind, id, task AS title, delegated_to, due_date,
+                           NULL AS created_at, NULL AS value, {flags} AS hits
+                    FROM delegations
+                    WHERE status=? AND due_date IS NOT NULL AND ({where})"""
+            )
+            # Check parameters appear twice: in the hits column and in the WHERE clause.
+            params += [*check_params, DelegationStatus.active, *check_params]
+        if plan.decision:
+            flags, where, check_params = self._predicates(plan.decision, _DECISION_PREDICATES)
+            parts.append(
+                f"""SELECT 'decision' AS kind, id, title, NULL AS delegated_to, NULL AS due_date,
+                           created_at, NULL AS value, {flags} AS hits
+                    FROM decisions
+                    WHERE status=? AND created_at IS NOT NULL AND created_at != '' AND ({where})"""
+            )
+            params += [*check_params, DecisionStatus.pending_execution, *check_params]
+        if plan.backup:
+            parts.append(
+                """SELECT 'backup' AS kind, NULL AS id, NULL AS title, NULL AS delegated_to,
+                          NULL AS due_date, NULL AS created_at, value, '' AS hits
+                   FROM facts WHERE category='work' AND key='backup_last_success'"""
+            )
+        if not parts:
+            return {}, None
+
+        by_index = {
+            "delegation": {i: check for check, i in plan.delegation.items()},
+            "decision": {i: check for check, i in plan.decision.items()},
+        }
+        hits: dict[tuple, list[sqlite3.Row]] = {}
+        backup_value = None
+        sql = " UNION ALL ".join(parts) + " ORDER BY 1, 2"  # kind, id
+        for row in self._reader().execute(sql, params):
+            if row["kind"] == "backup":
+                backup_value = row["value"]
+                continue
+            checks = by_index[row["kind"]]
+            for index in row["hits"].split(",")[:-1]:
+                hits.setdefault(checks[int(index)], []).append(row)
+        return hits, backup_value
+
+    @staticmethod
+    def _predicates(checks: dict[tuple, int], predicates: dict[str, str]) -> tuple[str, str, list]:
+        """SQL for the per-row list of satisfied checks, the OR of all checks, and their parameters."""
+        flags = " || ".join(
+            f"(CASE WHEN {predicates[check[0]]} THEN '{index},' ELSE '' END)" for check, index in checks.items()
+        )
+        where = " OR ".join(predicates[check[0]] for check in checks)
+        return flags, where, [value for check in checks for value in check[1:]]
+
+    @staticmethod
+    def _rule_matches(rule, check, hits, backup_value, now: datetime) -> list[dict]:
+        if check is None:
+            return []
+        parsed = parse_rule_condition(rule.condition)
+        if check[0] == "due_before":
+            min_days = int(parsed.get("days_overdue", 1))
+            today = now.date()
+            matches = []
+            for row in hits.get(check, []):
+                try:
+                    days_overdue = (today - date.fromisoformat(row["due_date"])).days
+                except ValueError:
+                    continue
+                if days_overdue >= min_days:
+                    matches.append({**_delegation_match(row), "days_overdue": days_overdue})
+            return matches
+        if check[0] == "created_before":
+            return [
+                {"id": row["id"], "title": row["title"], "created_at": row["created_at"]}
+                for row in hits.get(check, [])
+            ]
+        if check[0] == "due_between":
+            return [_delegation_match(row) for row in hits.get(check, [])]
+        return _stale_backup_matches(backup_value, int(parsed.get("max_age_hours", 48)), now)
+
+
+def _delegation_match(row: sqlite3.Row) -> dict:
+    return {
+        "id": row["id"],
+        "task": row["title"],
+        "delegated_to": row["delegated_to"],
+        "due_date": row["due_date"],
+    }
+
+
+def _stale_backup_matches(value: Optional[str], max_age_hours: int, now: datetime) -> list[dict]:
+    if value is None:
+        return [{"reason": "No backup_last_success fact found"}]
+    # Value format: "YYYY-MM-DD: summary text"
+    try:
+        last_backup = datetime.strptime(value.split(":")[0].strip(), "%Y-%m-%d")
+    except (ValueError, IndexError):
+        return [{"reason": f"Could not parse backup timestamp: {value}"}]
+    if last_backup >= now - timedelta(hours=max_age_hours):
+        return []
+    return [{
+        "last_success": value,
+        "hours_ago": round((now - last_backup).total_seconds() / 3600, 1),
+        "threshold_hours": max_age_hours,
+    }]
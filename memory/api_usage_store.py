@@ -5,13 +5,18 @@ import threading
 from datetime import datetime
 from typing import Optional
 
+from memory.usage_rollup_store import API_USAGE_SOURCE, day_bucket, hour_bucket, watermark_sql
+
+_API_USAGE_WATERMARK_SQL = watermark_sql(API_USAGE_SOURCE)
+
 
 class ApiUsageStore:
     """Manages API usage logging and aggregation for Anthropic API calls."""
 
-    def __init__(self, conn: sqlite3.Connection, *, lock=None):
+    def __init__(self, conn: sqlite3.Connection, *, lock=None, reader=None):
         self.conn = conn
         self._lock = lock or threading.RLock()
+        self._reader = reader or (lambda: self.conn)
 
     def log_api_call(
         self,
@@ -57,10 +62,44 @@ class ApiUsageStore:
     ) -> list[dict]:
         """Aggregated totals grouped by model_id and agent_name.
 
+        Answered from the raw log when *since* falls inside the raw retention
+        window, otherwise from the rollups plus the unrolled log tail. Rollup
+        buckets are hourly (daily past the hourly retention window), so an
+        older *since* is rounded down to its bucket.
+
         Returns list of dicts with model_id, agent_name, call_count,
         total_input_tokens, total_output_tokens, total_cache_creation,
         total_cache_read, avg_duration_ms.
         """
+        state = self._reader().execute(
+            "SELECT raw_pruned_before, hourly_pruned_before FROM usage_rollup_state WHERE source=?",
+            (API_USAGE_SOURCE,),
+        ).fetchone()
+        raw_horizon = state["raw_pruned_before"] if state else None
+        if since is not None and (raw_horizon is None or since >= raw_horizon):
+            rows = self._summary_from_log(since, agent_name, model)
+        else:
+            hourly_horizon = state["hourly_pruned_before"] if state else None
+            rows = self._summary_from_rollups(since, agent_name, model, hourly_horizon)
+        return [
+            {
+                "model_id": row["model_id"],
+                "agent_name": row["agent_name"],
+                "call_count": row["call_count"],
+                "total_input_tokens": row["total_input_tokens"],
+                "total_output_tokens": row["total_output_tokens"],
+                "total_cache_creation": row["total_cache_creation"],
+                "total_cache_read": row["total_cache_read"],
+                "avg_duration_ms": (
+                    round(row["avg_duration_ms"], 2)
+                    if row["avg_duration_ms"]
+                    else None
+                ),
+            }
+            for row in rows
+        ]
+
+    def _summary_from_log(self, since, agent_name, model) -> list[sqlite3.Row]:
         query = """SELECT
                        model_id,
                        agent_name,
@@ -85,24 +124,58 @@ class ApiUsageStore:
         if conditions:
             query += " WHERE " + " AND ".join(conditions)
         query += " GROUP BY model_id, agent_name ORDER BY call_count DESC"
-        rows = self.conn.execute(query, params).fetchall()
-        return [
-            {
-                "model_id": row["model_id"],
-                "agent_name": row["agent_name"],
-                "call_count": row["call_count"],
-                "total_input_tokens": row["total_input_tokens"],
-                "total_output_tokens": row["total_output_tokens"],
-                "total_cache_creation": row["total_cache_creation"],
-                "total_cache_read": row["total_cache_read"],
-                "avg_duration_ms": (
-                    round(row["avg_duration_ms"], 2)
-                    if row["avg_duration_ms"]
-                    else None
-                ),
-            }
-            for row in rows
-        ]
+        return self._reader().execute(query, params).fetchall()
+
+    def _summary_from_rollups(self, since, agent_name, model, hourly_horizon) -> list[sqlite3.Row]:
+        rollup_conditions = ["granularity = ?"]
+        tail_conditions = [f"id > ({_API_USAGE_WATERMARK_SQL})"]
+        rollup_params: list = []
+        tail_params: list = []
+        if since and (hourly_horizon is None or since >= hourly_horizon):
+            rollup_params += ["hour", hour_bucket(since)]
+            rollup_conditions.append("bucket >= ?")
+        elif since:
+            rollup_params += ["day", day_bucket(since)]
+            rollup_conditions.append("bucket >= ?")
+        else:
+            rollup_params.append("day")
+        if since:
+            tail_conditions.append("created_at >= ?")
+            tail_params.append(since)
+        conditions = []
+        params: list = []
+        if agent_name:
+            conditions.append("agent_name = ?")
+            params.append(agent_name)
+        if model:
+            conditions.append("model_id = ?")
+            params.append(model)
+
+        query = f"""WITH usage AS (
+                       SELECT model_id, NULLIF(agent_name, '') as agent_name, call_count,
+                              input_tokens, output_tokens, cache_creation_input_tokens,
+                              cache_read_input_tokens, duration_sum, duration_count
+                       FROM api_usage_rollup WHERE {" AND ".join(rollup_conditions)}
+                       UNION ALL
+                       SELECT model_id, agent_name, 1,
+                              input_tokens, output_tokens, cache_creation_input_tokens,
+                              cache_read_input_tokens, duration_ms, duration_ms IS NOT NULL
+                       FROM agent_api_log WHERE {" AND ".join(tail_conditions)}
+                   )
+                   SELECT
+                       model_id,
+                       agent_name,
+                       SUM(call_count) as call_count,
+                       SUM(input_tokens) as total_input_tokens,
+                       SUM(output_tokens) as total_output_tokens,
+                       SUM(cache_creation_input_tokens) as total_cache_creation,
+                       SUM(cache_read_input_tokens) as total_cache_read,
+                       SUM(duration_sum) * 1.0 / NULLIF(SUM(duration_count), 0) as avg_duration_ms
+                   FROM usage"""
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " GROUP BY model_id, agent_name ORDER BY call_count DESC"
+        return self._reader().execute(query, rollup_params + tail_params + params).fetchall()
 
     def get_api_usage_log(
         self,
@@ -132,7 +205,7 @@ class ApiUsageStore:
             query += " WHERE " + " AND ".join(conditions)
         query += " ORDER BY created_at DESC LIMIT ?"
         params.append(limit)
-        rows = self.conn.execute(query, params).fetchall()
+        rows = self._reader().execute(query, params).fetchall()
         return [
             {
                 "id": row["id"],
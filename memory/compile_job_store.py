@@ -0,0 +1,150 @@
+# memory/compile_job_store.py
+"""Domain store for the knowledge compilation job queue."""
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+
+from memory.models import CompileJobStatus
+
+
+class CompileJobStore:
+    """Manages document summary jobs, de-duplicated by content hash."""
+
+    def __init__(self, conn: sqlite3.Connection, *, lock=None, reader=None):
+        self.conn = conn
+        self._lock = lock or threading.RLock()
+        self._reader = reader or (lambda: self.conn)
+
+    def enqueue_compile_job(self, file_hash: str, source: str, text: str) -> bool:
+        """Queue a summary job for *file_hash*.
+
+        Returns True if a job was queued, False if the content is already
+        queued, in flight, or summarized. Failed jobs are re-queued.
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            cursor = self.conn.execute(
+                """INSERT INTO compile_jobs (file_hash, source, text, status, created_at, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(file_hash) DO UPDATE SET
+                       source=excluded.source,
+                       text=excluded.text,
+                       status=excluded.status,
+                       batch_id=NULL,
+                       error=NULL,
+                       updated_at=excluded.updated_at
+                   WHERE compile_jobs.status = ?""",
+                (file_hash, source, text, CompileJobStatus.pending, now, now, CompileJobStatus.failed),
+            )
+            self.conn.commit()
+        return cursor.rowcount > 0
+
+    def claim_compile_jobs(self, limit: int = 10) -> list[dict]:
+        """Atomically move up to *limit* pending jobs to running and return them."""
+        now = datetime.now().isoformat()
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT * FROM compile_jobs WHERE status=? ORDER BY id ASC LIMIT ?",
+                (CompileJobStatus.pending, limit),
+            ).fetchall()
+            if not rows:
+                return []
+            ids = [r["id"] for r in rows]
+            placeholders = ",".join("?" for _ in ids)
+            self.conn.execute(
+                f"UPDATE compile_jobs SET status=?, attempts=attempts+1, updated_at=? WHERE id IN ({placeholders})",
+                [CompileJobStatus.running, now, *ids],
+            )
+            self.conn.commit()
+        return [self._row_to_compile_job(r, status=CompileJobStatus.running) for r in rows]
+
+    def mark_compile_jobs_batched(self, file_hashes: list[str], batch_id: str) -> None:
+        """Record that *file_hashes* were submitted together as one Message Batch."""
+        if not file_hashes:
+            return
+        now = datetime.now().isoformat()
+        placeholders = ",".join("?" for _ in file_hashes)
+        with self._lock:
+            self.conn.execute(
+                f"UPDATE compile_jobs SET status=?, batch_id=?, updated_at=? WHERE file_hash IN ({placeholders})",
+                [CompileJobStatus.batched, batch_id, now, *file_hashes],
+            )
+            self.conn.commit()
+
+    def list_compile_batches(self) -> list[str]:
+        """Return batch ids that still have unresolved jobs."""
+        rows = self._reader().execute(
+            "SELECT DISTINCT batch_id FROM compile_jobs WHERE status=? AND batch_id IS NOT NULL",
+            (CompileJobStatus.batched,),
+        ).fetchall()
+        return [r["batch_id"] for r in rows]
+
+    def get_compile_job(self, file_hash: str) -> Optional[dict]:
+        row = self._reader().execute(
+            "SELECT * FROM compile_jobs WHERE file_hash=?", (file_hash,)
+        ).fetchone()
+        if row is None:
+            return None
+        return self._row_to_compile_job(row)
+
+    def finish_compile_job(self, file_hash: str, status: str, error: Optional[str] = None) -> None:
+        """Set a terminal or retry status. Text is dropped once a job is resolved."""
+        now = datetime.now().isoformat()
+        with self._lock:
+            if status in (CompileJobStatus.done, CompileJobStatus.skipped):
+                self.conn.execute(
+                    "UPDATE compile_jobs SET status=?, error=NULL, text='', updated_at=? WHERE file_hash=?",
+                    (status, now, file_hash),
+                )
+            else:
+                self.conn.execute(
+                    "UPDATE compile_jobs SET status=?, error=?, batch_id=NULL, updated_at=? WHERE file_hash=?",
+                    (status, error, now, file_hash),
+                )
+            self.conn.commit()
+
+    def requeue_stale_compile_jobs(self, older_than_minutes: int = 30) -> int:
+        """Return jobs stuck in running (e.g. after a crash) to pending."""
+        cutoff = (datetime.now() - timedelta(minutes=older_than_minutes)).isoformat()
+        with self._lock:
+            cursor = self.conn.execute(
+                "UPDATE compile_jobs SET status=?, updated_at=? WHERE status=? AND updated_at < ?",
+                (CompileJobStatus.pending, datetime.now().isoformat(), CompileJobStatus.running, cutoff),
+            )
+            self.conn.commit()
+        return cursor.rowcount
+
+    def get_compile_job_stats(self, failure_limit: int = 10) -> dict:
+        """Counts by status, outstanding batches, and the most recent failures."""
+        rows = self._reader().execute(
+            "SELECT status, COUNT(*) as n FROM compile_jobs GROUP BY status"
+        ).fetchall()
+        counts = {s.value: 0 for s in CompileJobStatus}
+        for row in rows:
+            counts[row["status"]] = row["n"]
+        failures = self._reader().execute(
+            "SELECT file_hash, source, attempts, error, updated_at FROM compile_jobs "
+            "WHERE status=? ORDER BY updated_at DESC LIMIT ?",
+            (CompileJobStatus.failed, failure_limit),
+        ).fetchall()
+        return {
+            "counts": counts,
+            "total": sum(counts.values()),
+            "outstanding_batches": self.list_compile_batches(),
+            "recent_failures": [dict(r) for r in failures],
+        }
+
+    def _row_to_compile_job(self, row: sqlite3.Row, status: Optional[str] = None) -> dict:
+        return {
+            "id": row["id"],
+            "file_hash": row["file_hash"],
+            "source": row["source"],
+            "text": row["text"],
+            "status": status or row["status"],
+            "attempts": row["attempts"] + (1 if status == CompileJobStatus.running else 0),
+            "batch_id": row["batch_id"],
+            "error": row["error"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
@@ -0,0 +1,175 @@
+# memory/connection.py
+"""SQLite connection management for MemoryStore.
+
+One writer connection, serialized by a lock, and a small pool of per-thread, read-only connections. In WAL mode
+readers never block the writer or each other, so threaded tool calls that
+only read no longer serialize on the shared connection.
+"""
+import logging
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_READ_POOL_SIZE = 4
+
+class WriterLock:
+    """Re-entrant lock that knows whether the calling thread holds it.
+
+    Drop-in for ``threading.RLock`` in the domain stores; the ownership check
+    lets reads issued inside a write section use the writer connection and
+    see their own uncommitted changes.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._owner: int | None = None
+        self._depth = 0
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        acquired = self._lock.acquire(blocking, timeout)
+        if acquired:
+            self._owner = threading.get_ident()
+            self._depth += 1
+        return acquired
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self._owner = None
+        self._lock.release()
+
+    def held_by_current_thread(self) -> bool:
+        return self._owner == threading.get_ident()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+def _release_reader(conn: sqlite3.Connection, slots: threading.BoundedSemaphore) -> None:
+    # Module-level so the finalizer does not keep the manager alive.
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+    slots.release()
+
+
+class _ReaderSlot:
+    """Holds one thread's read-only connection; frees its pool slot when collected."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
+class ConnectionManager:
+    """Single writer connection plus a bounded pool of per-thread readers.
+
+    - ``conn`` / ``lock``: the writer connection and the lock that serializes
+      every write to it.
+    - ``reader()``: the calling thread's read-only connection. Falls back to
+      the writer when the thread is inside a write section, when the pool is
+      exhausted, or for in-memory databases.
+    - ``transaction()``: ``BEGIN IMMEDIATE`` … ``COMMIT`` on the writer, rolled
+      back on error.
+    """
+
+    def __init__(self, db_path: Path, *, read_pool_size: int = DEFAULT_READ_POOL_SIZE):
+        self.db_path = db_path
+        self.conn = self._open(writer=True)
+        self.lock = WriterLock()
+        self._in_memory = str(db_path) == ":memory:"
+        self._read_pool_size = 0 if self._in_memory else max(0, read_pool_size)
+        self._read_slots = threading.BoundedSemaphore(self._read_pool_size) if self._read_pool_size else None
+        self._readers: "weakref.WeakSet[_ReaderSlot]" = weakref.WeakSet()
+        self._state_lock = threading.Lock()
+        self._local = threading.local()
+        self._closed = False
+
+    # --- Connections ---
+
+    def _open(self, writer: bool) -> sqlite3.Connection:
+        if writer:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+        else:
+            uri = f"file:{quote(str(Path(self.db_path).resolve()))}?mode=ro"
+            # check_same_thread=False only so close() can run from the owning
+            # MemoryStore's thread; each reader is otherwise used by one thread.
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            conn.execute("PRAGMA query_only=ON")
+        conn.execute("PRAGMA busy_timeout=30000")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def reader(self) -> sqlite3.Connection:
+        """Return a connection suitable for a read on the calling thread."""
+        if self._closed or self._read_slots is None or self.lock.held_by_current_thread():
+            return self.conn
+        slot = getattr(self._local, "slot", None)
+        if slot is not None:
+            return slot.conn
+        if not self._read_slots.acquire(blocking=False):
+            return self.conn
+        try:
+            conn = self._open(writer=False)
+        except sqlite3.Error:
+            logger.warning("Could not open read-only connection — using writer", exc_info=True)
+            self._read_slots.release()
+            return self.conn
+        slot = _ReaderSlot(conn)
+        weakref.finalize(slot, _release_reader, conn, self._read_slots)
+        with self._state_lock:
+            self._readers.add(slot)
+        self._local.slot = slot
+        return conn
+
+    @property
+    def open_reader_count(self) -> int:
+        with self._state_lock:
+            return len(self._readers)
+
+    # --- Transactions ---
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block of writes atomically on the writer connection."""
+        with self.lock:
+            if self.conn.in_transaction:
+                # Nested use: let the outermost transaction commit.
+                yield self.conn
+                return
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.rollback()
+                raise
+            else:
+                self.conn.commit()
+
+    # --- Shutdown ---
+
+    def close(self) -> None:
+        """Close the writer and every reader."""
+        if self._closed:
+            return
+        self._closed = True
+        with self._state_lock:
+            slots = list(self._readers)
+        for slot in slots:
+            try:
+                slot.conn.close()
+            except sqlite3.Error:
+                pass
+        self.conn.close()
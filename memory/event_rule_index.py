@@ -0,0 +1,110 @@
+# memory/event_rule_index.py
+"""In-memory index of enabled event rules for webhook dispatch.
+
+Rules are grouped by ``event_source``. Within a source, literal
+``event_type_pattern`` values go into a dict for exact lookups, ``"*"``
+rules always match, and glob patterns are compiled into one regex per
+literal prefix that reports every matching pattern in a single pass.
+Matching follows ``fnmatch.fnmatchcase`` semantics and returns rules in
+the order they were given (priority order).
+"""
+import fnmatch
+import re
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _literal_prefix(pattern: str) -> str:
+    for i, char in enumerate(pattern):
+        if char in _GLOB_CHARS:
+            return pattern[:i]
+    return pattern
+
+
+class _GlobBucket:
+    """Glob patterns sharing one literal prefix, compiled into a single regex.
+
+    Each pattern becomes an optional, empty-width lookahead followed by an
+    empty marker group; the marker is set exactly when that pattern matches
+    the whole event type, so one ``match`` call reports every hit.
+    """
+
+    __slots__ = ("regex", "groups")
+
+    def __init__(self, by_pattern: dict[str, list[tuple[int, dict]]]):
+        self.regex = re.compile("".join(
+            f"(?:(?={fnmatch.translate(pattern)})(?P<_rule{i}>))?" for i, pattern in enumerate(by_pattern)
+        ))
+        self.groups: list[tuple[int, list[tuple[int, dict]]]] = [
+            (self.regex.groupindex[f"_rule{i}"], matched) for i, matched in enumerate(by_pattern.values())
+        ]
+
+    def match(self, event_type: str, hits: list) -> None:
+        spans = self.regex.match(event_type).regs
+        for group, matched in self.groups:
+            if spans[group][0] >= 0:
+                hits.extend(matched)
+
+
+class _SourceRules:
+    __slots__ = ("exact", "catch_all", "glob_buckets", "prefix_lengths")
+
+    def __init__(self):
+        self.exact: dict[str, list[tuple[int, dict]]] = {}
+        self.catch_all: list[tuple[int, dict]] = []
+        self.glob_buckets: dict[str, _GlobBucket] = {}
+        self.prefix_lengths: tuple[int, ...] = ()
+
+
+class EventRuleIndex:
+    """Enabled event rules indexed by source, with glob patterns precompiled.
+
+    Glob patterns are bucketed by their literal prefix (``"alert."`` for
+    ``"alert.*"``), so an event only runs the regexes whose prefix it starts
+    with.
+    """
+
+    def __init__(self, rules: list[dict]):
+        self._size = len(rules)
+        self._sources: dict[str, _SourceRules] = {}
+        globs: dict[str, dict[str, dict[str, list[tuple[int, dict]]]]] = {}
+        for position, rule in enumerate(rules):
+            source = rule["event_source"]
+            entry = self._sources.setdefault(source, _SourceRules())
+            pattern = rule["event_type_pattern"]
+            if pattern == "*":
+                entry.catch_all.append((position, rule))
+            elif _GLOB_CHARS.isdisjoint(pattern):
+                entry.exact.setdefault(pattern, []).append((position, rule))
+            else:
+                by_prefix = globs.setdefault(source, {})
+                by_prefix.setdefault(_literal_prefix(pattern), {}).setdefault(pattern, []).append(
+                    (position, rule)
+                )
+
+        for source, by_prefix in globs.items():
+            entry = self._sources[source]
+            entry.glob_buckets = {prefix: _GlobBucket(patterns) for prefix, patterns in by_prefix.items()}
+            entry.prefix_lengths = tuple(sorted({len(prefix) for prefix in by_prefix}))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def match(self, source: str, event_type: str) -> list[dict]:
+        """Rules for *source* whose pattern matches *event_type*, in priority order."""
+        entry = self._sources.get(source)
+        if entry is None:
+            return []
+        hits = list(entry.catch_all)
+        exact = entry.exact.get(event_type)
+        if exact:
+            hits.extend(exact)
+        for length in entry.prefix_lengths:
+            if length > len(event_type):
+                break
+            bucket = entry.glob_buckets.get(event_type[:length])
+            if bucket is not None:
+                bucket.match(event_type, hits)
+        if len(hits) > 1:
+            hits.sort(key=lambda hit: hit[0])
+        return [dict(rule) for _, rule in hits]
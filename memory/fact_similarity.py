@@ -0,0 +1,194 @@
+# memory/fact_similarity.py
+"""MinHash/LSH index of near-duplicate facts.
+
+Each fact's value is reduced to its lower-cased word set (the same tokens
+the knowledge linter compares) and summarised by a ``NUM_PERM``-value
+MinHash signature, stored in ``fact_signatures``. The signature is split
+into ``BANDS`` bands of ``ROWS`` values. Each band is hashed together with
+the fact's category into a bucket key in ``fact_lsh``, so two facts
+collide only within a category and only when a whole band matches.
+
+When a fact is indexed, its bucket keys are looked up to find candidate
+facts. Each candidate's exact word-set Jaccard is computed, and pairs at
+or above ``PAIR_MIN_SIMILARITY`` are kept in ``fact_near_duplicates``. The
+linter then reads verified pairs instead of comparing every pair in a
+category.
+
+A pair with Jaccard similarity s becomes a candidate with probability
+1 - (1 - s**ROWS)**BANDS. With 25 bands of 4 rows that is 0.999 at 0.7 (the
+default lint threshold) and 0.999998 at 0.8. Below ``LSH_MIN_SIMILARITY``
+recall falls off (0.97 at 0.6, 0.80 at 0.5), so callers should compare
+exactly for lower thresholds.
+
+The tables are derived data. A trigger drops a fact's rows when its value
+or category changes, and foreign keys drop them with the fact.
+``backfill_fact_signatures`` indexes every fact without a signature.
+"""
+import hashlib
+import sqlite3
+import struct
+from array import array
+from functools import lru_cache
+from typing import Iterable
+
+NUM_PERM = 100
+BANDS = 25
+ROWS = NUM_PERM // BANDS
+LSH_MIN_SIMILARITY = 0.7
+PAIR_MIN_SIMILARITY = 0.5
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _permutations() -> tuple[tuple[int, int], ...]:
+    # Fixed, seeded coefficients: signatures are persisted, so they must be
+    # identical in every process.
+    coeffs = []
+    for i in range(NUM_PERM):
+        digest = hashlib.blake2b(f"fact-minhash:{i}".encode(), digest_size=16).digest()
+        a, b = struct.unpack(">QQ", digest)
+        coeffs.append((a % (_MERSENNE_PRIME - 1) + 1, b % _MERSENNE_PRIME))
+    return tuple(coeffs)
+
+
+_PERMUTATIONS = _permutations()
+
+# Individual statements, so a migration can run them inside its transaction.
+SCHEMA: tuple[str, ...] = (
+    """CREATE TABLE IF NOT EXISTS fact_signatures (
+        fact_id INTEGER PRIMARY KEY REFERENCES facts(id) ON DELETE CASCADE,
+        signature BLOB NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS fact_lsh (
+        bucket INTEGER NOT NULL,
+        fact_id INTEGER NOT NULL REFERENCES facts(id) ON DELETE CASCADE,
+        PRIMARY KEY (bucket, fact_id)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS idx_fact_lsh_fact ON fact_lsh(fact_id)",
+    """CREATE TABLE IF NOT EXISTS fact_near_duplicates (
+        fact_a INTEGER NOT NULL REFERENCES facts(id) ON DELETE CASCADE,
+        fact_b INTEGER NOT NULL REFERENCES facts(id) ON DELETE CASCADE,
+        similarity REAL NOT NULL,
+        PRIMARY KEY (fact_a, fact_b)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS idx_fact_near_duplicates_b ON fact_near_duplicates(fact_b)",
+    """CREATE TRIGGER IF NOT EXISTS facts_similarity_au AFTER UPDATE OF value, category ON facts
+    WHEN old.value IS NOT new.value OR old.category IS NOT new.category BEGIN
+        DELETE FROM fact_signatures WHERE fact_id = old.id;
+        DELETE FROM fact_lsh WHERE fact_id = old.id;
+        DELETE FROM fact_near_duplicates WHERE fact_a = old.id OR fact_b = old.id;
+    END""",
+)
+
+
+def words(value: str) -> frozenset[str]:
+    """The word set compared for near-duplicates."""
+    return frozenset((value or "").lower().split())
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@lru_cache(maxsize=65536)
+def _token_hashes(token: str) -> tuple[int, ...]:
+    x = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "big")
+    return tuple(((a * x + b) % _MERSENNE_PRIME) & _MAX_HASH for a, b in _PERMUTATIONS)
+
+
+def minhash(tokens: Iterable[str]) -> tuple[int, ...]:
+    """MinHash signature of *tokens*; empty for an empty set."""
+    hashes = [_token_hashes(t) for t in tokens]
+    if not hashes:
+        return ()
+    return tuple(map(min, *hashes)) if len(hashes) > 1 else hashes[0]
+
+
+def band_keys(category: str, signature: tuple[int, ...]) -> list[int]:
+    """One signed 64-bit bucket key per band, scoped to *category*."""
+    prefix = category.encode() + b"\0"
+    keys = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS:(band + 1) * ROWS]
+        digest = hashlib.blake2b(
+            prefix + bytes([band]) + array("I", rows).tobytes(), digest_size=8,
+        ).digest()
+        keys.append(int.from_bytes(digest, "big", signed=True))
+    return keys
+
+
+def index_fact(
+    conn: sqlite3.Connection, fact_id: int, category: str, value: str, *, replace: bool = True,
+) -> int:
+    """(Re)index one fact and record its verified near-duplicates.
+
+    Runs on the caller's transaction. *replace* = False skips clearing rows
+    for a fact known to have none. Returns the number of pairs recorded.
+    """
+    if replace:
+        conn.execute("DELETE FROM fact_lsh WHERE fact_id=?", (fact_id,))
+        conn.execute("DELETE FROM fact_near_duplicates WHERE fact_a=? OR fact_b=?", (fact_id, fact_id))
+    tokens = words(value)
+    signature = minhash(tokens)
+    conn.execute(
+        "INSERT OR REPLACE INTO fact_signatures (fact_id, signature) VALUES (?, ?)",
+        (fact_id, array("I", signature).tobytes()),
+    )
+    if not signature:
+        return 0
+
+    keys = band_keys(category, signature)
+    placeholders = ",".join("?" * len(keys))
+    # CROSS JOIN keeps the bucket lookup as the outer loop; otherwise the
+    # planner may scan the whole category through the (category, key) index.
+    candidates = conn.execute(
+        f"""SELECT f.id, f.value
+            FROM (SELECT DISTINCT fact_id FROM fact_lsh WHERE bucket IN ({placeholders})) c
+            CROSS JOIN facts f ON f.id = c.fact_id
+            WHERE f.category=?""",
+        (*keys, category),
+    ).fetchall()
+    conn.executemany(
+        "INSERT OR IGNORE INTO fact_lsh (bucket, fact_id) VALUES (?, ?)",
+        [(key, fact_id) for key in keys],
+    )
+
+    pairs = []
+    for other_id, other_value in candidates:
+        if other_id == fact_id:
+            continue
+        similarity = jaccard(tokens, words(other_value))
+        if similarity >= PAIR_MIN_SIMILARITY:
+            pairs.append((min(fact_id, other_id), max(fact_id, other_id), similarity))
+    conn.executemany(
+        "INSERT OR REPLACE INTO fact_near_duplicates (fact_a, fact_b, similarity) VALUES (?, ?, ?)",
+        pairs,
+    )
+    return len(pairs)
+
+
+def backfill(conn: sqlite3.Connection, batch_size: int = 1000) -> int:
+    """Index every fact that has no signature yet. Returns facts indexed.
+
+    Runs on the caller's transaction.
+    """
+    indexed = 0
+    last_id = -1
+    while True:
+        rows = conn.execute(
+            """SELECT f.id, f.category, f.value FROM facts f
+               WHERE f.id > ? AND NOT EXISTS (SELECT 1 FROM fact_signatures s WHERE s.fact_id = f.id)
+               ORDER BY f.id LIMIT ?""",
+            (last_id, batch_size),
+        ).fetchall()
+        for fact_id, category, value in rows:
+            # The trigger and foreign keys drop a fact's bucket and pair rows
+            # together with its signature, so there is nothing to clear.
+            index_fact(conn, fact_id, category, value, replace=False)
+        indexed += len(rows)
+        if len(rows) < batch_size:
+            return indexed
+        last_id = rows[-1][0]
@@ -8,6 +8,7 @@ import threading
 from datetime import datetime
 from typing import Optional
 
+from memory import fact_similarity
 from memory.models import ContextEntry, Fact, Location
 
 logger = logging.getLogger(__name__)
@@ -19,10 +20,11 @@ _FTS5_SPECIAL = re.compile(r'[*"^\-():,]|\b(?:OR|AND|NOT|NEAR)\b')
 class FactStore:
     """Manages facts (with FTS5 + ChromaDB vector search), locations, and context."""
 
-    def __init__(self, conn: sqlite3.Connection, chroma_collection=None, *, lock=None):
+    def __init__(self, conn: sqlite3.Connection, chroma_collection=None, *, lock=None, reader=None):
         self.conn = conn
         self._facts_collection = chroma_collection
         self._lock = lock or threading.RLock()
+        self._reader = reader or (lambda: self.conn)
 
     # --- Facts ---
 
@@ -41,6 +43,7 @@ class FactStore:
                 (fact.category, fact.key, fact.value, fact.confidence, fact.source,
                  1 if fact.pinned else 0, now, now),
             )
+            self._index_similarity(fact.category, fact.key)
             if self._facts_collection is not None:
                 try:
                     self._facts_collection.upsert(
@@ -55,7 +58,7 @@ class FactStore:
         return self.get_fact(fact.category, fact.key)
 
     def get_fact(self, category: str, key: str) -> Optional[Fact]:
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT * FROM facts WHERE category=? AND key=?", (category, key)
         ).fetchone()
         if row is None:
@@ -63,13 +66,13 @@ class FactStore:
         return self._row_to_fact(row)
 
     def get_facts_by_category(self, category: str) -> list[Fact]:
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             "SELECT * FROM facts WHERE category=?", (category,)
         ).fetchall()
         return [self._row_to_fact(r) for r in rows]
 
     def search_facts(self, query: str) -> list[Fact]:
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             "SELECT * FROM facts WHERE value LIKE ? OR key LIKE ?",
             (f"%{query}%", f"%{query}%"),
         ).fetchall()
@@ -118,7 +121,7 @@ class FactStore:
             if not tokens:
                 return []
             fts_query = " ".join(f'"{t}"' for t in tokens)
-            rows = self.conn.execute(
+            rows = self._reader().execute(
                 "SELECT f.* FROM facts f JOIN facts_fts fts ON f.id = fts.rowid "
                 "WHERE facts_fts MATCH ? ORDER BY rank",
                 (fts_query,),
@@ -165,7 +168,7 @@ class FactStore:
         params: list[str] = []
         for cat, key, _ in parsed:
             params.extend([cat, key])
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             f"SELECT * FROM facts WHERE {placeholders}", params
         ).fetchall()
         fact_map: dict[tuple[str, str], "Fact"] = {}
@@ -232,7 +235,7 @@ class FactStore:
             tokens = sanitized.split()
             if tokens:
                 fts_query = " ".join(f'"{t}"' for t in tokens)
-                rows = self.conn.execute(
+                rows = self._reader().execute(
                     "SELECT f.*, fts.rank FROM facts f "
                     "JOIN facts_fts fts ON f.id = fts.rowid "
                     "WHERE facts_fts MATCH ? ORDER BY rank",
@@ -318,7 +321,7 @@ class FactStore:
             params.append(category)
         where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
         params.append(limit)
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             f"SELECT * FROM facts{where} ORDER BY key LIMIT ?", params
         ).fetchall()
         return [self._row_to_fact(r) for r in rows]
@@ -338,7 +341,7 @@ class FactStore:
             clauses.append("category = ?")
             params.append(category)
         where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             f"SELECT DISTINCT key FROM facts{where} ORDER BY key", params
         ).fetchall()
         return [row["key"] for row in rows]
@@ -350,7 +353,7 @@ class FactStore:
         """
         if self._facts_collection is None:
             return 0
-        rows = self.conn.execute("SELECT * FROM facts").fetchall()
+        rows = self._reader().execute("SELECT * FROM facts").fetchall()
         count = 0
         for row in rows:
             fact = self._row_to_fact(row)
@@ -362,6 +365,63 @@ class FactStore:
             count += 1
         return count
 
+    # --- Near-duplicate index ---
+
+    def _index_similarity(self, category: str, key: str) -> None:
+        """Index a just-written fact unless its signature is current.
+
+        The index is derived data, so a failure is logged and rolled back to
+        a savepoint rather than failing the write; the linter's backfill
+        picks the fact up later.
+        """
+        self.conn.execute("SAVEPOINT fact_similarity")
+        try:
+            row = self.conn.execute(
+                """SELECT f.id, f.value, s.fact_id AS indexed FROM facts f
+                   LEFT JOIN fact_signatures s ON s.fact_id = f.id
+                   WHERE f.category=? AND f.key=?""",
+                (category, key),
+            ).fetchone()
+            if row is not None and row["indexed"] is None:
+                fact_similarity.index_fact(self.conn, row["id"], category, row["value"])
+        except sqlite3.Error:
+            logger.warning("Could not index fact %s/%s for near-duplicates", category, key, exc_info=True)
+            self.conn.execute("ROLLBACK TO fact_similarity")
+        self.conn.execute("RELEASE fact_similarity")
+
+    def backfill_fact_signatures(self) -> int:
+        """Index facts written without a signature (older rows, direct SQL). Returns facts indexed."""
+        with self._lock:
+            indexed = fact_similarity.backfill(self.conn)
+            self.conn.commit()
+        return indexed
+
+    def list_near_duplicate_facts(self, min_similarity: float = fact_similarity.LSH_MIN_SIMILARITY) -> list[dict]:
+        """Verified near-duplicate pairs at or above *min_similarity*.
+
+        Each dict has category, fact_a and fact_b (``{"key", "value"}``, in
+        key order) and similarity. Sorted by category, then keys. Pairs
+        below ``fact_similarity.PAIR_MIN_SIMILARITY`` are not recorded.
+        """
+        rows = self._reader().execute(
+            """SELECT fa.category, fa.key AS a_key, fa.value AS a_value,
+                      fb.key AS b_key, fb.value AS b_value, p.similarity
+               FROM fact_near_duplicates p
+               JOIN facts fa ON fa.id = p.fact_a
+               JOIN facts fb ON fb.id = p.fact_b
+               WHERE p.similarity >= ? AND fa.category = fb.category""",
+            (min_similarity,),
+        ).fetchall()
+        pairs = []
+        for row in rows:
+            a = {"key": row["a_key"], "value": row["a_value"]}
+            b = {"key": row["b_key"], "value": row["b_value"]}
+            if b["key"] < a["key"]:
+                a, b = b, a
+            pairs.append({"category": row["category"], "fact_a": a, "fact_b": b, "similarity": row["similarity"]})
+        pairs.sort(key=lambda p: (p["category"], p["fact_a"]["key"], p["fact_b"]["key"]))
+        return pairs
+
     def _row_to_fact(self, row: sqlite3.Row) -> Fact:
         pinned = False
         try:
@@ -399,7 +459,7 @@ class FactStore:
         return self.get_location(location.name)
 
     def get_location(self, name: str) -> Optional[Location]:
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT * FROM locations WHERE name=?", (name,)
         ).fetchone()
         if row is None:
@@ -407,7 +467,7 @@ class FactStore:
         return self._row_to_location(row)
 
     def list_locations(self) -> list[Location]:
-        rows = self.conn.execute("SELECT * FROM locations").fetchall()
+        rows = self._reader().execute("SELECT * FROM locations").fetchall()
         return [self._row_to_location(r) for r in rows]
 
     def _row_to_location(self, row: sqlite3.Row) -> Location:
@@ -431,7 +491,7 @@ class FactStore:
                 (entry.session_id, entry.topic, entry.summary, entry.agent),
             )
             self.conn.commit()
-        row = self.conn.execute("SELECT * FROM context WHERE id=?", (cursor.lastrowid,)).fetchone()
+        row = self._reader().execute("SELECT * FROM context WHERE id=?", (cursor.lastrowid,)).fetchone()
         return self._row_to_context(row)
 
     def list_context(self, session_id: Optional[str] = None, limit: int = 20) -> list[ContextEntry]:
@@ -442,11 +502,11 @@ class FactStore:
             params.append(session_id)
         query += " ORDER BY created_at DESC LIMIT ?"
         params.append(limit)
-        rows = self.conn.execute(query, params).fetchall()
+        rows = self._reader().execute(query, params).fetchall()
         return [self._row_to_context(r) for r in rows]
 
     def search_context(self, query: str, limit: int = 20) -> list[ContextEntry]:
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             """SELECT * FROM context
                WHERE topic LIKE ? OR summary LIKE ?
                ORDER BY created_at DESC
@@ -9,9 +9,10 @@ from typing import Optional
 class IdentityStore:
     """Manages identity linking and resolution across providers."""
 
-    def __init__(self, conn: sqlite3.Connection, *, lock=None):
+    def __init__(self, conn: sqlite3.Connection, *, lock=None, reader=None):
         self.conn = conn
         self._lock = lock or threading.RLock()
+        self._reader = reader or (lambda: self.conn)
 
     def link_identity(
         self,
@@ -37,7 +38,7 @@ class IdentityStore:
                 (canonical_name, provider, provider_id, display_name, email, metadata, now, now),
             )
             self.conn.commit()
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT * FROM identities WHERE provider=? AND provider_id=?",
             (provider, provider_id),
         ).fetchone()
@@ -57,7 +58,7 @@ class IdentityStore:
 
     def get_identity(self, canonical_name: str) -> list[dict]:
         """Get all linked identities for a canonical name."""
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             "SELECT * FROM identities WHERE canonical_name=? ORDER BY provider",
             (canonical_name,),
         ).fetchall()
@@ -65,7 +66,7 @@ class IdentityStore:
 
     def search_identity(self, query: str) -> list[dict]:
         """Search identities by canonical_name, display_name, email, or provider_id."""
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             """SELECT * FROM identities
                WHERE canonical_name LIKE ? OR display_name LIKE ? OR email LIKE ? OR provider_id LIKE ?
                ORDER BY canonical_name""",
@@ -75,13 +76,13 @@ class IdentityStore:
 
     def resolve_sender(self, provider: str, sender_id_or_email: str) -> Optional[str]:
         """Resolve a sender to a canonical name. Tries provider_id first, then email."""
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT canonical_name FROM identities WHERE provider=? AND provider_id=?",
             (provider, sender_id_or_email),
         ).fetchone()
         if row:
             return row["canonical_name"]
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT canonical_name FROM identities WHERE email=?",
             (sender_id_or_email,),
         ).fetchone()
@@ -96,7 +97,7 @@ class IdentityStore:
             return {"canonical_name": None, "match_type": None, "all_matches": []}
 
         # 1. Exact imessage provider match
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT canonical_name FROM identities WHERE provider='imessage' AND provider_id=?",
             (handle,),
         ).fetchone()
@@ -108,7 +109,7 @@ class IdentityStore:
             }
 
         # 2. Exact email match
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT canonical_name FROM identities WHERE email=?",
             (handle,),
         ).fetchone()
@@ -120,7 +121,7 @@ class IdentityStore:
             }
 
         # 3. Fuzzy search by provider_id
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             "SELECT DISTINCT canonical_name FROM identities WHERE provider_id LIKE ?",
             (f"%{handle}%",),
         ).fetchall()
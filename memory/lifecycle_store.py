@@ -39,9 +39,10 @@ class LifecycleStore:
         "name", "description", "alert_type", "condition", "enabled", "last_triggered_at",
     })
 
-    def __init__(self, conn: sqlite3.Connection, *, lock=None):
+    def __init__(self, conn: sqlite3.Connection, *, lock=None, reader=None):
         self.conn = conn
         self._lock = lock or threading.RLock()
+        self._reader = reader or (lambda: self.conn)
 
     # --- Decisions ---
 
@@ -62,7 +63,7 @@ class LifecycleStore:
         return self.get_decision(cursor.lastrowid)
 
     def get_decision(self, decision_id: int) -> Optional[Decision]:
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT * FROM decisions WHERE id=?", (decision_id,)
         ).fetchone()
         if row is None:
@@ -70,14 +71,14 @@ class LifecycleStore:
         return self._row_to_decision(row)
 
     def search_decisions(self, query: str) -> list[Decision]:
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             "SELECT * FROM decisions WHERE title LIKE ? OR description LIKE ? OR tags LIKE ?",
             (f"%{query}%", f"%{query}%", f"%{query}%"),
         ).fetchall()
         return [self._row_to_decision(r) for r in rows]
 
     def list_decisions_by_status(self, status: str) -> list[Decision]:
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             "SELECT * FROM decisions WHERE status=?", (status,)
         ).fetchall()
         return [self._row_to_decision(r) for r in rows]
@@ -146,7 +147,7 @@ class LifecycleStore:
         return self.get_delegation(cursor.lastrowid)
 
     def get_delegation(self, delegation_id: int) -> Optional[Delegation]:
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT * FROM delegations WHERE id=?", (delegation_id,)
         ).fetchone()
         if row is None:
@@ -162,12 +163,12 @@ class LifecycleStore:
         if delegated_to is not None:
             query += " AND delegated_to=?"
             params.append(delegated_to)
-        rows = self.conn.execute(query, params).fetchall()
+        rows = self._reader().execute(query, params).fetchall()
         return [self._row_to_delegation(r) for r in rows]
 
     def list_overdue_delegations(self) -> list[Delegation]:
         today = date.today().isoformat()
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             "SELECT * FROM delegations WHERE status='active' AND due_date IS NOT NULL AND due_date < ?",
             (today,),
         ).fetchall()
@@ -235,13 +236,13 @@ class LifecycleStore:
                  1 if rule.enabled else 0, now),
             )
             self.conn.commit()
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT * FROM alert_rules WHERE name=?", (rule.name,)
         ).fetchone()
         return self._row_to_alert_rule(row)
 
     def get_alert_rule(self, rule_id: int) -> Optional[AlertRule]:
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT * FROM alert_rules WHERE id=?", (rule_id,)
         ).fetchone()
         if row is None:
@@ -250,11 +251,11 @@ class LifecycleStore:
 
     def list_alert_rules(self, enabled_only: bool = False) -> list[AlertRule]:
         if enabled_only:
-            rows = self.conn.execute(
+            rows = self._reader().execute(
                 "SELECT * FROM alert_rules WHERE enabled=1"
             ).fetchall()
         else:
-            rows = self.conn.execute("SELECT * FROM alert_rules").fetchall()
+            rows = self._reader().execute("SELECT * FROM alert_rules").fetchall()
         return [self._row_to_alert_rule(r) for r in rows]
 
     def update_alert_rule(self, rule_id: int, **kwargs) -> Optional[AlertRule]:
@@ -0,0 +1,227 @@
+# memory/migrations.py
+"""Versioned schema migrations for memory.db.
+
+``MemoryStore._create_tables`` creates the baseline schema; every change
+after that is a numbered ``Migration`` applied in order. The version
+reached is stored in ``PRAGMA user_version``, and each migration runs in
+its own transaction together with the version bump, so a failed
+migration leaves the database at the previous version.
+
+Databases created before versioning report version 0 and may already
+have some of the early columns; ``add_column`` skips columns that exist,
+so those migrations are safe to replay.
+"""
+import logging
+import sqlite3
+from dataclasses import dataclass
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    apply: Callable[[sqlite3.Connection], None]
+
+
+def add_column(conn: sqlite3.Connection, table: str, column: str, column_type: str) -> None:
+    """ALTER TABLE ... ADD COLUMN unless *column* already exists."""
+    existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    if column not in existing:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+
+def _facts_pinned(conn):
+    add_column(conn, "facts", "pinned", "INTEGER DEFAULT 0")
+
+
+def _agent_memory_namespace(conn):
+    add_column(conn, "agent_memory", "namespace", "TEXT")
+
+
+def _scheduled_tasks_delivery(conn):
+    add_column(conn, "scheduled_tasks", "delivery_channel", "TEXT")
+    add_column(conn, "scheduled_tasks", "delivery_config", "TEXT")
+
+
+def _tool_usage_log_response_size(conn):
+    add_column(conn, "tool_usage_log", "response_size_bytes", "INTEGER")
+
+
+def _source_ref(conn):
+    for table in ("delegations", "decisions"):
+        add_column(conn, table, "source_ref", "TEXT")
+
+
+# One index per hot filter. Each is exercised by an EXPLAIN QUERY PLAN test
+# in tests/test_memory_migrations.py.
+HOT_PATH_INDEXES = {
+    "idx_webhook_events_status": "webhook_events(status, received_at)",
+    "idx_webhook_events_source": "webhook_events(source, received_at)",
+    "idx_webhook_events_received": "webhook_events(received_at)",
+    "idx_delegations_status_due": "delegations(status, due_date)",
+    "idx_delegations_delegated_to": "delegations(delegated_to)",
+    "idx_decisions_status": "decisions(status)",
+    "idx_scheduled_tasks_due": "scheduled_tasks(enabled, next_run_at)",
+    "idx_agent_memory_namespace": "agent_memory(agent_name, namespace, memory_type)",
+    "idx_identities_email": "identities(email)",
+    "idx_context_session": "context(session_id, created_at)",
+    "idx_event_rules_enabled": "event_rules(enabled, priority)",
+}
+
+
+def _hot_path_indexes(conn):
+    for name, target in HOT_PATH_INDEXES.items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+
+def _webhook_dispatch_queue(conn):
+    add_column(conn, "webhook_events", "attempts", "INTEGER DEFAULT 0")
+    add_column(conn, "webhook_events", "lease_owner", "TEXT")
+    add_column(conn, "webhook_events", "lease_expires_at", "TEXT")
+    add_column(conn, "webhook_events", "next_attempt_at", "TEXT")
+    add_column(conn, "webhook_events", "last_error", "TEXT")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_webhook_events_claim ON webhook_events(status, next_attempt_at)"
+    )
+
+
+def _webhook_event_rule_runs(conn):
+    # Rules that already succeeded for an event, so a retry runs only the
+    # rules that failed.
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS webhook_event_rule_runs (
+            event_id INTEGER NOT NULL REFERENCES webhook_events(id) ON DELETE CASCADE,
+            rule_id INTEGER NOT NULL,
+            completed_at TEXT NOT NULL,
+            PRIMARY KEY (event_id, rule_id)
+        ) WITHOUT ROWID"""
+    )
+
+
+# Tables whose writes bump a counter in table_changes, so caches of data
+# read from them (proactive checks) can tell when it changed.
+CHANGE_COUNTED_TABLES = ("decisions", "delegations", "facts", "skill_suggestions", "webhook_events")
+
+
+def _table_change_counters(conn):
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS table_changes (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID"""
+    )
+    for table in CHANGE_COUNTED_TABLES:
+        conn.execute("INSERT OR IGNORE INTO table_changes (name) VALUES (?)", (table,))
+        for op in ("INSERT", "UPDATE", "DELETE"):
+            conn.execute(
+                f"""CREATE TRIGGER IF NOT EXISTS {table}_{op.lower()}_counted AFTER {op} ON {table}
+                BEGIN
+                    UPDATE table_changes SET version = version + 1 WHERE name = '{table}';
+                END"""
+            )
+
+
+def _fact_similarity_index(conn):
+    from memory.fact_similarity import SCHEMA
+
+    for statement in SCHEMA:
+        conn.execute(statement)
+
+
+def _skill_pattern_clusters(conn):
+    from memory.skill_clusters import SCHEMA
+
+    for statement in SCHEMA:
+        conn.execute(statement)
+
+
+def _usage_log_autoincrement(conn):
+    """Rebuild the usage logs with AUTOINCREMENT ids.
+
+    The rollup watermark assumes raw ids only grow. Without AUTOINCREMENT,
+    SQLite reuses ids once retention has pruned every row, and the rollup
+    would skip the new rows. The sequence starts past both the largest
+    remaining id and the rollup watermark.
+    """
+    for table in ("tool_usage_log", "agent_api_log"):
+        table_sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table,)
+        ).fetchone()[0]
+        if "AUTOINCREMENT" in table_sql.upper():
+            continue
+        index_sqls = [
+            row[0] for row in conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type='index' AND tbl_name=? AND sql IS NOT NULL", (table,)
+            )
+        ]
+        columns = ", ".join(row[1] for row in conn.execute(f"PRAGMA table_info({table})"))
+        rebuilt_sql = table_sql.replace(
+            "id INTEGER PRIMARY KEY", "id INTEGER PRIMARY KEY AUTOINCREMENT", 1,
+        ).replace(table, f"{table}_rebuild", 1)
+        conn.execute(rebuilt_sql)
+        conn.execute(f"INSERT INTO {table}_rebuild ({columns}) SELECT {columns} FROM {table}")
+        conn.execute(f"DROP TABLE {table}")
+        conn.execute(f"ALTER TABLE {table}_rebuild RENAME TO {table}")
+        for index_sql in index_sqls:
+            conn.execute(index_sql)
+        watermark = conn.execute(
+            "SELECT COALESCE((SELECT last_id FROM usage_rollup_state WHERE source=?), 0)", (table,)
+        ).fetchone()[0]
+        max_id = conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0]
+        conn.execute("DELETE FROM sqlite_sequence WHERE name=?", (table,))
+        conn.execute(
+            "INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)", (table, max(watermark, max_id)),
+        )
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(1, "facts_pinned", _facts_pinned),
+    Migration(2, "agent_memory_namespace", _agent_memory_namespace),
+    Migration(3, "scheduled_tasks_delivery", _scheduled_tasks_delivery),
+    Migration(4, "tool_usage_log_response_size", _tool_usage_log_response_size),
+    Migration(5, "source_ref", _source_ref),
+    Migration(6, "hot_path_indexes", _hot_path_indexes),
+    Migration(7, "webhook_dispatch_queue", _webhook_dispatch_queue),
+    Migration(8, "fact_similarity_index", _fact_similarity_index),
+    Migration(9, "skill_pattern_clusters", _skill_pattern_clusters),
+    Migration(10, "usage_log_autoincrement", _usage_log_autoincrement),
+    Migration(11, "webhook_event_rule_runs", _webhook_event_rule_runs),
+    Migration(12, "table_change_counters", _table_change_counters),
+)
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def apply_migrations(
+    conn: sqlite3.Connection,
+    migrations: tuple[Migration, ...] = MIGRATIONS,
+) -> list[int]:
+    """Apply every migration newer than the database. Returns versions applied."""
+    applied = []
+    current = get_schema_version(conn)
+    for migration in sorted(migrations, key=lambda m: m.version):
+        if migration.version <= current:
+            continue
+        if conn.in_transaction:
+            conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            migration.apply(conn)
+            # PRAGMA does not accept bound parameters; version is an int.
+            conn.execute(f"PRAGMA user_version = {int(migration.version)}")
+        except Exception:
+            conn.rollback()
+            logger.error("Migration %d (%s) failed", migration.version, migration.name)
+            raise
+        conn.commit()
+        current = migration.version
+        applied.append(migration.version)
+        logger.info("Applied memory.db migration %d (%s)", migration.version, migration.name)
+    return applied
@@ -30,8 +30,10 @@ class StrEnum(str, Enum):
 
 class WebhookStatus(StrEnum):
     pending = "pending"
+    dispatching = "dispatching"  # leased by a dispatch worker
     processed = "processed"
-    failed = "failed"
+    failed = "failed"  # retried while next_attempt_at is set
+    dead_letter = "dead_letter"  # gave up after max attempts
 
 
 class DecisionStatus(StrEnum):
@@ -64,6 +66,17 @@ class HandlerType(StrEnum):
     morning_brief = "morning_brief"
     custom = "custom"
     knowledge_lint = "knowledge_lint"
+    knowledge_compile = "knowledge_compile"
+    usage_rollup = "usage_rollup"
+
+
+class CompileJobStatus(StrEnum):
+    pending = "pending"
+    running = "running"
+    batched = "batched"
+    done = "done"
+    skipped = "skipped"
+    failed = "failed"
 
 
 class DeliveryChannel(StrEnum):
@@ -254,6 +267,9 @@ class WebhookEvent:
     id: Optional[int] = None
     received_at: Optional[str] = None
     processed_at: Optional[str] = None
+    attempts: int = 0
+    next_attempt_at: Optional[str] = None
+    last_error: Optional[str] = None
 
 
 @dataclass
@@ -20,9 +20,10 @@ class SchedulerStore:
         "delivery_channel", "delivery_config", "updated_at",
     })
 
-    def __init__(self, conn: sqlite3.Connection, *, lock=None):
+    def __init__(self, conn: sqlite3.Connection, *, lock=None, reader=None):
         self.conn = conn
         self._lock = lock or threading.RLock()
+        self._reader = reader or (lambda: self.conn)
 
     def store_scheduled_task(self, task: ScheduledTask) -> ScheduledTask:
         now = datetime.now().isoformat()
@@ -49,13 +50,13 @@ class SchedulerStore:
                  task.next_run_at, task.delivery_channel, delivery_config_str, now, now),
             )
             self.conn.commit()
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT * FROM scheduled_tasks WHERE name=?", (task.name,)
         ).fetchone()
         return self._row_to_scheduled_task(row)
 
     def get_scheduled_task(self, task_id: int) -> Optional[ScheduledTask]:
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT * FROM scheduled_tasks WHERE id=?", (task_id,)
         ).fetchone()
         if row is None:
@@ -63,7 +64,7 @@ class SchedulerStore:
         return self._row_to_scheduled_task(row)
 
     def get_scheduled_task_by_name(self, name: str) -> Optional[ScheduledTask]:
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT * FROM scheduled_tasks WHERE name=?", (name,)
         ).fetchone()
         if row is None:
@@ -72,17 +73,17 @@ class SchedulerStore:
 
     def list_scheduled_tasks(self, enabled_only: bool = False) -> list[ScheduledTask]:
         if enabled_only:
-            rows = self.conn.execute(
+            rows = self._reader().execute(
                 "SELECT * FROM scheduled_tasks WHERE enabled=1"
             ).fetchall()
         else:
-            rows = self.conn.execute("SELECT * FROM scheduled_tasks").fetchall()
+            rows = self._reader().execute("SELECT * FROM scheduled_tasks").fetchall()
         return [self._row_to_scheduled_task(r) for r in rows]
 
     def get_due_tasks(self, now: Optional[str] = None) -> list[ScheduledTask]:
         if now is None:
             now = datetime.now().isoformat()
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             "SELECT * FROM scheduled_tasks WHERE enabled=1 AND next_run_at IS NOT NULL AND next_run_at <= ?",
             (now,),
         ).fetchall()
@@ -0,0 +1,191 @@
+# memory/skill_clusters.py
+"""Incremental clustering of skill_usage patterns.
+
+Clusters group a tool's query patterns by word-set Jaccard against the
+cluster's representative (the first pattern assigned to it), the same rule
+``skills.pattern_detector._cluster_patterns`` applies from scratch. Here
+the clusters are persisted:
+
+- ``skill_pattern_clusters``: tool, representative and running total_count;
+- ``skill_pattern_members``: which cluster each skill_usage row belongs to,
+  and the count already added to that cluster;
+- ``skill_pattern_tokens``: a per-tool inverted index from representative
+  tokens to clusters. A pattern can only reach a positive threshold against
+  a representative it shares a token with, so only those clusters are
+  compared;
+- ``skill_pattern_state``: the ``last_used`` watermark of the last analysis
+  and the threshold the clusters were built with.
+
+``update_clusters`` reads only skill_usage rows used since the watermark.
+A row that is already a member adds its count delta to its cluster. A new
+row joins the oldest matching candidate cluster or starts a new one. So the
+cost follows new activity, not total history. Changing the threshold
+rebuilds the clusters from scratch.
+"""
+import sqlite3
+from datetime import datetime
+from typing import Optional
+
+from memory.fact_similarity import jaccard, words
+
+SCHEMA: tuple[str, ...] = (
+    """CREATE TABLE IF NOT EXISTS skill_pattern_clusters (
+        id INTEGER PRIMARY KEY,
+        tool_name TEXT NOT NULL,
+        representative TEXT NOT NULL,
+        total_count INTEGER NOT NULL DEFAULT 0,
+        created_at TIMESTAMP,
+        updated_at TIMESTAMP
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_skill_pattern_clusters_count ON skill_pattern_clusters(total_count)",
+    """CREATE TABLE IF NOT EXISTS skill_pattern_members (
+        usage_id INTEGER PRIMARY KEY REFERENCES skill_usage(id) ON DELETE CASCADE,
+        cluster_id INTEGER NOT NULL REFERENCES skill_pattern_clusters(id) ON DELETE CASCADE,
+        counted INTEGER NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_skill_pattern_members_cluster ON skill_pattern_members(cluster_id)",
+    """CREATE TABLE IF NOT EXISTS skill_pattern_tokens (
+        tool_name TEXT NOT NULL,
+        token TEXT NOT NULL,
+        cluster_id INTEGER NOT NULL REFERENCES skill_pattern_clusters(id) ON DELETE CASCADE,
+        PRIMARY KEY (tool_name, token, cluster_id)
+    ) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS skill_pattern_state (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        watermark TEXT,
+        similarity_threshold REAL NOT NULL,
+        analyzed_at TIMESTAMP
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_skill_usage_last_used ON skill_usage(last_used)",
+)
+
+
+def update_clusters(conn: sqlite3.Connection, similarity_threshold: float) -> dict:
+    """Fold skill_usage changes since the last run into the clusters.
+
+    Runs on the caller's transaction. Returns counts: examined (rows read),
+    assigned (new rows placed), updated (members whose count grew),
+    clusters_created and rebuilt (threshold changed).
+    """
+    now = datetime.now().isoformat()
+    state = conn.execute(
+        "SELECT watermark, similarity_threshold FROM skill_pattern_state WHERE id=1"
+    ).fetchone()
+    rebuilt = state is not None and state[1] != similarity_threshold
+    watermark = None if state is None or rebuilt else state[0]
+    if rebuilt:
+        conn.execute("DELETE FROM skill_pattern_tokens")
+        conn.execute("DELETE FROM skill_pattern_members")
+        conn.execute("DELETE FROM skill_pattern_clusters")
+
+    # Highest counts first, like the from-scratch clustering, so a cluster's
+    # representative is its most used pattern at the time it was created.
+    # Rows used at the watermark are read again: increments can share its timestamp.
+    where, params = ("WHERE u.last_used >= ?", (watermark,)) if watermark is not None else ("", ())
+    rows = conn.execute(
+        f"""SELECT u.id, u.tool_name, u.query_pattern, u.count, u.last_used, m.cluster_id, m.counted
+            FROM skill_usage u LEFT JOIN skill_pattern_members m ON m.usage_id = u.id
+            {where}
+            ORDER BY u.count DESC, u.id""",
+        params,
+    ).fetchall()
+
+    stats = {"examined": len(rows), "assigned": 0, "updated": 0, "clusters_created": 0, "rebuilt": rebuilt}
+    for usage_id, tool_name, pattern, count, last_used, cluster_id, counted in rows:
+        if last_used and (watermark is None or last_used > watermark):
+            watermark = last_used
+        if cluster_id is not None:
+            if count != counted:
+                conn.execute(
+                    "UPDATE skill_pattern_clusters SET total_count = total_count + ?, updated_at=? WHERE id=?",
+                    (count - counted, now, cluster_id),
+                )
+                conn.execute("UPDATE skill_pattern_members SET counted=? WHERE usage_id=?", (count, usage_id))
+                stats["updated"] += 1
+            continue
+
+        tokens = words(pattern)
+        cluster_id = _find_cluster(conn, tool_name, tokens, similarity_threshold)
+        if cluster_id is None:
+            cluster_id = conn.execute(
+                """INSERT INTO skill_pattern_clusters (tool_name, representative, total_count, created_at, updated_at)
+                   VALUES (?, ?, 0, ?, ?)""",
+                (tool_name, pattern, now, now),
+            ).lastrowid
+            conn.executemany(
+                "INSERT OR IGNORE INTO skill_pattern_tokens (tool_name, token, cluster_id) VALUES (?, ?, ?)",
+                [(tool_name, token, cluster_id) for token in tokens],
+            )
+            stats["clusters_created"] += 1
+        conn.execute(
+            "UPDATE skill_pattern_clusters SET total_count = total_count + ?, updated_at=? WHERE id=?",
+            (count, now, cluster_id),
+        )
+        conn.execute(
+            "INSERT INTO skill_pattern_members (usage_id, cluster_id, counted) VALUES (?, ?, ?)",
+            (usage_id, cluster_id, count),
+        )
+        stats["assigned"] += 1
+
+    conn.execute(
+        """INSERT INTO skill_pattern_state (id, watermark, similarity_threshold, analyzed_at)
+           VALUES (1, ?, ?, ?)
+           ON CONFLICT(id) DO UPDATE SET
+               watermark=excluded.watermark,
+               similarity_threshold=excluded.similarity_threshold,
+               analyzed_at=excluded.analyzed_at""",
+        (watermark, similarity_threshold, now),
+    )
+    return stats
+
+
+def _find_cluster(
+    conn: sqlite3.Connection, tool_name: str, tokens: frozenset[str], similarity_threshold: float,
+) -> Optional[int]:
+    """The oldest cluster of *tool_name* whose representative is similar enough."""
+    if not tokens:
+        return None
+    placeholders = ",".join("?" * len(tokens))
+    candidates = conn.execute(
+        # CROSS JOIN keeps the token lookup as the outer loop instead of a
+        # scan of every cluster in id order.
+        f"""SELECT c.id, c.representative
+            FROM (SELECT DISTINCT cluster_id FROM skill_pattern_tokens
+                  WHERE tool_name=? AND token IN ({placeholders})) t
+            CROSS JOIN skill_pattern_clusters c ON c.id = t.cluster_id
+            ORDER BY c.id""",
+        (tool_name, *tokens),
+    ).fetchall()
+    for cluster_id, representative in candidates:
+        if jaccard(tokens, words(representative)) >= similarity_threshold:
+            return cluster_id
+    return None
+
+
+def list_clusters(conn: sqlite3.Connection, min_count: int = 1) -> list[dict]:
+    """Clusters with total_count >= *min_count*, largest first.
+
+    Each dict has tool_name, patterns (most used first), total_count and
+    representative.
+    """
+    clusters = conn.execute(
+        """SELECT id, tool_name, representative, total_count FROM skill_pattern_clusters
+           WHERE total_count >= ? ORDER BY total_count DESC, id""",
+        (min_count,),
+    ).fetchall()
+    if not clusters:
+        return []
+    by_id = {
+        row[0]: {"tool_name": row[1], "patterns": [], "total_count": row[3], "representative": row[2]}
+        for row in clusters
+    }
+    placeholders = ",".join("?" * len(by_id))
+    for cluster_id, pattern in conn.execute(
+        f"""SELECT m.cluster_id, u.query_pattern FROM skill_pattern_members m
+            JOIN skill_usage u ON u.id = m.usage_id
+            WHERE m.cluster_id IN ({placeholders})
+            ORDER BY u.count DESC, u.id""",
+        list(by_id),
+    ):
+        by_id[cluster_id]["patterns"].append(pattern)
+    return list(by_id.values())
@@ -5,15 +5,20 @@ import threading
 from datetime import datetime
 from typing import Optional
 
+from memory import skill_clusters
 from memory.models import SkillSuggestion, SkillSuggestionStatus, SkillUsage
+from memory.usage_rollup_store import TOOL_USAGE_SOURCE, watermark_sql
+
+_TOOL_USAGE_WATERMARK_SQL = watermark_sql(TOOL_USAGE_SOURCE)
 
 
 class SkillStore:
     """Manages skill usage tracking, tool invocation logs, and skill suggestions."""
 
-    def __init__(self, conn: sqlite3.Connection, *, lock=None):
+    def __init__(self, conn: sqlite3.Connection, *, lock=None, reader=None):
         self.conn = conn
         self._lock = lock or threading.RLock()
+        self._reader = reader or (lambda: self.conn)
 
     # --- Skill Usage ---
 
@@ -29,14 +34,14 @@ class SkillStore:
                 (tool_name, query_pattern, now, now),
             )
             self.conn.commit()
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT * FROM skill_usage WHERE tool_name=? AND query_pattern=?",
             (tool_name, query_pattern),
         ).fetchone()
         return self._row_to_skill_usage(row)
 
     def get_skill_usage_patterns(self, min_count: int = 1) -> list[dict]:
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             "SELECT tool_name, query_pattern, count, last_used FROM skill_usage "
             "WHERE count >= ? ORDER BY count DESC",
             (min_count,),
@@ -51,6 +56,24 @@ class SkillStore:
             for row in rows
         ]
 
+    def update_skill_clusters(self, similarity_threshold: float = 0.4) -> dict:
+        """Fold skill_usage changes since the last analysis into the persisted clusters.
+
+        See memory/skill_clusters.py. Returns the update counts.
+        """
+        with self._lock:
+            try:
+                stats = skill_clusters.update_clusters(self.conn, similarity_threshold)
+            except Exception:
+                self.conn.rollback()
+                raise
+            self.conn.commit()
+        return stats
+
+    def list_skill_clusters(self, min_count: int = 1) -> list[dict]:
+        """Persisted skill pattern clusters with total_count >= *min_count*, largest first."""
+        return skill_clusters.list_clusters(self._reader(), min_count)
+
     def _row_to_skill_usage(self, row: sqlite3.Row) -> SkillUsage:
         return SkillUsage(
             id=row["id"],
@@ -90,12 +113,12 @@ class SkillStore:
     ) -> list[dict]:
         """Retrieve invocation log entries, optionally filtered by tool name."""
         if tool_name:
-            rows = self.conn.execute(
+            rows = self._reader().execute(
                 "SELECT * FROM tool_usage_log WHERE tool_name=? ORDER BY created_at DESC LIMIT ?",
                 (tool_name, limit),
             ).fetchall()
         else:
-            rows = self.conn.execute(
+            rows = self._reader().execute(
                 "SELECT * FROM tool_usage_log ORDER BY created_at DESC LIMIT ?",
                 (limit,),
             ).fetchall()
@@ -114,20 +137,31 @@ class SkillStore:
         ]
 
     def get_tool_stats_summary(self) -> list[dict]:
-        """Aggregate tool usage stats from the invocation log."""
-        rows = self.conn.execute(
-            """SELECT
+        """Aggregate tool usage stats from the daily rollups plus the unrolled log tail."""
+        rows = self._reader().execute(
+            f"""WITH usage AS (
+                   SELECT tool_name, total_calls, success_count, failure_count,
+                          duration_sum, duration_count, response_size_sum,
+                          response_size_count, response_size_max, first_used, last_used
+                   FROM tool_usage_rollup WHERE granularity = 'day'
+                   UNION ALL
+                   SELECT tool_name, 1, success = 1, success = 0,
+                          duration_ms, duration_ms IS NOT NULL, response_size_bytes,
+                          response_size_bytes IS NOT NULL, response_size_bytes, created_at, created_at
+                   FROM tool_usage_log WHERE id > ({_TOOL_USAGE_WATERMARK_SQL})
+               )
+               SELECT
                    tool_name,
-                   COUNT(*) as total_calls,
-                   SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as success_count,
-                   SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as failure_count,
-                   AVG(CASE WHEN duration_ms IS NOT NULL THEN duration_ms END) as avg_duration_ms,
-                   AVG(CASE WHEN response_size_bytes IS NOT NULL THEN response_size_bytes END) as avg_response_size_bytes,
-                   MAX(response_size_bytes) as max_response_size_bytes,
-                   SUM(CASE WHEN response_size_bytes IS NOT NULL THEN response_size_bytes ELSE 0 END) as total_response_bytes,
-                   MIN(created_at) as first_used,
-                   MAX(created_at) as last_used
-               FROM tool_usage_log
+                   SUM(total_calls) as total_calls,
+                   SUM(success_count) as success_count,
+                   SUM(failure_count) as failure_count,
+                   SUM(duration_sum) * 1.0 / NULLIF(SUM(duration_count), 0) as avg_duration_ms,
+                   SUM(response_size_sum) * 1.0 / NULLIF(SUM(response_size_count), 0) as avg_response_size_bytes,
+                   MAX(response_size_max) as max_response_size_bytes,
+                   COALESCE(SUM(response_size_sum), 0) as total_response_bytes,
+                   MIN(first_used) as first_used,
+                   MAX(last_used) as last_used
+               FROM usage
                GROUP BY tool_name
                ORDER BY total_calls DESC"""
         ).fetchall()
@@ -148,10 +182,17 @@ class SkillStore:
         ]
 
     def get_top_patterns_by_tool(self, limit_per_tool: int = 10) -> dict[str, list[dict]]:
-        """Get top query patterns grouped by tool name from the invocation log."""
-        rows = self.conn.execute(
-            """SELECT tool_name, query_pattern, COUNT(*) as count
-               FROM tool_usage_log
+        """Get top query patterns grouped by tool name from the rollups plus the log tail."""
+        rows = self._reader().execute(
+            f"""WITH usage AS (
+                   SELECT tool_name, query_pattern, total_calls
+                   FROM tool_usage_rollup WHERE granularity = 'day'
+                   UNION ALL
+                   SELECT tool_name, query_pattern, 1
+                   FROM tool_usage_log WHERE id > ({_TOOL_USAGE_WATERMARK_SQL})
+               )
+               SELECT tool_name, query_pattern, SUM(total_calls) as count
+               FROM usage
                WHERE query_pattern != 'auto'
                GROUP BY tool_name, query_pattern
                ORDER BY tool_name, count DESC"""
@@ -182,7 +223,7 @@ class SkillStore:
         return self.get_skill_suggestion(cursor.lastrowid)
 
     def get_skill_suggestion(self, suggestion_id: int) -> Optional[SkillSuggestion]:
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT * FROM skill_suggestions WHERE id=?", (suggestion_id,)
         ).fetchone()
         if row is None:
@@ -190,7 +231,7 @@ class SkillStore:
         return self._row_to_skill_suggestion(row)
 
     def list_skill_suggestions(self, status: str = SkillSuggestionStatus.pending) -> list[SkillSuggestion]:
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             "SELECT * FROM skill_suggestions WHERE status=? ORDER BY confidence DESC",
             (status,),
         ).fetchall()
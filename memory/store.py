@@ -2,59 +2,81 @@
 """MemoryStore facade — delegates to domain-scoped stores.
 
 All public methods are preserved for backward compatibility.
-Table creation, migrations, and connection management remain centralized here.
+Table creation and connection management remain centralized here; schema
+changes after the baseline tables live in memory/migrations.py.
+Connections come from a ConnectionManager: one writer shared by every domain
+store and a small pool of per-thread read-only connections for reads.
+Tool usage and API call telemetry is written behind through a TelemetryBuffer.
 """
+import functools
 import logging
-import sqlite3
-import threading
 from pathlib import Path
 
 from memory.agent_memory_store import AgentMemoryStore
+from memory.alert_engine import AlertEngine
 from memory.api_usage_store import ApiUsageStore
+from memory.compile_job_store import CompileJobStore
+from memory.connection import DEFAULT_READ_POOL_SIZE, ConnectionManager
 from memory.fact_store import FactStore
 from memory.identity_store import IdentityStore
 from memory.lifecycle_store import LifecycleStore
+from memory.migrations import apply_migrations, get_schema_version
 from memory.scheduler_store import SchedulerStore
 from memory.skill_store import SkillStore
+from memory.telemetry_buffer import TelemetryBuffer
+from memory.usage_rollup_store import UsageRollupStore
 from memory.webhook_store import WebhookStore
 
 logger = logging.getLogger(__name__)
 
 
 class MemoryStore:
-    def __init__(self, db_path: Path, chroma_client=None):
+    def __init__(
+        self,
+        db_path: Path,
+        chroma_client=None,
+        *,
+        facts_collection=None,
+        read_pool_size: int = DEFAULT_READ_POOL_SIZE,
+        telemetry_options: dict | None = None,
+    ):
         self.db_path = db_path
-        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
-        self.conn.execute("PRAGMA journal_mode=WAL")
-        self.conn.execute("PRAGMA busy_timeout=30000")
-        self.conn.execute("PRAGMA foreign_keys=ON")
-        self.conn.row_factory = sqlite3.Row
+        self._db = ConnectionManager(db_path, read_pool_size=read_pool_size)
+        self.conn = self._db.conn
         self._chroma_client = chroma_client
-        self._facts_collection = None
-        if chroma_client is not None:
+        # A caller may hand over the collection (or a lazy handle to it)
+        # instead of the client, so that opening Chroma stays off this path.
+        self._facts_collection = facts_collection
+        if facts_collection is None and chroma_client is not None:
             self._facts_collection = chroma_client.get_or_create_collection(
                 "facts_vectors",
                 metadata={"hnsw:space": "cosine"},
             )
         self._create_tables()
-        self._migrate_facts_pinned()
-        self._migrate_agent_memory_namespace()
-        self._migrate_scheduled_tasks_delivery()
-        self._migrate_tool_usage_log_response_size()
-        self._migrate_source_ref()
+        apply_migrations(self.conn)
 
         # --- Thread safety: shared lock for all write operations ---
-        self._lock = threading.RLock()
-
-        # --- Domain stores (shared connection + lock) ---
-        self._fact_store = FactStore(self.conn, self._facts_collection, lock=self._lock)
-        self._lifecycle_store = LifecycleStore(self.conn, lock=self._lock)
-        self._webhook_store = WebhookStore(self.conn, lock=self._lock)
-        self._scheduler_store = SchedulerStore(self.conn, lock=self._lock)
-        self._skill_store = SkillStore(self.conn, lock=self._lock)
-        self._agent_memory_store = AgentMemoryStore(self.conn, lock=self._lock)
-        self._identity_store = IdentityStore(self.conn, lock=self._lock)
-        self._api_usage_store = ApiUsageStore(self.conn, lock=self._lock)
+        self._lock = self._db.lock
+
+        # --- Domain stores (shared writer + lock, per-thread readers) ---
+        shared = {"lock": self._lock, "reader": self._db.reader}
+        self._fact_store = FactStore(self.conn, self._facts_collection, **shared)
+        self._lifecycle_store = LifecycleStore(self.conn, **shared)
+        self._webhook_store = WebhookStore(self.conn, **shared)
+        self._scheduler_store = SchedulerStore(self.conn, **shared)
+        self._skill_store = SkillStore(self.conn, **shared)
+        self._agent_memory_store = AgentMemoryStore(self.conn, **shared)
+        self._identity_store = IdentityStore(self.conn, **shared)
+        self._api_usage_store = ApiUsageStore(self.conn, **shared)
+        self._compile_job_store = CompileJobStore(self.conn, **shared)
+        self._usage_rollup_store = UsageRollupStore(self.conn, **shared)
+        self._alert_engine = AlertEngine(self.conn, **shared)
+        self._telemetry = TelemetryBuffer(self._db, **(telemetry_options or {}))
+        flushed = self._flush_telemetry_first
+
+        # --- Connection helpers ---
+        self.reader = self._db.reader
+        self.transaction = self._db.transaction
 
         # --- Delegate all public methods ---
 
@@ -70,6 +92,8 @@ class MemoryStore:
         self.search_facts_hybrid = self._fact_store.search_facts_hybrid
         self.delete_fact = self._fact_store.delete_fact
         self.repair_vector_index = self._fact_store.repair_vector_index
+        self.backfill_fact_signatures = self._fact_store.backfill_fact_signatures
+        self.list_near_duplicate_facts = self._fact_store.list_near_duplicate_facts
         self.list_facts = self._fact_store.list_facts
         self.list_fact_keys = self._fact_store.list_fact_keys
         self.store_location = self._fact_store.store_location
@@ -98,17 +122,31 @@ class MemoryStore:
         self.update_alert_rule = self._lifecycle_store.update_alert_rule
         self.delete_alert_rule = self._lifecycle_store.delete_alert_rule
 
+        # AlertEngine: built-in alerts and alert rules in one query
+        self.evaluate_alerts = self._alert_engine.evaluate_alerts
+
         # WebhookStore: webhook events, event rules
         self.store_webhook_event = self._webhook_store.store_webhook_event
+        self.store_webhook_events = self._webhook_store.store_webhook_events
         self.get_webhook_event = self._webhook_store.get_webhook_event
         self.list_webhook_events = self._webhook_store.list_webhook_events
         self.update_webhook_event_status = self._webhook_store.update_webhook_event_status
+        self.claim_webhook_events = self._webhook_store.claim_webhook_events
+        self.extend_webhook_lease = self._webhook_store.extend_webhook_lease
+        self.complete_webhook_event = self._webhook_store.complete_webhook_event
+        self.record_webhook_rule_runs = self._webhook_store.record_webhook_rule_runs
+        self.get_webhook_rule_runs = self._webhook_store.get_webhook_rule_runs
+        self.fail_webhook_event = self._webhook_store.fail_webhook_event
+        self.release_webhook_event = self._webhook_store.release_webhook_event
+        self.requeue_webhook_event = self._webhook_store.requeue_webhook_event
+        self.get_webhook_queue_stats = self._webhook_store.get_webhook_queue_stats
         self.create_event_rule = self._webhook_store.create_event_rule
         self.get_event_rule = self._webhook_store.get_event_rule
         self.list_event_rules = self._webhook_store.list_event_rules
         self.update_event_rule = self._webhook_store.update_event_rule
         self.delete_event_rule = self._webhook_store.delete_event_rule
         self.match_event_rules = self._webhook_store.match_event_rules
+        self.invalidate_event_rule_index = self._webhook_store.invalidate_event_rule_index
 
         # SchedulerStore: scheduled tasks
         self.store_scheduled_task = self._scheduler_store.store_scheduled_task
@@ -120,12 +158,16 @@ class MemoryStore:
         self.delete_scheduled_task = self._scheduler_store.delete_scheduled_task
 
         # SkillStore: skill usage, tool usage log, skill suggestions
-        self.record_skill_usage = self._skill_store.record_skill_usage
-        self.get_skill_usage_patterns = self._skill_store.get_skill_usage_patterns
-        self.log_tool_invocation = self._skill_store.log_tool_invocation
-        self.get_tool_usage_log = self._skill_store.get_tool_usage_log
-        self.get_tool_stats_summary = self._skill_store.get_tool_stats_summary
-        self.get_top_patterns_by_tool = self._skill_store.get_top_patterns_by_tool
+        # (usage counters and the invocation log are buffered; reads flush first)
+        self.record_skill_usage = flushed(self._skill_store.record_skill_usage)
+        self.queue_skill_usage = self._telemetry.record_skill_usage
+        self.get_skill_usage_patterns = flushed(self._skill_store.get_skill_usage_patterns)
+        self.update_skill_clusters = flushed(self._skill_store.update_skill_clusters)
+        self.list_skill_clusters = self._skill_store.list_skill_clusters
+        self.log_tool_invocation = self._telemetry.log_tool_invocation
+        self.get_tool_usage_log = flushed(self._skill_store.get_tool_usage_log)
+        self.get_tool_stats_summary = flushed(self._skill_store.get_tool_stats_summary)
+        self.get_top_patterns_by_tool = flushed(self._skill_store.get_top_patterns_by_tool)
         self.store_skill_suggestion = self._skill_store.store_skill_suggestion
         self.get_skill_suggestion = self._skill_store.get_skill_suggestion
         self.list_skill_suggestions = self._skill_store.list_skill_suggestions
@@ -150,15 +192,38 @@ class MemoryStore:
         self.resolve_handle_to_name = self._identity_store.resolve_handle_to_name
 
         # ApiUsageStore: API call logging and aggregation
-        self.log_api_call = self._api_usage_store.log_api_call
-        self.get_api_usage_summary = self._api_usage_store.get_api_usage_summary
-        self.get_api_usage_log = self._api_usage_store.get_api_usage_log
+        # (API calls are buffered; reads flush first)
+        self.log_api_call = self._telemetry.log_api_call
+        self.get_api_usage_summary = flushed(self._api_usage_store.get_api_usage_summary)
+        self.get_api_usage_log = flushed(self._api_usage_store.get_api_usage_log)
+
+        # CompileJobStore: knowledge compilation queue
+        self.enqueue_compile_job = self._compile_job_store.enqueue_compile_job
+        self.claim_compile_jobs = self._compile_job_store.claim_compile_jobs
+        self.mark_compile_jobs_batched = self._compile_job_store.mark_compile_jobs_batched
+        self.list_compile_batches = self._compile_job_store.list_compile_batches
+        self.get_compile_job = self._compile_job_store.get_compile_job
+        self.finish_compile_job = self._compile_job_store.finish_compile_job
+        self.requeue_stale_compile_jobs = self._compile_job_store.requeue_stale_compile_jobs
+        self.get_compile_job_stats = self._compile_job_store.get_compile_job_stats
+
+        # UsageRollupStore: hourly/daily usage rollups and raw-log retention
+        self.rollup_usage = flushed(self._usage_rollup_store.rollup_usage)
+        self.get_rollup_state = self._usage_rollup_store.get_rollup_state
 
     # Preserve backward compat for _mmr_rerank (was a @staticmethod on MemoryStore)
     _mmr_rerank = staticmethod(FactStore._mmr_rerank)
 
     # --- Domain store properties ---
 
+    @property
+    def connection_manager(self) -> ConnectionManager:
+        return self._db
+
+    @property
+    def telemetry(self) -> TelemetryBuffer:
+        return self._telemetry
+
     @property
     def fact_store(self) -> FactStore:
         return self._fact_store
@@ -167,6 +232,10 @@ class MemoryStore:
     def lifecycle_store(self) -> LifecycleStore:
         return self._lifecycle_store
 
+    @property
+    def alert_engine(self) -> AlertEngine:
+        return self._alert_engine
+
     @property
     def webhook_store(self) -> WebhookStore:
         return self._webhook_store
@@ -191,6 +260,14 @@ class MemoryStore:
     def api_usage_store(self) -> ApiUsageStore:
         return self._api_usage_store
 
+    @property
+    def compile_job_store(self) -> CompileJobStore:
+        return self._compile_job_store
+
+    @property
+    def usage_rollup_store(self) -> UsageRollupStore:
+        return self._usage_rollup_store
+
     # --- Table creation (centralized) ---
 
     def _create_tables(self):
@@ -305,7 +382,7 @@ class MemoryStore:
             );
 
             CREATE TABLE IF NOT EXISTS tool_usage_log (
-                id INTEGER PRIMARY KEY,
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
                 tool_name TEXT NOT NULL,
                 query_pattern TEXT NOT NULL DEFAULT 'auto',
                 success INTEGER NOT NULL DEFAULT 1,
@@ -370,7 +447,7 @@ class MemoryStore:
             CREATE INDEX IF NOT EXISTS idx_identities_canonical_name ON identities(canonical_name);
 
             CREATE TABLE IF NOT EXISTS agent_api_log (
-                id INTEGER PRIMARY KEY,
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
                 model_id TEXT NOT NULL,
                 input_tokens INTEGER NOT NULL DEFAULT 0,
                 output_tokens INTEGER NOT NULL DEFAULT 0,
@@ -386,6 +463,61 @@ class MemoryStore:
             CREATE INDEX IF NOT EXISTS idx_agent_api_log_agent ON agent_api_log(agent_name);
             CREATE INDEX IF NOT EXISTS idx_agent_api_log_created ON agent_api_log(created_at);
 
+            CREATE TABLE IF NOT EXISTS compile_jobs (
+                id INTEGER PRIMARY KEY,
+                file_hash TEXT NOT NULL UNIQUE,
+                source TEXT NOT NULL,
+                text TEXT NOT NULL DEFAULT '',
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                batch_id TEXT,
+                error TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE INDEX IF NOT EXISTS idx_compile_jobs_status ON compile_jobs(status);
+
+            CREATE TABLE IF NOT EXISTS tool_usage_rollup (
+                granularity TEXT NOT NULL,
+                bucket TEXT NOT NULL,
+                tool_name TEXT NOT NULL,
+                query_pattern TEXT NOT NULL,
+                total_calls INTEGER NOT NULL DEFAULT 0,
+                success_count INTEGER NOT NULL DEFAULT 0,
+                failure_count INTEGER NOT NULL DEFAULT 0,
+                duration_sum INTEGER NOT NULL DEFAULT 0,
+                duration_count INTEGER NOT NULL DEFAULT 0,
+                response_size_sum INTEGER NOT NULL DEFAULT 0,
+                response_size_count INTEGER NOT NULL DEFAULT 0,
+                response_size_max INTEGER,
+                first_used TIMESTAMP,
+                last_used TIMESTAMP,
+                PRIMARY KEY (granularity, bucket, tool_name, query_pattern)
+            );
+
+            CREATE TABLE IF NOT EXISTS api_usage_rollup (
+                granularity TEXT NOT NULL,
+                bucket TEXT NOT NULL,
+                model_id TEXT NOT NULL,
+                agent_name TEXT NOT NULL DEFAULT '',
+                call_count INTEGER NOT NULL DEFAULT 0,
+                input_tokens INTEGER NOT NULL DEFAULT 0,
+                output_tokens INTEGER NOT NULL DEFAULT 0,
+                cache_creation_input_tokens INTEGER NOT NULL DEFAULT 0,
+                cache_read_input_tokens INTEGER NOT NULL DEFAULT 0,
+                duration_sum INTEGER NOT NULL DEFAULT 0,
+                duration_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (granularity, bucket, model_id, agent_name)
+            );
+
+            CREATE TABLE IF NOT EXISTS usage_rollup_state (
+                source TEXT PRIMARY KEY,
+                last_id INTEGER NOT NULL DEFAULT 0,
+                raw_pruned_before TIMESTAMP,
+                hourly_pruned_before TIMESTAMP,
+                rolled_up_at TIMESTAMP
+            );
+
             CREATE VIRTUAL TABLE IF NOT EXISTS facts_fts USING fts5(
                 key, value, category,
                 content='facts', content_rowid='id'
@@ -446,49 +578,26 @@ class MemoryStore:
 
     # --- Migrations (centralized) ---
 
-    def _migrate_facts_pinned(self):
-        """Add pinned column to facts if it doesn't exist."""
-        try:
-            self.conn.execute("ALTER TABLE facts ADD COLUMN pinned INTEGER DEFAULT 0")
-            self.conn.commit()
-        except sqlite3.OperationalError:
-            pass
+    @property
+    def schema_version(self) -> int:
+        return get_schema_version(self.reader())
 
-    def _migrate_agent_memory_namespace(self):
-        """Add namespace column to agent_memory if it doesn't exist."""
-        try:
-            self.conn.execute("ALTER TABLE agent_memory ADD COLUMN namespace TEXT")
-            self.conn.commit()
-        except sqlite3.OperationalError:
-            pass
-
-    def _migrate_scheduled_tasks_delivery(self):
-        """Add delivery_channel and delivery_config columns to scheduled_tasks if they don't exist."""
-        for col, col_type in [("delivery_channel", "TEXT"), ("delivery_config", "TEXT")]:
-            try:
-                self.conn.execute(f"ALTER TABLE scheduled_tasks ADD COLUMN {col} {col_type}")
-                self.conn.commit()
-            except sqlite3.OperationalError:
-                pass
+    # --- Connection management ---
 
-    def _migrate_tool_usage_log_response_size(self):
-        """Add response_size_bytes column to tool_usage_log if it doesn't exist."""
-        try:
-            self.conn.execute("ALTER TABLE tool_usage_log ADD COLUMN response_size_bytes INTEGER")
-            self.conn.commit()
-        except sqlite3.OperationalError:
-            pass
-
-    def _migrate_source_ref(self):
-        """Add source_ref column to delegations/decisions if missing (idempotent)."""
-        for table in ("delegations", "decisions"):
-            try:
-                self.conn.execute(f"ALTER TABLE {table} ADD COLUMN source_ref TEXT")
-                self.conn.commit()
-            except sqlite3.OperationalError:
-                pass
+    def _flush_telemetry_first(self, fn):
+        """Wrap a telemetry read so it sees rows still waiting in the buffer."""
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            self._telemetry.flush()
+            return fn(*args, **kwargs)
+        return wrapper
 
-    # --- Connection management ---
+    def flush_telemetry(self) -> int:
+        return self._telemetry.flush()
+
+    def get_telemetry_stats(self) -> dict:
+        return self._telemetry.stats()
 
     def close(self):
-        self.conn.close()
+        self._telemetry.close()
+        self._db.close()
@@ -0,0 +1,220 @@
+# memory/telemetry_buffer.py
+"""Write-behind buffer for high-frequency telemetry rows.
+
+Tool-call tracking (``skill_usage``, ``tool_usage_log``) and agent API
+logging (``agent_api_log``) used to commit once per row on the caller's
+thread. The buffer keeps those rows in memory and a background flusher
+writes them in a single transaction every ``flush_interval_ms`` or once
+``flush_rows`` rows are waiting, whichever comes first.
+
+The buffer is bounded: when it is full the oldest row is discarded and
+counted in ``dropped``. Reads of the telemetry tables go through
+``MemoryStore``, which flushes first, so callers still see their own rows.
+"""
+import logging
+import sqlite3
+import threading
+from collections import deque
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ROWS = 10_000
+DEFAULT_FLUSH_INTERVAL_MS = 250
+DEFAULT_FLUSH_ROWS = 200
+
+_SKILL_USAGE = "skill_usage"
+_TOOL_INVOCATION = "tool_invocation"
+_API_CALL = "api_call"
+
+
+class TelemetryBuffer:
+    """Bounded in-memory ring of telemetry rows with a background flusher.
+
+    The flusher thread is started on the first buffered row and exits once
+    the buffer is empty, so an idle store holds no thread.
+    """
+
+    def __init__(
+        self,
+        manager,
+        *,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        flush_rows: int = DEFAULT_FLUSH_ROWS,
+    ):
+        self._manager = manager
+        self._max_rows = max(1, max_rows)
+        self._flush_interval = max(0, flush_interval_ms) / 1000
+        self._flush_rows = max(1, flush_rows)
+        self._rows: deque = deque()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._dropped = 0
+        self._flushed = 0
+        self._flushes = 0
+
+    # --- Producers ---
+
+    def record_skill_usage(self, tool_name: str, query_pattern: str) -> None:
+        """Buffer one increment of the ``skill_usage`` counter."""
+        self._append(_SKILL_USAGE, (tool_name, query_pattern, datetime.now().isoformat()))
+
+    def log_tool_invocation(
+        self,
+        tool_name: str,
+        query_pattern: str = "auto",
+        success: bool = True,
+        duration_ms: int | None = None,
+        session_id: str | None = None,
+        response_size_bytes: int | None = None,
+    ) -> None:
+        """Buffer one ``tool_usage_log`` row."""
+        self._append(_TOOL_INVOCATION, (
+            tool_name, query_pattern, int(success), duration_ms, session_id,
+            response_size_bytes, datetime.now().isoformat(),
+        ))
+
+    def log_api_call(
+        self,
+        model_id: str,
+        input_tokens: int,
+        output_tokens: int,
+        cache_creation_input_tokens: int = 0,
+        cache_read_input_tokens: int = 0,
+        duration_ms: int | None = None,
+        agent_name: str | None = None,
+        caller: str = "unknown",
+        session_id: str | None = None,
+    ) -> None:
+        """Buffer one ``agent_api_log`` row."""
+        self._append(_API_CALL, (
+            model_id, input_tokens, output_tokens, cache_creation_input_tokens,
+            cache_read_input_tokens, duration_ms, agent_name, caller, session_id,
+            datetime.now().isoformat(),
+        ))
+
+    def _append(self, kind: str, row: tuple) -> None:
+        with self._cond:
+            if self._closed:
+                self._dropped += 1
+                return
+            if len(self._rows) >= self._max_rows:
+                self._rows.popleft()
+                self._dropped += 1
+            self._rows.append((kind, row))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="memory-telemetry-flusher", daemon=True,
+                )
+                self._thread.start()
+            elif len(self._rows) >= self._flush_rows:
+                self._cond.notify()
+
+    # --- Flushing ---
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed or len(self._rows) >= self._flush_rows,
+                    timeout=self._flush_interval,
+                )
+            self.flush()
+            with self._cond:
+                if self._closed or not self._rows:
+                    self._thread = None
+                    return
+
+    def flush(self) -> int:
+        """Write every buffered row in one transaction. Returns rows written."""
+        if not self._rows:
+            return 0
+        # Drain inside the writer transaction so concurrent flushes serialize
+        # on the writer lock and rows are committed in the order buffered.
+        batch: list = []
+        try:
+            with self._manager.transaction() as conn:
+                with self._cond:
+                    batch = list(self._rows)
+                    self._rows.clear()
+                if batch:
+                    _write_batch(conn, batch)
+        except sqlite3.Error:
+            logger.warning("Failed to flush %d telemetry row(s)", len(batch), exc_info=True)
+            with self._cond:
+                self._dropped += len(batch)
+            return 0
+        with self._cond:
+            self._flushed += len(batch)
+            self._flushes += 1 if batch else 0
+        return len(batch)
+
+    def close(self) -> None:
+        """Stop accepting rows, wait for the flusher, and write what is left."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join(timeout=30)
+        self.flush()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "buffered": len(self._rows),
+                "capacity": self._max_rows,
+                "flushed": self._flushed,
+                "flushes": self._flushes,
+                "dropped": self._dropped,
+            }
+
+
+def _write_batch(conn: sqlite3.Connection, batch: list[tuple[str, tuple]]) -> None:
+    # Coalesce skill_usage increments so each (tool, pattern) is one upsert.
+    skill_counts: dict[tuple[str, str], list] = {}
+    invocations: list[tuple] = []
+    api_calls: list[tuple] = []
+    for kind, row in batch:
+        if kind == _SKILL_USAGE:
+            tool_name, query_pattern, used_at = row
+            entry = skill_counts.setdefault((tool_name, query_pattern), [0, used_at, used_at])
+            entry[0] += 1
+            entry[2] = used_at
+        elif kind == _TOOL_INVOCATION:
+            invocations.append(row)
+        else:
+            api_calls.append(row)
+
+    if skill_counts:
+        conn.executemany(
+            """INSERT INTO skill_usage (tool_name, query_pattern, count, last_used, created_at)
+               VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT(tool_name, query_pattern) DO UPDATE SET
+                   count = count + excluded.count,
+                   last_used = excluded.last_used""",
+            [
+                (tool_name, query_pattern, count, last_used, created_at)
+                for (tool_name, query_pattern), (count, created_at, last_used) in skill_counts.items()
+            ],
+        )
+    if invocations:
+        conn.executemany(
+            """INSERT INTO tool_usage_log
+               (tool_name, query_pattern, success, duration_ms, session_id, response_size_bytes, created_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            invocations,
+        )
+    if api_calls:
+        conn.executemany(
+            """INSERT INTO agent_api_log
+               (model_id, input_tokens, output_tokens,
+                cache_creation_input_tokens, cache_read_input_tokens,
+                duration_ms, agent_name, caller, session_id, created_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            api_calls,
+        )
@@ -0,0 +1,210 @@
+# memory/usage_rollup_store.py
+"""Domain store for hourly/daily rollups of the usage log tables.
+
+``tool_usage_log`` and ``agent_api_log`` grow with every tool call and
+API round. ``rollup_usage`` folds raw rows into ``tool_usage_rollup`` and
+``api_usage_rollup`` (one row per bucket and key) and records a watermark
+per source in ``usage_rollup_state``. Analytics queries read the daily
+rollups plus the raw rows past the watermark, so raw rows older than the
+retention window can be pruned without changing their answers.
+"""
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+TOOL_USAGE_SOURCE = "tool_usage_log"
+API_USAGE_SOURCE = "agent_api_log"
+
+DEFAULT_RAW_RETENTION_DAYS = 30
+DEFAULT_HOURLY_RETENTION_DAYS = 90
+
+# Bucket keys: "YYYY-MM-DD" and "YYYY-MM-DDTHH". created_at may use either
+# isoformat ("T") or CURRENT_TIMESTAMP (" ") as the date/time separator.
+DAY_BUCKET_SQL = "substr(created_at, 1, 10)"
+HOUR_BUCKET_SQL = "substr(created_at, 1, 10) || 'T' || substr(created_at, 12, 2)"
+
+_GRANULARITIES = (("hour", HOUR_BUCKET_SQL), ("day", DAY_BUCKET_SQL))
+
+
+def watermark_sql(source: str) -> str:
+    """Scalar subquery for the last raw id of *source* already in the rollups."""
+    return f"SELECT COALESCE((SELECT last_id FROM usage_rollup_state WHERE source = '{source}'), 0)"
+
+
+def hour_bucket(timestamp: str) -> str:
+    """Hour bucket key for an ISO timestamp or date."""
+    hour = timestamp[11:13] if len(timestamp) >= 13 else "00"
+    return f"{timestamp[:10]}T{hour}"
+
+
+def day_bucket(timestamp: str) -> str:
+    """Day bucket key for an ISO timestamp or date."""
+    return timestamp[:10]
+
+
+class UsageRollupStore:
+    """Maintains usage rollups incrementally and prunes raw rows past retention."""
+
+    def __init__(self, conn: sqlite3.Connection, *, lock=None, reader=None):
+        self.conn = conn
+        self._lock = lock or threading.RLock()
+        self._reader = reader or (lambda: self.conn)
+
+    def rollup_usage(
+        self,
+        raw_retention_days: int | None = DEFAULT_RAW_RETENTION_DAYS,
+        hourly_retention_days: int | None = DEFAULT_HOURLY_RETENTION_DAYS,
+        now: datetime | None = None,
+    ) -> dict:
+        """Fold new raw rows into the rollups, then apply retention.
+
+        Raw rows are only deleted once rolled up and older than
+        *raw_retention_days*; hourly rollups older than
+        *hourly_retention_days* are dropped. Daily rollups are kept. Pass
+        ``None`` to disable either prune.
+        """
+        now = now or datetime.now()
+        raw_cutoff = (
+            (now - timedelta(days=raw_retention_days)).isoformat()
+            if raw_retention_days is not None else None
+        )
+        hourly_cutoff = (
+            (now - timedelta(days=hourly_retention_days)).isoformat()
+            if hourly_retention_days is not None else None
+        )
+        result = {}
+        with self._lock:
+            try:
+                for source, rollup in (
+                    (TOOL_USAGE_SOURCE, self._rollup_tool_usage),
+                    (API_USAGE_SOURCE, self._rollup_api_usage),
+                ):
+                    result[source] = self._rollup_source(
+                        source, rollup, raw_cutoff, hourly_cutoff, now.isoformat(),
+                    )
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+        return result
+
+    def get_rollup_state(self) -> dict[str, dict]:
+        """Watermark and prune horizons per source."""
+        rows = self._reader().execute("SELECT * FROM usage_rollup_state").fetchall()
+        return {
+            row["source"]: {
+                "last_id": row["last_id"],
+                "raw_pruned_before": row["raw_pruned_before"],
+                "hourly_pruned_before": row["hourly_pruned_before"],
+                "rolled_up_at": row["rolled_up_at"],
+            }
+            for row in rows
+        }
+
+    def _rollup_source(self, source, rollup, raw_cutoff, hourly_cutoff, rolled_up_at) -> dict:
+        state = self.conn.execute(
+            "SELECT * FROM usage_rollup_state WHERE source=?", (source,)
+        ).fetchone()
+        last_id = state["last_id"] if state else 0
+        max_id = self.conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {source}").fetchone()[0]
+        rolled = 0
+        if max_id > last_id:
+            rolled = self.conn.execute(
+                f"SELECT COUNT(*) FROM {source} WHERE id > ? AND id <= ?", (last_id, max_id)
+            ).fetchone()[0]
+            rollup(last_id, max_id)
+
+        # The watermark never moves back: ids are AUTOINCREMENT, so an empty
+        # table after a full prune still continues past last_id.
+        watermark = max(last_id, max_id)
+        pruned_raw = pruned_hourly = 0
+        rollup_table = "tool_usage_rollup" if source == TOOL_USAGE_SOURCE else "api_usage_rollup"
+        if raw_cutoff is not None:
+            pruned_raw = self.conn.execute(
+                f"DELETE FROM {source} WHERE id <= ? AND created_at < ?", (max_id, raw_cutoff)
+            ).rowcount
+        if hourly_cutoff is not None:
+            pruned_hourly = self.conn.execute(
+                f"DELETE FROM {rollup_table} WHERE granularity='hour' AND bucket < ?",
+                (hour_bucket(hourly_cutoff),),
+            ).rowcount
+
+        # Prune horizons only move forward, so a later run with a longer
+        # retention does not claim raw rows that are already gone.
+        raw_horizon = max(filter(None, (state and state["raw_pruned_before"], raw_cutoff)), default=None)
+        hourly_horizon = max(
+            filter(None, (state and state["hourly_pruned_before"], hourly_cutoff)), default=None,
+        )
+        self.conn.execute(
+            """INSERT INTO usage_rollup_state
+                   (source, last_id, raw_pruned_before, hourly_pruned_before, rolled_up_at)
+               VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT(source) DO UPDATE SET
+                   last_id = excluded.last_id,
+                   raw_pruned_before = excluded.raw_pruned_before,
+                   hourly_pruned_before = excluded.hourly_pruned_before,
+                   rolled_up_at = excluded.rolled_up_at""",
+            (source, watermark, raw_horizon, hourly_horizon, rolled_up_at),
+        )
+        return {
+            "rolled_up": rolled,
+            "pruned_raw": pruned_raw,
+            "pruned_hourly": pruned_hourly,
+            "last_id": watermark,
+        }
+
+    def _rollup_tool_usage(self, after_id: int, through_id: int) -> None:
+        for granularity, bucket_sql in _GRANULARITIES:
+            self.conn.execute(
+                f"""INSERT INTO tool_usage_rollup
+                       (granularity, bucket, tool_name, query_pattern, total_calls,
+                        success_count, failure_count, duration_sum, duration_count,
+                        response_size_sum, response_size_count, response_size_max,
+                        first_used, last_used)
+                   SELECT ?, {bucket_sql}, tool_name, query_pattern, COUNT(*),
+                          SUM(success = 1), SUM(success = 0),
+                          COALESCE(SUM(duration_ms), 0), COUNT(duration_ms),
+                          COALESCE(SUM(response_size_bytes), 0), COUNT(response_size_bytes),
+                          MAX(response_size_bytes), MIN(created_at), MAX(created_at)
+                   FROM tool_usage_log
+                   WHERE id > ? AND id <= ?
+                   GROUP BY 2, tool_name, query_pattern
+                   ON CONFLICT(granularity, bucket, tool_name, query_pattern) DO UPDATE SET
+                       total_calls = total_calls + excluded.total_calls,
+                       success_count = success_count + excluded.success_count,
+                       failure_count = failure_count + excluded.failure_count,
+                       duration_sum = duration_sum + excluded.duration_sum,
+                       duration_count = duration_count + excluded.duration_count,
+                       response_size_sum = response_size_sum + excluded.response_size_sum,
+                       response_size_count = response_size_count + excluded.response_size_count,
+                       response_size_max = MAX(COALESCE(response_size_max, excluded.response_size_max),
+                                               COALESCE(excluded.response_size_max, response_size_max)),
+                       first_used = MIN(first_used, excluded.first_used),
+                       last_used = MAX(last_used, excluded.last_used)""",
+                (granularity, after_id, through_id),
+            )
+
+    def _rollup_api_usage(self, after_id: int, through_id: int) -> None:
+        for granularity, bucket_sql in _GRANULARITIES:
+            self.conn.execute(
+                f"""INSERT INTO api_usage_rollup
+                       (granularity, bucket, model_id, agent_name, call_count,
+                        input_tokens, output_tokens, cache_creation_input_tokens,
+                        cache_read_input_tokens, duration_sum, duration_count)
+                   SELECT ?, {bucket_sql}, model_id, COALESCE(agent_name, ''), COUNT(*),
+                          SUM(input_tokens), SUM(output_tokens),
+                          SUM(cache_creation_input_tokens), SUM(cache_read_input_tokens),
+                          COALESCE(SUM(duration_ms), 0), COUNT(duration_ms)
+                   FROM agent_api_log
+                   WHERE id > ? AND id <= ?
+                   GROUP BY 2, model_id, COALESCE(agent_name, '')
+                   ON CONFLICT(granularity, bucket, model_id, agent_name) DO UPDATE SET
+                       call_count = call_count + excluded.call_count,
+                       input_tokens = input_tokens + excluded.input_tokens,
+                       output_tokens = output_tokens + excluded.output_tokens,
+                       cache_creation_input_tokens = cache_creation_input_tokens + excluded.cache_creation_input_tokens,
+                       cache_read_input_tokens = cache_read_input_tokens + excluded.cache_read_input_tokens,
+                       duration_sum = duration_sum + excluded.duration_sum,
+                       duration_count = duration_count + excluded.duration_count""",
+                (granularity, after_id, through_id),
+            )
@@ -1,14 +1,19 @@
 # memory/webhook_store.py
 """Domain store for webhook events and event rules."""
-import fnmatch
 import re
 import sqlite3
 import threading
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from typing import Optional
 
+from memory.event_rule_index import EventRuleIndex
 from memory.models import WebhookEvent, WebhookStatus
 
+# How often a cached rule index re-checks the table for changes made by
+# other processes (writes through this store invalidate it immediately).
+_RULE_INDEX_RECHECK_SECONDS = 1.0
+
 
 class WebhookStore:
     """Manages webhook events and event rules."""
@@ -19,9 +24,14 @@ class WebhookStore:
         "delivery_config", "enabled", "priority", "updated_at",
     })
 
-    def __init__(self, conn: sqlite3.Connection, *, lock=None):
+    def __init__(self, conn: sqlite3.Connection, *, lock=None, reader=None):
         self.conn = conn
         self._lock = lock or threading.RLock()
+        self._reader = reader or (lambda: self.conn)
+        self._rule_index: EventRuleIndex | None = None
+        self._rule_index_fingerprint: tuple | None = None
+        self._rule_index_checked_at = 0.0
+        self._rule_index_lock = threading.Lock()
 
     # --- Webhook Events ---
 
@@ -36,8 +46,37 @@ class WebhookStore:
             self.conn.commit()
         return self.get_webhook_event(cursor.lastrowid)
 
+    def store_webhook_events(self, events: list[WebhookEvent]) -> list[WebhookEvent]:
+        """Insert *events* in a single transaction. All or none are stored.
+
+        Returns the events with ``id``, ``status`` and ``received_at`` filled
+        in, in the order given.
+        """
+        if not events:
+            return []
+        now = datetime.now().isoformat()
+        stored = []
+        with self._lock:
+            try:
+                for event in events:
+                    status = event.status or WebhookStatus.pending
+                    cursor = self.conn.execute(
+                        """INSERT INTO webhook_events (source, event_type, payload, status, received_at)
+                           VALUES (?, ?, ?, ?, ?)""",
+                        (event.source, event.event_type, event.payload, status, now),
+                    )
+                    stored.append(WebhookEvent(
+                        id=cursor.lastrowid, source=event.source, event_type=event.event_type,
+                        payload=event.payload, status=status, received_at=now,
+                    ))
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+        return stored
+
     def get_webhook_event(self, event_id: int) -> Optional[WebhookEvent]:
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT * FROM webhook_events WHERE id=?", (event_id,)
         ).fetchone()
         if row is None:
@@ -57,19 +96,205 @@ class WebhookStore:
             params.append(source)
         query += " ORDER BY received_at DESC LIMIT ?"
         params.append(limit)
-        rows = self.conn.execute(query, params).fetchall()
+        rows = self._reader().execute(query, params).fetchall()
         return [self._row_to_webhook_event(r) for r in rows]
 
     def update_webhook_event_status(self, event_id: int, status: str) -> Optional[WebhookEvent]:
+        """Set *status* by hand. Clears any lease and scheduled retry."""
         now = datetime.now().isoformat() if status in (WebhookStatus.processed, WebhookStatus.failed) else None
         with self._lock:
             self.conn.execute(
-                "UPDATE webhook_events SET status=?, processed_at=? WHERE id=?",
+                """UPDATE webhook_events
+                   SET status=?, processed_at=?, lease_owner=NULL, lease_expires_at=NULL, next_attempt_at=NULL
+                   WHERE id=?""",
                 (status, now, event_id),
             )
             self.conn.commit()
         return self.get_webhook_event(event_id)
 
+    # --- Dispatch queue ---
+    #
+    # webhook_events doubles as the dispatch queue. A worker claims events
+    # by leasing them (status 'dispatching' with lease_owner and
+    # lease_expires_at); an expired lease makes the event claimable again,
+    # so a crashed worker never strands an event. Failed attempts are
+    # retried with exponential backoff via next_attempt_at, and events that
+    # exhaust max_attempts move to 'dead_letter'. Rules that succeeded on an
+    # earlier attempt are kept in webhook_event_rule_runs and not run again.
+
+    def claim_webhook_events(
+        self,
+        worker_id: str,
+        *,
+        limit: int = 10,
+        lease_seconds: float = 600,
+        max_attempts: int = 3,
+    ) -> list[WebhookEvent]:
+        """Atomically lease up to *limit* due events to *worker_id*, oldest first."""
+        now = datetime.now()
+        now_iso = now.isoformat()
+        lease_expires = (now + timedelta(seconds=lease_seconds)).isoformat()
+        with self._lock:
+            try:
+                # Leases that expired on their last allowed attempt are not
+                # retried again: the worker most likely crashed on this event.
+                self.conn.execute(
+                    """UPDATE webhook_events
+                       SET status=?, lease_owner=NULL, lease_expires_at=NULL, processed_at=?,
+                           last_error=COALESCE(last_error, 'lease expired')
+                       WHERE status=? AND lease_expires_at <= ? AND attempts >= ?""",
+                    (WebhookStatus.dead_letter, now_iso, WebhookStatus.dispatching, now_iso, max_attempts),
+                )
+                rows = self.conn.execute(
+                    """UPDATE webhook_events
+                       SET status=?, lease_owner=?, lease_expires_at=?, attempts=attempts+1
+                       WHERE id IN (
+                           SELECT id FROM webhook_events
+                           WHERE (status=? AND (next_attempt_at IS NULL OR next_attempt_at <= ?))
+                              OR (status=? AND next_attempt_at IS NOT NULL AND next_attempt_at <= ?)
+                              OR (status=? AND lease_expires_at <= ?)
+                           ORDER BY id LIMIT ?
+                       )
+                       RETURNING *""",
+                    (
+                        WebhookStatus.dispatching, worker_id, lease_expires,
+                        WebhookStatus.pending, now_iso,
+                        WebhookStatus.failed, now_iso,
+                        WebhookStatus.dispatching, now_iso,
+                        limit,
+                    ),
+                ).fetchall()
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+        return sorted((self._row_to_webhook_event(r) for r in rows), key=lambda e: e.id)
+
+    def extend_webhook_lease(self, event_id: int, worker_id: str, lease_seconds: float = 600) -> bool:
+        """Push out the lease on an event still held by *worker_id*."""
+        lease_expires = (datetime.now() + timedelta(seconds=lease_seconds)).isoformat()
+        return self._update_leased(
+            event_id, worker_id, "lease_expires_at=?", (lease_expires,),
+        )
+
+    def complete_webhook_event(self, event_id: int, worker_id: str) -> bool:
+        """Mark a leased event processed. False if the lease was lost."""
+        completed = self._update_leased(
+            event_id, worker_id,
+            "status=?, processed_at=?, last_error=NULL, next_attempt_at=NULL",
+            (WebhookStatus.processed, datetime.now().isoformat()),
+        )
+        if completed:
+            with self._lock:
+                self.conn.execute("DELETE FROM webhook_event_rule_runs WHERE event_id=?", (event_id,))
+                self.conn.commit()
+        return completed
+
+    def record_webhook_rule_runs(self, event_id: int, rule_ids: list[int]) -> None:
+        """Record that *rule_ids* succeeded for an event."""
+        if not rule_ids:
+            return
+        now = datetime.now().isoformat()
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO webhook_event_rule_runs (event_id, rule_id, completed_at) VALUES (?, ?, ?)",
+                [(event_id, rule_id, now) for rule_id in rule_ids],
+            )
+            self.conn.commit()
+
+    def get_webhook_rule_runs(self, event_id: int) -> set[int]:
+        """Ids of the rules that already succeeded for an event."""
+        return {
+            row["rule_id"] for row in self._reader().execute(
+                "SELECT rule_id FROM webhook_event_rule_runs WHERE event_id=?", (event_id,)
+            )
+        }
+
+    def fail_webhook_event(
+        self,
+        event_id: int,
+        worker_id: str,
+        error: str,
+        *,
+        max_attempts: int = 3,
+        retry_base_seconds: float = 60,
+    ) -> Optional[str]:
+        """Record a failed attempt on a leased event.
+
+        The event is retried after ``retry_base_seconds * 2**(attempts-1)``
+        or dead-lettered once it has had *max_attempts* attempts. Returns
+        the new status, or None if the lease was lost.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT attempts FROM webhook_events WHERE id=? AND lease_owner=?",
+                (event_id, worker_id),
+            ).fetchone()
+            if row is None:
+                return None
+            attempts = row["attempts"] or 0
+            now = datetime.now()
+            if attempts >= max_attempts:
+                status, next_attempt_at = WebhookStatus.dead_letter, None
+            else:
+                delay = retry_base_seconds * 2 ** max(attempts - 1, 0)
+                status, next_attempt_at = WebhookStatus.failed, (now + timedelta(seconds=delay)).isoformat()
+            updated = self._update_leased(
+                event_id, worker_id,
+                "status=?, processed_at=?, next_attempt_at=?, last_error=?",
+                (status, now.isoformat(), next_attempt_at, error[:2000]),
+            )
+        return status if updated else None
+
+    def release_webhook_event(self, event_id: int, worker_id: str, *, delay_seconds: float = 0) -> bool:
+        """Return a leased event to pending without counting the attempt."""
+        next_attempt_at = (datetime.now() + timedelta(seconds=delay_seconds)).isoformat() if delay_seconds else None
+        return self._update_leased(
+            event_id, worker_id,
+            "status=?, attempts=MAX(attempts-1, 0), next_attempt_at=?",
+            (WebhookStatus.pending, next_attempt_at),
+        )
+
+    def requeue_webhook_event(self, event_id: int) -> Optional[WebhookEvent]:
+        """Put a failed or dead-lettered event back in the queue with fresh attempts."""
+        with self._lock:
+            self.conn.execute(
+                """UPDATE webhook_events
+                   SET status=?, attempts=0, next_attempt_at=NULL, last_error=NULL,
+                       lease_owner=NULL, lease_expires_at=NULL, processed_at=NULL
+                   WHERE id=?""",
+                (WebhookStatus.pending, event_id),
+            )
+            self.conn.commit()
+        return self.get_webhook_event(event_id)
+
+    def get_webhook_queue_stats(self) -> dict:
+        """Event counts per status, plus the oldest claimable event's received_at."""
+        reader = self._reader()
+        counts = {
+            row["status"]: row["n"]
+            for row in reader.execute("SELECT status, COUNT(*) AS n FROM webhook_events GROUP BY status")
+        }
+        oldest = reader.execute(
+            "SELECT MIN(received_at) FROM webhook_events WHERE status=?", (WebhookStatus.pending,),
+        ).fetchone()[0]
+        return {"by_status": counts, "oldest_pending_received_at": oldest}
+
+    def _update_leased(self, event_id: int, worker_id: str, assignments: str, params: tuple) -> bool:
+        """Apply *assignments* to an event only while *worker_id* holds its lease.
+
+        Any assignment to ``status`` other than 'dispatching' also drops the lease.
+        """
+        if "status=" in assignments:
+            assignments += ", lease_owner=NULL, lease_expires_at=NULL"
+        with self._lock:
+            cursor = self.conn.execute(
+                f"UPDATE webhook_events SET {assignments} WHERE id=? AND lease_owner=? AND status=?",
+                (*params, event_id, worker_id, WebhookStatus.dispatching),
+            )
+            self.conn.commit()
+        return cursor.rowcount > 0
+
     def _row_to_webhook_event(self, row: sqlite3.Row) -> WebhookEvent:
         return WebhookEvent(
             id=row["id"],
@@ -79,6 +304,9 @@ class WebhookStore:
             status=row["status"],
             received_at=row["received_at"],
             processed_at=row["processed_at"],
+            attempts=row["attempts"] or 0,
+            next_attempt_at=row["next_attempt_at"],
+            last_error=row["last_error"],
         )
 
     # --- Event Rules ---
@@ -109,13 +337,14 @@ class WebhookStore:
                  1 if enabled else 0, priority, now, now),
             )
             self.conn.commit()
-        row = self.conn.execute(
+        self.invalidate_event_rule_index()
+        row = self._reader().execute(
             "SELECT * FROM event_rules WHERE name=?", (name,)
         ).fetchone()
         return self._row_to_event_rule_dict(row)
 
     def get_event_rule(self, rule_id: int) -> dict | None:
-        row = self.conn.execute(
+        row = self._reader().execute(
             "SELECT * FROM event_rules WHERE id=?", (rule_id,)
         ).fetchone()
         if row is None:
@@ -124,11 +353,11 @@ class WebhookStore:
 
     def list_event_rules(self, enabled_only: bool = True) -> list[dict]:
         if enabled_only:
-            rows = self.conn.execute(
+            rows = self._reader().execute(
                 "SELECT * FROM event_rules WHERE enabled=1 ORDER BY priority ASC"
             ).fetchall()
         else:
-            rows = self.conn.execute(
+            rows = self._reader().execute(
                 "SELECT * FROM event_rules ORDER BY priority ASC"
             ).fetchall()
         return [self._row_to_event_rule_dict(r) for r in rows]
@@ -149,6 +378,7 @@ class WebhookStore:
                 f"UPDATE event_rules SET {set_clause} WHERE id=?", values
             )
             self.conn.commit()
+        self.invalidate_event_rule_index()
         return self.get_event_rule(rule_id)
 
     def delete_event_rule(self, rule_id: int) -> dict:
@@ -157,20 +387,36 @@ class WebhookStore:
                 "DELETE FROM event_rules WHERE id=?", (rule_id,)
             )
             self.conn.commit()
+        self.invalidate_event_rule_index()
         if cursor.rowcount > 0:
             return {"status": "deleted", "id": rule_id}
         return {"status": "not_found", "id": rule_id}
 
     def match_event_rules(self, source: str, event_type: str) -> list[dict]:
-        """Find all enabled event rules that match the given source and event_type."""
-        rules = self.list_event_rules(enabled_only=True)
-        matched = []
-        for rule in rules:
-            if rule["event_source"] != source:
-                continue
-            if fnmatch.fnmatch(event_type, rule["event_type_pattern"]):
-                matched.append(rule)
-        return matched
+        """Find all enabled event rules that match the given source and event_type.
+
+        Served from a cached EventRuleIndex, so a burst of events costs no
+        SQLite round-trips beyond a periodic change check.
+        """
+        return self._event_rule_index().match(source, event_type)
+
+    def invalidate_event_rule_index(self) -> None:
+        with self._rule_index_lock:
+            self._rule_index = None
+
+    def _event_rule_index(self) -> EventRuleIndex:
+        index = self._rule_index
+        if index is not None and time.monotonic() - self._rule_index_checked_at < _RULE_INDEX_RECHECK_SECONDS:
+            return index
+        with self._rule_index_lock:
+            fingerprint = tuple(self._reader().execute(
+                "SELECT COUNT(*), MAX(id), MAX(updated_at) FROM event_rules"
+            ).fetchone())
+            if self._rule_index is None or fingerprint != self._rule_index_fingerprint:
+                self._rule_index = EventRuleIndex(self.list_event_rules(enabled_only=True))
+                self._rule_index_fingerprint = fingerprint
+            self._rule_index_checked_at = time.monotonic()
+            return self._rule_index
 
     def _row_to_event_rule_dict(self, row: sqlite3.Row) -> dict:
         return {
@@ -112,11 +112,11 @@ def _cell_pct(value) -> float:
 # Column mapping helpers
 # ---------------------------------------------------------------------------
 def _build_column_map(header_row) -> dict[str, int]:
-    """Build a lowercased, stripped column-name-to-index mapping from a header row."""
+    """Build a lowercased, stripped column-name-to-index mapping from a header row of values."""
     return {
-        str(cell.value).strip().lower(): idx
-        for idx, cell in enumerate(header_row)
-        if cell.value is not None
+        str(value).strip().lower(): idx
+        for idx, value in enumerate(header_row)
+        if value is not None
     }
 
 
@@ -169,6 +169,8 @@ def parse_okr_spreadsheet(path: Path) -> OKRSnapshot:
     if not path.exists():
         raise FileNotFoundError(f"OKR spreadsheet not found: {path}")
 
+    # read_only streams rows from the sheet XML instead of building the whole
+    # cell tree; rows are read as plain value tuples.
     wb = openpyxl.load_workbook(str(path), data_only=True, read_only=True)
 
     try:
@@ -200,7 +202,7 @@ def parse_okr_spreadsheet(path: Path) -> OKRSnapshot:
 # ---------------------------------------------------------------------------
 def _parse_objectives(ws) -> list[Objective]:
     """Parse the Objectives tab using header-based column mapping."""
-    rows = ws.iter_rows()
+    rows = ws.iter_rows(values_only=True)
     header_row = next(rows)
     col_map = _build_column_map(header_row)
     cols = _resolve_columns(
@@ -208,8 +210,7 @@ def _parse_objectives(ws) -> list[Objective]:
     )
 
     objectives = []
-    for row in rows:
-        cells = [c.value for c in row]
+    for cells in rows:
         if cells[cols["okr_id"]] is None:
             continue
         objectives.append(
@@ -229,7 +230,7 @@ def _parse_objectives(ws) -> list[Objective]:
 
 def _parse_key_results(ws) -> list[KeyResult]:
     """Parse the Key Results tab using header-based column mapping."""
-    rows = ws.iter_rows()
+    rows = ws.iter_rows(values_only=True)
     header_row = next(rows)
     col_map = _build_column_map(header_row)
     cols = _resolve_columns(
@@ -237,8 +238,7 @@ def _parse_key_results(ws) -> list[KeyResult]:
     )
 
     key_results = []
-    for row in rows:
-        cells = [c.value for c in row]
+    for cells in rows:
         if cells[cols["kr_id"]] is None:
             continue
         key_results.append(
@@ -265,7 +265,7 @@ def _parse_key_results(ws) -> list[KeyResult]:
 
 def _parse_initiatives(ws) -> list[Initiative]:
     """Parse the Initiatives tab using header-based column mapping."""
-    rows = ws.iter_rows()
+    rows = ws.iter_rows(values_only=True)
     header_row = next(rows)
     col_map = _build_column_map(header_row)
     cols = _resolve_columns(
@@ -273,8 +273,7 @@ def _parse_initiatives(ws) -> list[Initiative]:
     )
 
     initiatives = []
-    for row in rows:
-        cells = [c.value for c in row]
+    for cells in rows:
         if cells[cols["initiative_id"]] is None:
             continue
         initiatives.append(
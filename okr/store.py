@@ -1,5 +1,18 @@
-"""JSON-backed snapshot store for OKR data."""
+"""JSON-backed snapshot store for OKR data.
+
+The latest snapshot is parsed once and kept in memory, keyed by the file's
+mtime, size and inode, so repeated queries skip the file lock and
+``json.loads``. Alongside the rows, ``_SnapshotIndex`` keeps:
+
+- positions per okr_id, lower-cased team and lower-cased status;
+- the blended percentages of every objective;
+- a word index over the text-searchable fields. A row that contains the
+  search text also has, for each word of the text, a word containing it,
+  so the index narrows the candidates before the substring check.
+"""
 import json
+import os
+import threading
 from dataclasses import asdict
 from pathlib import Path
 from typing import Optional
@@ -7,6 +20,26 @@ from typing import Optional
 from okr.models import Initiative, KeyResult, OKRSnapshot, Objective, KR_WEIGHT, INITIATIVE_WEIGHT
 from utils.atomic import atomic_write, locked_read
 
+_KINDS = ("objectives", "key_results", "initiatives")
+
+# Fields matched by query(text=...), per kind.
+_TEXT_FIELDS = {
+    "objectives": ("name", "statement"),
+    "key_results": ("name",),
+    "initiatives": ("name", "description"),
+}
+
+_EMPTY_SUMMARY = {
+    "objectives_count": 0,
+    "key_results_count": 0,
+    "initiatives_count": 0,
+    "total_investment": 0,
+    "on_track": 0,
+    "at_risk": 0,
+    "blocked": 0,
+    "objectives_summary": [],
+}
+
 
 def _compute_blended(key_results: list, initiatives: list, okr_id: str) -> dict:
     """Compute kr_avg_pct, initiative_avg_pct, and blended_pct for a single OKR.
@@ -29,6 +62,93 @@ def _compute_blended(key_results: list, initiatives: list, okr_id: str) -> dict:
     }
 
 
+class _SnapshotIndex:
+    """A read-only, indexed view of one snapshot file's contents."""
+
+    _MAX_CACHED_WORDS = 1024
+
+    def __init__(self, data: dict) -> None:
+        self.timestamp = data["timestamp"]
+        self.source_file = data["source_file"]
+        self.rows = {kind: data[kind] for kind in _KINDS}
+        self.by_okr = {kind: self._group(rows, lambda r: r["okr_id"]) for kind, rows in self.rows.items()}
+        self.by_team = {kind: self._group(rows, lambda r: r["team"].lower()) for kind, rows in self.rows.items()}
+        self.by_status = {kind: self._group(rows, lambda r: r["status"].lower()) for kind, rows in self.rows.items()}
+
+        # Word -> positions, per kind, over the lower-cased text fields.
+        self.words: dict[str, dict[str, set[int]]] = {}
+        for kind, fields in _TEXT_FIELDS.items():
+            postings: dict[str, set[int]] = {}
+            for pos, row in enumerate(self.rows[kind]):
+                for field_name in fields:
+                    for word in row[field_name].lower().split():
+                        postings.setdefault(word, set()).add(pos)
+            self.words[kind] = postings
+        self._word_matches: dict[tuple[str, str], set[int]] = {}
+
+        key_results, initiatives = self.rows["key_results"], self.rows["initiatives"]
+        self.blended = {}
+        for okr_id in {o["okr_id"] for o in self.rows["objectives"]}:
+            self.blended[okr_id] = _compute_blended(
+                [key_results[p] for p in self.by_okr["key_results"].get(okr_id, ())],
+                [initiatives[p] for p in self.by_okr["initiatives"].get(okr_id, ())],
+                okr_id,
+            )
+        self.summary = self._summarize()
+
+    @staticmethod
+    def _group(rows: list[dict], key) -> dict[str, list[int]]:
+        groups: dict[str, list[int]] = {}
+        for pos, row in enumerate(rows):
+            groups.setdefault(key(row), []).append(pos)
+        return groups
+
+    def text_candidates(self, kind: str, text_lower: str) -> Optional[set[int]]:
+        """Positions that may contain *text_lower*, or None for whitespace-only text."""
+        candidates = None
+        for word in text_lower.split():
+            matches = self._word_matches.get((kind, word))
+            if matches is None:
+                matches = set()
+                for indexed, positions in self.words[kind].items():
+                    if word in indexed:
+                        matches |= positions
+                if len(self._word_matches) >= self._MAX_CACHED_WORDS:
+                    self._word_matches.clear()
+                self._word_matches[(kind, word)] = matches
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                break
+        return candidates
+
+    def _summarize(self) -> dict:
+        objectives = self.rows["objectives"]
+        objectives_summary = []
+        for o in objectives:
+            computed = self.blended[o["okr_id"]]
+            objectives_summary.append(
+                {
+                    "okr_id": o["okr_id"],
+                    "name": o["name"],
+                    "status": o["status"],
+                    "kr_avg_pct": computed["kr_avg_pct"],
+                    "initiative_avg_pct": computed["initiative_avg_pct"],
+                    "blended_pct": computed["blended_pct"],
+                    "pct_complete": computed["blended_pct"],  # backward compat; replaces stale Objectives tab value
+                }
+            )
+        return {
+            "objectives_count": len(objectives),
+            "key_results_count": len(self.rows["key_results"]),
+            "initiatives_count": len(self.rows["initiatives"]),
+            "total_investment": sum(i["investment_dollars"] for i in self.rows["initiatives"]),
+            "on_track": sum(1 for o in objectives if o["status"] == "On Track"),
+            "at_risk": sum(1 for o in objectives if o["status"] == "At Risk"),
+            "blocked": sum(1 for o in objectives if o["status"] == "Blocked"),
+            "objectives_summary": objectives_summary,
+        }
+
+
 class OKRStore:
     """Persists OKR snapshots as JSON and provides query capabilities."""
 
@@ -37,26 +157,48 @@ class OKRStore:
         self._data_dir.mkdir(parents=True, exist_ok=True)
         self._snapshot_path = self._data_dir / "latest_snapshot.json"
         self._lock_path = self._data_dir / ".okr_store.lock"
+        self._cache_lock = threading.Lock()
+        self._cache_key: Optional[tuple] = None
+        self._cache: Optional[_SnapshotIndex] = None
 
     def save(self, snapshot: OKRSnapshot) -> Path:
         """Serialize snapshot to JSON and write to disk atomically."""
         data = asdict(snapshot)
         content = json.dumps(data, indent=2, default=str)
         atomic_write(self._snapshot_path, content, self._lock_path)
+        with self._cache_lock:
+            self._cache_key = self._cache = None
         return self._snapshot_path
 
+    def _index(self) -> Optional[_SnapshotIndex]:
+        """The indexed latest snapshot, re-read only when the file has changed."""
+        try:
+            st = os.stat(self._snapshot_path)
+        except FileNotFoundError:
+            return None
+        # atomic_write replaces the file, so the inode changes on every save
+        # even when mtime and size happen to match.
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        with self._cache_lock:
+            if self._cache is None or self._cache_key != key:
+                data = json.loads(locked_read(self._snapshot_path, self._lock_path))
+                # Keyed by the stat taken before reading: a write that lands
+                # in between changes the key and is picked up next time.
+                self._cache, self._cache_key = _SnapshotIndex(data), key
+            return self._cache
+
     def load_latest(self) -> Optional[OKRSnapshot]:
         """Load the most recent snapshot from disk, or None if none exists."""
-        if not self._snapshot_path.exists():
+        index = self._index()
+        if index is None:
             return None
 
-        data = json.loads(locked_read(self._snapshot_path, self._lock_path))
         return OKRSnapshot(
-            timestamp=data["timestamp"],
-            source_file=data["source_file"],
-            objectives=[Objective(**o) for o in data["objectives"]],
-            key_results=[KeyResult(**kr) for kr in data["key_results"]],
-            initiatives=[Initiative(**i) for i in data["initiatives"]],
+            timestamp=index.timestamp,
+            source_file=index.source_file,
+            objectives=[Objective(**o) for o in index.rows["objectives"]],
+            key_results=[KeyResult(**kr) for kr in index.rows["key_results"]],
+            initiatives=[Initiative(**i) for i in index.rows["initiatives"]],
         )
 
     def query(
@@ -73,114 +215,54 @@ class OKRStore:
         Returns a dict with keys: objectives, key_results, initiatives.
         Each value is a list of dicts matching the filters.
         """
-        snapshot = self.load_latest()
-        if snapshot is None:
+        index = self._index()
+        if index is None:
             return {"objectives": [], "key_results": [], "initiatives": []}
 
-        objectives = [asdict(o) for o in snapshot.objectives]
-        key_results = [asdict(kr) for kr in snapshot.key_results]
-        initiatives = [asdict(i) for i in snapshot.initiatives]
-
-        if okr_id:
-            objectives = [o for o in objectives if o["okr_id"] == okr_id]
-            key_results = [kr for kr in key_results if kr["okr_id"] == okr_id]
-            initiatives = [i for i in initiatives if i["okr_id"] == okr_id]
-
-        if team:
-            team_lower = team.lower()
-            objectives = [o for o in objectives if o["team"].lower() == team_lower]
-            key_results = [kr for kr in key_results if kr["team"].lower() == team_lower]
-            initiatives = [i for i in initiatives if i["team"].lower() == team_lower]
-
-        if status:
-            status_lower = status.lower()
-            objectives = [o for o in objectives if o["status"].lower() == status_lower]
-            key_results = [kr for kr in key_results if kr["status"].lower() == status_lower]
-            initiatives = [i for i in initiatives if i["status"].lower() == status_lower]
-
-        if blocked_only:
-            initiatives = [i for i in initiatives if i["blocker"]]
-            # For blocked_only, only return initiatives (objectives/KRs not filtered)
-
-        if text:
-            text_lower = text.lower()
-            objectives = [
-                o for o in objectives
-                if text_lower in o["name"].lower()
-                or text_lower in o["statement"].lower()
-            ]
-            key_results = [
-                kr for kr in key_results
-                if text_lower in kr["name"].lower()
-            ]
-            initiatives = [
-                i for i in initiatives
-                if text_lower in i["name"].lower()
-                or text_lower in i["description"].lower()
-            ]
-
-        # Enrich each objective with computed blended percentages.
-        # Use the full (unfiltered) key_results and initiatives lists so that
-        # averages are always computed over all items belonging to the OKR,
-        # regardless of any active filters on the sibling lists.
-        all_key_results = [asdict(kr) for kr in snapshot.key_results]
-        all_initiatives = [asdict(i) for i in snapshot.initiatives]
-        for o in objectives:
-            computed = _compute_blended(all_key_results, all_initiatives, o["okr_id"])
+        text_lower = text.lower()
+        result = {}
+        for kind in _KINDS:
+            rows = index.rows[kind]
+            positions: Optional[set[int]] = None
+            for lookup, value in (
+                (index.by_okr, okr_id),
+                (index.by_team, team.lower()),
+                (index.by_status, status.lower()),
+            ):
+                if value:
+                    matched = set(lookup[kind].get(value, ()))
+                    positions = matched if positions is None else positions & matched
+            if text:
+                candidates = index.text_candidates(kind, text_lower)
+                if candidates is not None:
+                    positions = candidates if positions is None else positions & candidates
+            if positions is None:
+                positions = range(len(rows))
+
+            selected = []
+            for pos in sorted(positions):
+                row = rows[pos]
+                # For blocked_only, only return initiatives (objectives/KRs not filtered)
+                if blocked_only and kind == "initiatives" and not row["blocker"]:
+                    continue
+                if text and not any(text_lower in row[f].lower() for f in _TEXT_FIELDS[kind]):
+                    continue
+                selected.append(dict(row))
+            result[kind] = selected
+
+        # Enrich each objective with blended percentages, which are computed
+        # over all items belonging to the OKR regardless of active filters.
+        for o in result["objectives"]:
+            computed = index.blended[o["okr_id"]]
             o.update(computed)
             o["pct_complete"] = computed["blended_pct"]
 
-        return {
-            "objectives": objectives,
-            "key_results": key_results,
-            "initiatives": initiatives,
-        }
+        return result
 
     def executive_summary(self) -> dict:
         """Return high-level OKR status counts and investment totals."""
-        snapshot = self.load_latest()
-        if snapshot is None:
-            return {
-                "objectives_count": 0,
-                "key_results_count": 0,
-                "initiatives_count": 0,
-                "total_investment": 0,
-                "on_track": 0,
-                "at_risk": 0,
-                "blocked": 0,
-                "objectives_summary": [],
-            }
-
-        on_track = sum(1 for o in snapshot.objectives if o.status == "On Track")
-        at_risk = sum(1 for o in snapshot.objectives if o.status == "At Risk")
-        blocked = sum(1 for o in snapshot.objectives if o.status == "Blocked")
-        total_investment = sum(i.investment_dollars for i in snapshot.initiatives)
-
-        all_key_results = [asdict(kr) for kr in snapshot.key_results]
-        all_initiatives = [asdict(i) for i in snapshot.initiatives]
-
-        objectives_summary = []
-        for o in snapshot.objectives:
-            computed = _compute_blended(all_key_results, all_initiatives, o.okr_id)
-            objectives_summary.append(
-                {
-                    "okr_id": o.okr_id,
-                    "name": o.name,
-                    "status": o.status,
-                    "kr_avg_pct": computed["kr_avg_pct"],
-                    "initiative_avg_pct": computed["initiative_avg_pct"],
-                    "blended_pct": computed["blended_pct"],
-                    "pct_complete": computed["blended_pct"],  # backward compat; replaces stale Objectives tab value
-                }
-            )
+        index = self._index()
+        if index is None:
+            return dict(_EMPTY_SUMMARY, objectives_summary=[])
 
-        return {
-            "objectives_count": len(snapshot.objectives),
-            "key_results_count": len(snapshot.key_results),
-            "initiatives_count": len(snapshot.initiatives),
-            "total_investment": total_investment,
-            "on_track": on_track,
-            "at_risk": at_risk,
-            "blocked": blocked,
-            "objectives_summary": objectives_summary,
-        }
+        return dict(index.summary, objectives_summary=[dict(o) for o in index.summary["objectives_summary"]])
@@ -0,0 +1,175 @@
+"""Incremental file-age index for the stale-document check.
+
+Rewalking the Jarvis output directory and stat-ing every file on each
+suggestion pass is the expensive part of the proactive engine. The index
+remembers each directory's mtime together with the file mtimes it saw
+there. On refresh a directory whose mtime has not changed is reused as-is
+(only its subdirectories are revisited), so a steady-state pass costs one
+``stat`` per directory.
+
+A directory's mtime only changes when entries are added, removed or
+renamed, not when a file is rewritten in place. Rewriting can only make a
+file *newer*, so a cached mtime is a lower bound: files that look stale
+from the cache are re-stat-ed before they are counted, and files that
+look fresh are fresh.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+ROOT_BUCKET = "(root)"
+ARCHIVE_DIR = "_archive"
+
+# Directories modified this recently are rescanned next time, since a
+# change within the same mtime tick would otherwise go unnoticed.
+_RACY_SECONDS = 2.0
+
+
+class _DirState:
+    __slots__ = ("mtime_ns", "files", "subdirs")
+
+    def __init__(self, mtime_ns: Optional[int], files: dict[str, float], subdirs: list[str]):
+        self.mtime_ns = mtime_ns
+        self.files = files
+        self.subdirs = subdirs
+
+
+class DocumentAgeIndex:
+    """File mtimes under *root*, grouped by top-level directory.
+
+    Top-level files are grouped under ``ROOT_BUCKET``; the ``_archive``
+    directory is skipped.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._dirs: dict[str, _DirState] = {}
+        self._lock = threading.Lock()
+        self.last_refresh_stats: dict = {}
+
+    def stale_counts(
+        self,
+        retention_days: dict[str, int],
+        default_days: int,
+        now: Optional[datetime] = None,
+    ) -> dict[str, dict]:
+        """Refresh the index and count files older than their bucket's retention.
+
+        Returns ``{bucket: {"count": n, "threshold": days}}`` for buckets
+        with at least one stale file.
+        """
+        now = now or datetime.now()
+        with self._lock:
+            buckets, reused = self._refresh()
+            result: dict[str, dict] = {}
+            for bucket, dirs in buckets.items():
+                threshold = default_days if bucket == ROOT_BUCKET else retention_days.get(bucket, default_days)
+                count = 0
+                for path in dirs:
+                    state = self._dirs[path]
+                    for name, mtime in list(state.files.items()):
+                        if (now - datetime.fromtimestamp(mtime)).days <= threshold:
+                            continue
+                        if path in reused:
+                            mtime = self._restat(state, path, name)
+                            if mtime is None or (now - datetime.fromtimestamp(mtime)).days <= threshold:
+                                continue
+                        count += 1
+                if count:
+                    result[bucket] = {"count": count, "threshold": threshold}
+            return result
+
+    def _refresh(self) -> tuple[dict[str, list[str]], set[str]]:
+        """Bring the index up to date. Returns directories per bucket and the reused ones."""
+        started = time.monotonic()
+        seen: dict[str, _DirState] = {}
+        reused: set[str] = set()
+        buckets: dict[str, list[str]] = {}
+
+        root_state = self._scan(self.root, seen, reused, top_level=True)
+        if root_state is None:
+            self._dirs = {}
+            return {}, set()
+        buckets[ROOT_BUCKET] = [self.root]
+        for name in root_state.subdirs:
+            if name == ARCHIVE_DIR:
+                continue
+            stack = [os.path.join(self.root, name)]
+            dirs = buckets.setdefault(name, [])
+            while stack:
+                path = stack.pop()
+                state = self._scan(path, seen, reused)
+                if state is None:
+                    continue
+                dirs.append(path)
+                stack.extend(os.path.join(path, sub) for sub in state.subdirs)
+
+        self._dirs = seen
+        self.last_refresh_stats = {
+            "directories": len(seen),
+            "rescanned": len(seen) - len(reused),
+            "duration_ms": round((time.monotonic() - started) * 1000, 2),
+        }
+        return buckets, reused
+
+    def _scan(self, path: str, seen: dict, reused: set, top_level: bool = False) -> Optional[_DirState]:
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        cached = self._dirs.get(path)
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            seen[path] = cached
+            reused.add(path)
+            return cached
+
+        files: dict[str, float] = {}
+        subdirs: list[str] = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            # Like os.walk, don't descend into symlinked directories below the top level.
+                            if top_level or not entry.is_symlink():
+                                subdirs.append(entry.name)
+                            continue
+                        files[entry.name] = entry.stat().st_mtime
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+
+        if time.time() - mtime_ns / 1e9 < _RACY_SECONDS:
+            mtime_ns = None
+        state = _DirState(mtime_ns, files, subdirs)
+        seen[path] = state
+        return state
+
+    @staticmethod
+    def _restat(state: _DirState, path: str, name: str) -> Optional[float]:
+        try:
+            mtime = os.stat(os.path.join(path, name)).st_mtime
+        except OSError:
+            state.files.pop(name, None)
+            return None
+        state.files[name] = mtime
+        return mtime
+
+
+_indexes: dict[str, DocumentAgeIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_document_index(root: str) -> DocumentAgeIndex:
+    """The process-wide index for *root*, created on first use."""
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = _indexes[root] = DocumentAgeIndex(root)
+        return index
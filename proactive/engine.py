@@ -1,16 +1,36 @@
-"""Proactive suggestion engine — surfaces actionable insights from existing data."""
+"""Proactive suggestion engine — surfaces actionable insights from existing data.
+
+Checks run concurrently on a shared thread pool, each bounded by a timeout.
+A check whose timeout passes contributes its last cached result (or
+nothing) and keeps running in the background to refresh the cache. Results
+are cached per MemoryStore and check: database checks until a table they
+read changes or their TTL passes, session checks not at all.
+"""
 
 from __future__ import annotations
 
 import logging
-import os
-from collections import defaultdict
+import sqlite3
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-
+from typing import Any, Optional
+
+from config import (
+    PROACTIVE_CHECK_TIMEOUT_SECONDS,
+    PROACTIVE_CHECK_WORKERS,
+    PROACTIVE_DB_CHECK_TTL_SECONDS,
+    PROACTIVE_DOCUMENT_CHECK_TTL_SECONDS,
+    PROACTIVE_LINT_CHECK_TTL_SECONDS,
+)
 from memory.models import (
     DecisionStatus, DelegationStatus, SkillSuggestionStatus, WebhookStatus,
 )
 from memory.store import MemoryStore
+from proactive.document_index import ROOT_BUCKET, get_document_index
 from proactive.models import Suggestion
 
 logger = logging.getLogger(__name__)
@@ -28,30 +48,213 @@ DOCUMENT_RETENTION_DAYS: dict[str, int] = {
 DOCUMENT_RETENTION_DEFAULT = 90
 
 
+@dataclass(frozen=True)
+class CheckSpec:
+    name: str                   # runs ProactiveSuggestionEngine._check_<name>
+    ttl_seconds: float          # how long a result may be reused; 0 = always rerun
+    tables: tuple[str, ...] = ()  # memory.db tables read; a write to one drops the cached result
+
+
+CHECKS: tuple[CheckSpec, ...] = (
+    CheckSpec("skill_suggestions", PROACTIVE_DB_CHECK_TTL_SECONDS, ("skill_suggestions",)),
+    CheckSpec("unprocessed_webhooks", PROACTIVE_DB_CHECK_TTL_SECONDS, ("webhook_events",)),
+    CheckSpec("overdue_delegations", PROACTIVE_DB_CHECK_TTL_SECONDS, ("delegations",)),
+    CheckSpec("stale_decisions", PROACTIVE_DB_CHECK_TTL_SECONDS, ("decisions",)),
+    CheckSpec("upcoming_deadlines", PROACTIVE_DB_CHECK_TTL_SECONDS, ("delegations",)),
+    CheckSpec("session_checkpoint_needed", 0),
+    CheckSpec("session_token_limit", 0),
+    CheckSpec("session_unflushed_items", 0),
+    CheckSpec("session_brain_items", 0),
+    CheckSpec("knowledge_lint_findings", PROACTIVE_LINT_CHECK_TTL_SECONDS, ("facts",)),
+    CheckSpec("stale_documents", PROACTIVE_DOCUMENT_CHECK_TTL_SECONDS),
+)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _check_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=PROACTIVE_CHECK_WORKERS, thread_name_prefix="proactive-check",
+            )
+        return _executor
+
+
+class _CheckCache:
+    """Cached results and in-flight runs of the checks for one MemoryStore."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # name -> (suggestions, fingerprint, stored_at)
+        self.results: dict[str, tuple[list[Suggestion], Any, float]] = {}
+        # name -> (future, fingerprint) for runs that outlived their caller
+        self.inflight: dict[str, tuple[Future, Any]] = {}
+
+    def get(self, spec: CheckSpec, fingerprint: Any, now: float, *, allow_expired: bool = False):
+        with self.lock:
+            entry = self.results.get(spec.name)
+        if entry is None or entry[1] != fingerprint:
+            return None
+        if not allow_expired and now - entry[2] >= spec.ttl_seconds:
+            return None
+        return entry[0]
+
+    def put(self, name: str, suggestions: list[Suggestion], fingerprint: Any) -> None:
+        with self.lock:
+            self.results[name] = (suggestions, fingerprint, time.monotonic())
+
+    def clear(self) -> None:
+        with self.lock:
+            self.results.clear()
+
+
+_caches: "weakref.WeakKeyDictionary[Any, _CheckCache]" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def _cache_for(memory_store) -> _CheckCache:
+    with _caches_lock:
+        cache = _caches.get(memory_store)
+        if cache is None:
+            cache = _caches[memory_store] = _CheckCache()
+        return cache
+
+
+def _table_versions(memory_store) -> Optional[dict[str, int]]:
+    """Write counters of the tables the checks read, from ``table_changes``.
+
+    Triggers bump a table's counter on every insert, update and delete,
+    from this process or another, so writes to unrelated tables (usage
+    telemetry, caches) leave the cached checks alone. Returns None (no
+    caching) for anything that isn't a real store.
+    """
+    conn = getattr(memory_store, "conn", None)
+    if not isinstance(conn, sqlite3.Connection):
+        return None
+    try:
+        return dict(conn.execute("SELECT name, version FROM table_changes").fetchall())
+    except sqlite3.Error:
+        return None
+
+
+def _timed(fn) -> tuple[Any, float]:
+    started = time.monotonic()
+    return fn(), time.monotonic() - started
+
+
+def clear_check_cache(memory_store=None) -> None:
+    """Drop cached check results for *memory_store*, or for every store."""
+    with _caches_lock:
+        if memory_store is None:
+            caches = list(_caches.values())
+        else:
+            caches = [_caches[memory_store]] if memory_store in _caches else []
+    for cache in caches:
+        cache.clear()
+
+
 class ProactiveSuggestionEngine:
-    def __init__(self, memory_store: MemoryStore, session_health=None, session_manager=None, session_brain=None):
+    def __init__(
+        self,
+        memory_store: MemoryStore,
+        session_health=None,
+        session_manager=None,
+        session_brain=None,
+        check_timeout: Optional[float] = None,
+    ):
         self.memory_store = memory_store
         self.session_health = session_health
         self.session_manager = session_manager
         self.session_brain = session_brain
+        self.check_timeout = PROACTIVE_CHECK_TIMEOUT_SECONDS if check_timeout is None else check_timeout
+        # Per-check {"status": ok|cached|timeout|error, "ms": float} from the last run
+        self.last_check_timings: dict[str, dict] = {}
 
     def generate_suggestions(self) -> list[Suggestion]:
-        suggestions: list[Suggestion] = []
-        suggestions.extend(self._check_skill_suggestions())
-        suggestions.extend(self._check_unprocessed_webhooks())
-        suggestions.extend(self._check_overdue_delegations())
-        suggestions.extend(self._check_stale_decisions())
-        suggestions.extend(self._check_upcoming_deadlines())
-        suggestions.extend(self._check_session_checkpoint_needed())
-        suggestions.extend(self._check_session_token_limit())
-        suggestions.extend(self._check_session_unflushed_items())
-        suggestions.extend(self._check_session_brain_items())
-        suggestions.extend(self._check_knowledge_lint_findings())
-        suggestions.extend(self._check_stale_documents())
+        results = self._run_checks()
+        suggestions: list[Suggestion] = [s for spec in CHECKS for s in results[spec.name]]
         # Sort by priority: high first, then medium, then low
         suggestions.sort(key=lambda s: PRIORITY_ORDER.get(s.priority, 3))
         return suggestions
 
+    def _run_checks(self) -> dict[str, list[Suggestion]]:
+        """Run every check concurrently, reusing cached results where still valid."""
+        cache = _cache_for(self.memory_store)
+        table_versions = _table_versions(self.memory_store)
+        results: dict[str, list[Suggestion]] = {}
+        timings: dict[str, dict] = {}
+        pending: dict[str, tuple[CheckSpec, Future, Any]] = {}
+        started = time.monotonic()
+
+        for spec in CHECKS:
+            fingerprint = self._fingerprint(spec, table_versions)
+            if fingerprint is not None:
+                cached = cache.get(spec, fingerprint, started)
+                if cached is not None:
+                    results[spec.name] = cached
+                    timings[spec.name] = {"status": "cached", "ms": 0.0}
+                    continue
+            pending[spec.name] = (spec, self._submit(cache, spec, fingerprint), fingerprint)
+
+        deadline = started + self.check_timeout
+        for name, (spec, future, fingerprint) in pending.items():
+            try:
+                suggestions, elapsed = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FuturesTimeoutError:
+                stale = cache.get(spec, fingerprint, started, allow_expired=True) if fingerprint is not None else None
+                results[name] = stale or []
+                timings[name] = {"status": "timeout", "ms": round(self.check_timeout * 1000, 1)}
+                logger.warning("Proactive check %s timed out after %ss", name, self.check_timeout)
+                continue
+            except Exception as exc:
+                results[name] = []
+                timings[name] = {"status": "error", "ms": round((time.monotonic() - started) * 1000, 1)}
+                logger.warning("Proactive check %s failed: %s", name, exc)
+                continue
+            results[name] = suggestions
+            timings[name] = {"status": "ok", "ms": round(elapsed * 1000, 1)}
+
+        self.last_check_timings = timings
+        return results
+
+    def _fingerprint(self, spec: CheckSpec, table_versions: Optional[dict[str, int]]) -> Any:
+        """What a cached result of *spec* depends on; None means don't cache."""
+        if spec.ttl_seconds <= 0:
+            return None
+        if spec.tables:
+            if table_versions is None:
+                return None
+            # The date is included because several checks compare against today.
+            return tuple(table_versions.get(t) for t in spec.tables), date.today()
+        if spec.name == "stale_documents":
+            return JARVIS_OUTPUT_DIR
+        return ()
+
+    def _submit(self, cache: _CheckCache, spec: CheckSpec, fingerprint: Any) -> Future:
+        """Start a check, or join a run of it already in flight for the same data."""
+        method = getattr(self, f"_check_{spec.name}")
+        if fingerprint is None:
+            return _check_executor().submit(_timed, method)
+        with cache.lock:
+            inflight = cache.inflight.get(spec.name)
+            if inflight is not None and inflight[1] == fingerprint and not inflight[0].done():
+                return inflight[0]
+            future = _check_executor().submit(_timed, method)
+            cache.inflight[spec.name] = (future, fingerprint)
+
+        def store(done: Future) -> None:
+            with cache.lock:
+                if cache.inflight.get(spec.name, (None,))[0] is done:
+                    del cache.inflight[spec.name]
+            if done.exception() is None:
+                cache.put(spec.name, done.result()[0], fingerprint)
+
+        future.add_done_callback(store)
+        return future
+
     def _check_skill_suggestions(self) -> list[Suggestion]:
         pending = self.memory_store.list_skill_suggestions(status=SkillSuggestionStatus.pending)
         results = []
@@ -253,52 +456,13 @@ class ProactiveSuggestionEngine:
 
     def _check_stale_documents(self) -> list[Suggestion]:
         """Flag documents in the Jarvis output directory that exceed retention thresholds."""
-        if not os.path.isdir(JARVIS_OUTPUT_DIR):
-            return []
-
-        now = datetime.now()
-        # Collect stale file counts per top-level subdirectory
-        stale_by_dir: dict[str, dict] = defaultdict(lambda: {"count": 0, "threshold": 0})
-
-        for entry in os.scandir(JARVIS_OUTPUT_DIR):
-            if not entry.is_dir():
-                # Top-level files use the default threshold
-                threshold = DOCUMENT_RETENTION_DEFAULT
-                try:
-                    mtime = datetime.fromtimestamp(os.path.getmtime(entry.path))
-                except OSError:
-                    continue
-                age_days = (now - mtime).days
-                if age_days > threshold:
-                    bucket = stale_by_dir["(root)"]
-                    bucket["count"] += 1
-                    bucket["threshold"] = threshold
-                continue
-
-            dirname = entry.name
-            if dirname == "_archive":
-                continue
-
-            threshold = DOCUMENT_RETENTION_DAYS.get(dirname, DOCUMENT_RETENTION_DEFAULT)
-
-            for root, _dirs, files in os.walk(entry.path):
-                for fname in files:
-                    fpath = os.path.join(root, fname)
-                    try:
-                        mtime = datetime.fromtimestamp(os.path.getmtime(fpath))
-                    except OSError:
-                        continue
-                    age_days = (now - mtime).days
-                    if age_days > threshold:
-                        bucket = stale_by_dir[dirname]
-                        bucket["count"] += 1
-                        bucket["threshold"] = threshold
+        stale_by_dir = get_document_index(JARVIS_OUTPUT_DIR).stale_counts(
+            DOCUMENT_RETENTION_DAYS, DOCUMENT_RETENTION_DEFAULT,
+        )
 
         results: list[Suggestion] = []
         for dirname, info in sorted(stale_by_dir.items()):
-            if info["count"] == 0:
-                continue
-            display = JARVIS_OUTPUT_DIR if dirname == "(root)" else dirname
+            display = JARVIS_OUTPUT_DIR if dirname == ROOT_BUCKET else dirname
             results.append(Suggestion(
                 category="document",
                 priority="low",
@@ -374,10 +538,11 @@ class ProactiveSuggestionEngine:
         """Generate suggestions and optionally push notifications.
 
         Returns:
-            Dict with 'suggestions' list and optionally 'pushed' results.
+            Dict with 'suggestions' list, per-check 'check_timings' and
+            optionally 'pushed' results.
         """
         suggestions = self.generate_suggestions()
-        result: dict = {"suggestions": suggestions}
+        result: dict = {"suggestions": suggestions, "check_timings": self.last_check_timings}
         if push_enabled and suggestions:
             result["pushed"] = self.push_suggestions(suggestions, push_threshold)
         return result
@@ -3,10 +3,9 @@
 
 from __future__ import annotations
 
-import json
 import sys
 import traceback
-from datetime import date, datetime, timedelta
+from datetime import datetime, timedelta
 from pathlib import Path
 
 # Add parent dir to path for imports
@@ -34,99 +33,6 @@ def _log(log_path: Path, message: str):
         f.write(f"[{timestamp}] {message}\n")
 
 
-def _parse_rule_condition(condition: str) -> dict:
-    """Parse JSON condition string from alert rule."""
-    condition = (condition or "").strip()
-    if not condition:
-        return {}
-    try:
-        value = json.loads(condition)
-    except json.JSONDecodeError:
-        return {}
-    return value if isinstance(value, dict) else {}
-
-
-def _evaluate_rule(memory_store: MemoryStore, rule) -> dict:
-    """Evaluate a single alert rule against current data."""
-    parsed = _parse_rule_condition(rule.condition)
-    alert_type = (rule.alert_type or "").strip().lower()
-
-    if alert_type == "overdue_delegation":
-        min_days = int(parsed.get("days_overdue", 1))
-        today = date.today()
-        matches = [
-            {
-                "id": d.id,
-                "task": d.task,
-                "delegated_to": d.delegated_to,
-                "due_date": d.due_date,
-                "days_overdue": (today - date.fromisoformat(d.due_date)).days,
-            }
-            for d in memory_store.list_overdue_delegations()
-            if d.due_date and (today - date.fromisoformat(d.due_date)).days >= min_days
-        ]
-    elif alert_type in ("pending_decision", "stale_decision"):
-        stale_days = int(parsed.get("days_stale", 7))
-        cutoff = (date.today() - timedelta(days=stale_days)).isoformat()
-        matches = [
-            {
-                "id": d.id,
-                "title": d.title,
-                "created_at": d.created_at,
-            }
-            for d in memory_store.list_decisions_by_status("pending_execution")
-            if d.created_at and d.created_at[:10] < cutoff
-        ]
-    elif alert_type == "upcoming_deadline":
-        within_days = int(parsed.get("within_days", 3))
-        today = date.today()
-        soon = (today + timedelta(days=within_days)).isoformat()
-        today_str = today.isoformat()
-        matches = [
-            {
-                "id": d.id,
-                "task": d.task,
-                "delegated_to": d.delegated_to,
-                "due_date": d.due_date,
-            }
-            for d in memory_store.list_delegations(status="active")
-            if d.due_date and today_str <= d.due_date <= soon
-        ]
-    elif alert_type == "stale_backup":
-        max_age_hours = int(parsed.get("max_age_hours", 48))
-        cutoff = datetime.now() - timedelta(hours=max_age_hours)
-        fact = memory_store.get_fact("work", "backup_last_success")
-        matches = []
-        if fact is None:
-            matches.append({"reason": "No backup_last_success fact found"})
-        else:
-            # Value format: "YYYY-MM-DD: summary text"
-            try:
-                date_str = fact.value.split(":")[0].strip()
-                last_backup = datetime.strptime(date_str, "%Y-%m-%d")
-                if last_backup < cutoff:
-                    age_hours = (datetime.now() - last_backup).total_seconds() / 3600
-                    matches.append({
-                        "last_success": fact.value,
-                        "hours_ago": round(age_hours, 1),
-                        "threshold_hours": max_age_hours,
-                    })
-            except (ValueError, IndexError):
-                matches.append({
-                    "reason": f"Could not parse backup timestamp: {fact.value}"
-                })
-    else:
-        matches = []
-
-    return {
-        "rule_id": rule.id,
-        "name": rule.name,
-        "alert_type": rule.alert_type,
-        "count": len(matches),
-        "matches": matches,
-    }
-
-
 def _send_notification(title: str, message: str, log_path: Path):
     """Send macOS notification for triggered alert."""
     try:
@@ -164,12 +70,16 @@ def evaluate_alerts():
             _log(log_path, "No enabled rules to evaluate")
             return
 
-        # Evaluate each rule
+        # Evaluate every rule in one query, then notify per rule
+        results = memory_store.evaluate_alerts(rules, include_builtin=False)["rule_results"]
+        results_by_id = {r["rule_id"]: r for r in results}
         triggered_count = 0
         for rule in rules:
             try:
                 _log(log_path, f"Evaluating rule: {rule.name} (type={rule.alert_type})")
-                result = _evaluate_rule(memory_store, rule)
+                result = results_by_id[rule.id]
+                if "error" in result:
+                    raise ValueError(result["error"])
 
                 if result["count"] > 0:
                     triggered_count += 1
@@ -174,6 +174,7 @@ def build_imessage_daemon():
         IMESSAGE_DAEMON_ALLOWED_SENDERS,
         IMESSAGE_DAEMON_BOOTSTRAP_LOOKBACK_MINUTES,
         IMESSAGE_DAEMON_COMMAND_PREFIX,
+        IMESSAGE_DAEMON_DISPATCH_CONCURRENCY,
         IMESSAGE_DAEMON_ENABLED,
         IMESSAGE_DAEMON_MONITORED_CONVERSATION,
         IMESSAGE_DAEMON_POLL_INTERVAL_SECONDS,
@@ -204,6 +205,7 @@ def build_imessage_daemon():
         monitored_conversation=IMESSAGE_DAEMON_MONITORED_CONVERSATION,
         allowed_senders=IMESSAGE_DAEMON_ALLOWED_SENDERS,
         command_prefix=IMESSAGE_DAEMON_COMMAND_PREFIX,
+        dispatch_concurrency=IMESSAGE_DAEMON_DISPATCH_CONCURRENCY,
     )
 
     # Build executor with Claude API client and tool registry
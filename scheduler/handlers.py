@@ -258,6 +258,45 @@ def _run_knowledge_lint_handler(memory_store) -> str:
         return json.dumps({"status": "error", "handler": "knowledge_lint", "error": str(e)})
 
 
+def _run_knowledge_compile_handler(memory_store, document_store=None, handler_config: str = "") -> str:
+    """Drain the document summary queue (concurrent requests or Message Batches)."""
+    try:
+        from knowledge.compile_queue import run_compile_queue
+
+        config = _parse_json_config(handler_config)
+        if document_store is None:
+            from config import CHROMA_PERSIST_DIR
+            from documents.store import DocumentStore
+            document_store = DocumentStore(persist_dir=CHROMA_PERSIST_DIR)
+
+        result = run_compile_queue(
+            memory_store,
+            document_store,
+            mode=config.get("mode", "auto"),
+            limit=config.get("limit"),
+        )
+        return json.dumps({"status": "ok", "handler": "knowledge_compile", **result})
+    except Exception as e:
+        logger.error("Knowledge compile handler failed: %s", e)
+        return json.dumps({"status": "error", "handler": "knowledge_compile", "error": str(e)})
+
+
+def _run_usage_rollup_handler(memory_store, handler_config: str = "") -> str:
+    """Fold new usage log rows into the rollups and prune raw rows past retention."""
+    try:
+        from config import USAGE_HOURLY_RETENTION_DAYS, USAGE_RAW_RETENTION_DAYS
+
+        config = _parse_json_config(handler_config)
+        result = memory_store.rollup_usage(
+            raw_retention_days=config.get("raw_retention_days", USAGE_RAW_RETENTION_DAYS),
+            hourly_retention_days=config.get("hourly_retention_days", USAGE_HOURLY_RETENTION_DAYS),
+        )
+        return json.dumps({"status": "ok", "handler": "usage_rollup", "sources": result})
+    except Exception as e:
+        logger.error("Usage rollup handler failed: %s", e)
+        return json.dumps({"status": "error", "handler": "usage_rollup", "error": str(e)})
+
+
 def execute_handler(handler_type: str, handler_config: str, memory_store=None, agent_registry=None, document_store=None) -> str:
     """Execute a task handler and return a JSON result string."""
     # Import here to avoid module-level circular dependency
@@ -279,6 +318,10 @@ def execute_handler(handler_type: str, handler_config: str, memory_store=None, a
         return _run_morning_brief_handler(handler_config)
     elif handler_type == HandlerType.knowledge_lint:
         return _run_knowledge_lint_handler(memory_store)
+    elif handler_type == HandlerType.knowledge_compile:
+        return _run_knowledge_compile_handler(memory_store, document_store, handler_config)
+    elif handler_type == HandlerType.usage_rollup:
+        return _run_usage_rollup_handler(memory_store, handler_config)
     elif handler_type == HandlerType.custom:
         return _run_custom_handler(handler_config)
     else:
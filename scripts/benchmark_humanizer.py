@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Benchmark humanize() against the rule-by-rule reference implementation.
+
+Builds synthetic outbound texts of increasing size, once with no AI patterns
+and once with a sprinkling of them, and times:
+
+- sequential: one regex pass per rule (the old path);
+- compiled: ``humanize``, which runs only the rules whose literal occurs.
+
+Each result is also checked against the reference output.
+
+Usage: python scripts/benchmark_humanizer.py [--words 20000] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from humanizer.rules import DEFAULT_RULES, humanize  # noqa: E402
+
+PLAIN = (
+    "the team will review the plan with data from last quarter and send notes "
+    "to everyone on the list before friday so we can decide on next steps"
+).split()
+AI_PHRASES = (
+    "utilize", "Additionally,", "in order to", "serves as", "could potentially",
+    "—", "Great question!", "leverage", "robust", "landscape", "It is worth noting that",
+)
+
+
+def _humanize_sequential(text: str) -> str:
+    """Every rule as a separate pass, then the cleanup."""
+    for rule in DEFAULT_RULES:
+        text = rule.pattern.sub(rule.replacement, text)
+    text = re.sub(r"(?<=\S)  +", " ", text)
+    text = re.sub(r" ([.,;:!?])", r"\1", text)
+    return text.strip()
+
+
+def _text(words: int, ai_rate: float, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    return " ".join(
+        rng.choice(AI_PHRASES) if rng.random() < ai_rate else rng.choice(PLAIN)
+        for _ in range(words)
+    )
+
+
+def _timed(fn, text: str, repeat: int) -> tuple[str, float]:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(text)
+    return result, (time.perf_counter() - started) / repeat
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    mismatches = 0
+    for words in (200, 2_000, args.words):
+        for label, rate in (("clean", 0.0), ("2% AI", 0.02)):
+            text = _text(words, rate)
+            expected, sequential_s = _timed(_humanize_sequential, text, args.repeat)
+            actual, compiled_s = _timed(humanize, text, args.repeat)
+            same = actual == expected
+            mismatches += not same
+            print(f"{words:>7,} words {label:>6}: sequential {sequential_s * 1000:8.2f}ms  "
+                  f"compiled {compiled_s * 1000:8.2f}ms  ({sequential_s / compiled_s:5.1f}x)  same: {same}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
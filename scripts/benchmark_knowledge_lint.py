@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark near-duplicate linting on a synthetic fact store.
+
+Builds a temporary memory.db with N facts (default 100,000), about 1% of
+them near-copies of another fact, then times:
+
+- backfill: one-time MinHash/LSH indexing of facts written without a
+  signature (what an existing database pays once after upgrading);
+- store_fact: incremental indexing cost per write;
+- lint: ``KnowledgeLinter.check_near_duplicates()`` once the index is current,
+  which is what the knowledge_lint scheduled task pays on every run.
+
+With --exact-sample it also runs the exact all-pairs comparison on a
+smaller store and checks that LSH found the same pairs.
+
+Usage: python scripts/benchmark_knowledge_lint.py [--facts 100000] [--exact-sample 3000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from knowledge.linter import KnowledgeLinter  # noqa: E402
+from memory.models import Fact  # noqa: E402
+from memory.store import MemoryStore  # noqa: E402
+
+CATEGORIES = ("work", "work", "work", "personal", "preference", "relationship")
+
+
+def _populate(store: MemoryStore, n: int, seed: int = 7) -> int:
+    """Bulk-insert *n* facts; returns how many are near-copies."""
+    rng = random.Random(seed)
+    vocabulary = [f"w{i}" for i in range(20000)]
+    rows, values, copies = [], [], 0
+    for i in range(n):
+        category = rng.choice(CATEGORIES)
+        if values and rng.random() < 0.01:
+            base_category, base = rng.choice(values)
+            words = base.split()
+            words[rng.randrange(len(words))] = rng.choice(vocabulary)
+            category, value = base_category, " ".join(words)
+            copies += 1
+        else:
+            value = " ".join(rng.sample(vocabulary, rng.randint(8, 20)))
+        values.append((category, value))
+        rows.append((category, f"fact_{i}", value))
+    with store.conn:
+        store.conn.executemany("INSERT INTO facts (category, key, value) VALUES (?, ?, ?)", rows)
+    return copies
+
+
+def _timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--facts", type=int, default=100_000)
+    parser.add_argument("--exact-sample", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = MemoryStore(Path(tmp) / "bench.db")
+        try:
+            copies = _populate(store, args.facts)
+            indexed, backfill_s = _timed(store.backfill_fact_signatures)
+
+            writes = 200
+            _, store_s = _timed(lambda: [
+                store.store_fact(Fact(category="work", key=f"new_{i}", value=f"fresh fact number {i} about w{i}"))
+                for i in range(writes)
+            ])
+
+            linter = KnowledgeLinter(store)
+            findings, lint_s = _timed(linter.check_near_duplicates)
+
+            print(f"facts:           {args.facts:,} ({copies:,} near-copies)")
+            print(f"backfill:        {backfill_s:.2f}s for {indexed:,} facts (one-time)")
+            print(f"store_fact:      {store_s / writes * 1000:.2f}ms per write")
+            print(f"lint:            {lint_s * 1000:.0f}ms, {len(findings):,} near-duplicate pairs")
+        finally:
+            store.close()
+
+        if args.exact_sample:
+            store = MemoryStore(Path(tmp) / "exact.db")
+            try:
+                _populate(store, args.exact_sample)
+                linter = KnowledgeLinter(store)
+                lsh, lsh_s = _timed(linter.check_near_duplicates)
+                exact, exact_s = _timed(lambda: linter._check_near_duplicates_exact(0.7))
+                same = [(f["fact_a"]["key"], f["fact_b"]["key"]) for f in lsh] == [
+                    (f["fact_a"]["key"], f["fact_b"]["key"]) for f in exact
+                ]
+                print(f"exact sample:    {args.exact_sample:,} facts — exact {exact_s:.2f}s, "
+                      f"LSH (incl. backfill) {lsh_s:.2f}s, same pairs: {same}")
+            finally:
+                store.close()
+
+    return 0 if lint_s < 1.0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
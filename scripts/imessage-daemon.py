@@ -78,6 +78,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--bootstrap-lookback-minutes", type=int, default=env_int("IMESSAGE_DAEMON_BOOTSTRAP_LOOKBACK_MINUTES", 30))
     parser.add_argument("--max-lookback-minutes", type=int, default=env_int("IMESSAGE_DAEMON_MAX_LOOKBACK_MINUTES", 1440))
     parser.add_argument("--dispatch-batch-size", type=int, default=env_int("IMESSAGE_DAEMON_DISPATCH_BATCH_SIZE", 25))
+    parser.add_argument("--dispatch-concurrency", type=int, default=env_int("IMESSAGE_DAEMON_DISPATCH_CONCURRENCY", 4))
     parser.add_argument("--once", action="store_true", help="Run one ingest+dispatch cycle and exit.")
     parser.add_argument("--verbose", action="store_true")
     return parser.parse_args()
@@ -95,6 +96,7 @@ def build_config(args: argparse.Namespace) -> DaemonConfig:
         bootstrap_lookback_minutes=max(1, args.bootstrap_lookback_minutes),
         max_lookback_minutes=max(5, args.max_lookback_minutes),
         dispatch_batch_size=max(1, args.dispatch_batch_size),
+        dispatch_concurrency=max(1, args.dispatch_concurrency),
         monitored_conversation=os.getenv("IMESSAGE_DAEMON_MONITORED_CONVERSATION", ""),
     )
 
@@ -177,7 +179,7 @@ def main() -> int:
             try:
                 result = asyncio.run(daemon.run_once())
                 if result["ingested"] > 0 or result["dispatched"] > 0:
-                    logging.getLogger("imessage-daemon").info("Cycle result: %s", result)
+                    logging.getLogger("imessage-daemon").info("Cycle result: %s %s", result, daemon.metrics())
             except Exception:
                 logging.getLogger("imessage-daemon").exception("Daemon cycle crashed")
             import time
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Profile the import cost of Jarvis entry points with ``python -X importtime``.
+
+Each module is imported in a fresh interpreter. The report shows its
+cumulative import time, the slowest modules it pulled in, and whether any
+heavy optional package (anthropic, chromadb, rich) was loaded.
+
+Usage: python scripts/profile_imports.py [module ...] [--top 15]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules launchd and the CLI start for short-lived runs.
+ENTRY_POINTS = (
+    "config",
+    "scheduler.engine",
+    "scheduler.daemon",
+    "scheduler.alert_evaluator",
+    "webhook.receiver",
+    "webhook.dispatcher",
+    "chief.imessage_daemon",
+    "knowledge.compile_queue",
+    "agents.base",
+)
+HEAVY_PACKAGES = ("anthropic", "chromadb", "rich")
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def profile_import(module: str) -> dict:
+    """Import *module* in a fresh interpreter and parse its -X importtime log.
+
+    Returns total_ms (cumulative time of *module* itself), modules (name ->
+    (self_ms, cumulative_ms)) and heavy (the HEAVY_PACKAGES that were loaded).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    modules: dict[str, tuple[float, float]] = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            modules[match.group(4)] = (int(match.group(1)) / 1000, int(match.group(2)) / 1000)
+    return {
+        "total_ms": modules.get(module, (0.0, 0.0))[1],
+        "modules": modules,
+        "heavy": [name for name in HEAVY_PACKAGES if name in modules],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=list(ENTRY_POINTS))
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list per module")
+    args = parser.parse_args(argv)
+
+    for module in args.modules:
+        profile = profile_import(module)
+        heavy = ", ".join(profile["heavy"]) or "none"
+        print(f"{module}: {profile['total_ms']:.0f}ms (heavy packages: {heavy})")
+        slowest = sorted(profile["modules"].items(), key=lambda item: item[1][0], reverse=True)
+        for name, (self_ms, cumulative_ms) in slowest[:args.top]:
+            print(f"    {self_ms:8.1f}ms self {cumulative_ms:9.1f}ms cumulative  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
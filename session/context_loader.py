@@ -133,21 +133,10 @@ def _fetch_due_reminders(state: ServerState) -> list[dict]:
     if state.reminder_store is None:
         return []
     try:
-        reminders = state.reminder_store.list_reminders(completed=False)
+        reminders = state.reminder_store.due_reminders()
     except Exception:
         return []
-    today = datetime.now().date()
-    due = []
-    for r in reminders:
-        due_date_str = r.get("due_date") or r.get("dueDate")
-        if due_date_str:
-            try:
-                rd = datetime.fromisoformat(due_date_str).date()
-                if rd <= today:
-                    due.append(r)
-            except (ValueError, TypeError):
-                continue
-    return due
+    return [r for r in reminders if "error" not in r]
 
 
 def _fetch_brain_summary(state: ServerState) -> dict:
@@ -1,5 +1,10 @@
 # skills/pattern_detector.py
-"""Detects repeated tool usage patterns and suggests new agent configurations."""
+"""Detects repeated tool usage patterns and suggests new agent configurations.
+
+Clusters are maintained incrementally in memory.db (memory/skill_clusters.py):
+each analysis folds in only the skill_usage rows used since the last one.
+``_cluster_patterns`` is the equivalent from-scratch clustering.
+"""
 
 from memory.store import MemoryStore
 
@@ -18,7 +23,8 @@ def _jaccard_similarity(a: str, b: str) -> float:
 def _cluster_patterns(rows: list[dict], similarity_threshold: float = 0.4) -> list[dict]:
     """Group similar query patterns by tool_name and keyword overlap.
 
-    Returns a list of cluster dicts:
+    Each pattern joins the first cluster of its tool whose representative
+    (first pattern) is similar enough, or starts a new cluster. Returns a list of cluster dicts:
       {tool_name, patterns: [str], total_count, representative}
     """
     clusters: list[dict] = []
@@ -46,9 +52,16 @@ def _cluster_patterns(rows: list[dict], similarity_threshold: float = 0.4) -> li
 
 
 class PatternDetector:
-    def __init__(self, memory_store: MemoryStore, auto_create_threshold: float = 0.9):
+    def __init__(
+        self,
+        memory_store: MemoryStore,
+        auto_create_threshold: float = 0.9,
+        similarity_threshold: float = 0.4,
+    ):
         self.memory_store = memory_store
         self.auto_create_threshold = auto_create_threshold
+        self.similarity_threshold = similarity_threshold
+        self.last_update_stats: dict = {}
 
     def detect_patterns(
         self,
@@ -60,17 +73,16 @@ class PatternDetector:
         Returns list of dicts:
           {description, tool_name, patterns, total_count, confidence}
         """
-        rows = self.memory_store.get_skill_usage_patterns()
-        if not rows:
+        self.last_update_stats = self.memory_store.update_skill_clusters(self.similarity_threshold)
+        clusters = self.memory_store.list_skill_clusters(min_count=min_occurrences)
+        if not clusters:
             return []
 
-        clusters = _cluster_patterns(rows)
         results = []
-        # Compute max count for relative confidence scoring
-        max_count = max((c["total_count"] for c in clusters), default=1)
+        # Clusters come largest first, so the first holds the max count for
+        # relative confidence scoring.
+        max_count = clusters[0]["total_count"]
         for cluster in clusters:
-            if cluster["total_count"] < min_occurrences:
-                continue
             confidence = min(cluster["total_count"] / max(max_count, 1), 1.0)
             if confidence < confidence_threshold:
                 continue
@@ -1,9 +1,11 @@
 """Tests for ABNavigator — agent-browser-based Teams navigator."""
 
+import random
+
 import pytest
-from unittest.mock import AsyncMock, call
+from unittest.mock import AsyncMock
 
-from browser.ab_navigator import ABNavigator, SHORTCUT_NEW_MESSAGE, SHORTCUT_SEARCH
+from browser.ab_navigator import ABNavigator, SHORTCUT_NEW_MESSAGE, SHORTCUT_SEARCH, SnapshotIndex
 from browser.agent_browser import AgentBrowserError
 
 
@@ -151,6 +153,7 @@ class TestSearchAndNavigate:
         ab.press.assert_any_call(SHORTCUT_SEARCH)
         ab.fill.assert_called_once()
         ab.click.assert_called_once_with("@e20")
+        ab.fill.assert_called_once_with("@e2", "Jonas De Oliveira")
 
     @pytest.mark.asyncio
     async def test_returns_error_when_no_results(self, nav, ab):
@@ -369,3 +372,88 @@ class TestFindRefInSnapshot:
 
         ref = await nav._find_ref_in_snapshot("textbox", "to:")
         assert ref is None
+
+
+_TEAMS_SNAPSHOT = (
+    '    - heading "Chat" [ref=e1] [level=1]\n'
+    '    - combobox "Search (Cmd+E)" [ref=e2]\n'
+    '    - textbox "To: Enter name, email" [ref=e3]\n'
+    '    - option "Person Michael Larsen, VP" [ref=e4]\n'
+    '    - textbox "Type a message" [ref=e5]\n'
+    '    - button "Send (Enter)" [ref=e6]'
+)
+
+
+class TestSnapshotIndex:
+    def test_find_matches_linear_scan(self):
+        rng = random.Random(3)
+        words = ["textbox", "button", "option", "to:", "send", "message", "chat", "search", "enter name", "(cmd+e)"]
+        lines = [
+            f'    - {rng.choice(words)} "{" ".join(rng.sample(words, 3))}" [ref=e{i}]' for i in range(200)
+        ]
+        index = SnapshotIndex("\n".join(lines))
+        pairs = ABNavigator._extract_refs_with_text("\n".join(lines))
+        for _ in range(300):
+            keywords = rng.sample(words, rng.randint(1, 3))
+            expected = next(
+                (ref for ref, desc in pairs if all(kw.lower() in desc.lower() for kw in keywords)), None,
+            )
+            assert index.find(*keywords) == expected
+
+    def test_lookups_are_memoized(self):
+        index = SnapshotIndex(_TEAMS_SNAPSHOT)
+        assert index.find("textbox", "to:") == "@e3"
+        assert index._found[("textbox", "to:")] == "@e3"
+        assert index.find("textbox", "nothing") is None
+        assert ("textbox", "nothing") in index._found
+
+    def test_unchanged_lines_are_not_reparsed(self):
+        old = SnapshotIndex(_TEAMS_SNAPSHOT)
+        line = _TEAMS_SNAPSHOT.strip().split("\n")[0]
+        new = SnapshotIndex(line + '\n    - option "Person Heather Allen, Dir" [ref=e10]', old)
+        assert new._parsed[line] is old._parsed[line]
+        assert new.pairs[-1] == ("@e10", '- option "Person Heather Allen, Dir" [ref=e10]')
+
+
+class TestSnapshotCache:
+    @pytest.mark.asyncio
+    async def test_back_to_back_lookups_share_one_snapshot(self, nav, ab):
+        ab.snapshot = AsyncMock(return_value={"ok": True, "text": _TEAMS_SNAPSHOT})
+
+        assert await nav.find_compose_box() == "@e5"
+        assert await nav._find_ref_in_snapshot("button", "send") == "@e6"
+        assert ab.snapshot.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_actions_invalidate_the_snapshot(self, nav, ab):
+        ab.snapshot = AsyncMock(return_value={"ok": True, "text": _TEAMS_SNAPSHOT})
+
+        await nav._find_ref_in_snapshot("combobox")
+        await nav._act(ab.press, "Escape")
+        await nav._find_ref_in_snapshot("combobox")
+        assert ab.snapshot.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_snapshot_expires(self, nav, ab, monkeypatch):
+        ab.snapshot = AsyncMock(return_value={"ok": True, "text": _TEAMS_SNAPSHOT})
+        monkeypatch.setattr("browser.ab_navigator.SNAPSHOT_MAX_AGE_SECONDS", 0)
+
+        await nav._find_ref_in_snapshot("combobox")
+        await nav._find_ref_in_snapshot("combobox")
+        assert ab.snapshot.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_hit_rate_over_a_lookup_flow(self, nav, ab):
+        ab.snapshot = AsyncMock(return_value={"ok": True, "text": _TEAMS_SNAPSHOT})
+
+        # Locate the recipient box, compose box and send button, then re-check
+        # the compose box and send button after a page-changing action.
+        await nav._find_ref_in_snapshot("textbox", "to:")
+        await nav.find_compose_box()
+        await nav._find_ref_in_snapshot("button", "send")
+        await nav._act(ab.press, "Escape")
+        await nav.find_compose_box()
+        await nav._find_ref_in_snapshot("button", "send")
+
+        assert (nav.snapshot_hits, nav.snapshot_misses) == (3, 2)
+        assert nav.snapshot_hit_rate == 0.6
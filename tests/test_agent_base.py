@@ -781,6 +781,7 @@ EXPECTED_DISPATCH_TOOLS = {
     "get_mail_messages", "get_mail_message", "search_mail",
     "get_unread_count", "send_email",
     "mark_mail_read", "mark_mail_flagged", "move_mail_message",
+    "mark_mail_read_bulk", "mark_mail_flagged_bulk", "move_mail_messages_bulk",
     "web_open", "web_snapshot", "web_click", "web_fill",
     "web_get_text", "web_screenshot", "web_execute_js",
     "web_scroll", "web_find", "web_state_save", "web_state_load",
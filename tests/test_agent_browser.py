@@ -320,3 +320,25 @@ class TestAgentBrowserMethods:
         args = mock_exec.call_args[0]
         assert "press" in args
         assert "Enter" in args
+
+
+@pytest.mark.asyncio
+class TestAgentBrowserBatch:
+    async def test_batch_runs_sequentially(self):
+        proc = _make_process(stdout=b'{"ok": true}')
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)) as mock_exec:
+            browser = AgentBrowser()
+            assert await browser.batch([("press", "Tab"), ("snapshot",)]) == [{"ok": True}, {"ok": True}]
+        assert [c.args[1:] for c in mock_exec.call_args_list] == [("press", "Tab"), ("snapshot",)]
+
+    async def test_page_changing_commands_bump_generation(self):
+        proc = _make_process(stdout=b'{"ok": true}')
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
+            browser = AgentBrowser()
+            await browser.snapshot()
+            await browser.get_text("@e1")
+            assert browser.generation == 0
+            await browser.press("Enter")
+            assert browser.generation == 1
+            await browser.batch([("snapshot",), ("fill", "@e2", "hi")])
+            assert browser.generation == 2
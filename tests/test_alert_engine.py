@@ -0,0 +1,134 @@
+"""Tests for memory/alert_engine.py — single-pass alert evaluation."""
+import json
+import random
+from datetime import date, datetime, timedelta
+
+from memory.models import AlertRule, Delegation, Fact
+from tools.lifecycle import check_alerts
+
+
+def _rule(store, name, alert_type, **condition):
+    return store.store_alert_rule(AlertRule(name=name, alert_type=alert_type, condition=json.dumps(condition)))
+
+
+def _decision(store, title, days_ago, status="pending_execution"):
+    created = (datetime.now() - timedelta(days=days_ago)).isoformat()
+    store.conn.execute(
+        "INSERT INTO decisions (title, status, created_at, updated_at) VALUES (?, ?, ?, ?)",
+        (title, status, created, created),
+    )
+    store.conn.commit()
+
+
+def _delegation(store, task, due_in_days, status="active"):
+    due = (date.today() + timedelta(days=due_in_days)).isoformat() if due_in_days is not None else None
+    return store.store_delegation(Delegation(task=task, delegated_to="alice", due_date=due, status=status))
+
+
+def _captured_selects(store, call):
+    statements = []
+    reader = store.reader()
+    reader.set_trace_callback(statements.append)
+    try:
+        result = call()
+    finally:
+        reader.set_trace_callback(None)
+    return result, [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+
+def _reference_builtin(store):
+    """The Python filtering check_alerts did before the engine."""
+    today = date.today()
+    cutoff = (today - timedelta(days=7)).isoformat()
+    soon = (today + timedelta(days=3)).isoformat()
+    return {
+        "overdue_delegations": sorted(d.id for d in store.list_overdue_delegations()),
+        "stale_decisions": sorted(
+            d.id for d in store.list_decisions_by_status("pending_execution")
+            if d.created_at and d.created_at[:10] < cutoff
+        ),
+        "upcoming_deadlines": sorted(
+            d.id for d in store.list_delegations(status="active")
+            if d.due_date and today.isoformat() <= d.due_date <= soon
+        ),
+    }
+
+
+class TestAlertEngine:
+    def test_builtin_alerts_match_python_filtering(self, memory_store):
+        rng = random.Random(3)
+        for i in range(60):
+            _delegation(memory_store, f"task {i}", rng.choice([None, *range(-10, 10)]),
+                        status=rng.choice(["active", "active", "completed"]))
+            _decision(memory_store, f"decision {i}", rng.randint(0, 14),
+                      status=rng.choice(["pending_execution", "executed"]))
+
+        alerts = memory_store.evaluate_alerts([])["alerts"]
+        assert {k: sorted(a["id"] for a in v) for k, v in alerts.items()} == _reference_builtin(memory_store)
+
+    def test_all_checks_run_in_one_statement(self, memory_store):
+        _delegation(memory_store, "late", -5)
+        _decision(memory_store, "old", 10)
+        memory_store.store_fact(Fact(category="work", key="backup_last_success", value="2020-01-01: ok"))
+        rules = [
+            _rule(memory_store, "overdue-3", "overdue_delegation", days_overdue=3),
+            _rule(memory_store, "stale-5", "stale_decision", days_stale=5),
+            _rule(memory_store, "soon", "upcoming_deadline", within_days=2),
+            _rule(memory_store, "backup", "stale_backup", max_age_hours=24),
+        ]
+
+        snapshot, selects = _captured_selects(memory_store, lambda: memory_store.evaluate_alerts(rules))
+
+        assert len(selects) == 1
+        assert [r["count"] for r in snapshot["rule_results"]] == [1, 1, 0, 1]
+        assert snapshot["rule_results"][0]["matches"][0]["days_overdue"] == 5
+
+    def test_identical_checks_are_shared(self, memory_store):
+        _delegation(memory_store, "late", -2)
+        rules = [
+            _rule(memory_store, "a", "overdue_delegation", days_overdue=1),  # same as the built-in
+            _rule(memory_store, "b", "overdue_delegation", days_overdue=1),
+            _rule(memory_store, "c", "pending_decision", days_stale=7),  # same as the built-in
+            _rule(memory_store, "d", "stale_decision", days_stale=7),
+        ]
+        snapshot, (sql,) = _captured_selects(memory_store, lambda: memory_store.evaluate_alerts(rules))
+        # Three built-in checks; every rule reuses one of them.
+        assert sql.count("CASE WHEN") == 3
+        assert [r["count"] for r in snapshot["rule_results"]] == [1, 1, 0, 0]
+
+    def test_duplicate_rules_reported_once(self, memory_store):
+        rule = _rule(memory_store, "dup", "overdue_delegation")
+        results = memory_store.evaluate_alerts([rule, rule], include_builtin=False)["rule_results"]
+        assert len(results) == 1
+
+    def test_overdue_threshold_and_unparseable_dates(self, memory_store):
+        _delegation(memory_store, "two days", -2)
+        _delegation(memory_store, "today", 0)
+        memory_store.store_delegation(Delegation(task="bad", delegated_to="bob", due_date="2000-01-01T09:00"))
+        rules = [
+            _rule(memory_store, "zero", "overdue_delegation", days_overdue=0),
+            _rule(memory_store, "two", "overdue_delegation", days_overdue=2),
+            _rule(memory_store, "three", "overdue_delegation", days_overdue=3),
+        ]
+        results = memory_store.evaluate_alerts(rules, include_builtin=False)["rule_results"]
+        assert [[m["task"] for m in r["matches"]] for r in results] == [["two days"], ["two days"], []]
+
+    def test_invalid_condition_reported_per_rule(self, memory_store):
+        _delegation(memory_store, "late", -5)
+        memory_store.store_alert_rule(AlertRule(
+            name="bad", alert_type="overdue_delegation", condition='{"days_overdue": "x"}',
+        ))
+        _rule(memory_store, "good", "overdue_delegation", days_overdue=1)
+
+        result = check_alerts(memory_store)
+
+        assert [r["name"] for r in result["rule_alerts"]] == ["good"]
+        assert [e["name"] for e in result["rule_errors"]] == ["bad"]
+
+    def test_query_uses_status_indexes(self, memory_store):
+        _delegation(memory_store, "late", -5)
+        _decision(memory_store, "old", 10)
+        _, (sql,) = _captured_selects(memory_store, lambda: memory_store.evaluate_alerts([]))
+        plan = " | ".join(row[3] for row in memory_store.conn.execute(f"EXPLAIN QUERY PLAN {sql}"))
+        assert "idx_delegations_status_due" in plan
+        assert "idx_decisions_status" in plan
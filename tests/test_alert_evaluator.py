@@ -1,4 +1,4 @@
-"""Tests for scheduler/alert_evaluator.py."""
+"""Tests for scheduler/alert_evaluator.py and the rule checks it runs (memory/alert_engine.py)."""
 
 from __future__ import annotations
 
@@ -9,6 +9,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from memory.alert_engine import parse_rule_condition
 from memory.models import AlertRule, Decision, Delegation, Fact
 from memory.store import MemoryStore
 
@@ -20,20 +21,21 @@ def log_path(tmp_path):
     return tmp_path / "alert-eval.log"
 
 
+def _evaluate_rule(memory_store, rule) -> dict:
+    (result,) = memory_store.evaluate_alerts([rule], include_builtin=False)["rule_results"]
+    return result
+
+
 def test_parse_rule_condition():
     """Test JSON condition parsing."""
-    from scheduler.alert_evaluator import _parse_rule_condition
-
-    assert _parse_rule_condition("") == {}
-    assert _parse_rule_condition('{"days_overdue": 3}') == {"days_overdue": 3}
-    assert _parse_rule_condition("invalid json") == {}
-    assert _parse_rule_condition('["not", "a", "dict"]') == {}
+    assert parse_rule_condition("") == {}
+    assert parse_rule_condition('{"days_overdue": 3}') == {"days_overdue": 3}
+    assert parse_rule_condition("invalid json") == {}
+    assert parse_rule_condition('["not", "a", "dict"]') == {}
 
 
 def test_evaluate_overdue_delegation_rule(memory_store):
     """Test evaluation of overdue_delegation alert rule."""
-    from scheduler.alert_evaluator import _evaluate_rule
-
     # Create overdue delegation
     overdue_date = (date.today() - timedelta(days=5)).isoformat()
     delegation = Delegation(
@@ -65,8 +67,6 @@ def test_evaluate_overdue_delegation_rule(memory_store):
 
 def test_evaluate_stale_decision_rule(memory_store):
     """Test evaluation of stale_decision alert rule."""
-    from scheduler.alert_evaluator import _evaluate_rule
-
     # Create old pending decision
     old_date = (date.today() - timedelta(days=10)).isoformat()
 
@@ -96,8 +96,6 @@ def test_evaluate_stale_decision_rule(memory_store):
 
 def test_evaluate_upcoming_deadline_rule(memory_store):
     """Test evaluation of upcoming_deadline alert rule."""
-    from scheduler.alert_evaluator import _evaluate_rule
-
     # Create delegation with upcoming deadline
     upcoming_date = (date.today() + timedelta(days=2)).isoformat()
     delegation = Delegation(
@@ -126,8 +124,6 @@ def test_evaluate_upcoming_deadline_rule(memory_store):
 
 def test_evaluate_stale_backup_rule_triggers(memory_store):
     """Test stale_backup alert fires when backup is older than threshold."""
-    from scheduler.alert_evaluator import _evaluate_rule
-
     # Store a backup success fact from 3 days ago
     old_date = (date.today() - timedelta(days=3)).isoformat()
     memory_store.store_fact(Fact(
@@ -152,8 +148,6 @@ def test_evaluate_stale_backup_rule_triggers(memory_store):
 
 def test_evaluate_stale_backup_rule_passes(memory_store):
     """Test stale_backup alert does NOT fire when backup is recent."""
-    from scheduler.alert_evaluator import _evaluate_rule
-
     today = date.today().isoformat()
     memory_store.store_fact(Fact(
         category="work", key="backup_last_success",
@@ -176,8 +170,6 @@ def test_evaluate_stale_backup_rule_passes(memory_store):
 
 def test_evaluate_stale_backup_rule_no_fact(memory_store):
     """Test stale_backup alert fires when no backup fact exists at all."""
-    from scheduler.alert_evaluator import _evaluate_rule
-
     rule = AlertRule(
         name="stale_backup_check",
         alert_type="stale_backup",
@@ -194,8 +186,6 @@ def test_evaluate_stale_backup_rule_no_fact(memory_store):
 
 def test_evaluate_unknown_alert_type(memory_store):
     """Test evaluation handles unknown alert types gracefully."""
-    from scheduler.alert_evaluator import _evaluate_rule
-
     rule = AlertRule(
         name="unknown_type",
         alert_type="unknown_type",
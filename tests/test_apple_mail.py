@@ -372,6 +372,94 @@ class TestMoveMessage:
             assert 'account "Work"' in call_args
 
 
+# ---------------------------------------------------------------------------
+# Tests: bulk mark/move
+# ---------------------------------------------------------------------------
+
+
+def _bulk_output(*statuses):
+    return "".join(f"{mid}|||{status}\n~~~RECORD~~~\n" for mid, status in statuses)
+
+
+class TestBulkUpdates:
+    def test_mark_read_bulk_single_script_with_per_item_status(self):
+        store = MailStore()
+        output = _bulk_output(("m1", "OK"), ("m2", "ERROR: Message not found"), ("m3", "OK"))
+        with patch("apple_mail.mail._run_applescript", return_value={"output": output}) as mock_run:
+            result = store.mark_read_bulk(["m1", "m2", "m3", "m1"], read=False)
+        mock_run.assert_called_once()
+        script = mock_run.call_args[0][0]
+        assert '{"m1", "m2", "m3"}' in script
+        assert "set read status of foundMsg to false" in script
+        assert result["status"] == "partial"
+        assert (result["succeeded"], result["failed"], result["read"]) == (2, 1, False)
+        assert result["results"][1] == {"message_id": "m2", "error": "ERROR: Message not found"}
+
+    def test_mark_flagged_bulk_escapes_ids(self):
+        store = MailStore()
+        with patch("apple_mail.mail._run_applescript", return_value={"output": _bulk_output(('a"b', "OK"))}) as mock_run:
+            result = store.mark_flagged_bulk(['a"b'])
+        assert '{"a\\"b"}' in mock_run.call_args[0][0]
+        assert result["status"] == "ok" and result["flagged"] is True
+
+    def test_move_messages_bulk_resolves_target_once(self):
+        store = MailStore()
+        output = _bulk_output(("m1", "OK"), ("m2", "OK"))
+        with patch("apple_mail.mail._run_applescript", return_value={"output": output}) as mock_run:
+            result = store.move_messages_bulk(["m1", "m2"], "Archive", target_account="Work")
+        script = mock_run.call_args[0][0]
+        assert script.count('set targetMb to mailbox "Archive" of account "Work"') == 1
+        assert "move foundMsg to targetMb" in script
+        assert result["moved_to"] == "Archive" and result["succeeded"] == 2
+
+    def test_large_batches_are_split(self):
+        store = MailStore()
+        ids = [f"m{i}" for i in range(150)]
+
+        def fake_run(script, timeout):
+            batch = [mid for mid in ids if f'"{mid}"' in script]
+            return {"output": _bulk_output(*((mid, "OK") for mid in batch))}
+
+        with patch("apple_mail.mail._run_applescript", side_effect=fake_run) as mock_run:
+            result = store.mark_read_bulk(ids)
+        assert mock_run.call_count == 2
+        assert mock_run.call_args_list[0].kwargs["timeout"] > mock_run.call_args_list[1].kwargs["timeout"]
+        assert result["succeeded"] == 150
+
+    def test_ids_resolved_per_mailbox(self):
+        store = MailStore()
+        with patch("apple_mail.mail._run_applescript", return_value={"output": _bulk_output(("m1", "OK"))}) as mock_run:
+            store.mark_read_bulk(["m1"])
+        script = mock_run.call_args[0][0]
+        assert "set mbIds to message id of messages of mb" in script
+        assert "if mbIds contains targetId then" in script
+
+    def test_failed_batch_marks_only_its_ids(self):
+        store = MailStore()
+        ids = [f"m{i}" for i in range(150)]
+        responses = iter([
+            {"error": "Mail not responding"},
+            {"output": _bulk_output(*((mid, "OK") for mid in ids[100:]))},
+        ])
+
+        with patch("apple_mail.mail._run_applescript", side_effect=lambda *a, **kw: next(responses)):
+            result = store.mark_read_bulk(ids)
+        assert result["status"] == "partial"
+        assert (result["succeeded"], result["failed"]) == (50, 100)
+        assert result["results"][0] == {"message_id": "m0", "error": "ERROR: Mail not responding"}
+
+    def test_script_error_returns_error(self):
+        store = MailStore()
+        with patch("apple_mail.mail._run_applescript", return_value={"error": "Mail not running"}):
+            assert store.mark_read_bulk(["m1"]) == {"error": "Mail not running"}
+
+    def test_empty_ids_rejected_without_script(self):
+        store = MailStore()
+        with patch("apple_mail.mail._run_applescript") as mock_run:
+            assert "error" in store.move_messages_bulk([" ", ""], "Archive")
+        mock_run.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # Tests: MailStore.send_message
 # ---------------------------------------------------------------------------
@@ -604,3 +604,81 @@ def test_verify_handle_returns_display_name(tmp_path: Path, monkeypatch):
     result = store.verify_handle("+17035551234")
     assert result["found_in_threads"] is True
     assert "Ross Young" in result["display_names"]
+
+
+def _profile_store(tmp_path: Path) -> MessageStore:
+    return MessageStore(
+        db_path=tmp_path / "chat.db",
+        communicate_script=Path("/tmp/missing"),
+        profile_db_path=tmp_path / "thread-profiles.db",
+    )
+
+
+def test_record_observations_aggregates_in_one_transaction(tmp_path: Path, monkeypatch):
+    store = _profile_store(tmp_path)
+    statements: list[str] = []
+    store._profile_conn().set_trace_callback(statements.append)
+    monkeypatch.setattr(store, "_open_profile_db", lambda: pytest.fail("opened a new profile connection"))
+
+    rows = [
+        {"chat_identifier": "chat-a", "sender": "", "date_local": "2026-01-03 09:00:00"},
+        {"chat_identifier": "chat-a", "sender": "+1111", "date_local": "2026-01-02 09:00:00"},
+        {"chat_identifier": "chat-a", "sender": "+2222", "date_local": "2026-01-01 09:00:00"},
+        {"chat_identifier": "chat-a", "sender": "+1111", "date_local": "2026-01-01 08:00:00"},
+        {"chat_identifier": "chat-b", "sender": "+3333", "date_local": "2026-01-01 07:00:00"},
+        {"chat_identifier": "", "sender": "+9999", "date_local": "2026-01-01 07:00:00"},
+    ] * 40
+    store._record_observations(rows)
+
+    assert sum(1 for s in statements if s.lstrip().startswith("INSERT")) == 5
+    assert sum(1 for s in statements if s == "COMMIT") == 1
+
+    profiles = store._load_profiles(["chat-a", "chat-b", "chat-missing"])
+    assert set(profiles) == {"chat-a", "chat-b"}
+    assert profiles["chat-a"]["last_seen_at"] == "2026-01-03 09:00:00"
+    assert profiles["chat-a"]["last_sender"] == ""
+    assert profiles["chat-a"]["preferred_handle"] == "+1111"
+    assert sorted(profiles["chat-a"]["members"]) == ["+1111", "+2222"]
+    member = store._profile_conn().execute(
+        "SELECT last_seen_at FROM thread_members WHERE chat_identifier = 'chat-a' AND handle = '+1111'"
+    ).fetchone()
+    assert member["last_seen_at"] == "2026-01-02 09:00:00"
+
+
+def test_record_observations_keeps_newer_stored_values(tmp_path: Path):
+    store = _profile_store(tmp_path)
+    store._record_observations([{"chat_identifier": "chat-a", "sender": "+1111", "date_local": "2026-02-01 00:00:00"}])
+    store._record_observations([{"chat_identifier": "chat-a", "sender": "+2222", "date_local": "2026-01-01 00:00:00"}])
+
+    profile = store._load_profiles(["chat-a"])["chat-a"]
+    assert profile["last_sender"] == "+1111"
+    assert profile["preferred_handle"] == "+1111"
+    assert sorted(profile["members"]) == ["+1111", "+2222"]
+
+
+def test_load_profiles_cache_invalidation(tmp_path: Path):
+    store = _profile_store(tmp_path)
+    store._record_observations([{"chat_identifier": "chat-a", "sender": "+1111", "date_local": "2026-01-01 00:00:00"}])
+    statements: list[str] = []
+    store._profile_conn().set_trace_callback(statements.append)
+
+    def selects() -> int:
+        return sum(1 for s in statements if "FROM thread_profiles" in s)
+
+    first = store._load_profiles(["chat-a", "chat-none"])
+    first["chat-a"]["members"].append("mutated")
+    assert store._load_profiles(["chat-a", "chat-none"])["chat-a"]["members"] == ["+1111"]
+    assert selects() == 1
+
+    # Our own write invalidates the touched thread.
+    store._record_observations([{"chat_identifier": "chat-a", "sender": "+2222", "date_local": "2026-01-02 00:00:00"}])
+    assert store._load_profiles(["chat-a"])["chat-a"]["last_sender"] == "+2222"
+    assert selects() == 2
+
+    # A write through another connection is picked up via data_version.
+    with store._open_profile_db() as conn:
+        conn.execute("UPDATE thread_profiles SET display_name = 'Team' WHERE chat_identifier = 'chat-a'")
+        conn.commit()
+    assert store._load_profiles(["chat-a"])["chat-a"]["display_name"] == "Team"
+    assert selects() == 3
+    store.close()
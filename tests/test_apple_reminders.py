@@ -5,7 +5,7 @@ Since EventKit is macOS-only via PyObjC, all tests mock the EventKit framework
 objects and the module-level _EVENTKIT_AVAILABLE flag.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -505,3 +505,185 @@ class TestPermissionDenied:
             assert len(result) == 1
             assert "error" in result[0]
             assert "Reminders access denied" in result[0]["error"]
+
+
+# ---------------------------------------------------------------------------
+# Tests: reminder index
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def ns_calendar():
+    """NSCalendar stand-in whose dateFromComponents_ returns the components as-is."""
+    with patch("apple_reminders.eventkit.NSCalendar", create=True) as mock_ns_cal:
+        mock_ns_cal.currentCalendar.return_value.dateFromComponents_.side_effect = lambda components: components
+        yield mock_ns_cal
+
+
+def _due_reminder(uid, title, due, list_name="Reminders", completed=False):
+    """Mock EKReminder due at *due* (a datetime)."""
+    rem = _make_mock_reminder(uid=uid, title=title, list_name=list_name, completed=completed)
+    rem.dueDateComponents.return_value = MagicMock()
+    rem.dueDateComponents.return_value.timeIntervalSince1970.return_value = due.timestamp()
+    return rem
+
+
+def _entry(uid, due=None, list_name="Inbox", completed=False):
+    return {"id": uid, "title": uid, "due_date": due, "list_name": list_name, "completed": completed}, object()
+
+
+class TestReminderIndex:
+    def test_lookups_by_id_list_and_due_date(self):
+        from apple_reminders.index import ReminderIndex
+
+        index = ReminderIndex()
+        index.replace([
+            _entry("a", "2026-03-02T09:00:00"),
+            _entry("b", "2026-03-01T09:00:00", list_name="Work"),
+            _entry("c"),
+            _entry("d", "2026-03-01T10:00:00", completed=True),
+        ])
+
+        assert index.get("b")["list_name"] == "Work"
+        assert index.get("missing") is None
+        assert [r["id"] for r in index.reminders(list_name="Inbox")] == ["a", "c", "d"]
+        assert [r["id"] for r in index.reminders(completed=False)] == ["a", "b", "c"]
+        assert [r["id"] for r in index.due_before("2026-03-01T23:59:59")] == ["b"]
+        assert [r["id"] for r in index.due_before("2026-03-02T09:00:00", completed=None)] == ["b", "d", "a"]
+
+    def test_upsert_and_remove_keep_due_order(self):
+        from apple_reminders.index import ReminderIndex
+
+        index = ReminderIndex()
+        index.replace([_entry("a", "2026-03-02T09:00:00"), _entry("b", "2026-03-03T09:00:00")])
+        index.upsert({**_entry("b", "2026-03-01T09:00:00", list_name="Work")[0]})
+        index.upsert({**_entry("e", "2026-03-04T09:00:00")[0]})
+        index.remove("a")
+
+        assert [r["id"] for r in index.due_before("2026-12-31")] == ["b", "e"]
+        assert [r["id"] for r in index.reminders(list_name="Work")] == ["b"]
+        assert [r["id"] for r in index.reminders(list_name="Inbox")] == ["e"]
+
+    def test_reads_return_copies(self):
+        from apple_reminders.index import ReminderIndex
+
+        index = ReminderIndex()
+        index.replace([_entry("a")])
+        index.get("a")["title"] = "changed"
+        index.reminders()[0]["title"] = "changed"
+        assert index.get("a")["title"] == "a"
+
+    def test_ttl_and_invalidation(self):
+        from apple_reminders.index import ReminderIndex
+
+        now = [100.0]
+        index = ReminderIndex(ttl_seconds=30, clock=lambda: now[0])
+        assert not index.fresh()
+        index.replace([])
+        assert index.fresh()
+        now[0] += 30
+        assert not index.fresh()
+
+        index.replace([])
+        index.invalidate()
+        assert not index.fresh()
+
+    def test_rebuild_started_before_invalidation_stays_stale(self):
+        from apple_reminders.index import ReminderIndex
+
+        index = ReminderIndex()
+        generation = index.generation
+        index.invalidate()  # a change notification lands mid-fetch
+        index.replace([_entry("a")], generation)
+        assert not index.fresh()
+        assert index.get("a") is not None
+
+
+class TestReminderStoreIndex:
+    def test_reads_share_one_fetch(self, reminder_store, ns_calendar):
+        rem = _make_mock_reminder(uid="R1", title="Buy milk")
+        reminder_store._fetch_reminders = MagicMock(return_value=[rem])
+
+        assert [r["id"] for r in reminder_store.list_reminders()] == ["R1"]
+        assert [r["id"] for r in reminder_store.search_reminders("milk")] == ["R1"]
+        assert reminder_store.due_reminders() == []
+        reminder_store._fetch_reminders.assert_called_once()
+
+        reminder_store._index.invalidate()
+        reminder_store.list_reminders()
+        assert reminder_store._fetch_reminders.call_count == 2
+
+    def test_find_by_external_id_uses_index(self, reminder_store, ns_calendar):
+        rem = _make_mock_reminder(uid="EXT-1")
+        reminder_store._store.calendarItemWithIdentifier_.return_value = None
+        reminder_store._fetch_reminders = MagicMock(return_value=[rem])
+
+        assert reminder_store._find_reminder_by_id("EXT-1") is rem
+        assert reminder_store._find_reminder_by_id("EXT-1") is rem
+        assert reminder_store._find_reminder_by_id("MISSING") is None
+        reminder_store._fetch_reminders.assert_called_once()
+        # A fresh index answers without asking EventKit for the local id.
+        assert reminder_store._store.calendarItemWithIdentifier_.call_count == 2
+
+    def test_due_reminders_defaults_to_end_of_today(self, reminder_store, ns_calendar):
+        now = datetime.now()
+        overdue = _due_reminder("OLD", "Overdue", now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=2))
+        today = _due_reminder("TODAY", "Today", now.replace(hour=23, minute=0, second=0, microsecond=0))
+        tomorrow = _due_reminder("NEXT", "Tomorrow", now + timedelta(days=1, hours=1))
+        done = _due_reminder("DONE", "Done", now - timedelta(days=1), completed=True)
+        reminder_store._fetch_reminders = MagicMock(return_value=[tomorrow, today, done, overdue])
+
+        assert [r["id"] for r in reminder_store.due_reminders()] == ["OLD", "TODAY"]
+        assert [r["id"] for r in reminder_store.due_reminders(include_completed=True)] == ["OLD", "DONE", "TODAY"]
+        assert [r["id"] for r in reminder_store.due_reminders(before=now + timedelta(days=3))] == [
+            "OLD", "TODAY", "NEXT",
+        ]
+
+    def test_writes_update_index_in_place(self, reminder_store, ns_calendar):
+        kept = _make_mock_reminder(uid="KEEP", title="Keep")
+        gone = _make_mock_reminder(uid="GONE", title="Gone")
+        reminder_store._fetch_reminders = MagicMock(return_value=[kept, gone])
+        reminder_store._store.saveReminder_commit_error_.return_value = (True, None)
+        reminder_store._store.removeReminder_commit_error_.return_value = (True, None)
+        reminder_store.list_reminders()
+
+        reminder_store._find_reminder_by_id = MagicMock(return_value=gone)
+        reminder_store.delete_reminder("GONE")
+        kept.isCompleted.return_value = True
+        reminder_store._find_reminder_by_id = MagicMock(return_value=kept)
+        reminder_store.complete_reminder("KEEP")
+
+        assert reminder_store.list_reminders(completed=True) == [reminder_store._index.get("KEEP")]
+        assert reminder_store.search_reminders("gone", include_completed=True) == []
+        reminder_store._fetch_reminders.assert_called_once()
+
+    def test_fetch_timeout_is_an_error(self, reminder_store):
+        with patch("apple_reminders.eventkit._FETCH_TIMEOUT_SECONDS", 0.01):
+            result = reminder_store.list_reminders()
+        assert "timed out" in result[0]["error"]
+        assert not reminder_store._index.fresh()
+
+
+class TestAsyncFetch:
+    @pytest.mark.asyncio
+    async def test_awaits_completion_handler_from_another_thread(self, reminder_store, ns_calendar):
+        import threading
+
+        rem = _make_mock_reminder(uid="A1")
+
+        def fetch(predicate, handler):
+            threading.Timer(0.01, handler, args=([rem],)).start()
+
+        reminder_store._store.fetchRemindersMatchingPredicate_completion_.side_effect = fetch
+
+        assert await reminder_store._fetch_reminders_async("pred") == [rem]
+        assert await reminder_store.refresh_index_async() == {"indexed": 1}
+        assert reminder_store._index.fresh()
+        assert reminder_store._index.get("A1")["id"] == "A1"
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises(self, reminder_store):
+        with patch("apple_reminders.eventkit._FETCH_TIMEOUT_SECONDS", 0.01):
+            with pytest.raises(RuntimeError, match="timed out"):
+                await reminder_store._fetch_reminders_async("pred")
+            assert "timed out" in (await reminder_store.refresh_index_async())["error"]
@@ -237,40 +237,25 @@ class TestFetchPendingDecisions:
 
 
 class TestFetchDueReminders:
-    def test_filters_to_today_or_overdue(self):
-        """Only reminders due today or earlier are included."""
+    def test_reads_due_index(self):
+        """Delegates the today-or-overdue query to the store's due-date index."""
         state = _make_state()
-
-        today = datetime.now().date().isoformat()
-        yesterday = (datetime.now().date() - timedelta(days=1)).isoformat()
-        tomorrow = (datetime.now().date() + timedelta(days=1)).isoformat()
-
-        state.reminder_store.list_reminders.return_value = [
-            {"name": "Today task", "due_date": today},
-            {"name": "Overdue task", "due_date": yesterday},
-            {"name": "Future task", "due_date": tomorrow},
-            {"name": "No due date"},
+        state.reminder_store.due_reminders.return_value = [
+            {"name": "Overdue task", "due_date": "2026-01-01T09:00:00"},
+            {"name": "Today task", "due_date": datetime.now().date().isoformat()},
         ]
 
         result = _fetch_due_reminders(state)
 
-        names = [r["name"] for r in result]
-        assert "Today task" in names
-        assert "Overdue task" in names
-        assert "Future task" not in names
-        assert "No due date" not in names
+        assert [r["name"] for r in result] == ["Overdue task", "Today task"]
+        state.reminder_store.due_reminders.assert_called_once_with()
+        state.reminder_store.list_reminders.assert_not_called()
 
-    def test_handles_dueDate_key(self):
-        """Also accepts 'dueDate' key (camelCase variant)."""
+    def test_drops_error_entries(self):
+        """A permission or platform error from the store yields no reminders."""
         state = _make_state()
-        today = datetime.now().date().isoformat()
-        state.reminder_store.list_reminders.return_value = [
-            {"name": "CamelCase task", "dueDate": today},
-        ]
-
-        result = _fetch_due_reminders(state)
-        assert len(result) == 1
-        assert result[0]["name"] == "CamelCase task"
+        state.reminder_store.due_reminders.return_value = [{"error": "Reminders access denied."}]
+        assert _fetch_due_reminders(state) == []
 
     def test_returns_empty_if_store_is_none(self):
         """Returns empty list when reminder_store is None."""
@@ -278,9 +263,9 @@ class TestFetchDueReminders:
         assert _fetch_due_reminders(state) == []
 
     def test_handles_exception(self):
-        """Returns empty list if list_reminders raises."""
+        """Returns empty list if due_reminders raises."""
         state = _make_state()
-        state.reminder_store.list_reminders.side_effect = RuntimeError("EventKit error")
+        state.reminder_store.due_reminders.side_effect = RuntimeError("EventKit error")
         assert _fetch_due_reminders(state) == []
 
 
@@ -345,7 +330,7 @@ class TestLoadSessionContext:
         state.memory_store.list_decisions_by_status.return_value = [dec]
         # Reminders
         today = datetime.now().date().isoformat()
-        state.reminder_store.list_reminders.return_value = [
+        state.reminder_store.due_reminders.return_value = [
             {"name": "Due today", "due_date": today},
         ]
         # Brain
@@ -382,7 +367,7 @@ class TestLoadSessionContext:
         state.mail_store.list_mailboxes.return_value = []
         state.memory_store.list_overdue_delegations.return_value = []
         state.memory_store.list_decisions_by_status.return_value = []
-        state.reminder_store.list_reminders.return_value = []
+        state.reminder_store.due_reminders.return_value = []
         state.session_brain.to_dict.return_value = {}
 
         config = ContextLoaderConfig(per_source_timeout_seconds=1)
@@ -402,7 +387,7 @@ class TestLoadSessionContext:
         state.mail_store.list_mailboxes.return_value = [{"unread_count": 2}]
         state.memory_store.list_overdue_delegations.return_value = []
         state.memory_store.list_decisions_by_status.return_value = []
-        state.reminder_store.list_reminders.return_value = []
+        state.reminder_store.due_reminders.return_value = []
         state.session_brain.to_dict.return_value = {}
 
         ctx = load_session_context(state)
@@ -423,7 +408,7 @@ class TestLoadSessionContext:
         state.mail_store.list_mailboxes.side_effect = RuntimeError("mail fail")
         state.memory_store.list_overdue_delegations.side_effect = RuntimeError("deleg fail")
         state.memory_store.list_decisions_by_status.side_effect = RuntimeError("dec fail")
-        state.reminder_store.list_reminders.side_effect = RuntimeError("rem fail")
+        state.reminder_store.due_reminders.side_effect = RuntimeError("rem fail")
         state.session_brain.to_dict.side_effect = RuntimeError("brain fail")
 
         ctx = load_session_context(state)
@@ -486,7 +471,7 @@ class TestLoadSessionContext:
         state.mail_store.list_mailboxes.return_value = []
         state.memory_store.list_overdue_delegations.return_value = []
         state.memory_store.list_decisions_by_status.return_value = []
-        state.reminder_store.list_reminders.return_value = []
+        state.reminder_store.due_reminders.return_value = []
         state.session_brain.to_dict.return_value = {}
 
         ctx = load_session_context(state, None)
@@ -501,7 +486,7 @@ class TestLoadSessionContext:
         state.mail_store.list_mailboxes.return_value = []
         state.memory_store.list_overdue_delegations.return_value = []
         state.memory_store.list_decisions_by_status.return_value = []
-        state.reminder_store.list_reminders.return_value = []
+        state.reminder_store.due_reminders.return_value = []
         state.session_brain.to_dict.return_value = {}
 
         config = ContextLoaderConfig(ttl_minutes=30)
@@ -76,6 +76,9 @@ def mail_store():
     mock.mark_read.return_value = {"status": "ok"}
     mock.mark_flagged.return_value = {"status": "ok"}
     mock.move_message.return_value = {"status": "moved"}
+    mock.mark_read_bulk.return_value = {"status": "ok", "results": []}
+    mock.mark_flagged_bulk.return_value = {"status": "ok", "results": []}
+    mock.move_messages_bulk.return_value = {"status": "ok", "results": []}
     return mock
 
 
@@ -588,6 +591,20 @@ class TestMailToolsSmoke:
         assert isinstance(result, dict)
         mail_store.move_message.assert_called_once()
 
+    def test_mark_mail_read_bulk(self, agent, mail_store):
+        result = agent._dispatch_tool("mark_mail_read_bulk", {"message_ids": "msg-1, msg-2"})
+        assert isinstance(result, dict)
+        mail_store.mark_read_bulk.assert_called_once_with(message_ids=["msg-1", "msg-2"], read=True)
+
+    def test_move_mail_messages_bulk_accepts_list(self, agent, mail_store):
+        result = agent._dispatch_tool("move_mail_messages_bulk", {
+            "message_ids": ["msg-1", "msg-2"], "target_mailbox": "Archive"
+        })
+        assert isinstance(result, dict)
+        mail_store.move_messages_bulk.assert_called_once_with(
+            message_ids=["msg-1", "msg-2"], target_mailbox="Archive", target_account=""
+        )
+
     def test_mail_none_returns_error(self, full_config, memory_store, document_store):
         """All mail tools return error dict when mail_store is None."""
         no_mail_agent = BaseExpertAgent(
@@ -606,6 +623,9 @@ class TestMailToolsSmoke:
             ("mark_mail_read", {"message_id": "x"}),
             ("mark_mail_flagged", {"message_id": "x"}),
             ("move_mail_message", {"message_id": "x", "target_mailbox": "y"}),
+            ("mark_mail_read_bulk", {"message_ids": "x,y"}),
+            ("mark_mail_flagged_bulk", {"message_ids": "x,y"}),
+            ("move_mail_messages_bulk", {"message_ids": "x,y", "target_mailbox": "y"}),
         ]
         for tool_name, tool_input in cases:
             result = no_mail_agent._dispatch_tool(tool_name, tool_input)
@@ -667,6 +687,9 @@ class TestReturnTypes:
         "mark_mail_read": {"message_id": "x"},
         "mark_mail_flagged": {"message_id": "x"},
         "move_mail_message": {"message_id": "x", "target_mailbox": "Archive"},
+        "mark_mail_read_bulk": {"message_ids": "x,y"},
+        "mark_mail_flagged_bulk": {"message_ids": "x,y"},
+        "move_mail_messages_bulk": {"message_ids": "x,y", "target_mailbox": "Archive"},
         "web_open": {"url": "https://example.com"},
         "web_snapshot": {},
         "web_click": {"ref": "@e1"},
@@ -0,0 +1,112 @@
+"""Tests for memory/event_rule_index.py — compiled event-rule matching."""
+import fnmatch
+import random
+import sqlite3
+from unittest.mock import patch
+
+from memory.event_rule_index import EventRuleIndex
+
+
+def _rule(i, source, pattern):
+    return {"id": i, "name": f"rule-{i}", "event_source": source, "event_type_pattern": pattern}
+
+
+def _reference_match(rules, source, event_type):
+    return [
+        r for r in rules
+        if r["event_source"] == source and fnmatch.fnmatchcase(event_type, r["event_type_pattern"])
+    ]
+
+
+class TestEventRuleIndex:
+    def test_exact_glob_and_catch_all_in_priority_order(self):
+        rules = [
+            _rule(1, "github", "alert.*"),
+            _rule(2, "github", "push"),
+            _rule(3, "github", "*"),
+            _rule(4, "github", "alert.critical"),
+            _rule(5, "jira", "*"),
+        ]
+        index = EventRuleIndex(rules)
+        assert [r["id"] for r in index.match("github", "alert.critical")] == [1, 3, 4]
+        assert [r["id"] for r in index.match("github", "push")] == [2, 3]
+        assert index.match("slack", "message") == []
+
+    def test_shared_pattern_returns_every_rule(self):
+        index = EventRuleIndex([_rule(1, "s", "a.?"), _rule(2, "s", "a.?")])
+        assert [r["id"] for r in index.match("s", "a.b")] == [1, 2]
+
+    def test_character_classes(self):
+        index = EventRuleIndex([_rule(1, "s", "issue.[cu]*"), _rule(2, "s", "issue.[!c]*")])
+        assert [r["id"] for r in index.match("s", "issue.created")] == [1]
+        assert [r["id"] for r in index.match("s", "issue.updated")] == [1, 2]
+
+    def test_returned_rules_are_copies(self):
+        index = EventRuleIndex([_rule(1, "s", "x")])
+        index.match("s", "x")[0]["name"] = "mutated"
+        assert index.match("s", "x")[0]["name"] == "rule-1"
+
+    def test_matches_fnmatch_on_random_rules(self):
+        rng = random.Random(7)
+        parts = ["alert", "push", "issue", "created", "x", "y"]
+        patterns = ["*", "?", "alert.*", "*.created", "issue.?", "[ax]*", "push", "alert.*.y", "*x*"]
+        rules = []
+        for i in range(300):
+            pattern = rng.choice(patterns + [".".join(rng.sample(parts, 2))])
+            rules.append(_rule(i, rng.choice(["github", "jira"]), pattern))
+        index = EventRuleIndex(rules)
+        for _ in range(500):
+            source = rng.choice(["github", "jira", "other"])
+            event_type = ".".join(rng.choice(parts) for _ in range(rng.randint(1, 3)))
+            assert index.match(source, event_type) == _reference_match(rules, source, event_type)
+
+
+class TestWebhookStoreRuleCache:
+    def _create(self, store, name, pattern="*", **kwargs):
+        return store.create_event_rule(
+            name=name, event_source="github", event_type_pattern=pattern, agent_name="agent", **kwargs,
+        )
+
+    def test_burst_matching_does_not_query_sqlite(self, memory_store):
+        self._create(memory_store, "all")
+        memory_store.match_event_rules("github", "push")  # builds the index
+
+        statements: list[str] = []
+        reader = memory_store.reader()
+        reader.set_trace_callback(statements.append)
+        try:
+            for _ in range(200):
+                assert len(memory_store.match_event_rules("github", "push")) == 1
+        finally:
+            reader.set_trace_callback(None)
+        assert statements == []
+
+    def test_create_update_delete_invalidate(self, memory_store):
+        rule = self._create(memory_store, "alerts", "alert.*")
+        assert len(memory_store.match_event_rules("github", "alert.x")) == 1
+
+        memory_store.update_event_rule(rule["id"], event_type_pattern="push")
+        assert memory_store.match_event_rules("github", "alert.x") == []
+        assert len(memory_store.match_event_rules("github", "push")) == 1
+
+        memory_store.update_event_rule(rule["id"], enabled=False)
+        assert memory_store.match_event_rules("github", "push") == []
+
+        self._create(memory_store, "second", "push")
+        assert [r["name"] for r in memory_store.match_event_rules("github", "push")] == ["second"]
+
+        memory_store.delete_event_rule(rule["id"])
+        memory_store.delete_event_rule(memory_store.match_event_rules("github", "push")[0]["id"])
+        assert memory_store.match_event_rules("github", "push") == []
+
+    def test_changes_from_other_connections_are_picked_up(self, memory_store):
+        self._create(memory_store, "all")
+        assert len(memory_store.match_event_rules("github", "push")) == 1
+
+        other = sqlite3.connect(memory_store.db_path)
+        other.execute("UPDATE event_rules SET enabled=0, updated_at='2099-01-01T00:00:00'")
+        other.commit()
+        other.close()
+
+        with patch("memory.webhook_store._RULE_INDEX_RECHECK_SECONDS", 0):
+            assert memory_store.match_event_rules("github", "push") == []
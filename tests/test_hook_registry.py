@@ -1,6 +1,7 @@
 # tests/test_hook_registry.py
 """Tests for the plugin hook / lifecycle system."""
 
+import asyncio
 import json
 import os
 import time
@@ -597,3 +598,126 @@ class TestServerStateHookRegistry:
         reg = HookRegistry()
         state["hook_registry"] = reg
         assert state["hook_registry"] is reg
+
+
+# ---------------------------------------------------------------------------
+# fire_hooks_async, timeouts, observe-only hooks, metrics
+# ---------------------------------------------------------------------------
+
+class TestFireHooksAsync:
+    @pytest.mark.asyncio
+    async def test_results_match_sync_order(self):
+        reg = HookRegistry()
+
+        async def coro_hook(ctx):
+            return "async"
+
+        reg.register_hook("before_tool_call", lambda ctx: "late", priority=200)
+        reg.register_hook("before_tool_call", coro_hook, priority=10)
+        reg.register_hook("before_tool_call", lambda ctx: 1 / 0, priority=10, name="bad")
+        reg.register_hook("before_tool_call", lambda ctx: "sync", priority=10)
+        assert await reg.fire_hooks_async("before_tool_call", {}) == ["async", None, "sync", "late"]
+
+    @pytest.mark.asyncio
+    async def test_equal_priority_hooks_run_concurrently(self):
+        reg = HookRegistry()
+        for _ in range(3):
+            reg.register_hook("before_tool_call", lambda ctx: time.sleep(0.2) or "done", priority=10)
+        started = time.monotonic()
+        results = await reg.fire_hooks_async("before_tool_call", {})
+        assert results == ["done"] * 3
+        assert time.monotonic() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_priority_groups_run_in_order(self):
+        reg = HookRegistry()
+        order = []
+
+        async def slow(ctx):
+            await asyncio.sleep(0.05)
+            order.append("first")
+
+        reg.register_hook("before_tool_call", lambda ctx: order.append("second"), priority=20)
+        reg.register_hook("before_tool_call", slow, priority=10)
+        await reg.fire_hooks_async("before_tool_call", {})
+        assert order == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_timeout_yields_none_and_is_counted(self, caplog):
+        reg = HookRegistry(default_timeout=0.05)
+
+        async def hangs(ctx):
+            await asyncio.sleep(5)
+
+        reg.register_hook("before_tool_call", hangs, name="hangs")
+        reg.register_hook("before_tool_call", lambda ctx: "ok", name="fine", timeout=1.0)
+        with caplog.at_level("WARNING", logger="jarvis-mcp.hooks"):
+            assert await reg.fire_hooks_async("before_tool_call", {}) == [None, "ok"]
+        assert "hangs" in caplog.text
+        metrics = reg.hook_metrics()["before_tool_call"]
+        assert metrics["hangs"]["timeouts"] == 1
+        assert metrics["fine"]["count"] == 1 and metrics["fine"]["timeouts"] == 0
+
+    @pytest.mark.asyncio
+    async def test_observe_only_hook_runs_off_the_critical_path(self):
+        reg = HookRegistry()
+        seen = []
+        reg.register_hook(
+            "after_tool_call", lambda ctx: time.sleep(0.2) or seen.append(ctx["tool_name"]),
+            name="observer", observe_only=True,
+        )
+        reg.register_hook("after_tool_call", lambda ctx: "inline")
+        started = time.monotonic()
+        assert await reg.fire_hooks_async("after_tool_call", {"tool_name": "t"}) == [None, "inline"]
+        assert time.monotonic() - started < 0.15
+        await reg.drain_observers()
+        assert seen == ["t"]
+
+    @pytest.mark.asyncio
+    async def test_usage_tracker_path_applies_transforms(self):
+        reg = HookRegistry()
+        reg.register_hook("before_tool_call", lambda ctx: {"tool_args": {"x": 2}})
+        results = await reg.fire_hooks_async("before_tool_call", build_tool_context("t", {"x": 1}))
+        assert extract_transformed_args(results) == {"x": 2}
+
+
+class TestFireHooksSyncAdditions:
+    def test_coroutine_hook_is_awaited(self):
+        reg = HookRegistry()
+
+        async def coro_hook(ctx):
+            return ctx["tool_name"]
+
+        reg.register_hook("before_tool_call", coro_hook)
+        assert reg.fire_hooks("before_tool_call", {"tool_name": "t"}) == ["t"]
+
+    def test_observe_only_hook_is_backgrounded(self):
+        reg = HookRegistry()
+        seen = []
+        reg.register_hook("after_tool_call", lambda ctx: seen.append(1) or "ignored", observe_only=True)
+        assert reg.fire_hooks("after_tool_call", {}) == [None]
+        asyncio.run(reg.drain_observers())
+        assert seen == [1]
+
+    def test_latency_histogram(self):
+        reg = HookRegistry()
+        reg.register_hook("before_tool_call", lambda ctx: None, name="quick")
+        reg.register_hook("before_tool_call", lambda ctx: 1 / 0, name="bad")
+        for _ in range(3):
+            reg.fire_hooks("before_tool_call", {})
+        metrics = reg.hook_metrics()["before_tool_call"]
+        assert metrics["quick"]["count"] == 3
+        assert sum(metrics["quick"]["buckets"].values()) == 3
+        assert metrics["quick"]["buckets"]["<=1ms"] == 3
+        assert metrics["bad"]["errors"] == 3
+
+    def test_yaml_timeout_and_observe_only(self, tmp_path):
+        config = [{
+            "event_type": "after_tool_call", "name": "audit", "handler": "hooks.builtin.audit_log_hook",
+            "timeout": 2.5, "observe_only": True,
+        }]
+        (tmp_path / "h.yaml").write_text(yaml.dump(config))
+        reg = HookRegistry()
+        assert reg.load_configs(tmp_path) == 1
+        hook = reg.get_hooks("after_tool_call")[0]
+        assert (hook["timeout"], hook["observe_only"]) == (2.5, True)
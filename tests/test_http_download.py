@@ -0,0 +1,223 @@
+"""Tests for browser/http_download.py (ranged, resumable, cached downloads)."""
+
+import json
+import re
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from browser.http_download import DownloadManifest, http_download
+from browser.sharepoint_download import download_sharepoint_file
+
+CONTENT = bytes(range(256)) * 41  # 10,496 bytes
+URL = "https://sp.example.com/sites/T/_layouts/15/download.aspx?UniqueId=%7Babc%7D"
+
+
+class _Response:
+    def __init__(self, status, headers=None, body=b""):
+        self.status = status
+        self.headers = {k.lower(): v for k, v in (headers or {}).items()}
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+    async def dispose(self):
+        pass
+
+
+class FakeRequest:
+    """Minimal Playwright APIRequestContext serving one file."""
+
+    def __init__(self, content=CONTENT, etag='"v1"', ranges=True, head_status=None, content_type=None):
+        self.content = content
+        self.etag = etag
+        self.ranges = ranges
+        self.head_status = head_status
+        self.content_type = content_type or "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        self.calls = []
+        self.fail_ranges = set()
+
+    def _headers(self, length):
+        headers = {"Content-Length": str(length), "Content-Type": self.content_type,
+                   "Last-Modified": "Mon, 02 Mar 2026 09:00:00 GMT"}
+        if self.etag:
+            headers["ETag"] = self.etag
+        if self.ranges:
+            headers["Accept-Ranges"] = "bytes"
+        return headers
+
+    async def head(self, url, headers=None, timeout=None, fail_on_status_code=True):
+        self.calls.append(("HEAD", dict(headers or {})))
+        if self.head_status:
+            return _Response(self.head_status)
+        if self.etag and (headers or {}).get("If-None-Match") == self.etag:
+            return _Response(304, {"ETag": self.etag})
+        return _Response(200, self._headers(len(self.content)))
+
+    async def get(self, url, headers=None, timeout=None, fail_on_status_code=True):
+        headers = dict(headers or {})
+        self.calls.append(("GET", headers))
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", headers.get("Range", ""))
+        if not match or not self.ranges or headers.get("If-Range", self.etag) != self.etag:
+            return _Response(200, self._headers(len(self.content)), self.content)
+        start, end = int(match.group(1)), min(int(match.group(2)), len(self.content) - 1)
+        if start in self.fail_ranges:
+            return _Response(503)
+        response_headers = self._headers(end - start + 1)
+        response_headers["Content-Range"] = f"bytes {start}-{end}/{len(self.content)}"
+        return _Response(206, response_headers, self.content[start:end + 1])
+
+    def count(self, method):
+        return sum(1 for m, _ in self.calls if m == method)
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    async def instant(_delay):
+        return None
+    monkeypatch.setattr("browser.http_download.asyncio.sleep", instant)
+
+
+class TestHttpDownload:
+    @pytest.mark.asyncio
+    async def test_parallel_ranges_assemble_file(self, tmp_path):
+        request = FakeRequest()
+        dest = tmp_path / "okr" / "plan.xlsx"
+
+        result = await http_download(request, URL, dest, parallel=3, segment_bytes=1024)
+
+        assert dest.read_bytes() == CONTENT
+        assert result["method"] == "http_ranged"
+        assert result["segments"] == 11 and result["resumed_segments"] == 0
+        assert request.count("GET") == 11
+        assert sorted(p.name for p in dest.parent.iterdir()) == ["plan.xlsx"]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_file_costs_one_head(self, tmp_path):
+        request = FakeRequest()
+        manifest = DownloadManifest(tmp_path / "cache.json")
+        dest = tmp_path / "plan.xlsx"
+        first = await http_download(request, URL, dest, manifest=manifest, segment_bytes=4096)
+        request.calls.clear()
+
+        second = await http_download(request, URL, dest, manifest=manifest, segment_bytes=4096)
+
+        assert second["method"] == "not_modified"
+        assert second["sha256"] == first["sha256"]
+        assert request.calls == [("HEAD", {"If-None-Match": '"v1"',
+                                           "If-Modified-Since": "Mon, 02 Mar 2026 09:00:00 GMT"})]
+        assert json.loads((tmp_path / "cache.json").read_text())[URL]["etag"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_changed_etag_downloads_again(self, tmp_path):
+        manifest = DownloadManifest(tmp_path / "cache.json")
+        dest = tmp_path / "plan.xlsx"
+        await http_download(FakeRequest(), URL, dest, manifest=manifest)
+
+        updated = FakeRequest(content=CONTENT[::-1], etag='"v2"')
+        result = await http_download(updated, URL, dest, manifest=manifest)
+
+        assert result["method"] == "http_ranged"
+        assert dest.read_bytes() == CONTENT[::-1]
+        assert manifest.get(URL)["etag"] == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_locally_modified_copy_is_not_trusted(self, tmp_path):
+        manifest = DownloadManifest(tmp_path / "cache.json")
+        dest = tmp_path / "plan.xlsx"
+        await http_download(FakeRequest(), URL, dest, manifest=manifest)
+        dest.write_bytes(b"x" * len(CONTENT))
+
+        request = FakeRequest()
+        result = await http_download(request, URL, dest, manifest=manifest)
+
+        assert result["method"] == "http_ranged"
+        assert request.calls[0] == ("HEAD", {})
+        assert dest.read_bytes() == CONTENT
+
+    @pytest.mark.asyncio
+    async def test_failed_segments_resume(self, tmp_path, no_backoff):
+        request = FakeRequest()
+        request.fail_ranges = {2048, 8192}
+        dest = tmp_path / "plan.xlsx"
+
+        with pytest.raises(RuntimeError, match="2 of 11 segments failed"):
+            await http_download(request, URL, dest, segment_bytes=1024)
+        assert not dest.exists()
+        assert len(json.loads((tmp_path / "plan.xlsx.part.json").read_text())["done"]) == 9
+
+        request.fail_ranges = set()
+        request.calls.clear()
+        result = await http_download(request, URL, dest, segment_bytes=1024)
+
+        assert result["resumed_segments"] == 9
+        assert request.count("GET") == 2
+        assert dest.read_bytes() == CONTENT
+        assert not (tmp_path / "plan.xlsx.part.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_partial_file_for_older_version_is_discarded(self, tmp_path, no_backoff):
+        request = FakeRequest()
+        request.fail_ranges = {0}
+        dest = tmp_path / "plan.xlsx"
+        with pytest.raises(RuntimeError):
+            await http_download(request, URL, dest, segment_bytes=1024)
+
+        updated = FakeRequest(content=CONTENT[::-1], etag='"v2"')
+        result = await http_download(updated, URL, dest, segment_bytes=1024)
+
+        assert result["resumed_segments"] == 0
+        assert dest.read_bytes() == CONTENT[::-1]
+
+    @pytest.mark.asyncio
+    async def test_without_range_support_uses_one_get(self, tmp_path):
+        request = FakeRequest(ranges=False)
+        dest = tmp_path / "plan.xlsx"
+
+        result = await http_download(request, URL, dest)
+
+        assert result["method"] == "http"
+        assert request.count("GET") == 1
+        assert dest.read_bytes() == CONTENT
+
+    @pytest.mark.asyncio
+    async def test_head_refused_probes_with_one_byte_range(self, tmp_path):
+        request = FakeRequest(head_status=405)
+        dest = tmp_path / "plan.xlsx"
+
+        result = await http_download(request, URL, dest, segment_bytes=8192)
+
+        assert result["method"] == "http_ranged"
+        assert request.calls[1] == ("GET", {"Range": "bytes=0-0"})
+        assert dest.read_bytes() == CONTENT
+
+    @pytest.mark.asyncio
+    async def test_sign_in_page_is_an_error(self, tmp_path):
+        request = FakeRequest(content_type="text/html; charset=utf-8")
+        with pytest.raises(RuntimeError, match="HTML page"):
+            await http_download(request, URL, tmp_path / "plan.xlsx")
+
+    @pytest.mark.asyncio
+    async def test_unauthorized_is_an_error(self, tmp_path):
+        with pytest.raises(RuntimeError, match="not authorized"):
+            await http_download(FakeRequest(head_status=403), URL, tmp_path / "plan.xlsx")
+
+
+class TestSharepointHttpStrategy:
+    @pytest.mark.asyncio
+    async def test_http_strategy_runs_before_browser_download(self, tmp_path):
+        ctx = MagicMock(request=FakeRequest(), new_page=AsyncMock())
+        manager = MagicMock()
+        manager.is_alive.return_value = True
+        manager.connect = AsyncMock(return_value=(AsyncMock(), MagicMock(contexts=[ctx])))
+        dest = tmp_path / "out.xlsx"
+        url = "https://host/sites/T/Doc.aspx?sourcedoc=%7B1234-ABCD%7D&file=out.xlsx"
+
+        first = await download_sharepoint_file(manager, url, dest, cache_manifest=tmp_path / "cache.json")
+        second = await download_sharepoint_file(manager, url, dest, cache_manifest=tmp_path / "cache.json")
+
+        assert first["status"] == "downloaded" and first["method"] == "http_ranged"
+        assert second["method"] == "not_modified"
+        assert dest.read_bytes() == CONTENT
+        ctx.new_page.assert_not_called()
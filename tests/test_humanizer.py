@@ -1,10 +1,46 @@
 """Tests for the humanizer rule-based text transformer."""
 
+import random
+import re
+
 import pytest
 
 import mcp_server  # noqa: F401 — trigger registration
 
-from humanizer.rules import humanize, HumanizerRule, DEFAULT_RULES
+from humanizer.rules import humanize, HumanizerRule, DEFAULT_RULES, _compile
+
+
+def _humanize_sequential(text, rules=None):
+    """Reference implementation: every rule as a separate pass. ``humanize`` must match it."""
+    if not text:
+        return ""
+    result = text
+    for rule in rules if rules is not None else DEFAULT_RULES:
+        result = rule.pattern.sub(rule.replacement, result)
+    # Clean up double spaces left by removals (only mid-line, preserve leading indent)
+    result = re.sub(r"(?<=\S)  +", " ", result)
+    # Clean up space before punctuation
+    result = re.sub(r" ([.,;:!?])", r"\1", result)
+    return result.strip()
+
+
+def _literal_runs(pattern):
+    """Runs of literal characters that every match of *pattern* contains.
+
+    Uses the stdlib's private regex parser, which is fine for checking the
+    hand-written rule literals here but is kept out of humanizer itself.
+    """
+    from re import _constants as sre_constants, _parser as sre_parser
+
+    zero_width = {sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT}
+    runs, current = [], ""
+    for op, av in sre_parser.parse(pattern.pattern, pattern.flags):
+        if op is sre_constants.LITERAL:
+            current += chr(av)
+        elif op not in zero_width:
+            runs.append(current)
+            current = ""
+    return [run for run in (*runs, current) if run]
 
 
 class TestEmDashRemoval:
@@ -177,3 +213,59 @@ class TestRuleStructure:
         text = "word  word"
         result = humanize(text)
         assert result == "word word"
+
+
+class TestCompiledRules:
+    """humanize() must give exactly what applying each rule in turn gives."""
+
+    @staticmethod
+    def _fuzz(rules, fragments, cases, seed):
+        rng = random.Random(seed)
+        for _ in range(cases):
+            text = "".join(rng.choice(fragments) for _ in range(rng.randint(1, 12)))
+            assert humanize(text, rules) == _humanize_sequential(text, rules), repr(text)
+
+    def test_matches_sequential_on_default_rules(self):
+        fragments = sorted(
+            {rule.literal for rule in DEFAULT_RULES}
+            | {" ", "  ", "\n", "\t", ".", ",", "!", "x", "2024", "potentially", "possibly", "as", "\u017f"}
+        )
+        self._fuzz(None, fragments, cases=20000, seed=0)
+
+    def test_matches_sequential_on_interacting_custom_rules(self):
+        rules = [
+            HumanizerRule("a", re.compile(r"ab"), "ba", "", literal="ab"),
+            HumanizerRule("b", re.compile(r"b+a"), lambda m: m.group().upper(), "", literal="ba"),
+            HumanizerRule("c", re.compile(r"(B)A"), r"\1c", "", literal="A"),
+            HumanizerRule("d", re.compile(r"cc", re.IGNORECASE), "x", "", literal="cc"),
+            HumanizerRule("e", re.compile(r"x?y"), "Z", "", literal="y"),
+            HumanizerRule("f", re.compile(r"Zx|ab"), "", ""),
+            HumanizerRule("g", re.compile(r"(?<=a)c"), "a c", "", literal="c"),
+        ]
+        self._fuzz(rules, list("abcxyABCXYZ ,.") + ["ab", "cc", "  "], cases=20000, seed=3)
+
+    def test_rule_enabled_by_an_earlier_removal_still_applies(self):
+        text = "We could It is worth noting that potentially ship."
+        assert humanize(text) == _humanize_sequential(text) == "We could ship."
+
+    def test_cleanup_matches_sequential(self):
+        for text in ("a  .", "a   b", "a .", "\n   .", "  x", "a \t .", "a  ,  b  !", "x ! ! ."):
+            assert humanize(text) == _humanize_sequential(text), repr(text)
+
+    def test_default_rule_literals_are_in_every_match(self):
+        for rule in DEFAULT_RULES:
+            assert rule.literal, rule.name
+            runs = _literal_runs(rule.pattern)
+            if rule.pattern.flags & re.IGNORECASE:
+                assert any(rule.literal.lower() in run.lower() for run in runs), rule.name
+            else:
+                assert any(rule.literal in run for run in runs), rule.name
+
+    def test_rule_without_literal_always_runs(self):
+        rule = HumanizerRule("digits", re.compile(r"\d+"), "#", "")
+        assert humanize("call 555 now", [rule]) == "call # now"
+
+    def test_text_without_literals_runs_no_rule(self):
+        compiled = _compile(tuple((rule.pattern, rule.replacement, rule.literal) for rule in DEFAULT_RULES))
+        assert compiled.candidates("The server is running on port 8080.") == set()
+        assert {DEFAULT_RULES[i].name for i in compiled.candidates("we utilize it")} == {"vocab_utilize"}
@@ -428,3 +428,111 @@ def test_build_imessage_daemon_refuses_empty_allowlist(tmp_path, monkeypatch):
 
     # Restore config
     importlib.reload(config)
+
+
+def _seed_jobs(daemon: IMessageDaemon, jobs: list[tuple[str, str, str]]) -> None:
+    """Queue (guid, conversation, text) jobs with increasing timestamps."""
+    daemon.store.ingest_messages([
+        IngestedMessage(
+            guid=guid,
+            text=text,
+            date_local="2026-03-03 10:00:00",
+            timestamp_epoch=1741000000 + i,
+            raw_json=json.dumps({"guid": guid, "chat_identifier": conversation}),
+        )
+        for i, (guid, conversation, text) in enumerate(jobs)
+    ])
+
+
+def test_claim_queued_jobs_marks_batch_running(tmp_path):
+    cfg = _config(tmp_path)
+    daemon = IMessageDaemon(cfg, message_store=MagicMock())
+    _seed_jobs(daemon, [("g1", "chat-a", "one"), ("g2", "chat-b", "two"), ("g3", "chat-a", "three")])
+
+    claimed = daemon.store.claim_queued_jobs(limit=2)
+
+    assert [(j["message_guid"], j["conversation"], j["attempts"]) for j in claimed] == [
+        ("g1", "chat-a", 1), ("g2", "chat-b", 1),
+    ]
+    assert daemon.store.count_jobs_by_status("running") == 2
+    assert [j["message_guid"] for j in daemon.store.claim_queued_jobs(limit=10)] == ["g3"]
+    assert daemon.store.claim_queued_jobs(limit=10) == []
+    daemon.close()
+
+
+@pytest.mark.asyncio
+async def test_dispatch_runs_conversations_concurrently_in_order(tmp_path):
+    import asyncio as _asyncio
+    from dataclasses import replace
+
+    cfg = replace(_config(tmp_path), dispatch_concurrency=2)
+    daemon = IMessageDaemon(cfg, message_store=MagicMock())
+    _seed_jobs(daemon, [
+        ("a1", "chat-a", "a1"), ("b1", "chat-b", "b1"), ("a2", "chat-a", "a2"), ("c1", "chat-c", "c1"),
+    ])
+    events: list[str] = []
+    in_flight = 0
+    peak = 0
+
+    async def execute(text):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        events.append(f"start {text}")
+        await _asyncio.sleep(0.05 if text == "a1" else 0.01)
+        events.append(f"end {text}")
+        in_flight -= 1
+        return f"reply {text}"
+
+    daemon.executor = MagicMock(execute=execute)
+    replies: list[str] = []
+    daemon.reply_fn = lambda body: replies.append(body)
+
+    dispatched = await daemon._dispatch_cycle()
+
+    assert dispatched == 4
+    assert peak == 2
+    assert events.index("end a1") < events.index("start a2")
+    assert events.index("start b1") < events.index("end a1")
+    assert replies.index("reply a1") < replies.index("reply a2")
+    assert daemon.store.count_jobs_by_status("succeeded") == 4
+    metrics = daemon.metrics()
+    assert metrics["queue_depth"] == 0 and metrics["running"] == 0
+    assert metrics["dispatch_latency"]["count"] == 4
+    assert metrics["dispatch_latency"]["p95_ms"] >= metrics["dispatch_latency"]["p50_ms"]
+    daemon.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_reply_does_not_delay_next_job(tmp_path):
+    import asyncio as _asyncio
+    import threading
+    import time as _time
+
+    cfg = _config(tmp_path)
+    daemon = IMessageDaemon(cfg, message_store=MagicMock())
+    _seed_jobs(daemon, [("a1", "chat-a", "a1"), ("a2", "chat-a", "a2")])
+    started: dict[str, float] = {}
+    sent: list[tuple[str, float]] = []
+    release = threading.Event()
+
+    async def execute(text):
+        started[text] = _time.perf_counter()
+        return f"reply {text}"
+
+    def slow_reply(body):
+        if body == "reply a1":
+            release.wait(1)
+        sent.append((body, _time.perf_counter()))
+
+    daemon.executor = MagicMock(execute=execute)
+    daemon.reply_fn = slow_reply
+
+    cycle = _asyncio.create_task(daemon._dispatch_cycle())
+    while "a2" not in started:
+        await _asyncio.sleep(0.01)
+    assert sent == []  # a2 ran while a1's reply was still being sent
+    release.set()
+    assert await cycle == 2
+    assert [body for body, _ in sent] == ["reply a1", "reply a2"]
+    daemon.close()
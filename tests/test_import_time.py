@@ -0,0 +1,83 @@
+"""Import-time regression tests for short-lived entry points.
+
+Each entry point is imported in a fresh interpreter under ``-X importtime``.
+Loading a heavy package (anthropic, chromadb) at import fails outright; the
+time budgets are loose enough for a slow CI machine and only catch large
+regressions. Set IMPORT_TIME_BUDGET_SCALE to stretch them.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+from profile_imports import profile_import  # noqa: E402
+
+_SCALE = float(os.environ.get("IMPORT_TIME_BUDGET_SCALE", "1"))
+
+# Budget in ms of cumulative import time. These run on every launchd tick
+# or one-shot CLI call; typical times are 50-110ms.
+BUDGETS_MS = {
+    "config": 300,
+    "scheduler.engine": 500,
+    "scheduler.daemon": 500,
+    "scheduler.alert_evaluator": 500,
+    "webhook.receiver": 500,
+    "webhook.dispatcher": 600,
+    "chief.imessage_daemon": 500,
+    "knowledge.compile_queue": 500,
+    "agents.base": 600,
+}
+
+
+@pytest.mark.parametrize("module", sorted(BUDGETS_MS))
+def test_entry_point_import_budget(module):
+    profile = profile_import(module)
+    assert not {"anthropic", "chromadb"} & set(profile["heavy"]), (
+        f"{module} imports {profile['heavy']} at load time"
+    )
+    assert profile["total_ms"] <= BUDGETS_MS[module] * _SCALE, (
+        f"{module} took {profile['total_ms']:.0f}ms to import (budget {BUDGETS_MS[module] * _SCALE:.0f}ms)"
+    )
+
+
+def test_lazy_import_defers_until_attribute_access():
+    import subprocess
+
+    code = (
+        "import sys; from utils.lazy_import import lazy_import; "
+        "m = lazy_import('tomllib'); assert 'tomllib' not in sys.modules; "
+        "assert m.loads('a = 1') == {'a': 1}; assert 'tomllib' in sys.modules"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=os.path.join(os.path.dirname(__file__), ".."),
+        capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_lazy_secret_settings(monkeypatch):
+    import importlib
+
+    import config
+
+    calls = []
+
+    def fake_get_secret(key):
+        calls.append(key)
+        return {"m365_client_id": "cid"}.get(key)
+
+    monkeypatch.setattr("vault.keychain.get_secret", fake_get_secret)
+    monkeypatch.delenv("TEAMS_SEND_BACKEND", raising=False)
+    monkeypatch.delenv("TEAMS_POSTER_BACKEND", raising=False)
+    try:
+        importlib.reload(config)
+        assert calls == []
+        assert config.TEAMS_SEND_BACKEND == "graph"
+        assert calls == ["m365_client_id"]
+        assert config.M365_GRAPH_ENABLED is True
+        assert calls == ["m365_client_id"]
+    finally:
+        monkeypatch.undo()
+        importlib.reload(config)
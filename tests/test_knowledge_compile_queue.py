@@ -0,0 +1,206 @@
+"""Tests for knowledge/compile_queue.py — queued, de-duplicated summary compilation."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import documents.ingestion
+from documents.ingestion import ingest_path
+from knowledge.compile_queue import (
+    collect_compile_batches,
+    enqueue_document_summary,
+    process_compile_jobs,
+    run_compile_queue,
+    submit_compile_batch,
+)
+
+LONG_TEXT = " ".join(["word"] * 60)
+
+
+def _client(summary="A summary."):
+    client = MagicMock()
+    client.messages.create.return_value = SimpleNamespace(content=[SimpleNamespace(text=summary)])
+    return client
+
+
+class TestCompileJobStore:
+    def test_enqueue_dedupes_by_file_hash(self, memory_store):
+        assert memory_store.enqueue_compile_job("h1", "a.md", "text") is True
+        assert memory_store.enqueue_compile_job("h1", "copy-of-a.md", "text") is False
+        assert memory_store.get_compile_job_stats()["counts"]["pending"] == 1
+
+    def test_done_job_is_never_requeued(self, memory_store):
+        memory_store.enqueue_compile_job("h1", "a.md", "text")
+        memory_store.claim_compile_jobs()
+        memory_store.finish_compile_job("h1", "done")
+        assert memory_store.enqueue_compile_job("h1", "a.md", "text") is False
+        assert memory_store.get_compile_job("h1")["text"] == ""
+
+    def test_failed_job_is_requeued(self, memory_store):
+        memory_store.enqueue_compile_job("h1", "a.md", "text")
+        memory_store.claim_compile_jobs()
+        memory_store.finish_compile_job("h1", "failed", error="boom")
+        assert memory_store.enqueue_compile_job("h1", "a.md", "text") is True
+        job = memory_store.get_compile_job("h1")
+        assert job["status"] == "pending"
+        assert job["error"] is None
+
+    def test_claim_marks_running_and_counts_attempts(self, memory_store):
+        for i in range(3):
+            memory_store.enqueue_compile_job(f"h{i}", f"{i}.md", "text")
+        claimed = memory_store.claim_compile_jobs(limit=2)
+        assert [j["file_hash"] for j in claimed] == ["h0", "h1"]
+        assert all(j["status"] == "running" and j["attempts"] == 1 for j in claimed)
+        assert memory_store.claim_compile_jobs(limit=5)[0]["file_hash"] == "h2"
+        assert memory_store.claim_compile_jobs(limit=5) == []
+
+    def test_requeue_stale_running_jobs(self, memory_store):
+        memory_store.enqueue_compile_job("h1", "a.md", "text")
+        memory_store.claim_compile_jobs()
+        memory_store.conn.execute("UPDATE compile_jobs SET updated_at='2000-01-01T00:00:00'")
+        memory_store.conn.commit()
+        assert memory_store.requeue_stale_compile_jobs() == 1
+        assert memory_store.get_compile_job("h1")["status"] == "pending"
+
+
+class TestEnqueue:
+    def test_short_text_not_enqueued(self, memory_store):
+        assert enqueue_document_summary(memory_store, "too short", "a.md", "h1") is False
+        assert memory_store.get_compile_job("h1") is None
+
+    def test_text_truncated_before_storing(self, memory_store):
+        text = " ".join(f"w{i}" for i in range(4000))
+        assert enqueue_document_summary(memory_store, text, "a.md", "h1") is True
+        assert len(memory_store.get_compile_job("h1")["text"].split()) == 3000
+
+    def test_ingest_path_enqueues_instead_of_calling_llm(self, memory_store, tmp_path):
+        (tmp_path / "a.md").write_text(LONG_TEXT)
+        (tmp_path / "b.md").write_text(LONG_TEXT)  # identical content, same hash
+        document_store = MagicMock()
+        with patch.object(documents.ingestion, "COMPILE_ON_INGEST", True), \
+             patch("knowledge.compiler.compile_document_summary") as mock_compile:
+            result = ingest_path(tmp_path, document_store, memory_store=memory_store)
+        mock_compile.assert_not_called()
+        assert "Queued 1 document summary job(s)." in result
+        assert memory_store.get_compile_job_stats()["counts"]["pending"] == 1
+
+
+class TestProcessCompileJobs:
+    def test_processes_pending_jobs(self, memory_store):
+        enqueue_document_summary(memory_store, LONG_TEXT, "a.md", "h1")
+        enqueue_document_summary(memory_store, LONG_TEXT + " more", "b.md", "h2")
+        document_store = MagicMock()
+        client = _client()
+
+        result = process_compile_jobs(memory_store, document_store, concurrency=2, client=client)
+
+        assert result == {"claimed": 2, "done": 2, "retried": 0, "failed": 0}
+        assert client.messages.create.call_count == 2
+        ids = sorted(c.kwargs["ids"][0] for c in document_store.add_documents.call_args_list)
+        assert ids == ["h1_summary", "h2_summary"]
+        assert memory_store.get_compile_job_stats()["counts"]["done"] == 2
+
+    def test_api_failure_retries_then_fails(self, memory_store):
+        enqueue_document_summary(memory_store, LONG_TEXT, "a.md", "h1")
+        client = MagicMock()
+        client.messages.create.side_effect = RuntimeError("overloaded")
+
+        for _ in range(2):
+            assert process_compile_jobs(memory_store, MagicMock(), client=client)["retried"] == 1
+        assert process_compile_jobs(memory_store, MagicMock(), client=client)["failed"] == 1
+        job = memory_store.get_compile_job("h1")
+        assert job["status"] == "failed"
+        assert "overloaded" in job["error"]
+
+
+class TestMessageBatches:
+    def _batch_client(self, results, status="ended"):
+        client = MagicMock()
+        client.messages.batches.create.return_value = SimpleNamespace(id="msgbatch_1")
+        client.messages.batches.retrieve.return_value = SimpleNamespace(processing_status=status)
+        client.messages.batches.results.return_value = results
+        return client
+
+    def test_submit_and_collect(self, memory_store):
+        enqueue_document_summary(memory_store, LONG_TEXT, "a.md", "h1")
+        enqueue_document_summary(memory_store, LONG_TEXT + " more", "b.md", "h2")
+        results = [
+            SimpleNamespace(custom_id="h1", result=SimpleNamespace(
+                type="succeeded",
+                message=SimpleNamespace(content=[SimpleNamespace(text="Summary one.")]),
+            )),
+            SimpleNamespace(custom_id="h2", result=SimpleNamespace(type="expired")),
+        ]
+        client = self._batch_client(results)
+
+        submitted = submit_compile_batch(memory_store, client=client)
+        assert submitted == {"submitted": 2, "batch_id": "msgbatch_1"}
+        requests = client.messages.batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == ["h1", "h2"]
+        assert memory_store.list_compile_batches() == ["msgbatch_1"]
+
+        document_store = MagicMock()
+        collected = collect_compile_batches(memory_store, document_store, client=client)
+        assert collected["done"] == 1
+        assert collected["retried"] == 1
+        assert memory_store.get_compile_job("h1")["status"] == "done"
+        assert memory_store.get_compile_job("h2")["status"] == "pending"
+        assert memory_store.list_compile_batches() == []
+
+    def test_in_progress_batch_left_alone(self, memory_store):
+        enqueue_document_summary(memory_store, LONG_TEXT, "a.md", "h1")
+        client = self._batch_client([], status="in_progress")
+        submit_compile_batch(memory_store, client=client)
+        collected = collect_compile_batches(memory_store, MagicMock(), client=client)
+        assert collected["batches_ended"] == 0
+        client.messages.batches.results.assert_not_called()
+        assert memory_store.get_compile_job("h1")["status"] == "batched"
+
+    def test_auto_mode_uses_batches_above_threshold(self, memory_store):
+        for i in range(3):
+            enqueue_document_summary(memory_store, LONG_TEXT + f" {i}", f"{i}.md", f"h{i}")
+        client = self._batch_client([])
+        with patch("knowledge.compile_queue.KNOWLEDGE_COMPILE_BATCH_THRESHOLD", 3):
+            result = run_compile_queue(memory_store, MagicMock(), client=client)
+        assert result["mode"] == "batch"
+        assert result["processed"]["submitted"] == 3
+        client.messages.create.assert_not_called()
+
+    def test_invalid_mode_raises(self, memory_store):
+        with pytest.raises(ValueError):
+            run_compile_queue(memory_store, MagicMock(), mode="bogus")
+
+
+class TestKnowledgeCompileHandler:
+    def test_handler_runs_queue(self, memory_store):
+        from scheduler.handlers import execute_handler
+
+        enqueue_document_summary(memory_store, LONG_TEXT, "a.md", "h1")
+        with patch("knowledge.compile_queue.anthropic.Anthropic", return_value=_client()):
+            result = json.loads(execute_handler(
+                "knowledge_compile", '{"mode": "concurrent"}',
+                memory_store=memory_store, document_store=MagicMock(),
+            ))
+        assert result["status"] == "ok"
+        assert result["processed"]["done"] == 1
+
+
+class TestCompileStatusTool:
+    @pytest.mark.asyncio
+    async def test_status_reports_progress(self, memory_store):
+        import mcp_server
+        from mcp_tools.document_tools import get_knowledge_compile_status
+
+        memory_store.enqueue_compile_job("h1", "a.md", "text")
+        memory_store.enqueue_compile_job("h2", "b.md", "text")
+        memory_store.claim_compile_jobs(limit=1)
+        memory_store.finish_compile_job("h1", "done")
+        mcp_server._state.memory_store = memory_store
+
+        result = json.loads(await get_knowledge_compile_status())
+
+        assert result["counts"]["done"] == 1
+        assert result["counts"]["pending"] == 1
+        assert result["progress_pct"] == 50.0
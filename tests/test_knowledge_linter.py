@@ -1,8 +1,12 @@
 """Tests for the knowledge linter module."""
 
 import json
-import pytest
+import random
+import sqlite3
 from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
 
 from memory.models import Fact
 from knowledge.linter import KnowledgeLinter, _jaccard_similarity
@@ -162,6 +166,77 @@ def test_duplicates_no_repeated_pairs(memory_store):
     assert len(findings) == 1
 
 
+# ---------------------------------------------------------------------------
+# MinHash/LSH near-duplicate index
+# ---------------------------------------------------------------------------
+
+def _pairs(findings):
+    return [(f["category"], f["fact_a"]["key"], f["fact_b"]["key"], f["similarity"]) for f in findings]
+
+
+def test_lsh_matches_exact_comparison(memory_store):
+    rng = random.Random(11)
+    vocabulary = [f"w{i}" for i in range(300)]
+    values = []
+    for i in range(300):
+        if values and rng.random() < 0.2:
+            words = rng.choice(values).split()
+            words[rng.randrange(len(words))] = rng.choice(vocabulary)
+            value = " ".join(words)
+        else:
+            value = " ".join(rng.sample(vocabulary, rng.randint(6, 12)))
+        values.append(value)
+        _store(memory_store, f"k{i:03d}", value, category=rng.choice(["work", "personal"]))
+
+    linter = KnowledgeLinter(memory_store)
+    lsh = linter.check_near_duplicates(similarity_threshold=0.7)
+    exact = linter._check_near_duplicates_exact(0.7)
+    assert len(exact) > 10
+    assert _pairs(lsh) == _pairs(exact)
+
+
+def test_lsh_pairs_follow_updates_and_deletes(memory_store):
+    _store(memory_store, "a", "alpha beta gamma delta epsilon zeta")
+    _store(memory_store, "b", "alpha beta gamma delta epsilon eta")
+    _store(memory_store, "c", "unrelated words entirely")
+    linter = KnowledgeLinter(memory_store)
+    assert [(f["fact_a"]["key"], f["fact_b"]["key"]) for f in linter.check_near_duplicates()] == [("a", "b")]
+
+    _store(memory_store, "b", "something else now")
+    _store(memory_store, "c", "alpha beta gamma delta epsilon theta")
+    assert [(f["fact_a"]["key"], f["fact_b"]["key"]) for f in linter.check_near_duplicates()] == [("a", "c")]
+
+    memory_store.delete_fact("work", "c")
+    assert linter.check_near_duplicates() == []
+
+
+def test_facts_written_directly_are_backfilled(memory_store):
+    memory_store.conn.executemany(
+        "INSERT INTO facts (category, key, value) VALUES ('work', ?, ?)",
+        [("x", "the quarterly report is due on monday"), ("y", "the quarterly report is due on tuesday")],
+    )
+    memory_store.conn.commit()
+    findings = KnowledgeLinter(memory_store).check_near_duplicates(similarity_threshold=0.7)
+    assert [(f["fact_a"]["key"], f["fact_b"]["key"]) for f in findings] == [("x", "y")]
+    assert memory_store.backfill_fact_signatures() == 0
+
+
+def test_low_threshold_uses_exact_comparison(memory_store):
+    _store(memory_store, "k1", "red green blue yellow")
+    _store(memory_store, "k2", "red green purple orange")  # Jaccard 1/3
+    linter = KnowledgeLinter(memory_store)
+    assert linter.check_near_duplicates(similarity_threshold=0.7) == []
+    findings = linter.check_near_duplicates(similarity_threshold=0.3)
+    assert findings[0]["similarity"] == 0.33
+
+
+def test_store_fact_survives_index_failure(memory_store):
+    with patch("memory.fact_similarity.index_fact", side_effect=sqlite3.OperationalError("boom")):
+        stored = _store(memory_store, "k", "value that cannot be indexed")
+    assert memory_store.get_fact("work", "k").value == stored.value
+    assert memory_store.backfill_fact_signatures() == 1
+
+
 # ---------------------------------------------------------------------------
 # run_all
 # ---------------------------------------------------------------------------
@@ -0,0 +1,180 @@
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from apple_mail.envelope_index import EnvelopeIndex, default_index_path
+from apple_mail.mail import MailStore
+
+WORK = "6B29FC40-CA47-1067-B31D-00DD010662DA"
+HOME = "F81D4FAE-7DEC-11D0-A765-00A0C91E6BF6"
+
+
+def _make_envelope_index(db_path: Path) -> None:
+    """A minimal subset of Mail's V10 Envelope Index schema."""
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        """
+        CREATE TABLE mailboxes (
+            ROWID INTEGER PRIMARY KEY, url TEXT UNIQUE,
+            total_count INTEGER DEFAULT 0, unread_count INTEGER DEFAULT 0
+        );
+        CREATE TABLE addresses (ROWID INTEGER PRIMARY KEY, address TEXT, comment TEXT);
+        CREATE TABLE subjects (ROWID INTEGER PRIMARY KEY, subject TEXT);
+        CREATE TABLE message_global_data (ROWID INTEGER PRIMARY KEY, message_id_header TEXT);
+        CREATE TABLE messages (
+            ROWID INTEGER PRIMARY KEY, global_message_id INTEGER, sender INTEGER,
+            subject_prefix TEXT, subject INTEGER, date_sent INTEGER, date_received INTEGER,
+            mailbox INTEGER, read INTEGER DEFAULT 0, flagged INTEGER DEFAULT 0, deleted INTEGER DEFAULT 0
+        );
+        """
+    )
+    conn.executemany(
+        "INSERT INTO mailboxes(ROWID, url, total_count, unread_count) VALUES(?, ?, ?, ?)",
+        [
+            (1, f"imap://{WORK}/INBOX", 3, 2),
+            (2, f"imap://{WORK}/Projects/Q3%20Plan", 1, 0),
+            (3, f"ews://{HOME}/Inbox", 1, 1),
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO addresses(ROWID, address, comment) VALUES(?, ?, ?)",
+        [(1, "alice@example.com", "Alice Smith"), (2, "bob@example.com", ""), (3, "news@example.com", "100%_News")],
+    )
+    conn.executemany(
+        "INSERT INTO subjects(ROWID, subject) VALUES(?, ?)",
+        [(1, "Budget review"), (2, "Lunch?"), (3, "Weekly digest"), (4, "Q3 plan"), (5, "Old budget")],
+    )
+    conn.executemany(
+        "INSERT INTO message_global_data(ROWID, message_id_header) VALUES(?, ?)",
+        [(i, f"<msg{i}@example.com>") for i in range(1, 7)],
+    )
+    conn.executemany(
+        "INSERT INTO messages(ROWID, global_message_id, sender, subject_prefix, subject, date_sent,"
+        " date_received, mailbox, read, flagged, deleted) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (1, 1, 1, "Re: ", 1, 1_700_000_000, 1_700_000_100, 1, 0, 1, 0),
+            (2, 2, 2, "", 2, 1_700_000_200, 1_700_000_300, 1, 1, 0, 0),
+            (3, 3, 3, "", 3, 1_700_000_400, 1_700_000_500, 1, 0, 0, 0),
+            (4, 4, 1, "", 4, 1_700_000_600, 1_700_000_700, 2, 1, 0, 0),
+            (5, 5, 2, "", 1, 1_700_000_800, 1_700_000_900, 3, 0, 0, 0),
+            (6, 6, 1, "", 5, 1_700_001_000, 1_700_001_100, 1, 0, 0, 1),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+def _make_accounts_db(db_path: Path) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE ZACCOUNT (Z_PK INTEGER PRIMARY KEY, ZIDENTIFIER TEXT, ZACCOUNTDESCRIPTION TEXT)")
+    conn.execute("INSERT INTO ZACCOUNT(ZIDENTIFIER, ZACCOUNTDESCRIPTION) VALUES(?, 'Work')", (WORK,))
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def envelope_index(tmp_path: Path) -> EnvelopeIndex:
+    db_path = tmp_path / "Envelope Index"
+    accounts_path = tmp_path / "Accounts4.sqlite"
+    _make_envelope_index(db_path)
+    _make_accounts_db(accounts_path)
+    return EnvelopeIndex(db_path, accounts_db_path=accounts_path)
+
+
+class TestEnvelopeIndex:
+    def test_list_mailboxes_resolves_names_and_counts(self, envelope_index):
+        mailboxes = {(mb["account"], mb["name"]): mb for mb in envelope_index.list_mailboxes()}
+        assert set(mailboxes) == {("Work", "INBOX"), ("Work", "Projects/Q3 Plan"), (HOME, "Inbox")}
+        assert mailboxes[("Work", "INBOX")]["unread_count"] == 2
+        assert mailboxes[(HOME, "Inbox")]["account_id"] == HOME
+
+    def test_get_messages_newest_first_without_deleted(self, envelope_index):
+        messages = envelope_index.get_messages("INBOX", account="Work")
+        assert [m["message_id"] for m in messages] == ["msg3@example.com", "msg2@example.com", "msg1@example.com"]
+        oldest = messages[-1]
+        assert oldest["subject"] == "Re: Budget review"
+        assert oldest["sender"] == "Alice Smith <alice@example.com>"
+        assert oldest["flagged"] is True and oldest["read"] is False
+        assert oldest["mailbox"] == "INBOX" and oldest["account"] == "Work"
+        assert messages[1]["sender"] == "bob@example.com"
+
+    def test_mailbox_name_matches_across_accounts_when_no_account(self, envelope_index):
+        messages = envelope_index.get_messages("inbox", limit=2)
+        assert [m["message_id"] for m in messages] == ["msg5@example.com", "msg3@example.com"]
+
+    def test_account_matches_id_or_name(self, envelope_index):
+        by_id = envelope_index.get_messages("Inbox", account=HOME)
+        assert [m["message_id"] for m in by_id] == ["msg5@example.com"]
+        with pytest.raises(LookupError):
+            envelope_index.get_messages("INBOX", account="Personal")
+
+    def test_search_matches_subject_address_and_name(self, envelope_index):
+        assert [m["message_id"] for m in envelope_index.search_messages("budget", account="Work")] == [
+            "msg1@example.com"
+        ]
+        assert [m["message_id"] for m in envelope_index.search_messages("alice")] == ["msg1@example.com"]
+        assert [m["message_id"] for m in envelope_index.search_messages("bob@", account=HOME)] == [
+            "msg5@example.com"
+        ]
+
+    def test_search_escapes_like_wildcards(self, envelope_index):
+        assert [m["message_id"] for m in envelope_index.search_messages("100%_")] == ["msg3@example.com"]
+        assert envelope_index.search_messages("0%N") == []
+
+    def test_opens_read_only(self, envelope_index):
+        conn = envelope_index._open()
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM messages")
+        conn.close()
+
+    def test_missing_accounts_db_falls_back_to_ids(self, tmp_path):
+        db_path = tmp_path / "Envelope Index"
+        _make_envelope_index(db_path)
+        index = EnvelopeIndex(db_path, accounts_db_path=tmp_path / "missing.sqlite")
+        assert {mb["account"] for mb in index.list_mailboxes()} == {WORK, HOME}
+
+    def test_default_index_path_picks_newest_version(self, tmp_path):
+        for version in ("V9", "V10", "V2"):
+            (tmp_path / version / "MailData").mkdir(parents=True)
+            (tmp_path / version / "MailData" / "Envelope Index").touch()
+        (tmp_path / "V11").mkdir()
+        assert default_index_path(tmp_path) == tmp_path / "V10" / "MailData" / "Envelope Index"
+        assert default_index_path(tmp_path / "absent") is None
+
+
+class TestMailStoreWithIndex:
+    def test_reads_use_index_without_applescript(self, envelope_index):
+        store = MailStore(envelope_index=envelope_index)
+        with patch("apple_mail.mail._run_applescript") as mock_run:
+            assert len(store.get_messages("INBOX", account="Work")) == 3
+            assert store.search_messages("lunch")[0]["subject"] == "Lunch?"
+            assert sum(mb["unread_count"] for mb in store.list_mailboxes()) == 3
+        mock_run.assert_not_called()
+
+    def test_unknown_mailbox_falls_back_to_applescript(self, envelope_index):
+        store = MailStore(envelope_index=envelope_index)
+        with patch("apple_mail.mail._run_applescript", return_value={"output": ""}) as mock_run:
+            assert store.get_messages("Archive") == []
+        assert 'mailbox "Archive"' in mock_run.call_args[0][0]
+
+    def test_unreadable_index_falls_back_to_applescript(self, tmp_path):
+        bad = tmp_path / "Envelope Index"
+        bad.write_bytes(b"not a database")
+        store = MailStore(envelope_index=EnvelopeIndex(bad))
+        with patch("apple_mail.mail._run_applescript", return_value={"output": ""}) as mock_run:
+            assert store.search_messages("x") == []
+        mock_run.assert_called_once()
+
+    def test_missing_index_uses_applescript(self, tmp_path):
+        store = MailStore(envelope_index=EnvelopeIndex(tmp_path / "none"))
+        with patch("apple_mail.mail._run_applescript", return_value={"output": ""}) as mock_run:
+            store.list_mailboxes()
+        mock_run.assert_called_once()
+
+    def test_message_bodies_still_use_applescript(self, envelope_index):
+        store = MailStore(envelope_index=envelope_index)
+        with patch("apple_mail.mail._run_applescript", return_value={"error": "x"}) as mock_run:
+            store.get_message("msg1@example.com")
+        mock_run.assert_called_once()
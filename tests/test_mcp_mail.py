@@ -60,6 +60,9 @@ class TestMailToolsRegistered:
             "mark_mail_read",
             "mark_mail_flagged",
             "move_mail_message",
+            "mark_mail_read_bulk",
+            "mark_mail_flagged_bulk",
+            "move_mail_messages_bulk",
             "reply_to_email",
             "send_email",
         ]
@@ -314,6 +317,47 @@ class TestMoveMailMessageTool:
         )
 
 
+# ---------------------------------------------------------------------------
+# bulk mark/move
+# ---------------------------------------------------------------------------
+
+
+class TestBulkMailTools:
+    @pytest.mark.asyncio
+    async def test_mark_read_bulk_splits_ids(self, mail_state):
+        from mcp_tools.mail_tools import mark_mail_read_bulk
+
+        mail_state.mark_read_bulk.return_value = {"status": "ok", "succeeded": 2, "failed": 0, "results": []}
+
+        data = json.loads(await mark_mail_read_bulk(message_ids="m1, m2,", read="false"))
+
+        assert data["succeeded"] == 2
+        mail_state.mark_read_bulk.assert_called_once_with(["m1", "m2"], read=False)
+
+    @pytest.mark.asyncio
+    async def test_mark_flagged_bulk(self, mail_state):
+        from mcp_tools.mail_tools import mark_mail_flagged_bulk
+
+        mail_state.mark_flagged_bulk.return_value = {"status": "ok", "results": []}
+
+        await mark_mail_flagged_bulk(message_ids="m1")
+
+        mail_state.mark_flagged_bulk.assert_called_once_with(["m1"], flagged=True)
+
+    @pytest.mark.asyncio
+    async def test_move_bulk(self, mail_state):
+        from mcp_tools.mail_tools import move_mail_messages_bulk
+
+        mail_state.move_messages_bulk.return_value = {"status": "partial", "results": []}
+
+        data = json.loads(await move_mail_messages_bulk(message_ids="m1,m2", target_mailbox="Archive"))
+
+        assert data["status"] == "partial"
+        mail_state.move_messages_bulk.assert_called_once_with(
+            ["m1", "m2"], target_mailbox="Archive", target_account=""
+        )
+
+
 # ---------------------------------------------------------------------------
 # reply_to_email
 # ---------------------------------------------------------------------------
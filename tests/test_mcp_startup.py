@@ -0,0 +1,174 @@
+"""Tests for mcp_tools/startup.py and the lazy app_lifespan in mcp_server."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+import mcp_server
+from mcp_tools.startup import LazyHandle, StartupTimeline, start_warmers
+
+
+class _Target:
+    def __init__(self):
+        self.value = 42
+
+    def ping(self):
+        return "pong"
+
+
+class TestLazyHandle:
+    def test_builds_on_first_attribute_access(self):
+        calls = []
+        handle = LazyHandle("target", lambda: calls.append(1) or _Target())
+        assert not handle.ready and calls == []
+
+        assert handle.ping() == "pong"
+        assert handle.value == 42
+        assert handle.ready and calls == [1]
+
+    def test_is_truthy_before_build(self):
+        handle = LazyHandle("target", _Target)
+        assert handle and handle is not None
+        assert not handle.ready
+
+    def test_concurrent_first_use_builds_once(self):
+        calls = []
+
+        def factory():
+            calls.append(1)
+            time.sleep(0.05)
+            return _Target()
+
+        handle = LazyHandle("target", factory)
+        threads = [threading.Thread(target=handle.resolve) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+
+    def test_failed_build_is_retried(self):
+        attempts = []
+
+        def factory():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("not yet")
+            return _Target()
+
+        handle = LazyHandle("target", factory)
+        with pytest.raises(RuntimeError):
+            handle.ping()
+        assert handle.ping() == "pong"
+
+    def test_setattr_forwards_to_target(self):
+        handle = LazyHandle("target", _Target)
+        handle.value = 7
+        assert handle.resolve().value == 7
+
+    def test_records_build_in_timeline(self):
+        timeline = StartupTimeline()
+        LazyHandle("target", _Target, timeline).resolve()
+        assert [(p["phase"], p["mode"], p["ok"]) for p in timeline.to_list()] == [("target", "on-demand", True)]
+
+    @pytest.mark.asyncio
+    async def test_warm_builds_in_worker_thread(self):
+        built_in = []
+        handle = LazyHandle("target", lambda: built_in.append(threading.get_ident()) or _Target())
+        await handle.warm()
+        assert handle.ready
+        assert built_in != [threading.get_ident()]
+
+
+class TestStartupTimeline:
+    def test_phase_records_failure_and_reraises(self):
+        timeline = StartupTimeline()
+        with timeline.phase("ok"):
+            pass
+        with pytest.raises(ValueError):
+            with timeline.phase("bad"):
+                raise ValueError("boom")
+        assert [(p["phase"], p["ok"]) for p in timeline.to_list()] == [("ok", True), ("bad", False)]
+
+    @pytest.mark.asyncio
+    async def test_start_warmers_logs_failures_without_raising(self):
+        timeline = StartupTimeline()
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        async def succeed():
+            return None
+
+        tasks = start_warmers({"fail": fail, "succeed": succeed}, timeline)
+        await asyncio.gather(*tasks.values())
+        assert {(p["phase"], p["mode"], p["ok"]) for p in timeline.to_list()} == {
+            ("fail", "background", False),
+            ("succeed", "background", True),
+        }
+
+
+class _SlowStore:
+    def __init__(self, delay):
+        time.sleep(delay)
+        self.client = self
+
+    def get_or_create_collection(self, *args, **kwargs):
+        return None
+
+    def list_reminders(self, completed=False):
+        return []
+
+    async def refresh_index_async(self):
+        return {"indexed": 0}
+
+
+@pytest.fixture
+def slow_subsystems(tmp_path, monkeypatch):
+    """Point the lifespan at tmp_path and make every heavy subsystem take 0.5s."""
+    monkeypatch.setattr("config.DATA_DIR", tmp_path)
+    monkeypatch.setattr("config.AGENT_CONFIGS_DIR", tmp_path / "agents")
+    monkeypatch.setattr("config.MEMORY_DB_PATH", tmp_path / "memory.db")
+    monkeypatch.setattr("config.OKR_DATA_DIR", tmp_path / "okr")
+    monkeypatch.setattr("config.SESSION_BRAIN_PATH", tmp_path / "brain.md")
+    monkeypatch.setattr("config.SESSION_CONTEXT_ENABLED", False)
+    monkeypatch.setattr("config.M365_GRAPH_ENABLED", False)
+    monkeypatch.setattr("config.CALENDAR_ROUTING_DB_PATH", tmp_path / "routing.db")
+    monkeypatch.setattr(mcp_server, "_open_document_store", lambda: _SlowStore(0.5))
+    monkeypatch.setattr(mcp_server, "_open_calendar_store", lambda: _SlowStore(0.5))
+    monkeypatch.setattr(mcp_server, "_open_reminder_store", lambda: _SlowStore(0.5))
+    monkeypatch.setattr(
+        "connectors.claude_m365_bridge.ClaudeM365Bridge.is_connector_connected",
+        lambda self: time.sleep(0.5) or True,
+    )
+    yield
+    mcp_server._state.clear()
+
+
+class TestLazyLifespan:
+    @pytest.mark.asyncio
+    async def test_serves_before_heavy_subsystems_are_ready(self, slow_subsystems, monkeypatch):
+        monkeypatch.setattr("config.MCP_LAZY_STARTUP", True)
+        started = time.perf_counter()
+        async with mcp_server.app_lifespan(None):
+            assert time.perf_counter() - started < 0.4
+            state = mcp_server._state
+            assert not state.document_store.ready
+            # A tool that needs a store before warm-up finishes builds or waits for it.
+            assert state.reminder_store.list_reminders() == []
+
+            await asyncio.sleep(1.0)
+            assert state.document_store.ready and state.apple_calendar_store.ready
+            assert state.memory_store.get_scheduled_task_by_name("alert_eval") is not None
+            assert state.calendar_store is not None
+            phases = {p["phase"] for p in state.startup_timeline.to_list()}
+            assert {"imports", "memory_store", "m365_connectivity", "default_tasks"} <= phases
+
+    @pytest.mark.asyncio
+    async def test_eager_mode_finishes_warm_up_before_serving(self, slow_subsystems, monkeypatch):
+        monkeypatch.setattr("config.MCP_LAZY_STARTUP", False)
+        async with mcp_server.app_lifespan(None):
+            state = mcp_server._state
+            assert state.document_store.ready and state.reminder_store.ready
+            assert state.memory_store.get_scheduled_task_by_name("usage_rollup") is not None
@@ -0,0 +1,114 @@
+"""Tests for memory/connection.py — writer connection, read pool, transactions."""
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from memory.connection import ConnectionManager
+from memory.models import Fact
+from memory.store import MemoryStore
+
+
+@pytest.fixture
+def manager(tmp_path):
+    mgr = ConnectionManager(tmp_path / "conn.db", read_pool_size=2)
+    mgr.conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+    mgr.conn.commit()
+    yield mgr
+    mgr.close()
+
+
+class TestReaders:
+    def test_reader_is_read_only_and_separate(self, manager):
+        reader = manager.reader()
+        assert reader is not manager.conn
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("INSERT INTO t (v) VALUES ('x')")
+
+    def test_reader_is_reused_per_thread(self, manager):
+        assert manager.reader() is manager.reader()
+
+    def test_reader_sees_committed_writes(self, manager):
+        reader = manager.reader()
+        manager.conn.execute("INSERT INTO t (v) VALUES ('a')")
+        manager.conn.commit()
+        assert reader.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+
+    def test_reads_inside_write_lock_use_writer(self, manager):
+        with manager.lock:
+            manager.conn.execute("INSERT INTO t (v) VALUES ('uncommitted')")
+            assert manager.reader() is manager.conn
+            assert manager.reader().execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+            manager.conn.rollback()
+
+    def test_pool_exhaustion_falls_back_to_writer(self, manager):
+        barrier = threading.Barrier(3)
+
+        def grab():
+            conn = manager.reader()
+            barrier.wait()
+            return conn
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            conns = list(pool.map(lambda _: grab(), range(3)))
+        readers = [c for c in conns if c is not manager.conn]
+        assert len(readers) == 2
+        assert len({id(c) for c in readers}) == 2
+
+    def test_in_memory_database_uses_writer(self):
+        mgr = ConnectionManager(":memory:")
+        try:
+            assert mgr.reader() is mgr.conn
+        finally:
+            mgr.close()
+
+
+class TestTransactions:
+    def test_commit(self, manager):
+        with manager.transaction() as conn:
+            conn.execute("INSERT INTO t (v) VALUES ('a')")
+            conn.execute("INSERT INTO t (v) VALUES ('b')")
+        assert manager.reader().execute("SELECT COUNT(*) FROM t").fetchone()[0] == 2
+
+    def test_rollback_on_error(self, manager):
+        with pytest.raises(RuntimeError):
+            with manager.transaction() as conn:
+                conn.execute("INSERT INTO t (v) VALUES ('a')")
+                raise RuntimeError("boom")
+        assert manager.reader().execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_nested_transaction_commits_once(self, manager):
+        with manager.transaction() as outer:
+            outer.execute("INSERT INTO t (v) VALUES ('a')")
+            with manager.transaction() as inner:
+                inner.execute("INSERT INTO t (v) VALUES ('b')")
+            assert manager.conn.in_transaction
+        assert not manager.conn.in_transaction
+
+
+class TestMemoryStoreIntegration:
+    def test_concurrent_reads_use_pooled_connections(self, tmp_path):
+        store = MemoryStore(tmp_path / "test.db", read_pool_size=5)
+        store.store_fact(Fact(category="work", key="k", value="v"))
+        seen = set()
+        lock = threading.Lock()
+
+        def read(_):
+            assert store.get_fact("work", "k").value == "v"
+            with lock:
+                seen.add(id(store.reader()))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(read, range(40)))
+        assert id(store.conn) not in seen
+        assert 1 <= store.connection_manager.open_reader_count <= 5
+        store.close()
+
+    def test_store_transaction_helper(self, tmp_path):
+        store = MemoryStore(tmp_path / "test.db")
+        with store.transaction() as conn:
+            conn.execute("INSERT INTO locations (name) VALUES ('home')")
+            conn.execute("INSERT INTO locations (name) VALUES ('office')")
+        assert {loc.name for loc in store.list_locations()} == {"home", "office"}
+        store.close()
@@ -0,0 +1,185 @@
+"""Tests for memory/migrations.py — versioned migrations and hot-path query plans."""
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from memory.migrations import (
+    HOT_PATH_INDEXES,
+    LATEST_VERSION,
+    MIGRATIONS,
+    Migration,
+    apply_migrations,
+    get_schema_version,
+)
+from memory.models import Decision, Delegation, ScheduledTask, WebhookEvent
+from memory.store import MemoryStore
+
+
+class TestMigrations:
+    def test_new_database_is_at_latest_version(self, memory_store):
+        assert memory_store.schema_version == LATEST_VERSION
+        indexes = {
+            row[0] for row in memory_store.conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        }
+        assert set(HOT_PATH_INDEXES) <= indexes
+
+    def test_versions_are_unique_and_increasing(self):
+        versions = [m.version for m in MIGRATIONS]
+        assert versions == sorted(set(versions))
+
+    def test_reopen_applies_nothing(self, tmp_path):
+        MemoryStore(tmp_path / "m.db").close()
+        conn = sqlite3.connect(tmp_path / "m.db")
+        assert apply_migrations(conn) == []
+        conn.close()
+
+    def test_unversioned_database_with_existing_columns(self, tmp_path):
+        """Databases from before versioning already have some migrated columns."""
+        store = MemoryStore(tmp_path / "m.db")
+        store.conn.execute("PRAGMA user_version = 0")
+        store.conn.commit()
+        store.close()
+
+        store = MemoryStore(tmp_path / "m.db")
+        assert store.schema_version == LATEST_VERSION
+        store.close()
+
+    def test_usage_logs_rebuilt_with_autoincrement(self, tmp_path):
+        """Legacy usage logs reuse ids after a full prune; the rebuild stops that."""
+        store = MemoryStore(tmp_path / "m.db")
+        conn = store.conn
+        conn.execute("DROP TABLE tool_usage_log")
+        conn.execute(
+            "CREATE TABLE tool_usage_log (id INTEGER PRIMARY KEY, tool_name TEXT NOT NULL, "
+            "query_pattern TEXT NOT NULL DEFAULT 'auto', success INTEGER NOT NULL DEFAULT 1, "
+            "duration_ms INTEGER, session_id TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, "
+            "response_size_bytes INTEGER)"
+        )
+        conn.execute("CREATE INDEX idx_tool_usage_log_tool ON tool_usage_log(tool_name)")
+        conn.execute("INSERT INTO tool_usage_log (id, tool_name) VALUES (3, 'a')")
+        conn.execute("INSERT INTO usage_rollup_state (source, last_id) VALUES ('tool_usage_log', 7)")
+        conn.execute("PRAGMA user_version = 9")
+        conn.commit()
+        store.close()
+
+        store = MemoryStore(tmp_path / "m.db")
+        conn = store.conn
+        table_sql = conn.execute("SELECT sql FROM sqlite_master WHERE name='tool_usage_log'").fetchone()[0]
+        assert "AUTOINCREMENT" in table_sql
+        assert conn.execute("SELECT tool_name FROM tool_usage_log WHERE id=3").fetchone()[0] == "a"
+        assert conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name='idx_tool_usage_log_tool'"
+        ).fetchone() is not None
+        conn.execute("DELETE FROM tool_usage_log")
+        conn.execute("INSERT INTO tool_usage_log (tool_name) VALUES ('b')")
+        assert conn.execute("SELECT id FROM tool_usage_log").fetchone()[0] == 8
+        store.close()
+
+    def test_failed_migration_rolls_back(self, tmp_path):
+        conn = sqlite3.connect(tmp_path / "m.db")
+        conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+        conn.commit()
+
+        def broken(c):
+            c.execute("ALTER TABLE t ADD COLUMN a TEXT")
+            c.execute("ALTER TABLE missing ADD COLUMN b TEXT")
+
+        migrations = (
+            Migration(1, "ok", lambda c: c.execute("CREATE INDEX idx_t ON t(id)")),
+            Migration(2, "broken", broken),
+        )
+        with pytest.raises(sqlite3.OperationalError):
+            apply_migrations(conn, migrations)
+        assert get_schema_version(conn) == 1
+        assert "a" not in {row[1] for row in conn.execute("PRAGMA table_info(t)")}
+        conn.close()
+
+
+def _query_plans(store, call) -> list[tuple[str, str]]:
+    """Run *call* and return (sql, plan) for every SELECT it issued on this thread's reader."""
+    statements: list[str] = []
+    reader = store.reader()
+    reader.set_trace_callback(statements.append)
+    try:
+        call()
+    finally:
+        reader.set_trace_callback(None)
+    plans = []
+    for sql in statements:
+        if not sql.lstrip().upper().startswith("SELECT"):
+            continue
+        detail = " | ".join(row[3] for row in store.conn.execute(f"EXPLAIN QUERY PLAN {sql}"))
+        plans.append((sql, detail))
+    assert plans, "no SELECT statements captured"
+    return plans
+
+
+def _assert_uses_index(store, call, index_name):
+    plans = _query_plans(store, call)
+    assert any(index_name in plan for _, plan in plans), f"{index_name} not used: {plans}"
+    for sql, plan in plans:
+        full_scans = [step for step in plan.split(" | ") if step.startswith("SCAN") and "USING" not in step]
+        assert not full_scans, f"{sql!r} scans a table: {plan}"
+
+
+@pytest.fixture
+def populated(memory_store):
+    memory_store.store_webhook_event(WebhookEvent(source="github", event_type="push", payload="{}"))
+    memory_store.store_delegation(Delegation(task="t", delegated_to="alice", due_date="2026-01-01"))
+    memory_store.store_decision(Decision(title="d"))
+    memory_store.store_scheduled_task(ScheduledTask(
+        name="job", schedule_type="interval", schedule_config='{"minutes": 5}',
+        next_run_at=datetime.now().isoformat(),
+    ))
+    memory_store.store_shared_memory("team", "insight", "k", "v")
+    memory_store.link_identity("Alice", "email", "alice@example.com", email="alice@example.com")
+    return memory_store
+
+
+class TestHotPathQueryPlans:
+    def test_webhook_events_by_status(self, populated):
+        _assert_uses_index(
+            populated, lambda: populated.list_webhook_events(status="pending"), "idx_webhook_events_status",
+        )
+
+    def test_webhook_events_by_source(self, populated):
+        _assert_uses_index(
+            populated, lambda: populated.list_webhook_events(source="github"), "idx_webhook_events_source",
+        )
+
+    def test_webhook_events_recent(self, populated):
+        _assert_uses_index(populated, lambda: populated.list_webhook_events(), "idx_webhook_events_received")
+
+    def test_delegations_by_status(self, populated):
+        _assert_uses_index(
+            populated, lambda: populated.list_delegations(status="active"), "idx_delegations_status_due",
+        )
+
+    def test_overdue_delegations(self, populated):
+        _assert_uses_index(populated, populated.list_overdue_delegations, "idx_delegations_status_due")
+
+    def test_decisions_by_status(self, populated):
+        _assert_uses_index(
+            populated, lambda: populated.list_decisions_by_status("pending_execution"), "idx_decisions_status",
+        )
+
+    def test_due_scheduled_tasks(self, populated):
+        _assert_uses_index(populated, populated.get_due_tasks, "idx_scheduled_tasks_due")
+
+    def test_agent_memory_by_namespace(self, populated):
+        _assert_uses_index(
+            populated,
+            lambda: populated.get_shared_memories("team", memory_type="insight"),
+            "idx_agent_memory_namespace",
+        )
+
+    def test_identity_by_email(self, populated):
+        _assert_uses_index(
+            populated, lambda: populated.resolve_sender("slack", "alice@example.com"), "idx_identities_email",
+        )
+
+    def test_context_by_session(self, populated):
+        _assert_uses_index(
+            populated, lambda: populated.list_context(session_id="s1"), "idx_context_session",
+        )
@@ -282,3 +282,77 @@ def test_query_objectives_include_blended_pct(store, blended_snapshot):
     assert obj["blended_pct"] == pytest.approx(0.24, abs=1e-9)
     assert obj["kr_avg_pct"] == pytest.approx(0.20, abs=1e-9)
     assert obj["initiative_avg_pct"] == pytest.approx(0.30, abs=1e-9)
+
+
+# ---------------------------------------------------------------------------
+# Cached snapshot and indexes
+# ---------------------------------------------------------------------------
+
+def _count_reads(monkeypatch):
+    import okr.store as store_module
+    reads = []
+    real = store_module.locked_read
+
+    def counting(*args, **kwargs):
+        reads.append(args[0])
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(store_module, "locked_read", counting)
+    return reads
+
+
+def test_queries_reuse_cached_snapshot(store, sample_snapshot, monkeypatch):
+    store.save(sample_snapshot)
+    reads = _count_reads(monkeypatch)
+
+    store.query(team="Security")
+    store.query(text="training")
+    store.executive_summary()
+    store.load_latest()
+    assert len(reads) == 1
+
+
+def test_cache_reloads_when_file_changes(store, sample_snapshot, monkeypatch):
+    store.save(sample_snapshot)
+    assert store.executive_summary()["objectives_count"] == 3
+    reads = _count_reads(monkeypatch)
+
+    # Written by another process: only the file changes, not this store's state.
+    other = OKRStore(store._data_dir)
+    sample_snapshot.objectives = sample_snapshot.objectives[:1]
+    other.save(sample_snapshot)
+
+    assert store.executive_summary()["objectives_count"] == 1
+    assert len(reads) == 1
+
+
+def test_results_do_not_share_cached_rows(store, sample_snapshot):
+    store.save(sample_snapshot)
+    first = store.query(okr_id="OKR 1")
+    first["objectives"][0]["name"] = "changed"
+    first["key_results"].clear()
+    store.executive_summary()["objectives_summary"][0]["name"] = "changed"
+
+    second = store.query(okr_id="OKR 1")
+    assert second["objectives"][0]["name"] == "Security Controls"
+    assert len(second["key_results"]) == 2
+    assert store.executive_summary()["objectives_summary"][0]["name"] == "Security Controls"
+
+
+def test_text_search_keeps_substring_semantics(store, sample_snapshot):
+    store.save(sample_snapshot)
+    # Partial words and phrases spanning words match like a plain substring search.
+    assert [i["name"] for i in store.query(text="rain")["initiatives"]] == ["Security Training"]
+    assert [i["name"] for i in store.query(text="ity TRAIN")["initiatives"]] == ["Security Training"]
+    assert store.query(text="training security")["initiatives"] == []
+    assert [o["okr_id"] for o in store.query(text="earn")["objectives"]] == ["OKR 1"]
+
+
+def test_combined_filters_match_linear_filtering(store, sample_snapshot):
+    store.save(sample_snapshot)
+    result = store.query(team="security", status="on track", text="a")
+    assert [o["okr_id"] for o in result["objectives"]] == ["OKR 1", "OKR 3"]
+    assert [kr["kr_id"] for kr in result["key_results"]] == ["KR 1.1", "KR 3.1"]
+    assert [i["initiative_id"] for i in result["initiatives"]] == ["ISP-001", "ISP-004", "ISP-005"]
+    # Blended values still cover every KR of the OKR, including other teams'.
+    assert result["objectives"][0]["kr_avg_pct"] == pytest.approx(15.0)
@@ -0,0 +1,74 @@
+"""Tests for proactive/document_index.py — incremental stale-document scanning."""
+import os
+import time
+
+from proactive.document_index import ROOT_BUCKET, DocumentAgeIndex
+
+DAY = 86400
+
+
+def _file(path, age_days):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("x")
+    past = time.time() - age_days * DAY
+    os.utime(path, (past, past))
+    return path
+
+
+def _settle(*dirs):
+    """Backdate directory mtimes so the index trusts them on the next pass."""
+    past = time.time() - 60
+    for d in dirs:
+        os.utime(d, (past, past))
+
+
+def _tree(root):
+    _file(root / "old.txt", 100)
+    _file(root / "new.txt", 1)
+    _file(root / "Meeting_Prep" / "a.md", 20)
+    _file(root / "Meeting_Prep" / "2026" / "b.md", 30)
+    _file(root / "Meeting_Prep" / "c.md", 5)
+    _file(root / "Other" / "d.md", 95)
+    _file(root / "_archive" / "e.md", 400)
+    _settle(root, root / "Meeting_Prep", root / "Meeting_Prep" / "2026", root / "Other", root / "_archive")
+
+
+class TestDocumentAgeIndex:
+    def test_counts_stale_files_per_bucket(self, tmp_path):
+        _tree(tmp_path)
+        counts = DocumentAgeIndex(str(tmp_path)).stale_counts({"Meeting_Prep": 14}, 90)
+        assert counts == {
+            ROOT_BUCKET: {"count": 1, "threshold": 90},
+            "Meeting_Prep": {"count": 2, "threshold": 14},
+            "Other": {"count": 1, "threshold": 90},
+        }
+
+    def test_unchanged_directories_are_not_rescanned(self, tmp_path):
+        _tree(tmp_path)
+        index = DocumentAgeIndex(str(tmp_path))
+        first = index.stale_counts({"Meeting_Prep": 14}, 90)
+        assert index.last_refresh_stats["rescanned"] == 4
+
+        assert index.stale_counts({"Meeting_Prep": 14}, 90) == first
+        assert (index.last_refresh_stats["directories"], index.last_refresh_stats["rescanned"]) == (4, 0)
+
+    def test_new_file_rescans_only_its_directory(self, tmp_path):
+        _tree(tmp_path)
+        index = DocumentAgeIndex(str(tmp_path))
+        index.stale_counts({}, 90)
+        _file(tmp_path / "Other" / "f.md", 200)
+
+        counts = index.stale_counts({}, 90)
+        assert counts["Other"]["count"] == 2
+        assert index.last_refresh_stats["rescanned"] == 1
+
+    def test_file_rewritten_in_place_is_no_longer_stale(self, tmp_path):
+        _tree(tmp_path)
+        index = DocumentAgeIndex(str(tmp_path))
+        assert index.stale_counts({}, 90)["Other"]["count"] == 1
+
+        os.utime(tmp_path / "Other" / "d.md")  # directory mtime is unchanged
+        assert "Other" not in index.stale_counts({}, 90)
+
+    def test_missing_root(self, tmp_path):
+        assert DocumentAgeIndex(str(tmp_path / "nope")).stale_counts({}, 90) == {}
@@ -1,5 +1,8 @@
 """Tests for the proactive suggestion engine."""
 
+import os
+import threading
+import time
 from datetime import date, datetime, timedelta
 
 import pytest
@@ -7,7 +10,7 @@ import pytest
 from memory.models import Decision, Delegation, SkillSuggestion, WebhookEvent
 from memory.store import MemoryStore
 from mcp_tools.state import SessionHealth
-from proactive.engine import ProactiveSuggestionEngine
+from proactive.engine import CHECKS, ProactiveSuggestionEngine
 from session.brain import SessionBrain
 
 
@@ -342,3 +345,99 @@ class TestCheckKnowledgeLintFindings:
         assert len(result) >= 1
         assert result[0].category == "knowledge"
         assert result[0].priority == "low"
+
+
+class TestConcurrentChecks:
+    def test_check_all_reports_timings_for_every_check(self, engine):
+        result = engine.check_all(push_enabled=False)
+        assert set(result["check_timings"]) == {spec.name for spec in CHECKS}
+        assert all(t["status"] == "ok" for t in result["check_timings"].values())
+
+    def test_db_checks_cached_until_database_changes(self, memory_store, engine):
+        engine.generate_suggestions()
+        assert engine.last_check_timings["overdue_delegations"]["status"] == "ok"
+
+        engine.generate_suggestions()
+        assert engine.last_check_timings["overdue_delegations"]["status"] == "cached"
+        assert engine.last_check_timings["session_brain_items"]["status"] == "ok"  # never cached
+
+        # Cache is shared with new engines on the same store and dropped on write.
+        yesterday = (date.today() - timedelta(days=1)).isoformat()
+        memory_store.store_delegation(Delegation(task="late", delegated_to="bob", due_date=yesterday))
+        other = ProactiveSuggestionEngine(memory_store)
+        assert any(s.title == "Overdue: late" for s in other.generate_suggestions())
+        assert other.last_check_timings["overdue_delegations"]["status"] == "ok"
+
+    def test_unrelated_writes_keep_db_checks_cached(self, memory_store, engine):
+        engine.generate_suggestions()
+        memory_store.log_tool_invocation("query_memory")
+        memory_store.flush_telemetry()
+        memory_store.store_delegation(Delegation(task="later", delegated_to="bob"))
+
+        engine.generate_suggestions()
+        timings = engine.last_check_timings
+        assert timings["stale_decisions"]["status"] == "cached"
+        assert timings["knowledge_lint_findings"]["status"] == "cached"
+        assert timings["overdue_delegations"]["status"] == "ok"
+
+    def test_writes_from_another_connection_drop_cached_results(self, memory_store, engine):
+        engine.generate_suggestions()
+        other = MemoryStore(memory_store.db_path)
+        try:
+            other.store_decision(Decision(title="elsewhere"))
+        finally:
+            other.close()
+
+        engine.generate_suggestions()
+        assert engine.last_check_timings["stale_decisions"]["status"] == "ok"
+        assert engine.last_check_timings["overdue_delegations"]["status"] == "cached"
+
+    def test_slow_check_times_out_without_blocking_others(self, memory_store):
+        release = threading.Event()
+        yesterday = (date.today() - timedelta(days=1)).isoformat()
+        memory_store.store_delegation(Delegation(task="late", delegated_to="bob", due_date=yesterday))
+        engine = ProactiveSuggestionEngine(memory_store, check_timeout=0.2)
+
+        def slow():
+            release.wait(5)
+            return []
+
+        engine._check_knowledge_lint_findings = slow
+        started = time.monotonic()
+        suggestions = engine.generate_suggestions()
+        assert time.monotonic() - started < 2
+        assert engine.last_check_timings["knowledge_lint_findings"]["status"] == "timeout"
+        assert any(s.title == "Overdue: late" for s in suggestions)
+
+        # The background run finishes and fills the cache for the next pass.
+        release.set()
+        for _ in range(50):
+            engine.generate_suggestions()
+            if engine.last_check_timings["knowledge_lint_findings"]["status"] == "cached":
+                break
+            time.sleep(0.02)
+        assert engine.last_check_timings["knowledge_lint_findings"]["status"] == "cached"
+
+    def test_failing_check_is_isolated(self, memory_store, engine):
+        memory_store.store_skill_suggestion(SkillSuggestion(description="p", suggested_name="s"))
+
+        def boom():
+            raise RuntimeError("broken")
+
+        engine._check_unprocessed_webhooks = boom
+        suggestions = engine.generate_suggestions()
+        assert engine.last_check_timings["unprocessed_webhooks"]["status"] == "error"
+        assert any(s.category == "skill" for s in suggestions)
+
+    def test_stale_documents_from_index(self, tmp_path, engine, monkeypatch):
+        root = tmp_path / "Jarvis"
+        (root / "Meeting_Prep").mkdir(parents=True)
+        old = root / "Meeting_Prep" / "prep.md"
+        old.write_text("x")
+        past = time.time() - 30 * 86400
+        os.utime(old, (past, past))
+        monkeypatch.setattr("proactive.engine.JARVIS_OUTPUT_DIR", str(root))
+
+        (suggestion,) = engine._check_stale_documents()
+        assert suggestion.title == "1 stale document(s) in Meeting_Prep"
+        assert "14 days" in suggestion.description
@@ -117,13 +117,21 @@ def _mock_page_with_download(mock_download):
     return mock_page
 
 
-def _mock_manager(mock_page):
-    """Create a mock manager that returns a browser with one context + page."""
+def _mock_manager(mock_page, request=None):
+    """Create a mock manager that returns a browser with one context + page.
+
+    Without *request*, the HTTP strategy is refused (HTTP 403) so the
+    browser download strategies run.
+    """
     manager = MagicMock()
     manager.is_alive.return_value = True
 
     mock_ctx = MagicMock()
     mock_ctx.new_page = AsyncMock(return_value=mock_page)
+    if request is None:
+        request = MagicMock()
+        request.head = AsyncMock(return_value=MagicMock(status=403, headers={}, dispose=AsyncMock()))
+    mock_ctx.request = request
 
     mock_browser = MagicMock()
     mock_browser.contexts = [mock_ctx]
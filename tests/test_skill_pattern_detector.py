@@ -1,4 +1,6 @@
 # tests/test_skill_pattern_detector.py
+import random
+
 import pytest
 
 from memory.store import MemoryStore
@@ -117,3 +119,64 @@ class TestPatternDetector:
         patterns = detector.detect_patterns(min_occurrences=5, confidence_threshold=0.0)
         assert len(patterns) == 1
         assert patterns[0]["total_count"] == 8
+
+
+class TestIncrementalClusters:
+    def _seed(self, store, rows):
+        for tool, pattern, count in rows:
+            for _ in range(count):
+                store.queue_skill_usage(tool, pattern)
+        store.flush_telemetry()
+
+    def test_first_build_matches_from_scratch_clustering(self, memory_store):
+        rng = random.Random(5)
+        vocab = ["search", "work", "tasks", "projects", "calendar", "weekly", "meeting", "notes", "email", "draft"]
+        rows = {
+            (rng.choice(["query_memory", "search_calendar"]), " ".join(rng.sample(vocab, rng.randint(2, 4))))
+            for _ in range(80)
+        }
+        self._seed(memory_store, [(tool, pattern, rng.randint(1, 9)) for tool, pattern in sorted(rows)])
+
+        memory_store.update_skill_clusters(0.4)
+        incremental = memory_store.list_skill_clusters()
+        usage = sorted(memory_store.get_skill_usage_patterns(), key=lambda r: -r["count"])
+        scratch = _cluster_patterns(usage, similarity_threshold=0.4)
+
+        def key(clusters):
+            return sorted((c["tool_name"], c["representative"], c["total_count"], sorted(c["patterns"])) for c in clusters)
+
+        assert key(incremental) == key(scratch)
+
+    def test_only_new_activity_is_examined(self, memory_store):
+        self._seed(memory_store, [("query_memory", f"pattern {i}", 1) for i in range(50)])
+        detector = PatternDetector(memory_store)
+        detector.detect_patterns()
+        assert detector.last_update_stats["assigned"] == 50
+
+        memory_store.conn.execute("UPDATE skill_usage SET last_used='2020-01-01T00:00:00'")
+        memory_store.conn.commit()
+        memory_store.record_skill_usage("query_memory", "pattern 3")
+        memory_store.record_skill_usage("query_memory", "brand new thing")
+        detector.detect_patterns()
+        stats = detector.last_update_stats
+        assert (stats["examined"], stats["updated"], stats["assigned"]) == (2, 1, 1)
+
+    def test_increments_and_new_patterns_update_clusters(self, memory_store):
+        self._seed(memory_store, [("query_memory", "search work projects", 4)])
+        detector = PatternDetector(memory_store)
+        assert detector.detect_patterns(min_occurrences=5, confidence_threshold=0.0) == []
+
+        self._seed(memory_store, [("query_memory", "search work tasks", 2), ("query_memory", "search work projects", 1)])
+        (pattern,) = detector.detect_patterns(min_occurrences=5, confidence_threshold=0.0)
+        assert pattern["total_count"] == 7
+        assert pattern["patterns"] == ["search work projects", "search work tasks"]
+        assert detector.last_update_stats["clusters_created"] == 0
+
+    def test_threshold_change_rebuilds(self, memory_store):
+        self._seed(memory_store, [("query_memory", "search work projects", 3), ("query_memory", "search work tasks", 3)])
+        memory_store.update_skill_clusters(0.4)
+        assert len(memory_store.list_skill_clusters()) == 1
+
+        stats = memory_store.update_skill_clusters(0.9)
+        assert stats["rebuilt"]
+        assert len(memory_store.list_skill_clusters()) == 2
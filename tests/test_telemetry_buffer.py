@@ -0,0 +1,122 @@
+"""Tests for memory/telemetry_buffer.py — write-behind telemetry rows."""
+import sqlite3
+import time
+
+import pytest
+
+from memory.store import MemoryStore
+from memory.telemetry_buffer import TelemetryBuffer
+
+
+@pytest.fixture
+def store(tmp_path):
+    # Long interval and high row threshold so rows stay buffered until flushed.
+    store = MemoryStore(
+        tmp_path / "test.db",
+        telemetry_options={"flush_interval_ms": 60_000, "flush_rows": 10_000},
+    )
+    yield store
+    store.close()
+
+
+def _raw_count(store, table):
+    conn = sqlite3.connect(store.db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestBuffering:
+    def test_rows_are_not_written_on_the_caller_thread(self, store):
+        store.log_tool_invocation("query_memory", success=True, duration_ms=5)
+        store.log_api_call("sonnet", 10, 5, agent_name="a")
+        assert _raw_count(store, "tool_usage_log") == 0
+        assert _raw_count(store, "agent_api_log") == 0
+        assert store.get_telemetry_stats()["buffered"] == 2
+
+    def test_flush_writes_all_rows_in_one_transaction(self, store):
+        for i in range(5):
+            store.log_tool_invocation("search_mail", query_pattern=f"q{i}")
+        store.log_api_call("haiku", 1, 1)
+        assert store.flush_telemetry() == 6
+        stats = store.get_telemetry_stats()
+        assert stats["flushes"] == 1
+        assert stats["buffered"] == 0
+        assert _raw_count(store, "tool_usage_log") == 5
+
+    def test_reads_flush_pending_rows(self, store):
+        store.log_tool_invocation("list_locations")
+        store.log_api_call("sonnet", 100, 50, caller="test")
+        assert len(store.get_tool_usage_log(tool_name="list_locations")) == 1
+        assert store.get_api_usage_log(caller="test")[0]["input_tokens"] == 100
+
+    def test_skill_usage_increments_are_coalesced(self, store):
+        for _ in range(3):
+            store.queue_skill_usage("query_memory", "weekly")
+        store.queue_skill_usage("search_mail", "invoice")
+        counts = {p["tool_name"]: p["count"] for p in store.get_skill_usage_patterns()}
+        assert counts == {"query_memory": 3, "search_mail": 1}
+
+    def test_record_skill_usage_includes_buffered_increments(self, store):
+        store.queue_skill_usage("query_memory", "weekly")
+        assert store.record_skill_usage("query_memory", "weekly").count == 2
+
+
+class TestFlusher:
+    def test_background_flush_after_interval(self, tmp_path):
+        store = MemoryStore(tmp_path / "test.db", telemetry_options={"flush_interval_ms": 10})
+        try:
+            store.log_tool_invocation("query_memory")
+            deadline = time.monotonic() + 5
+            while _raw_count(store, "tool_usage_log") == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert _raw_count(store, "tool_usage_log") == 1
+        finally:
+            store.close()
+
+    def test_row_threshold_triggers_flush(self, tmp_path):
+        store = MemoryStore(
+            tmp_path / "test.db",
+            telemetry_options={"flush_interval_ms": 60_000, "flush_rows": 3},
+        )
+        try:
+            for _ in range(4):
+                store.log_tool_invocation("query_memory")
+            deadline = time.monotonic() + 5
+            while _raw_count(store, "tool_usage_log") < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert _raw_count(store, "tool_usage_log") >= 3
+        finally:
+            store.close()
+
+    def test_close_drains_buffer(self, tmp_path):
+        store = MemoryStore(
+            tmp_path / "test.db",
+            telemetry_options={"flush_interval_ms": 60_000, "flush_rows": 10_000},
+        )
+        for _ in range(25):
+            store.log_api_call("sonnet", 1, 1)
+        store.close()
+        assert _raw_count(store, "agent_api_log") == 25
+
+
+class TestBounds:
+    def test_full_buffer_drops_oldest_and_counts(self, store):
+        buffer = TelemetryBuffer(
+            store.connection_manager, max_rows=3, flush_interval_ms=60_000, flush_rows=100,
+        )
+        for i in range(5):
+            buffer.log_tool_invocation("t", query_pattern=f"q{i}")
+        assert buffer.stats()["dropped"] == 2
+        buffer.close()
+        patterns = [r["query_pattern"] for r in store.get_tool_usage_log(tool_name="t")]
+        assert sorted(patterns) == ["q2", "q3", "q4"]
+
+    def test_rows_after_close_are_dropped(self, store):
+        buffer = TelemetryBuffer(store.connection_manager)
+        buffer.close()
+        buffer.log_api_call("sonnet", 1, 1)
+        assert buffer.stats() == {
+            "buffered": 0, "capacity": 10_000, "flushed": 0, "flushes": 0, "dropped": 1,
+        }
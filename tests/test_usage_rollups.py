@@ -0,0 +1,159 @@
+"""Tests for memory/usage_rollup_store.py — usage rollups and raw-log retention."""
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from scheduler.handlers import execute_handler
+
+
+def _backdate(store, table, days):
+    """Move every raw row in *table* back by *days*."""
+    rows = store.conn.execute(f"SELECT id, created_at FROM {table}").fetchall()
+    for row in rows:
+        shifted = datetime.fromisoformat(row["created_at"]) - timedelta(days=days)
+        store.conn.execute(f"UPDATE {table} SET created_at=? WHERE id=?", (shifted.isoformat(), row["id"]))
+    store.conn.commit()
+
+
+def _raw_count(store, table):
+    return store.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+@pytest.fixture
+def tool_usage(memory_store):
+    memory_store.log_tool_invocation("query_memory", "weekly", success=True, duration_ms=10, response_size_bytes=500)
+    memory_store.log_tool_invocation("query_memory", "weekly", success=False, duration_ms=30)
+    memory_store.log_tool_invocation("search_mail", "invoice", success=True, duration_ms=20, response_size_bytes=100)
+    memory_store.log_tool_invocation("search_mail", "auto", success=True)
+    memory_store.flush_telemetry()
+    return memory_store
+
+
+class TestToolUsageRollups:
+    def test_rollup_preserves_stats_and_patterns(self, tool_usage):
+        before_stats = tool_usage.get_tool_stats_summary()
+        before_patterns = tool_usage.get_top_patterns_by_tool()
+
+        result = tool_usage.rollup_usage(raw_retention_days=None)
+
+        assert result["tool_usage_log"]["rolled_up"] == 4
+        assert tool_usage.get_tool_stats_summary() == before_stats
+        assert tool_usage.get_top_patterns_by_tool() == before_patterns
+
+    def test_stats_combine_rollups_and_raw_tail(self, tool_usage):
+        tool_usage.rollup_usage(raw_retention_days=None)
+        tool_usage.log_tool_invocation("query_memory", "weekly", success=True, duration_ms=20)
+
+        stats = {s["tool_name"]: s for s in tool_usage.get_tool_stats_summary()}
+        qm = stats["query_memory"]
+        assert qm["total_calls"] == 3
+        assert qm["success_count"] == 2
+        assert qm["failure_count"] == 1
+        assert qm["avg_duration_ms"] == 20.0
+        assert qm["max_response_size_bytes"] == 500
+        assert tool_usage.get_top_patterns_by_tool()["query_memory"] == [{"pattern": "weekly", "count": 3}]
+
+    def test_rollup_is_incremental(self, tool_usage):
+        tool_usage.rollup_usage(raw_retention_days=None)
+        assert tool_usage.rollup_usage(raw_retention_days=None)["tool_usage_log"]["rolled_up"] == 0
+        tool_usage.log_tool_invocation("search_mail", "invoice")
+        assert tool_usage.rollup_usage(raw_retention_days=None)["tool_usage_log"]["rolled_up"] == 1
+        stats = {s["tool_name"]: s for s in tool_usage.get_tool_stats_summary()}
+        assert stats["search_mail"]["total_calls"] == 3
+
+    def test_retention_prunes_rolled_up_raw_rows_only(self, tool_usage):
+        _backdate(tool_usage, "tool_usage_log", days=40)
+        before = tool_usage.get_tool_stats_summary()
+        tool_usage.log_tool_invocation("query_memory", "recent")
+        tool_usage.flush_telemetry()
+
+        result = tool_usage.rollup_usage(raw_retention_days=30)
+
+        assert result["tool_usage_log"]["pruned_raw"] == 4
+        assert _raw_count(tool_usage, "tool_usage_log") == 1
+        stats = {s["tool_name"]: s for s in tool_usage.get_tool_stats_summary()}
+        assert stats["query_memory"]["total_calls"] == 3
+        assert stats["search_mail"] == next(s for s in before if s["tool_name"] == "search_mail")
+
+    def test_full_prune_then_new_rows_are_rolled_up(self, tool_usage):
+        _backdate(tool_usage, "tool_usage_log", days=40)
+        tool_usage.rollup_usage(raw_retention_days=30)
+        assert _raw_count(tool_usage, "tool_usage_log") == 0
+
+        tool_usage.log_tool_invocation("search_mail", "invoice")
+        tool_usage.flush_telemetry()
+        stats = {s["tool_name"]: s for s in tool_usage.get_tool_stats_summary()}
+        assert stats["search_mail"]["total_calls"] == 3
+
+        result = tool_usage.rollup_usage(raw_retention_days=30)
+        assert result["tool_usage_log"]["rolled_up"] == 1
+        assert result["tool_usage_log"]["last_id"] == 5
+
+        tool_usage.conn.execute("DELETE FROM tool_usage_log")
+        tool_usage.conn.commit()
+        assert tool_usage.rollup_usage(raw_retention_days=30)["tool_usage_log"]["last_id"] == 5
+        stats = {s["tool_name"]: s for s in tool_usage.get_tool_stats_summary()}
+        assert stats["search_mail"]["total_calls"] == 3
+
+    def test_hourly_rollups_expire_daily_rollups_kept(self, tool_usage):
+        _backdate(tool_usage, "tool_usage_log", days=120)
+        tool_usage.rollup_usage(raw_retention_days=30, hourly_retention_days=90)
+        granularities = {
+            row[0] for row in tool_usage.conn.execute("SELECT DISTINCT granularity FROM tool_usage_rollup")
+        }
+        assert granularities == {"day"}
+        assert sum(s["total_calls"] for s in tool_usage.get_tool_stats_summary()) == 4
+
+
+class TestApiUsageRollups:
+    def _log(self, store, n, agent="research", model="model-a"):
+        for _ in range(n):
+            store.log_api_call(model_id=model, input_tokens=100, output_tokens=10, duration_ms=50, agent_name=agent)
+        store.flush_telemetry()
+
+    def test_summary_unchanged_by_rollup_and_prune(self, memory_store):
+        self._log(memory_store, 3)
+        self._log(memory_store, 2, agent=None, model="model-b")
+        _backdate(memory_store, "agent_api_log", days=45)
+        self._log(memory_store, 1)
+        before = memory_store.get_api_usage_summary()
+
+        memory_store.rollup_usage(raw_retention_days=30)
+
+        assert _raw_count(memory_store, "agent_api_log") == 1
+        assert memory_store.get_api_usage_summary() == before
+        assert memory_store.get_api_usage_summary(agent_name="research")[0]["call_count"] == 4
+        none_agent = memory_store.get_api_usage_summary(model="model-b")[0]
+        assert none_agent["agent_name"] is None
+        assert none_agent["total_input_tokens"] == 200
+
+    def test_since_inside_retention_reads_raw_log(self, memory_store):
+        self._log(memory_store, 2)
+        _backdate(memory_store, "agent_api_log", days=45)
+        self._log(memory_store, 1)
+        memory_store.rollup_usage(raw_retention_days=30)
+
+        since = (datetime.now() - timedelta(days=1)).isoformat()
+        assert memory_store.get_api_usage_summary(since=since)[0]["call_count"] == 1
+
+    def test_since_past_retention_uses_rollups(self, memory_store):
+        self._log(memory_store, 2)
+        _backdate(memory_store, "agent_api_log", days=45)
+        self._log(memory_store, 1)
+        memory_store.rollup_usage(raw_retention_days=30)
+
+        since = (datetime.now() - timedelta(days=60)).isoformat()
+        assert memory_store.get_api_usage_summary(since=since)[0]["call_count"] == 3
+        since = (datetime.now() - timedelta(days=40)).isoformat()
+        assert memory_store.get_api_usage_summary(since=since)[0]["call_count"] == 1
+
+
+class TestUsageRollupHandler:
+    def test_handler_rolls_up_and_reports(self, tool_usage):
+        result = json.loads(execute_handler(
+            "usage_rollup", '{"raw_retention_days": 30}', memory_store=tool_usage,
+        ))
+        assert result["status"] == "ok"
+        assert result["sources"]["tool_usage_log"]["rolled_up"] == 4
+        assert tool_usage.get_rollup_state()["tool_usage_log"]["last_id"] == 4
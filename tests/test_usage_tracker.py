@@ -101,7 +101,7 @@ class TestUsageTracker:
 
         with patch.object(
             mcp_server._state.memory_store,
-            "record_skill_usage",
+            "queue_skill_usage",
             side_effect=Exception("db error"),
         ):
             result = await tracked_mcp.call_tool("list_locations", {})
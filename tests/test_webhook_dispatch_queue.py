@@ -0,0 +1,239 @@
+"""Tests for the webhook dispatch queue — leases, retries and dead-lettering."""
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from memory.models import WebhookEvent, WebhookStatus
+from memory.store import MemoryStore
+from webhook.dispatch_queue import DispatchWorker
+
+
+def _store_events(store, n, event_type="alert.fired"):
+    return store.store_webhook_events([
+        WebhookEvent(source="github", event_type=event_type, payload=str(i)) for i in range(n)
+    ])
+
+
+def _expire_lease(store, event_id):
+    past = (datetime.now() - timedelta(seconds=1)).isoformat()
+    store.conn.execute("UPDATE webhook_events SET lease_expires_at=? WHERE id=?", (past, event_id))
+    store.conn.commit()
+
+
+def _make_due(store, event_id):
+    past = (datetime.now() - timedelta(seconds=1)).isoformat()
+    store.conn.execute("UPDATE webhook_events SET next_attempt_at=? WHERE id=?", (past, event_id))
+    store.conn.commit()
+
+
+def _success(rule="rule", agent="agent"):
+    return {"rule_name": rule, "agent_name": agent, "status": "success", "result_text": "ok",
+            "duration_seconds": 0.0, "delivery_status": None}
+
+
+class TestClaims:
+    def test_claim_leases_oldest_first(self, memory_store):
+        events = _store_events(memory_store, 3)
+        claimed = memory_store.claim_webhook_events("w1", limit=2)
+        assert [e.id for e in claimed] == [events[0].id, events[1].id]
+        assert all(e.status == WebhookStatus.dispatching and e.attempts == 1 for e in claimed)
+        assert [e.id for e in memory_store.claim_webhook_events("w2", limit=5)] == [events[2].id]
+        assert memory_store.claim_webhook_events("w3") == []
+
+    def test_expired_lease_is_reclaimed(self, memory_store):
+        (event,) = _store_events(memory_store, 1)
+        memory_store.claim_webhook_events("crashed")
+        _expire_lease(memory_store, event.id)
+
+        (reclaimed,) = memory_store.claim_webhook_events("w2")
+        assert reclaimed.attempts == 2
+        # The old owner can no longer complete it.
+        assert not memory_store.complete_webhook_event(event.id, "crashed")
+        assert memory_store.complete_webhook_event(event.id, "w2")
+        assert memory_store.get_webhook_event(event.id).status == WebhookStatus.processed
+
+    def test_expired_lease_on_last_attempt_dead_letters(self, memory_store):
+        (event,) = _store_events(memory_store, 1)
+        memory_store.claim_webhook_events("crashed", max_attempts=1)
+        _expire_lease(memory_store, event.id)
+        assert memory_store.claim_webhook_events("w2", max_attempts=1) == []
+        assert memory_store.get_webhook_event(event.id).status == WebhookStatus.dead_letter
+
+    def test_failures_back_off_then_dead_letter(self, memory_store):
+        (event,) = _store_events(memory_store, 1)
+        delays = []
+        for _ in range(2):
+            memory_store.claim_webhook_events("w", max_attempts=3)
+            before = datetime.now()
+            status = memory_store.fail_webhook_event(event.id, "w", "boom", max_attempts=3, retry_base_seconds=10)
+            assert status == WebhookStatus.failed
+            stored = memory_store.get_webhook_event(event.id)
+            delays.append((datetime.fromisoformat(stored.next_attempt_at) - before).total_seconds())
+            assert memory_store.claim_webhook_events("w") == []  # not due yet
+            _make_due(memory_store, event.id)
+        assert delays[0] == pytest.approx(10, abs=1)
+        assert delays[1] == pytest.approx(20, abs=1)
+
+        memory_store.claim_webhook_events("w", max_attempts=3)
+        assert memory_store.fail_webhook_event(event.id, "w", "boom", max_attempts=3) == WebhookStatus.dead_letter
+        stored = memory_store.get_webhook_event(event.id)
+        assert (stored.attempts, stored.last_error) == (3, "boom")
+        _make_due(memory_store, event.id)
+        assert memory_store.claim_webhook_events("w") == []
+
+        memory_store.requeue_webhook_event(event.id)
+        assert memory_store.claim_webhook_events("w")[0].attempts == 1
+
+    def test_release_does_not_count_attempt(self, memory_store):
+        (event,) = _store_events(memory_store, 1)
+        memory_store.claim_webhook_events("w")
+        assert memory_store.release_webhook_event(event.id, "w", delay_seconds=60)
+        stored = memory_store.get_webhook_event(event.id)
+        assert (stored.status, stored.attempts) == (WebhookStatus.pending, 0)
+        assert memory_store.claim_webhook_events("w") == []
+
+    def test_manually_failed_events_are_not_retried(self, memory_store):
+        (event,) = _store_events(memory_store, 1)
+        memory_store.update_webhook_event_status(event.id, WebhookStatus.failed)
+        assert memory_store.claim_webhook_events("w") == []
+
+    def test_workers_on_separate_connections_never_share_events(self, memory_store):
+        events = _store_events(memory_store, 200)
+        claimed: dict[str, list[int]] = {}
+
+        def work(name):
+            store = MemoryStore(memory_store.db_path)
+            try:
+                ids = claimed.setdefault(name, [])
+                while batch := store.claim_webhook_events(name, limit=7):
+                    ids.extend(e.id for e in batch)
+            finally:
+                store.close()
+
+        threads = [threading.Thread(target=work, args=(f"w{i}",)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        all_ids = [i for ids in claimed.values() for i in ids]
+        assert sorted(all_ids) == [e.id for e in events]
+
+
+@pytest.mark.asyncio
+class TestDispatchWorker:
+    async def test_drains_backlog_with_bounded_concurrency(self, memory_store):
+        _store_events(memory_store, 12)
+        active = peak = 0
+
+        async def dispatch(event, skip_rule_ids=()):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return [_success()]
+
+        worker = DispatchWorker(memory_store, concurrency=3)
+        with patch.object(worker.dispatcher, "dispatch", side_effect=dispatch):
+            result = await worker.drain()
+
+        assert result["dispatched"] == 12
+        assert peak == 3
+        assert len(memory_store.list_webhook_events(status="processed")) == 12
+
+    async def test_two_workers_dispatch_each_event_once(self, memory_store):
+        _store_events(memory_store, 20)
+        seen = []
+
+        async def dispatch(event, skip_rule_ids=()):
+            seen.append(event.id)
+            await asyncio.sleep(0)
+            return [_success()]
+
+        workers = [DispatchWorker(memory_store, concurrency=4, worker_id=f"w{i}") for i in range(2)]
+        for w in workers:
+            w.dispatcher.dispatch = AsyncMock(side_effect=dispatch)
+        results = await asyncio.gather(*(w.drain() for w in workers))
+
+        assert sum(r["dispatched"] for r in results) == 20
+        assert sorted(seen) == sorted(set(seen))
+
+    async def test_failed_rule_is_retried_then_dead_lettered(self, memory_store):
+        (event,) = _store_events(memory_store, 1)
+        failure = {**_success(), "status": "error"}
+        worker = DispatchWorker(memory_store, max_attempts=2, retry_base_seconds=0)
+        worker.dispatcher.dispatch = AsyncMock(return_value=[failure])
+
+        # With no backoff the retry is due at once, so one drain sees both attempts.
+        result = await worker.drain()
+        assert (result["failed"], result["dead_lettered"]) == (1, 1)
+        assert worker.dispatcher.dispatch.await_count == 2
+        stored = memory_store.get_webhook_event(event.id)
+        assert (stored.status, stored.last_error) == (WebhookStatus.dead_letter, "rule: error")
+
+    async def test_retry_skips_rules_that_succeeded(self, memory_store):
+        for name in ("ok", "flaky"):
+            memory_store.create_event_rule(
+                name=name, event_source="github", event_type_pattern="alert.*", agent_name=name,
+            )
+        (event,) = _store_events(memory_store, 1)
+        worker = DispatchWorker(memory_store, retry_base_seconds=0)
+        runs = []
+
+        async def run_rule(rule, *_):
+            runs.append(rule["name"])
+            status = "error" if rule["name"] == "flaky" and runs.count("flaky") == 1 else "success"
+            return {**_success(rule["name"], rule["agent_name"]), "status": status}
+
+        with patch.object(worker.dispatcher, "_run_rule", side_effect=run_rule):
+            result = await worker.drain()
+
+        assert (result["failed"], result["dispatched"]) == (1, 1)
+        assert sorted(runs) == ["flaky", "flaky", "ok"]
+        assert memory_store.get_webhook_event(event.id).status == WebhookStatus.processed
+        assert memory_store.get_webhook_rule_runs(event.id) == set()
+
+    async def test_unmatched_event_is_released(self, memory_store):
+        (event,) = _store_events(memory_store, 1, event_type="no.match")
+        worker = DispatchWorker(memory_store)
+        assert (await worker.drain())["skipped"] == 1
+        stored = memory_store.get_webhook_event(event.id)
+        assert (stored.status, stored.attempts) == (WebhookStatus.pending, 0)
+
+    async def test_lease_renewed_while_dispatch_runs(self, memory_store):
+        (event,) = _store_events(memory_store, 1)
+        worker = DispatchWorker(memory_store, lease_seconds=0.09)
+
+        async def slow(_, skip_rule_ids=()):
+            await asyncio.sleep(0.2)
+            return [_success()]
+
+        worker.dispatcher.dispatch = AsyncMock(side_effect=slow)
+        with patch.object(memory_store, "extend_webhook_lease", wraps=memory_store.extend_webhook_lease) as spy:
+            assert (await worker.drain())["dispatched"] == 1
+        assert spy.call_count >= 2
+
+
+@pytest.mark.asyncio
+class TestAgentConcurrency:
+    async def test_runs_of_one_agent_are_limited(self, memory_store):
+        from webhook.dispatcher import EventDispatcher
+
+        dispatcher = EventDispatcher(agent_registry=None, memory_store=memory_store, agent_concurrency=1)
+        active = peak = 0
+
+        async def run_rule(rule, *args):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return _success(rule["name"], rule["agent_name"])
+
+        rules = [{"name": f"r{i}", "agent_name": "same"} for i in range(4)]
+        with patch.object(dispatcher, "_run_rule", side_effect=run_rule):
+            await asyncio.gather(*(dispatcher._dispatch_single(r, "s", "e", "", "") for r in rules))
+        assert peak == 1
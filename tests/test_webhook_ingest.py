@@ -230,7 +230,8 @@ class TestIngestEvents:
             json.dumps({"source": "s", "event_type": "e", "payload": "data"})
         )
 
-        with patch.object(memory_store, "store_webhook_event", side_effect=RuntimeError("DB locked")):
+        with patch.object(memory_store, "store_webhook_events", side_effect=RuntimeError("DB locked")), \
+                patch.object(memory_store, "store_webhook_event", side_effect=RuntimeError("DB locked")):
             result = ingest_events(memory_store, inbox_dir, debounce_seconds=0)
 
         assert result["failed"] == 1
@@ -255,7 +256,9 @@ class TestIngestEvents:
                 raise RuntimeError("DB locked on second file")
             return original_store(event)
 
-        with patch.object(memory_store, "store_webhook_event", side_effect=store_that_fails_on_second):
+        # The batch insert fails as a whole, then each event is retried alone.
+        with patch.object(memory_store, "store_webhook_events", side_effect=RuntimeError("DB locked")), \
+                patch.object(memory_store, "store_webhook_event", side_effect=store_that_fails_on_second):
             result = ingest_events(memory_store, inbox_dir, debounce_seconds=0)
 
         assert result["ingested"] == 2
@@ -326,7 +329,7 @@ class TestDispatchPendingEvents:
 
         call_count = 0
 
-        async def mock_dispatch(event):
+        async def mock_dispatch(event, skip_rule_ids=()):
             nonlocal call_count
             call_count += 1
             if call_count == 1:
@@ -0,0 +1,112 @@
+"""Tests for webhook/receiver.py — watch-mode inbox ingestion."""
+import json
+import os
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from webhook.ingest import inbox_lock
+from webhook.receiver import InboxWatcher
+
+
+def _drop(inbox_dir, name, age_seconds=0.0, **event):
+    path = inbox_dir / name
+    path.write_text(json.dumps({"source": "github", "event_type": "push", **event}))
+    if age_seconds:
+        past = time.time() - age_seconds
+        os.utime(path, (past, past))
+    return path
+
+
+@pytest.fixture
+def watcher(memory_store, inbox_dir):
+    w = InboxWatcher(memory_store, inbox_dir, debounce_seconds=0, poll_interval=0.01, use_inotify=False)
+    w.open()
+    yield w
+    w.close()
+
+
+class TestInboxWatcher:
+    def test_existing_backlog_ingested_in_one_batch(self, memory_store, inbox_dir):
+        for i in range(30):
+            _drop(inbox_dir, f"e{i:02d}.json")
+        w = InboxWatcher(memory_store, inbox_dir, debounce_seconds=0, use_inotify=False)
+        w.open()
+        try:
+            with patch.object(memory_store, "store_webhook_events", wraps=memory_store.store_webhook_events) as spy:
+                result = w.process()
+        finally:
+            w.close()
+        assert result["ingested"] == 30
+        assert spy.call_count == 1
+        assert len(memory_store.list_webhook_events(limit=100)) == 30
+        assert not list(inbox_dir.glob("*.json"))
+
+    def test_new_file_ingested_and_dispatched(self, memory_store, inbox_dir, watcher):
+        dispatch = MagicMock(return_value={"dispatched": 1, "failed": 0, "skipped": 0})
+        watcher.dispatch = dispatch
+        assert watcher.run_once(timeout=0) is None
+
+        _drop(inbox_dir, "event.json")
+        result = watcher.run_once(timeout=0)
+
+        assert result["ingested"] == 1
+        assert result["dispatch"]["dispatched"] == 1
+        dispatch.assert_called_once()
+        stats = watcher.stats()
+        assert stats["mode"] == "poll"
+        assert stats["ingested"] == 1
+        assert stats["ingest_latency"]["count"] == 1
+        assert stats["end_to_end_latency"]["count"] == 1
+
+    def test_debounced_file_retried_when_settled(self, memory_store, inbox_dir, watcher):
+        watcher.debounce_seconds = 60
+        _drop(inbox_dir, "fresh.json")
+        assert watcher.run_once(timeout=0)["skipped"] == 1
+        assert watcher.process() is None  # not due again yet
+
+        past = time.time() - 120
+        os.utime(inbox_dir / "fresh.json", (past, past))
+        watcher._pending["fresh.json"] = 0
+        assert watcher.process()["ingested"] == 1
+        assert watcher.stats()["pending"] == 0
+
+    def test_waits_while_poll_task_holds_lock(self, memory_store, inbox_dir, watcher):
+        _drop(inbox_dir, "event.json")
+        with inbox_lock(inbox_dir) as acquired:
+            assert acquired
+            assert watcher.run_once(timeout=0)["status"] == "skipped"
+        assert memory_store.list_webhook_events() == []
+        assert watcher.stats()["lock_busy"] == 1
+
+        watcher._pending["event.json"] = 0
+        assert watcher.process()["ingested"] == 1
+
+    def test_store_failure_left_for_retry(self, memory_store, inbox_dir, watcher):
+        _drop(inbox_dir, "event.json")
+        with patch.object(memory_store, "store_webhook_events", side_effect=RuntimeError("locked")), \
+                patch.object(memory_store, "store_webhook_event", side_effect=RuntimeError("locked")):
+            assert watcher.run_once(timeout=0)["failed"] == 1
+        assert (inbox_dir / "event.json").exists()
+        assert watcher.stats()["pending"] == 1
+        assert watcher.process() is None  # backs off before retrying
+
+    def test_malformed_file_moved_to_failed(self, memory_store, inbox_dir, watcher):
+        (inbox_dir / "bad.json").write_text("nope")
+        assert watcher.run_once(timeout=0)["failed"] == 1
+        assert (inbox_dir / "failed" / "bad.json").exists()
+        assert watcher.stats()["pending"] == 0
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_mode(self, memory_store, inbox_dir):
+        w = InboxWatcher(memory_store, inbox_dir, debounce_seconds=0, use_inotify=True)
+        w.open()
+        try:
+            assert w.mode == "inotify"
+            _drop(inbox_dir, "event.json")
+            result = w.run_once(timeout=2)
+        finally:
+            w.close()
+        assert result["ingested"] == 1
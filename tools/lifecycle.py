@@ -2,12 +2,10 @@
 
 from __future__ import annotations
 
-import json
-from datetime import date, datetime, timedelta
 from typing import Any, Optional
 
 from memory.models import (
-    AlertRule, Decision, DecisionStatus, Delegation, DelegationStatus,
+    AlertRule, Decision, DecisionStatus, Delegation,
     DelegationPriority, SourceRef,
 )
 
@@ -265,148 +263,26 @@ def list_alert_rules(memory_store, *, enabled_only: bool = False) -> dict[str, A
     return {"results": results}
 
 
-def _parse_rule_condition(condition: str) -> dict[str, Any]:
-    condition = (condition or "").strip()
-    if not condition:
-        return {}
-    try:
-        value = json.loads(condition)
-    except json.JSONDecodeError:
-        return {}
-    return value if isinstance(value, dict) else {}
-
-
-def _evaluate_rule(memory_store, rule) -> dict[str, Any]:
-    parsed = _parse_rule_condition(rule.condition)
-    alert_type = (rule.alert_type or "").strip().lower()
-
-    if alert_type == "overdue_delegation":
-        min_days = int(parsed.get("days_overdue", 1))
-        today = date.today()
-        matches = []
-        for d in memory_store.list_overdue_delegations():
-            if not d.due_date:
-                continue
-            try:
-                days_overdue = (today - date.fromisoformat(d.due_date)).days
-            except ValueError:
-                continue
-            if days_overdue >= min_days:
-                matches.append({
-                    "id": d.id,
-                    "task": d.task,
-                    "delegated_to": d.delegated_to,
-                    "due_date": d.due_date,
-                    "days_overdue": days_overdue,
-                })
-    elif alert_type in ("pending_decision", "stale_decision"):
-        stale_days = int(parsed.get("days_stale", 7))
-        cutoff = (date.today() - timedelta(days=stale_days)).isoformat()
-        matches = [
-            {
-                "id": d.id,
-                "title": d.title,
-                "created_at": d.created_at,
-            }
-            for d in memory_store.list_decisions_by_status(DecisionStatus.pending_execution)
-            if d.created_at and d.created_at[:10] < cutoff
-        ]
-    elif alert_type == "upcoming_deadline":
-        within_days = int(parsed.get("within_days", 3))
-        today = date.today()
-        soon = (today + timedelta(days=within_days)).isoformat()
-        today_str = today.isoformat()
-        matches = [
-            {
-                "id": d.id,
-                "task": d.task,
-                "delegated_to": d.delegated_to,
-                "due_date": d.due_date,
-            }
-            for d in memory_store.list_delegations(status="active")
-            if d.due_date and today_str <= d.due_date <= soon
-        ]
-    elif alert_type == "stale_backup":
-        max_age_hours = int(parsed.get("max_age_hours", 48))
-        cutoff = datetime.now() - timedelta(hours=max_age_hours)
-        fact = memory_store.get_fact("work", "backup_last_success")
-        matches = []
-        if fact is None:
-            matches.append({"reason": "No backup_last_success fact found"})
-        else:
-            # Value format: "YYYY-MM-DD: summary text"
-            try:
-                date_str = fact.value.split(":")[0].strip()
-                last_backup = datetime.strptime(date_str, "%Y-%m-%d")
-                if last_backup < cutoff:
-                    age_hours = (datetime.now() - last_backup).total_seconds() / 3600
-                    matches.append({
-                        "last_success": fact.value,
-                        "hours_ago": round(age_hours, 1),
-                        "threshold_hours": max_age_hours,
-                    })
-            except (ValueError, IndexError):
-                matches.append({
-                    "reason": f"Could not parse backup timestamp: {fact.value}"
-                })
-    else:
-        matches = []
-
-    return {
-        "rule_id": rule.id,
-        "name": rule.name,
-        "alert_type": rule.alert_type,
-        "count": len(matches),
-        "matches": matches,
-    }
-
-
 def check_alerts(memory_store) -> dict[str, Any]:
-    alerts = {"overdue_delegations": [], "stale_decisions": [], "upcoming_deadlines": []}
-
-    overdue = memory_store.list_overdue_delegations()
-    for d in overdue:
-        alerts["overdue_delegations"].append({
-            "id": d.id,
-            "task": d.task,
-            "delegated_to": d.delegated_to,
-            "due_date": d.due_date,
-        })
-
-    pending = memory_store.list_decisions_by_status(DecisionStatus.pending_execution)
-    cutoff = (date.today() - timedelta(days=7)).isoformat()
-    for d in pending:
-        if d.created_at and d.created_at[:10] < cutoff:
-            alerts["stale_decisions"].append({
-                "id": d.id,
-                "title": d.title,
-                "created_at": d.created_at,
-            })
-
-    today = date.today()
-    soon = (today + timedelta(days=3)).isoformat()
-    today_str = today.isoformat()
-    active = memory_store.list_delegations(status=DelegationStatus.active)
-    for d in active:
-        if d.due_date and today_str <= d.due_date <= soon:
-            alerts["upcoming_deadlines"].append({
-                "id": d.id,
-                "task": d.task,
-                "delegated_to": d.delegated_to,
-                "due_date": d.due_date,
-            })
-
-    rule_alerts = []
-    for rule in memory_store.list_alert_rules(enabled_only=True):
-        evaluated = _evaluate_rule(memory_store, rule)
-        if evaluated["count"] > 0:
-            rule_alerts.append(evaluated)
+    """Built-in alerts plus every enabled alert rule that currently matches.
+
+    Everything is evaluated in one query by memory.alert_engine; rules whose
+    condition cannot be evaluated are listed under ``rule_errors``.
+    """
+    snapshot = memory_store.evaluate_alerts(memory_store.list_alert_rules(enabled_only=True))
+    alerts = snapshot["alerts"]
+    rule_alerts = [r for r in snapshot["rule_results"] if r["count"] > 0]
+    rule_errors = [
+        {"rule_id": r["rule_id"], "name": r["name"], "error": r["error"]}
+        for r in snapshot["rule_results"] if "error" in r
+    ]
 
     total = sum(len(v) for v in alerts.values()) + sum(r["count"] for r in rule_alerts)
     return {
         "total_alerts": total,
         "alerts": alerts,
         "rule_alerts": rule_alerts,
+        "rule_errors": rule_errors,
     }
 
 
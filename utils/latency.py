@@ -0,0 +1,14 @@
+"""Latency sample summaries shared by the daemon metrics endpoints."""
+
+
+def latency_summary(samples) -> dict:
+    """Count, p50, p95 and max of *samples* (milliseconds); count only if empty."""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "p50_ms": ordered[len(ordered) // 2],
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max_ms": ordered[-1],
+    }
@@ -0,0 +1,35 @@
+# utils/lazy_import.py
+"""Deferred imports for heavy third-party packages.
+
+``anthropic`` and ``chromadb`` each take the better part of a second to
+import. ``lazy_import`` returns a stand-in module that imports the real one
+the first time one of its attributes is read, so modules can keep writing
+``anthropic.Anthropic(...)`` while one-shot processes that never make an API
+call (launchd jobs, the webhook receiver, CLI scripts) skip the import.
+
+Setting an attribute on the stand-in (as ``mock.patch`` does) shadows the
+real module's attribute for callers holding the stand-in only.
+"""
+import importlib
+import sys
+import types
+
+
+class _LazyModule(types.ModuleType):
+    """Stands in for a module until one of its attributes is read."""
+
+    def __getattr__(self, attr: str):
+        # Only reached for names not set on the stand-in itself.
+        return getattr(importlib.import_module(self.__name__), attr)
+
+    def __repr__(self) -> str:
+        loaded = self.__name__ in sys.modules
+        return f"<lazy module {self.__name__!r} ({'loaded' if loaded else 'not loaded'})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """The module *name*, or a stand-in that imports it on first use."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return _LazyModule(name)
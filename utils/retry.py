@@ -3,20 +3,30 @@ import asyncio
 import logging
 from functools import wraps
 
-import anthropic
+from utils.lazy_import import lazy_import
 
+anthropic = lazy_import("anthropic")
 logger = logging.getLogger(__name__)
 
-RETRYABLE_EXCEPTIONS = (
-    anthropic.RateLimitError,
-    anthropic.InternalServerError,
-    anthropic.APIConnectionError,
-)
-
 MAX_RETRIES = 3
 BASE_DELAY = 1  # seconds
 
 
+def _retryable_exceptions() -> tuple[type[BaseException], ...]:
+    # Resolved on first failure, so decorating a function does not import anthropic.
+    return (
+        anthropic.RateLimitError,
+        anthropic.InternalServerError,
+        anthropic.APIConnectionError,
+    )
+
+
+def __getattr__(name):
+    if name == "RETRYABLE_EXCEPTIONS":
+        return _retryable_exceptions()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def retry_api_call(func):
     """Decorator that retries async Anthropic API calls with exponential backoff."""
 
@@ -26,7 +36,7 @@ def retry_api_call(func):
         for attempt in range(MAX_RETRIES + 1):
             try:
                 return await func(*args, **kwargs)
-            except RETRYABLE_EXCEPTIONS as exc:
+            except _retryable_exceptions() as exc:
                 last_exception = exc
                 if attempt < MAX_RETRIES:
                     delay = BASE_DELAY * (2 ** attempt)
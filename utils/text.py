@@ -4,3 +4,9 @@
 def split_addresses(value: str) -> list[str]:
     """Split a comma-separated address string into a trimmed list."""
     return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def split_ids(value: str | list[str]) -> list[str]:
+    """Split a comma-separated ID string, or trim a list of IDs."""
+    items = value.split(",") if isinstance(value, str) else value
+    return [str(v).strip() for v in items if str(v).strip()]
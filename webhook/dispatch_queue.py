@@ -0,0 +1,172 @@
+"""Leased, retrying dispatch of queued webhook events.
+
+``webhook_events`` is the queue (see the dispatch-queue section of
+memory/webhook_store.py). A ``DispatchWorker`` claims due events with a
+lease, runs them through ``EventDispatcher`` with bounded concurrency, and
+records the outcome:
+
+- every matched rule succeeded: the event is processed;
+- no rule matched: the event goes back to pending and is re-checked later,
+  in case a rule is added;
+- anything else: the attempt fails and is retried with exponential
+  backoff, until ``max_attempts`` moves the event to dead_letter.
+
+Rules that succeed are recorded per event (``webhook_event_rule_runs``),
+so a retry only runs the rules that failed.
+
+Leases are renewed while an event is running. If a worker dies, its lease
+expires and another worker picks the event up. Claims are a single
+``UPDATE ... RETURNING``, so any number of workers, in one process or
+several, can drain the queue together.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from typing import Optional
+
+logger = logging.getLogger("jarvis-webhook-queue")
+
+# Events that matched no rule are re-checked after this many seconds.
+NO_RULE_RECHECK_SECONDS = 60
+
+
+def _default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class DispatchWorker:
+    """Drains the webhook dispatch queue with bounded concurrency.
+
+    Args:
+        memory_store: MemoryStore holding the queue.
+        agent_registry: AgentRegistry for the EventDispatcher.
+        document_store: Optional DocumentStore passed to agents.
+        concurrency: Events dispatched at once by this worker.
+        agent_concurrency: Concurrent runs allowed per agent (0 = unlimited).
+        max_concurrent: Concurrent rule dispatches within one event.
+        lease_seconds: Lease length; renewed every third of it while running.
+        max_attempts: Attempts before an event is dead-lettered.
+        retry_base_seconds: Delay before the first retry; doubles each attempt.
+        worker_id: Lease owner name (defaults to host:pid:random).
+    """
+
+    def __init__(
+        self,
+        memory_store,
+        agent_registry=None,
+        document_store=None,
+        *,
+        concurrency: Optional[int] = None,
+        agent_concurrency: Optional[int] = None,
+        max_concurrent: Optional[int] = None,
+        lease_seconds: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        retry_base_seconds: Optional[float] = None,
+        worker_id: Optional[str] = None,
+    ):
+        import config as app_config
+        from webhook.dispatcher import EventDispatcher
+
+        self.memory_store = memory_store
+        self.concurrency = concurrency or app_config.WEBHOOK_DISPATCH_CONCURRENCY
+        self.lease_seconds = lease_seconds or app_config.WEBHOOK_DISPATCH_LEASE_SECONDS
+        self.max_attempts = max_attempts or app_config.WEBHOOK_DISPATCH_MAX_ATTEMPTS
+        self.retry_base_seconds = (
+            app_config.WEBHOOK_DISPATCH_RETRY_BASE_SECONDS if retry_base_seconds is None else retry_base_seconds
+        )
+        self.worker_id = worker_id or _default_worker_id()
+        self.dispatcher = EventDispatcher(
+            agent_registry=agent_registry,
+            memory_store=memory_store,
+            document_store=document_store,
+            parallel=True,
+            max_concurrent=(
+                app_config.MAX_CONCURRENT_AGENT_DISPATCHES if max_concurrent is None else max_concurrent
+            ),
+            agent_concurrency=(
+                app_config.WEBHOOK_DISPATCH_AGENT_CONCURRENCY if agent_concurrency is None else agent_concurrency
+            ),
+        )
+
+    async def drain(self, max_events: Optional[int] = None) -> dict:
+        """Dispatch due events until none are left (or *max_events* were claimed).
+
+        Returns counts: dispatched, failed (will be retried), dead_lettered,
+        skipped (no matching rule) and lost_lease (another worker took over).
+        """
+        counts = {"dispatched": 0, "failed": 0, "dead_lettered": 0, "skipped": 0, "lost_lease": 0}
+        running: set[asyncio.Task] = set()
+        claimed = 0
+        while True:
+            free = self.concurrency - len(running)
+            if max_events is not None:
+                free = min(free, max_events - claimed)
+            if free > 0:
+                events = self.memory_store.claim_webhook_events(
+                    self.worker_id,
+                    limit=free,
+                    lease_seconds=self.lease_seconds,
+                    max_attempts=self.max_attempts,
+                )
+                claimed += len(events)
+                running.update(asyncio.create_task(self._handle(event)) for event in events)
+            if not running:
+                return counts
+            done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                counts[task.result()] += 1
+
+    async def _handle(self, event) -> str:
+        heartbeat = asyncio.create_task(self._renew_lease(event.id))
+        done = self.memory_store.get_webhook_rule_runs(event.id)
+        try:
+            results = await self.dispatcher.dispatch(event, skip_rule_ids=done)
+        except Exception as exc:
+            logger.error("Dispatch failed for event %s: %s", event.id, exc)
+            return self._fail(event, str(exc))
+        finally:
+            heartbeat.cancel()
+
+        self.memory_store.record_webhook_rule_runs(
+            event.id, [r["rule_id"] for r in results if r["status"] == "success" and r.get("rule_id") is not None],
+        )
+        if not results and not done:
+            self.memory_store.release_webhook_event(
+                event.id, self.worker_id, delay_seconds=NO_RULE_RECHECK_SECONDS,
+            )
+            return "skipped"
+        failures = [r for r in results if r["status"] != "success"]
+        if failures:
+            return self._fail(event, "; ".join(f"{r['rule_name']}: {r['status']}" for r in failures))
+        if not self.memory_store.complete_webhook_event(event.id, self.worker_id):
+            logger.warning("Lease on webhook event %s was lost before completion", event.id)
+            return "lost_lease"
+        return "dispatched"
+
+    def _fail(self, event, error: str) -> str:
+        status = self.memory_store.fail_webhook_event(
+            event.id,
+            self.worker_id,
+            error,
+            max_attempts=self.max_attempts,
+            retry_base_seconds=self.retry_base_seconds,
+        )
+        if status is None:
+            logger.warning("Lease on webhook event %s was lost before recording failure", event.id)
+            return "lost_lease"
+        if status == "dead_letter":
+            logger.error("Webhook event %s dead-lettered after %d attempts: %s", event.id, event.attempts, error)
+            return "dead_lettered"
+        return "failed"
+
+    async def _renew_lease(self, event_id: int) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            if not self.memory_store.extend_webhook_lease(event_id, self.worker_id, self.lease_seconds):
+                logger.warning("Could not renew lease on webhook event %s", event_id)
+                return
@@ -14,7 +14,7 @@ import json
 import logging
 import time
 from string import Template
-from typing import Optional
+from typing import Collection, Optional
 
 from agents.triage import classify_and_resolve
 
@@ -32,6 +32,7 @@ class EventDispatcher:
         delivery_fn=None,
         parallel: bool = True,
         max_concurrent: int = 0,
+        agent_concurrency: int = 0,
     ):
         """
         Args:
@@ -42,6 +43,8 @@ class EventDispatcher:
                          Defaults to scheduler.delivery.deliver_result if not provided.
             parallel: If True, dispatch matched rules concurrently (default True).
             max_concurrent: Maximum concurrent agent dispatches (0 = unlimited).
+            agent_concurrency: Maximum concurrent runs of any one agent across
+                every event this dispatcher handles (0 = unlimited).
         """
         self.agent_registry = agent_registry
         self.memory_store = memory_store
@@ -49,6 +52,8 @@ class EventDispatcher:
         self._delivery_fn = delivery_fn
         self.parallel = parallel
         self.max_concurrent = max_concurrent
+        self.agent_concurrency = agent_concurrency
+        self._agent_semaphores: dict[str, asyncio.Semaphore] = {}
 
     def _get_delivery_fn(self):
         if self._delivery_fn is not None:
@@ -56,14 +61,15 @@ class EventDispatcher:
         from delivery.service import deliver_result
         return deliver_result
 
-    async def dispatch(self, webhook_event) -> list[dict]:
+    async def dispatch(self, webhook_event, skip_rule_ids: Collection[int] = ()) -> list[dict]:
         """Dispatch a webhook event to all matching event rules.
 
         Args:
             webhook_event: A WebhookEvent (or dict-like) with source, event_type, payload, id.
+            skip_rule_ids: Ids of matching rules not to run (already done for this event).
 
         Returns:
-            List of dispatch result dicts, one per matched rule.
+            List of dispatch result dicts, one per rule run.
         """
         source = webhook_event.source if hasattr(webhook_event, "source") else webhook_event["source"]
         event_type = webhook_event.event_type if hasattr(webhook_event, "event_type") else webhook_event["event_type"]
@@ -77,6 +83,10 @@ class EventDispatcher:
         if not matched_rules:
             logger.info("No matching event rules for source=%s type=%s", source, event_type)
             return []
+        if skip_rule_ids:
+            matched_rules = [r for r in matched_rules if r["id"] not in skip_rule_ids]
+            if not matched_rules:
+                return []
 
         # Guard against unbounded fan-out from too many matching rules
         max_rules = 50
@@ -134,6 +144,26 @@ class EventDispatcher:
         event_type: str,
         payload: str,
         timestamp: str,
+    ) -> dict:
+        """Execute a single rule dispatch, within the agent's concurrency limit."""
+        if self.agent_concurrency <= 0:
+            result = await self._run_rule(rule, source, event_type, payload, timestamp)
+        else:
+            semaphore = self._agent_semaphores.get(rule["agent_name"])
+            if semaphore is None:
+                semaphore = self._agent_semaphores[rule["agent_name"]] = asyncio.Semaphore(self.agent_concurrency)
+            async with semaphore:
+                result = await self._run_rule(rule, source, event_type, payload, timestamp)
+        result.setdefault("rule_id", rule.get("id"))
+        return result
+
+    async def _run_rule(
+        self,
+        rule: dict,
+        source: str,
+        event_type: str,
+        payload: str,
+        timestamp: str,
     ) -> dict:
         """Execute a single rule dispatch. Catches all exceptions."""
         agent_name = rule["agent_name"]
@@ -15,10 +15,10 @@ import logging
 import shutil
 import sys
 import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-
-from memory.models import WebhookStatus
+from typing import Iterator
 
 logger = logging.getLogger("jarvis-webhook-ingest")
 
@@ -28,45 +28,45 @@ async def dispatch_pending_events(
     agent_registry=None,
     document_store=None,
 ) -> dict:
-    """Dispatch all pending webhook events through the event rule system.
+    """Drain the webhook dispatch queue through the event rule system.
+
+    Events are leased, retried with backoff and dead-lettered by
+    webhook.dispatch_queue.DispatchWorker; dead-lettered events count as
+    failed here.
 
     Returns dict with counts: {"dispatched": N, "failed": N, "skipped": N}
     """
-    counts = {"dispatched": 0, "failed": 0, "skipped": 0}
-    pending = memory_store.list_webhook_events(status=WebhookStatus.pending)
-    if not pending:
-        return counts
+    from webhook.dispatch_queue import DispatchWorker
 
-    from config import MAX_CONCURRENT_AGENT_DISPATCHES
-    from webhook.dispatcher import EventDispatcher
-    dispatcher = EventDispatcher(
-        agent_registry=agent_registry,
-        memory_store=memory_store,
-        document_store=document_store,
-        parallel=True,
-        max_concurrent=MAX_CONCURRENT_AGENT_DISPATCHES,
-    )
+    worker = DispatchWorker(memory_store, agent_registry, document_store)
+    result = await worker.drain()
+    return {
+        "dispatched": result["dispatched"],
+        "failed": result["failed"] + result["dead_lettered"],
+        "skipped": result["skipped"],
+    }
 
-    for event in pending:
-        try:
-            results = await dispatcher.dispatch(event)
-            if results:
-                all_success = all(r["status"] == "success" for r in results)
-                new_status = WebhookStatus.processed if all_success else WebhookStatus.failed
-                memory_store.update_webhook_event_status(event.id, new_status)
-                if all_success:
-                    counts["dispatched"] += 1
-                else:
-                    counts["failed"] += 1
-            else:
-                # No matching rules — skip without changing status
-                counts["skipped"] += 1
-        except Exception as exc:
-            logger.error("Dispatch failed for event %s: %s", event.id, exc)
-            memory_store.update_webhook_event_status(event.id, WebhookStatus.failed)
-            counts["failed"] += 1
 
-    return counts
+# Events parsed from the inbox are stored this many per transaction.
+INGEST_BATCH_SIZE = 200
+
+
+@contextmanager
+def inbox_lock(inbox_dir: Path) -> Iterator[bool]:
+    """Hold the inbox's exclusive ``fcntl`` lock; yields False if another ingest has it."""
+    lf = open(Path(inbox_dir) / ".ingest.lock", "w")
+    try:
+        try:
+            fcntl.flock(lf, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lf, fcntl.LOCK_UN)
+    finally:
+        lf.close()
 
 
 def ingest_events(
@@ -80,90 +80,34 @@ def ingest_events(
     Each JSON file must contain:
         {"source": "...", "event_type": "...", "payload": {...}}
 
-    Valid events are stored via memory_store.store_webhook_event().
+    Valid events are stored via memory_store.store_webhook_events(), up to
+    INGEST_BATCH_SIZE per transaction.
     Processed files move to inbox_dir/processed/.
     Malformed files move to inbox_dir/failed/.
 
-    Returns dict with counts: {"ingested": N, "failed": N, "skipped": N}
+    Returns dict with counts: {"ingested": N, "failed": N, "skipped": N},
+    plus "max_latency_ms" (file landed to event stored) when anything was
+    ingested.
     """
-    from memory.models import WebhookEvent
-
     inbox_dir = Path(inbox_dir)
-    processed_dir = inbox_dir / "processed"
-    failed_dir = inbox_dir / "failed"
-
-    processed_dir.mkdir(parents=True, exist_ok=True)
-    failed_dir.mkdir(parents=True, exist_ok=True)
-
-    counts = {"ingested": 0, "failed": 0, "skipped": 0}
+    (inbox_dir / "processed").mkdir(parents=True, exist_ok=True)
+    (inbox_dir / "failed").mkdir(parents=True, exist_ok=True)
 
     # Acquire exclusive lock to prevent concurrent ingest calls
-    lock_file = inbox_dir / ".ingest.lock"
-    lf = open(lock_file, "w")
-    try:
-        fcntl.flock(lf, fcntl.LOCK_EX | fcntl.LOCK_NB)
-    except BlockingIOError:
-        lf.close()
-        return {"status": "skipped", "reason": "another ingest in progress"}
+    with inbox_lock(inbox_dir) as acquired:
+        if not acquired:
+            return {"status": "skipped", "reason": "another ingest in progress"}
 
-    try:
         json_files = sorted(inbox_dir.glob("*.json"))
         if not json_files:
             logger.info("No JSON files found in %s", inbox_dir)
-            return counts
-
-        now = time.time()
-        for filepath in json_files:
-            # Skip recently modified files to debounce partial writes
-            if debounce_seconds > 0 and now - filepath.stat().st_mtime < debounce_seconds:
-                counts["skipped"] += 1
-                continue
-
-            try:
-                raw = filepath.read_text(encoding="utf-8")
-                data = json.loads(raw)
-            except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
-                logger.warning("Malformed file %s: %s", filepath.name, exc)
-                _move_file(filepath, failed_dir)
-                counts["failed"] += 1
-                continue
-
-            # Validate required fields
-            source = data.get("source") if isinstance(data, dict) else None
-            event_type = data.get("event_type") if isinstance(data, dict) else None
-            if not source or not event_type:
-                logger.warning(
-                    "Missing required fields (source, event_type) in %s", filepath.name
-                )
-                _move_file(filepath, failed_dir)
-                counts["failed"] += 1
-                continue
-
-            # Normalize payload to string
-            payload = data.get("payload", "")
-            if not isinstance(payload, str):
-                payload = json.dumps(payload)
-
-            event = WebhookEvent(
-                source=source,
-                event_type=event_type,
-                payload=payload,
-            )
-            try:
-                stored = memory_store.store_webhook_event(event)
-                logger.info(
-                    "Ingested event id=%s source=%s type=%s from %s",
-                    stored.id,
-                    source,
-                    event_type,
-                    filepath.name,
-                )
-                _move_file(filepath, processed_dir)
-                counts["ingested"] += 1
-            except Exception as exc:
-                logger.error("Failed to store event from %s: %s", filepath.name, exc)
-                counts["failed"] += 1
+            return {"ingested": 0, "failed": 0, "skipped": 0}
 
+        counts, landed = ingest_files(
+            memory_store, inbox_dir, json_files, debounce_seconds=debounce_seconds,
+        )
+        if landed:
+            counts["max_latency_ms"] = round((time.time() - min(landed)) * 1000, 1)
         logger.info(
             "Ingest complete: %d ingested, %d failed, %d skipped",
             counts["ingested"],
@@ -171,9 +115,106 @@ def ingest_events(
             counts["skipped"],
         )
         return counts
-    finally:
-        fcntl.flock(lf, fcntl.LOCK_UN)
-        lf.close()
+
+
+def ingest_files(
+    memory_store,
+    inbox_dir: Path,
+    files: list[Path],
+    *,
+    debounce_seconds: float = 2.0,
+) -> tuple[dict, list[float]]:
+    """Ingest *files* from the inbox. The caller must hold ``inbox_lock``.
+
+    Files modified within the last *debounce_seconds* are skipped so that
+    partially written files are not read. Returns the counts dict and the
+    modification time of every ingested file (when it landed in the inbox).
+    """
+    from memory.models import WebhookEvent
+
+    processed_dir = inbox_dir / "processed"
+    failed_dir = inbox_dir / "failed"
+    counts = {"ingested": 0, "failed": 0, "skipped": 0}
+    parsed: list[tuple[Path, float, WebhookEvent]] = []
+
+    now = time.time()
+    for filepath in files:
+        try:
+            mtime = filepath.stat().st_mtime
+        except FileNotFoundError:
+            continue  # picked up by an earlier batch
+        # Skip recently modified files to debounce partial writes
+        if debounce_seconds > 0 and now - mtime < debounce_seconds:
+            counts["skipped"] += 1
+            continue
+
+        try:
+            raw = filepath.read_text(encoding="utf-8")
+            data = json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
+            logger.warning("Malformed file %s: %s", filepath.name, exc)
+            _move_file(filepath, failed_dir)
+            counts["failed"] += 1
+            continue
+
+        # Validate required fields
+        source = data.get("source") if isinstance(data, dict) else None
+        event_type = data.get("event_type") if isinstance(data, dict) else None
+        if not source or not event_type:
+            logger.warning(
+                "Missing required fields (source, event_type) in %s", filepath.name
+            )
+            _move_file(filepath, failed_dir)
+            counts["failed"] += 1
+            continue
+
+        # Normalize payload to string
+        payload = data.get("payload", "")
+        if not isinstance(payload, str):
+            payload = json.dumps(payload)
+
+        parsed.append((filepath, mtime, WebhookEvent(source=source, event_type=event_type, payload=payload)))
+
+    landed: list[float] = []
+    for start in range(0, len(parsed), INGEST_BATCH_SIZE):
+        batch = parsed[start:start + INGEST_BATCH_SIZE]
+        for (filepath, mtime, _), stored in zip(batch, _store_batch(memory_store, batch)):
+            if stored is None:
+                # Left in the inbox so the next ingest retries it.
+                counts["failed"] += 1
+                continue
+            logger.info(
+                "Ingested event id=%s source=%s type=%s from %s",
+                stored.id,
+                stored.source,
+                stored.event_type,
+                filepath.name,
+            )
+            _move_file(filepath, processed_dir)
+            counts["ingested"] += 1
+            landed.append(mtime)
+    return counts, landed
+
+
+def _store_batch(memory_store, batch: list) -> list:
+    """Store a batch in one transaction, falling back to one insert per event.
+
+    The fallback keeps one unstorable event from holding back the rest.
+    Returns the stored event, or None, for each entry of *batch*.
+    """
+    try:
+        return memory_store.store_webhook_events([event for _, _, event in batch])
+    except Exception as exc:
+        logger.warning("Batch insert of %d events failed, storing individually: %s", len(batch), exc)
+
+    stored = []
+    for filepath, _, event in batch:
+        try:
+            stored.append(memory_store.store_webhook_event(event))
+        except Exception as exc:
+            logger.error("Failed to store event from %s: %s", filepath.name, exc)
+            stored.append(None)
+    return stored
 
 
 def _move_file(src: Path, dest_dir: Path) -> Path:
@@ -1,32 +1,343 @@
 """Standalone entry point for the webhook inbox ingestion.
 
 Usage:
-    python -m webhook.receiver
+    python -m webhook.receiver            # ingest the inbox once
+    python -m webhook.receiver --watch    # ingest files as they land
+
+Watch mode uses inotify on Linux and falls back to polling the inbox
+elsewhere. New files are ingested in batches under the same ``fcntl`` lock
+and debounce rules as the scheduled ``webhook_poll`` task, and pending
+events are dispatched straight away when auto-dispatch is enabled.
 """
 
+import argparse
+import ctypes
+import ctypes.util
 import logging
+import os
+import select
+import signal
+import struct
 import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Optional
 
 import config as app_config
 from memory.store import MemoryStore
-from webhook.ingest import ingest_events
+from utils.latency import latency_summary
+from webhook.ingest import ingest_events, ingest_files, inbox_lock
 
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
     stream=sys.stderr,
 )
+logger = logging.getLogger("jarvis-webhook-receiver")
+
+# Files whose insert failed are retried after this many seconds.
+FAILED_RETRY_SECONDS = 30.0
+# Latency samples kept for stats().
+LATENCY_SAMPLES = 1000
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_Q_OVERFLOW = 0x00004000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class _InotifyWatch:
+    """inotify watch on one directory, via libc (Linux only)."""
+
+    def __init__(self, directory: Path):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        wd = libc.inotify_add_watch(self._fd, os.fsencode(directory), _IN_CLOSE_WRITE | _IN_MOVED_TO)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+        self._poller = select.poll()
+        self._poller.register(self._fd, select.POLLIN)
+
+    def wait(self, timeout: float) -> Optional[set[str]]:
+        """Names written or moved into the directory; None if the queue overflowed."""
+        if not self._poller.poll(max(timeout, 0) * 1000):
+            return set()
+        names: set[str] = set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return names
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            offset += _INOTIFY_EVENT.size
+            if mask & _IN_Q_OVERFLOW:
+                return None
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if name:
+                names.add(os.fsdecode(name))
+        return names
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class _PollWatch:
+    """Fallback watch that compares directory listings every *interval* seconds."""
+
+    def __init__(self, directory: Path, interval: float):
+        self._directory = directory
+        self._interval = interval
+        self._seen = self._snapshot()
+
+    def _snapshot(self) -> dict[str, int]:
+        snapshot = {}
+        with os.scandir(self._directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        snapshot[entry.name] = entry.stat().st_mtime_ns
+                except FileNotFoundError:
+                    continue
+        return snapshot
+
+    def wait(self, timeout: float) -> Optional[set[str]]:
+        time.sleep(max(min(timeout, self._interval), 0))
+        current = self._snapshot()
+        changed = {name for name, mtime in current.items() if self._seen.get(name) != mtime}
+        self._seen = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InboxWatcher:
+    """Ingest webhook inbox files as they land and dispatch them immediately.
+
+    Args:
+        memory_store: MemoryStore that receives the events.
+        inbox_dir: Directory external automations drop JSON files into.
+        dispatch: Optional callable run after each batch that ingested
+            events (e.g. dispatching pending events to agents).
+        debounce_seconds: Files modified more recently than this are left
+            for a later pass, as in ``ingest_events``.
+        poll_interval: Polling period when inotify is unavailable.
+        use_inotify: Force (True) or disable (False) inotify; by default it
+            is used when the platform supports it.
+    """
+
+    def __init__(
+        self,
+        memory_store,
+        inbox_dir: Path,
+        *,
+        dispatch: Optional[Callable[[], dict]] = None,
+        debounce_seconds: float = app_config.WEBHOOK_WATCH_DEBOUNCE_SECONDS,
+        poll_interval: float = app_config.WEBHOOK_WATCH_POLL_INTERVAL_SECONDS,
+        use_inotify: Optional[bool] = None,
+    ):
+        self.memory_store = memory_store
+        self.inbox_dir = Path(inbox_dir)
+        self.dispatch = dispatch
+        self.debounce_seconds = debounce_seconds
+        self.poll_interval = poll_interval
+        self.use_inotify = sys.platform.startswith("linux") if use_inotify is None else use_inotify
+        self._watch = None
+        self._stop = threading.Event()
+        # name -> earliest time.time() at which to (re)try the file
+        self._pending: dict[str, float] = {}
+        self._ingest_latency_ms: deque = deque(maxlen=LATENCY_SAMPLES)
+        self._end_to_end_latency_ms: deque = deque(maxlen=LATENCY_SAMPLES)
+        self._totals = {"ingested": 0, "failed": 0, "batches": 0, "dispatches": 0, "lock_busy": 0}
+
+    @property
+    def mode(self) -> Optional[str]:
+        if self._watch is None:
+            return None
+        return "inotify" if isinstance(self._watch, _InotifyWatch) else "poll"
+
+    def open(self) -> None:
+        """Start watching, queueing every file already in the inbox."""
+        self.inbox_dir.mkdir(parents=True, exist_ok=True)
+        (self.inbox_dir / "processed").mkdir(exist_ok=True)
+        (self.inbox_dir / "failed").mkdir(exist_ok=True)
+        if self.use_inotify:
+            try:
+                self._watch = _InotifyWatch(self.inbox_dir)
+            except (OSError, AttributeError) as exc:
+                logger.warning("inotify unavailable (%s); polling %s instead", exc, self.inbox_dir)
+        if self._watch is None:
+            self._watch = _PollWatch(self.inbox_dir, self.poll_interval)
+        self._queue(path.name for path in self.inbox_dir.glob("*.json"))
+        logger.info("Watching %s (%s)", self.inbox_dir, self.mode)
+
+    def close(self) -> None:
+        if self._watch is not None:
+            self._watch.close()
+            self._watch = None
 
+    def stop(self) -> None:
+        """Ask run() to return after the current pass."""
+        self._stop.set()
+
+    def run(self) -> None:
+        """Watch and ingest until stop() is called."""
+        if self._watch is None:
+            self.open()
+        try:
+            while not self._stop.is_set():
+                self.run_once()
+        finally:
+            self.close()
+
+    def run_once(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """Wait for new files (or a pending retry) and ingest what is due.
+
+        Returns the ingest counts, or None if nothing was due.
+        """
+        if self._watch is None:
+            self.open()
+        if timeout is None:
+            timeout = self._next_wakeup()
+        changed = self._watch.wait(timeout)
+        if changed is None:  # inotify overflow: fall back to a full listing
+            changed = {path.name for path in self.inbox_dir.glob("*.json")}
+        self._queue(changed)
+        return self.process()
+
+    def process(self) -> Optional[dict]:
+        """Ingest every pending file whose retry time has come."""
+        now = time.time()
+        due = sorted(name for name, at in self._pending.items() if at <= now)
+        if not due:
+            return None
+
+        with inbox_lock(self.inbox_dir) as acquired:
+            if not acquired:
+                # The scheduled webhook_poll task is ingesting; try again shortly.
+                self._totals["lock_busy"] += 1
+                for name in due:
+                    self._pending[name] = now + self.poll_interval
+                return {"status": "skipped", "reason": "another ingest in progress"}
+            counts, landed = ingest_files(
+                self.memory_store,
+                self.inbox_dir,
+                [self.inbox_dir / name for name in due],
+                debounce_seconds=self.debounce_seconds,
+            )
+        stored_at = time.time()
+        self._requeue_leftovers(due, stored_at)
+
+        self._totals["batches"] += 1
+        self._totals["ingested"] += counts["ingested"]
+        self._totals["failed"] += counts["failed"]
+        self._ingest_latency_ms.extend(round((stored_at - mtime) * 1000, 1) for mtime in landed)
+        if landed:
+            counts["max_latency_ms"] = round((stored_at - min(landed)) * 1000, 1)
+            logger.info(
+                "Ingested %d event(s) in one batch, %.0f ms after the oldest landed",
+                counts["ingested"], counts["max_latency_ms"],
+            )
+
+        if landed and self.dispatch is not None:
+            try:
+                counts["dispatch"] = self.dispatch()
+            except Exception as exc:
+                logger.error("Dispatch after ingest failed: %s", exc)
+            else:
+                self._totals["dispatches"] += 1
+                dispatched_at = time.time()
+                self._end_to_end_latency_ms.extend(
+                    round((dispatched_at - mtime) * 1000, 1) for mtime in landed
+                )
+        return counts
+
+    def stats(self) -> dict:
+        """Totals plus ingest and end-to-end (landed to dispatched) latency."""
+        return {
+            "mode": self.mode,
+            "pending": len(self._pending),
+            **self._totals,
+            "ingest_latency": latency_summary(self._ingest_latency_ms),
+            "end_to_end_latency": latency_summary(self._end_to_end_latency_ms),
+        }
+
+    def _queue(self, names) -> None:
+        now = time.time()
+        for name in names:
+            if name.endswith(".json") and not name.startswith("."):
+                self._pending[name] = min(self._pending.get(name, now), now)
+
+    def _requeue_leftovers(self, due: list[str], now: float) -> None:
+        """Drop files that left the inbox; schedule a retry for the rest."""
+        for name in due:
+            try:
+                mtime = (self.inbox_dir / name).stat().st_mtime
+            except FileNotFoundError:
+                self._pending.pop(name, None)
+                continue
+            if self.debounce_seconds > 0 and now - mtime < self.debounce_seconds:
+                self._pending[name] = mtime + self.debounce_seconds
+            else:
+                self._pending[name] = now + FAILED_RETRY_SECONDS
+
+    def _next_wakeup(self) -> float:
+        if not self._pending:
+            return self.poll_interval
+        return max(0.0, min(min(self._pending.values()) - time.time(), self.poll_interval))
+
+
+def _build_dispatch(memory_store) -> Optional[Callable[[], dict]]:
+    """Dispatch pending events after each batch when auto-dispatch is enabled."""
+    if not app_config.WEBHOOK_AUTO_DISPATCH_ENABLED:
+        return None
+
+    import asyncio
+
+    from agents.registry import AgentRegistry
+    from webhook.ingest import dispatch_pending_events
+
+    agent_registry = AgentRegistry(app_config.AGENT_CONFIGS_DIR)
+
+    def dispatch() -> dict:
+        return asyncio.run(dispatch_pending_events(memory_store, agent_registry))
+
+    return dispatch
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Ingest webhook inbox files.")
+    parser.add_argument("--watch", action="store_true", help="keep running and ingest files as they land")
+    args = parser.parse_args(argv)
 
-def main():
     app_config.DATA_DIR.mkdir(parents=True, exist_ok=True)
     inbox_dir = app_config.WEBHOOK_INBOX_DIR
     inbox_dir.mkdir(parents=True, exist_ok=True)
 
     memory_store = MemoryStore(app_config.MEMORY_DB_PATH)
     try:
-        result = ingest_events(memory_store, inbox_dir)
-        print(f"Ingest result: {result}")
+        if not args.watch:
+            result = ingest_events(memory_store, inbox_dir)
+            print(f"Ingest result: {result}")
+            return
+
+        watcher = InboxWatcher(memory_store, inbox_dir, dispatch=_build_dispatch(memory_store))
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: watcher.stop())
+        watcher.run()
+        logger.info("Watcher stopped: %s", watcher.stats())
     finally:
         memory_store.close()
 